@@ -0,0 +1,64 @@
+"""
+Times parsing, typechecking and evaluating a program with a single large
+array literal, like a lookup table. Also typechecks nested array literals of
+increasing depth, where the time per level should stay constant.
+
+Usage: python -m benchmarks.arrays [--elements N] [--depths N [N ...]]
+                                   [--frontend NAME]
+"""
+
+import argparse
+import gc
+import time
+from typing import Any, Callable
+
+from compiler.compiler import get_default_environs
+from compiler.parser import DEFAULT_FRONTEND, FRONTENDS, parse_to_ast
+
+
+def timed(name: str, fn: Callable[[], Any]) -> Any:
+    gc.collect()
+    start = time.perf_counter()
+    result = fn()
+    print(f"  {name:<10} {time.perf_counter() - start:8.3f} s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--elements", type=int, default=1_000_000)
+    parser.add_argument(
+        "--depths", type=int, nargs="+", default=[1_000, 10_000, 20_000]
+    )
+    parser.add_argument("--frontend", choices=FRONTENDS, default=DEFAULT_FRONTEND)
+    args = parser.parse_args()
+
+    sources = {
+        "int": f"let table = {list(range(args.elements))}",
+        "string": f"let table = {[str(i) for i in range(args.elements)]}",
+    }
+
+    for name, source in sources.items():
+        source = source.replace("'", '"')
+        print(f"{name} array of {args.elements} elements")
+
+        ast = timed("parse", lambda: parse_to_ast(source, args.frontend))
+        type_env, env = get_default_environs()
+        timed("typecheck", lambda: ast.typecheck(type_env))
+        timed("eval", lambda: ast.eval(env))
+
+    for depth in args.depths:
+        source = "let nested = " + "[" * depth + "1" + "]" * depth
+        print(f"array nested {depth} levels deep")
+
+        ast = parse_to_ast(source, args.frontend)
+        type_env, _ = get_default_environs()
+        gc.collect()
+        start = time.perf_counter()
+        ast.typecheck(type_env)
+        elapsed = time.perf_counter() - start
+        print(f"  typecheck  {elapsed:8.3f} s   {elapsed / depth * 1e6:6.2f} us per level")
+
+
+if __name__ == "__main__":
+    main()
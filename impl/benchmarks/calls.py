@@ -0,0 +1,50 @@
+"""
+Times calls to a recursive Ryu function, each returning from inside nested
+statements, which is dominated by the cost of returning from a call.
+
+Usage: python -m benchmarks.calls [--depth N] [--repeat N] [--backend NAME]
+"""
+
+import argparse
+import gc
+import time
+
+from compiler.compiler import BACKENDS, DEFAULT_BACKEND, get_default_environs
+from compiler.parser import parse_to_ast
+
+from benchmarks import programs
+
+
+def fibonacci(n: int) -> int:
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depth", type=int, default=22)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--backend", choices=list(BACKENDS), default=DEFAULT_BACKEND)
+    args = parser.parse_args()
+
+    source, calls = programs.calls(args.depth)
+    print(f"fib({args.depth}): {calls} calls")
+
+    ast = parse_to_ast(source)
+    for _ in range(args.repeat):
+        type_env, env = get_default_environs()
+        ast.typecheck(type_env)
+
+        gc.collect()
+        start = time.perf_counter()
+        BACKENDS[args.backend](ast, env)
+        elapsed = time.perf_counter() - start
+
+        assert env.get("result") == fibonacci(args.depth)
+        print(f"  eval {elapsed:8.3f} s {elapsed / calls * 1e6:8.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Times running each program in examples/ on the tree-walking evaluator and on
+the bytecode virtual machine (or the given backends), after typechecking it
+once. The examples are small, so each one is run many times, with its output
+discarded. Programs that do not typecheck, like the ones in examples/errors,
+are skipped.
+
+Usage: python -m benchmarks.examples [--runs N] [--backends NAME ...]
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import time
+
+from compiler import errors
+from compiler.compiler import BACKENDS, get_default_environs
+from compiler.parser import parse_to_ast
+
+from benchmarks import programs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=2_000)
+    parser.add_argument(
+        "--backends", nargs="+", choices=list(BACKENDS), default=["tree", "bytecode"]
+    )
+    args = parser.parse_args()
+
+    baseline = args.backends[0]
+    print(f"{'example':<36}" + "".join(f"{name:>12}" for name in args.backends))
+
+    for path in sorted(programs.EXAMPLES.rglob("*.ryu")):
+        name = str(path.relative_to(programs.EXAMPLES))
+        ast = parse_to_ast(path.read_text())
+        try:
+            ast.typecheck(get_default_environs()[0])
+        except errors.CompilerError:
+            print(f"{name:<36} skipped, does not typecheck")
+            continue
+
+        times: dict[str, float] = {}
+        for backend in args.backends:
+            envs = [get_default_environs()[1] for _ in range(args.runs)]
+            run = BACKENDS[backend]
+
+            gc.collect()
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                for env in envs:
+                    run(ast, env)
+                times[backend] = (time.perf_counter() - start) / args.runs
+
+        row = "".join(f"{times[b] * 1e6:9.1f} us" for b in args.backends)
+        speedups = ", ".join(
+            f"{b} {times[baseline] / times[b]:.2f}x" for b in args.backends[1:]
+        )
+        print(f"{name:<36}{row}  {speedups}")
+
+
+if __name__ == "__main__":
+    main()
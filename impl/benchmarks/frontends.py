@@ -0,0 +1,53 @@
+"""
+Compares the throughput of the lark and the hand written (pratt) front ends
+in tokens per second, on large generated programs.
+
+Usage: python -m benchmarks.frontends [--statements N] [--runs N]
+"""
+
+import argparse
+import gc
+import time
+
+from compiler.parser import FRONTENDS
+from compiler.pratt import tokenize
+
+from benchmarks import programs
+
+
+def best_time(frontend: str, source: str, runs: int) -> float:
+    parse = FRONTENDS[frontend]  # type: ignore
+    times: list[float] = []
+
+    for _ in range(runs):
+        gc.collect()
+        start = time.perf_counter()
+        parse(source)
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--statements", type=int, default=20_000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    sources = {
+        "straight line": programs.straight_line(args.statements),
+        "functions": programs.functions(args.statements // 10),
+    }
+
+    for name, source in sources.items():
+        tokens = len(tokenize(source)) - 1  # without the end marker
+        print(f"{name} ({tokens} tokens)")
+
+        for frontend in FRONTENDS:
+            elapsed = best_time(frontend, source, args.runs)
+            rate = tokens / elapsed
+            print(f"  {frontend:<6} {elapsed:7.3f} s   {rate / 1000:8.1f} k tokens/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Compares parsing a whole buffer against reparsing it incrementally after
+typing a character in the middle, for growing buffer sizes. The first edit
+also anchors the statements after it to the end of the buffer, and is
+reported separately.
+
+Usage: python -m benchmarks.incremental [--runs N]
+"""
+
+import argparse
+import re
+import time
+
+from compiler.incremental import TextEdit, reparse
+from compiler.parser import parse_to_ast
+
+from benchmarks import programs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    for statements in (1_000, 10_000, 100_000):
+        source = programs.straight_line(statements)
+        # an integer literal in the middle of the buffer
+        middle = re.compile(r"= \d").search(source, len(source) // 2).start() + 2
+        edit = TextEdit(middle, middle, "9")
+
+        start = time.perf_counter()
+        ast = parse_to_ast(source)
+        full = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ast = reparse(ast, source, edit)
+        first = time.perf_counter() - start
+        source = edit.apply(source)
+
+        incremental = float("inf")
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            ast = reparse(ast, source, edit)
+            incremental = min(incremental, time.perf_counter() - start)
+            source = edit.apply(source)
+
+        print(
+            f"{statements:>7} statements   full {full * 1000:9.2f} ms"
+            f"   first edit {first * 1000:7.2f} ms"
+            f"   incremental {incremental * 1000:7.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
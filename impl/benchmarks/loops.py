@@ -0,0 +1,76 @@
+"""
+Reports the frames allocated and the time taken per iteration of loops of
+each kind, at the top level and inside a function. Blocks run in the frame
+of their function (or of the outermost block at the top level), so the only
+frames allocated in a loop should be the ones of the calls it makes.
+
+Usage: python -m benchmarks.loops [--iterations N]
+"""
+
+import argparse
+import gc
+import time
+from typing import Any, Optional
+
+from compiler.compiler import BACKENDS, get_default_environs
+from compiler.env import RuntimeEnvironment
+from compiler.parser import parse_to_ast
+
+from benchmarks import programs
+
+
+class CountFrames:
+    """
+    Counts the runtime environments created while active.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.init = RuntimeEnvironment.__init__
+
+    def __enter__(self):
+        def counting_init(
+            env: RuntimeEnvironment,
+            enclosing: Optional[RuntimeEnvironment] = None,
+            size: int = 0,
+        ):
+            self.count += 1
+            self.init(env, enclosing, size)
+
+        setattr(RuntimeEnvironment, "__init__", counting_init)
+        return self
+
+    def __exit__(self, *exc: Any):
+        setattr(RuntimeEnvironment, "__init__", self.init)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=100_000)
+    args = parser.parse_args()
+    n = args.iterations
+
+    print(f"loops of {n} iterations")
+    print(f"  {'':24} {'frames/iter':>12} {'us/iter':>9}")
+
+    for kind, source in programs.loops(n).items():
+        ast = parse_to_ast(source)
+        type_env, env = get_default_environs()
+        ast.typecheck(type_env)
+
+        with CountFrames() as frames:
+            BACKENDS["tree"](ast, env)
+        assert env.get("total") == n
+
+        type_env, env = get_default_environs()
+        ast.typecheck(type_env)
+        gc.collect()
+        start = time.perf_counter()
+        BACKENDS["tree"](ast, env)
+        elapsed = time.perf_counter() - start
+
+        print(f"  {kind:24} {frames.count / n:12.2f} {elapsed / n * 1e6:9.2f}")
+
+
+if __name__ == "__main__":
+    main()
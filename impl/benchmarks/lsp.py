@@ -0,0 +1,54 @@
+"""
+Compares the time the language server takes to update the diagnostics of a
+document after typing or deleting a character inside a function body against parsing
+and typechecking the whole document, for growing numbers of functions.
+
+Usage: python -m benchmarks.lsp [--runs N]
+"""
+
+import argparse
+import time
+
+from compiler.compiler import get_default_environs
+from compiler.incremental import TextEdit
+from compiler.lsp import Document
+from compiler.parser import parse_to_ast
+
+from benchmarks import programs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    for functions in (100, 1_000, 10_000):
+        source = programs.functions(functions)
+
+        start = time.perf_counter()
+        parse_to_ast(source).typecheck(get_default_environs()[0])
+        full = time.perf_counter() - start
+
+        document = Document(source)
+        document.diagnostics()
+
+        # the initial total of a function in the middle of the document
+        middle = source.index("let total = 0", len(source) // 2) + len("let total = ")
+        edits = [TextEdit(middle, middle, "1"), TextEdit(middle, middle + 1, "")]
+
+        incremental = float("inf")
+        for i in range(args.runs):
+            start = time.perf_counter()
+            document.edit(edits[i % 2])
+            document.diagnostics()
+            incremental = min(incremental, time.perf_counter() - start)
+
+        print(
+            f"{functions:>6} functions   full {full * 1000:9.2f} ms"
+            f"   incremental {incremental * 1000:7.2f} ms"
+            f"   ({len(document.cache.rechecked)} items checked)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Times the exhaustiveness and redundancy checks of match statements over
+large generated enums, with ladders of hundreds of arms ending in a
+wildcard and with exhaustive ladders of one or two arms per variant.
+
+Usage: python -m benchmarks.matching [--variants N [N ...]] [--arms N]
+"""
+
+import argparse
+import gc
+import time
+
+from compiler.compiler import get_default_environs
+from compiler.parser import parse_to_ast
+
+from benchmarks import programs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--variants", type=int, nargs="+", default=[1_000, 2_000, 4_000]
+    )
+    parser.add_argument("--arms", type=int, default=500)
+    args = parser.parse_args()
+
+    for variants in args.variants:
+        for arms in (args.arms, 2 * variants):
+            ast = parse_to_ast(programs.match_ladder(variants, arms))
+            type_env, _ = get_default_environs()
+
+            gc.collect()
+            start = time.perf_counter()
+            ast.typecheck(type_env)
+            elapsed = time.perf_counter() - start
+
+            print(f"{variants:>6} variants {arms:>6} arms   typecheck {elapsed:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Reports the memory held by the AST of a large generated program, in total,
+per node and relative to the size of the source.
+
+Usage: python -m benchmarks.memory [--statements N] [--frontend NAME]
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from compiler.ast.base import Ast, field_names
+from compiler.parser import DEFAULT_FRONTEND, FRONTENDS, parse_to_ast
+
+from benchmarks import programs
+
+
+def count_nodes(root: Ast) -> int:
+    count = 0
+    stack = [root]
+
+    while stack:
+        node = stack.pop()
+        count += 1
+        for name in field_names(type(node)):
+            value = getattr(node, name)
+            if isinstance(value, Ast):
+                stack.append(value)
+            elif isinstance(value, list):
+                stack.extend(item for item in value if isinstance(item, Ast))  # type: ignore
+
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--statements", type=int, default=100_000)
+    parser.add_argument("--frontend", choices=FRONTENDS, default=DEFAULT_FRONTEND)
+    args = parser.parse_args()
+
+    source = programs.straight_line(args.statements)
+    print(f"{args.statements} statements ({len(source)} bytes of source)")
+
+    gc.collect()
+    tracemalloc.start()
+    ast = parse_to_ast(source, args.frontend)
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    nodes = count_nodes(ast)
+    print(f"  nodes          {nodes:>12}")
+    print(f"  ast size       {size / 2**20:12.1f} MiB")
+    print(f"  per node       {size / nodes:12.1f} bytes")
+    print(f"  source ratio   {size / len(source):12.1f} x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Measures the memory held by the AST of a large program and the time spent
+typechecking and evaluating it, both of which depend on how identifiers and
+operators are stored in the tree (every variable access is a lookup of an
+identifier in the environment).
+
+Usage: python -m benchmarks.names [--functions N] [--frontend NAME]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from compiler.compiler import get_default_environs
+from compiler.parser import DEFAULT_FRONTEND, FRONTENDS, parse_to_ast
+
+from benchmarks import programs
+
+
+def timed(name: str, fn: Callable[[], Any]) -> Any:
+    gc.collect()
+    start = time.perf_counter()
+    result = fn()
+    print(f"  {name:<10} {time.perf_counter() - start:8.3f} s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--functions", type=int, default=5_000)
+    parser.add_argument("--frontend", choices=FRONTENDS, default=DEFAULT_FRONTEND)
+    args = parser.parse_args()
+
+    source = programs.functions(args.functions)
+    print(f"{args.functions} functions ({len(source.splitlines())} lines)")
+
+    gc.collect()
+    tracemalloc.start()
+    ast = parse_to_ast(source, args.frontend)
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {'ast size':<10} {size / 2**20:8.1f} MiB")
+
+    type_env, env = get_default_environs()
+    timed("typecheck", lambda: ast.typecheck(type_env))
+    timed("eval", lambda: ast.eval(env))
+
+
+if __name__ == "__main__":
+    main()
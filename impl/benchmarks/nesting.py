@@ -0,0 +1,51 @@
+"""
+Stress test for deeply nested programs: times every pass over the AST that
+runs on an explicit stack, at nesting depths well beyond the recursion limit.
+
+Usage: python -m benchmarks.nesting [--depths N [N ...]]
+"""
+
+import argparse
+import gc
+import time
+from typing import Any, Callable
+
+from compiler.ast.base import Ast
+from compiler.env import TypeEnvironment
+from compiler.parser import FRONTENDS, parse, parse_to_ast, parse_tree_to_ast
+
+from benchmarks import programs
+
+
+def timed(name: str, fn: Callable[[], Any]) -> Any:
+    gc.collect()
+    start = time.perf_counter()
+    try:
+        result = fn()
+    except RecursionError:
+        print(f"  {name:<18} RecursionError")
+        return None
+
+    print(f"  {name:<18} {time.perf_counter() - start:8.3f} s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depths", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    for depth in args.depths:
+        source = programs.nested(depth)
+        print(f"depth {depth} ({len(source.splitlines())} lines)")
+
+        ast: Ast = timed("parse (lark)", lambda: parse_to_ast(source, "lark"))
+        timed("parse (pratt)", lambda: FRONTENDS["pratt"](source))
+        timed("parse + transform", lambda: parse_tree_to_ast(parse(source)))
+        timed("to_dict", ast.to_dict)
+        timed("typecheck", lambda: ast.typecheck(TypeEnvironment()))
+        timed("to_type_dict", ast.to_type_dict)
+
+
+if __name__ == "__main__":
+    main()
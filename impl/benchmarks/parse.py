@@ -0,0 +1,61 @@
+"""
+Compares building the AST from a lark parse tree against building it
+directly from the parser callbacks, on large generated programs.
+
+Usage: python -m benchmarks.parse [--statements N]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Callable
+
+from compiler.ast.base import Ast
+from compiler.parser import parse, parse_to_ast, parse_tree_to_ast
+
+from benchmarks import programs
+
+
+def via_tree(source: str) -> Ast:
+    return parse_tree_to_ast(parse(source))
+
+
+def direct(source: str) -> Ast:
+    return parse_to_ast(source, frontend="lark")
+
+
+def measure(fn: Callable[[str], Ast], source: str) -> tuple[float, int]:
+    gc.collect()
+    start = time.perf_counter()
+    fn(source)
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    fn(source)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--statements", type=int, default=20_000)
+    args = parser.parse_args()
+
+    sources = {
+        "straight line": programs.straight_line(args.statements),
+        "functions": programs.functions(args.statements // 10),
+    }
+
+    for name, source in sources.items():
+        print(f"{name} ({len(source) / 1024:.0f} KiB)")
+        for label, fn in (("tree + transform", via_tree), ("direct", direct)):
+            elapsed, peak = measure(fn, source)
+            print(f"  {label:<17} {elapsed:7.3f} s   peak {peak / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""
+Generators for large synthetic Ryu programs used by the benchmarks and by
+the tests.
+"""
+
+import random
+from pathlib import Path
+
+EXAMPLES = Path(__file__).parent.parent / "examples"
+
+
+def functions(count: int) -> str:
+    """
+    A program defining many small functions with control flow, each of which
+    is called once.
+    """
+    lines: list[str] = []
+
+    for i in range(count):
+        lines.append(
+            f"""
+fn f{i}(a: int, b: int) -> int {{
+    let total = 0
+    for i in a..b {{
+        if i % 2 == 0 {{
+            total = total + i
+        }} else {{
+            total = total - 1
+        }}
+    }}
+    return total
+}}
+let r{i} = f{i}({i}, {i + 10})"""
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+def nested(depth: int) -> str:
+    """
+    A program whose blocks (if statements, match cases and loops) are nested
+    depth levels deep, like machine generated decision trees.
+    """
+    opening: list[str] = []
+    closing: list[str] = []
+
+    for i in range(depth):
+        match i % 3:
+            case 0:
+                opening.append("if true {")
+                closing.append("}")
+            case 1:
+                opening.append("match true { case true {")
+                closing.append("} case false { print 0 } }")
+            case _:
+                opening.append("while false {")
+                closing.append("}")
+
+    return "\n".join([*opening, "print 1", *reversed(closing)]) + "\n"
+
+
+def match_ladder(variants: int, arms: int) -> str:
+    """
+    An enum with the given number of variants, a third of which carry a bool
+    and a third another enum, and a function matching on it with the given
+    number of arms (nested patterns included) followed by a wildcard. The
+    variants without a value take one arm and the others two: with enough
+    arms to cover all of them, there is no wildcard.
+    """
+    members: list[str] = []
+    patterns: list[str] = []
+
+    for i in range(variants):
+        match i % 3:
+            case 0:
+                members.append(f"    V{i}")
+                patterns.append(f"E::V{i}")
+            case 1:
+                members.append(f"    V{i}(bool)")
+                patterns += [f"E::V{i}(true)", f"E::V{i}(false)"]
+            case _:
+                members.append(f"    V{i}(Inner)")
+                patterns += [f"E::V{i}(Inner::B(_))", f"E::V{i}(Inner::A)"]
+
+    cases = [
+        f"        case {pattern} {{ return {i} }}"
+        for i, pattern in enumerate(patterns[:arms])
+    ]
+    if arms < len(patterns):
+        cases.append("        case _ { return -1 }")
+
+    lines = [
+        "enum Inner {",
+        "    A",
+        "    B(bool)",
+        "}",
+        "enum E {",
+        *members,
+        "}",
+        "fn pick(e: E) -> int {",
+        "    match e {",
+        *cases,
+        "    }",
+        "}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def quicksort(size: int, seed: int = 0) -> tuple[str, list[int]]:
+    """
+    examples/algorithms/quicksort.ryu sorting a shuffled array of size
+    integers into the global `sorted`, instead of printing a small one.
+    Returns the program and the array it sorts.
+    """
+    values = list(range(size))
+    random.Random(seed).shuffle(values)
+
+    lines = EXAMPLES.joinpath("algorithms", "quicksort.ryu").read_text().splitlines()
+    for i, line in enumerate(lines):
+        if line.startswith("let array ="):
+            lines[i] = f"let array = {values}"
+        elif line.startswith("print("):
+            lines[i] = "let sorted = quicksort(array, 0, n - 1)"
+
+    return "\n".join(lines) + "\n", values
+
+def straight_line(statements: int) -> str:
+    """
+    A program made of simple top level declarations, assignments and
+    expressions, similar to machine generated batch scripts.
+    """
+    lines: list[str] = []
+
+    for i in range(statements):
+        match i % 4:
+            case 0:
+                lines.append(f"let v{i} = {i} + {i} * 2 - (3 % 7)")
+            case 1:
+                lines.append(f"let v{i} = [{i}, {i + 1}, {i + 2}]")
+            case 2:
+                lines.append(f'let v{i} = "str{i}" + "ing"')
+            case _:
+                lines.append(f"let v{i} = {i} < {i + 1} && true")
+
+    return "\n".join(lines) + "\n"
+
+
+def structs(count: int) -> str:
+    """
+    A program declaring many struct types, each with functions taking and
+    returning them that are called a few times.
+    """
+    lines: list[str] = []
+
+    for i in range(count):
+        lines.append(
+            f"""
+struct S{i} {{
+    id: int
+    name: string
+    values: array<int>
+    rows: array<array<int>>
+    names: array<array<string>>
+    tags: array<string>
+    flags: array<bool>
+    valid: bool
+}}
+fn make{i}(id: int, values: array<int>, rows: array<array<int>>) -> S{i} {{
+    let names = [["n"]]
+    return S{i}(id = id, name = "s", values = values, rows = rows, names = names, tags = ["t"], flags = [true], valid = true)
+}}
+fn pick{i}(a: S{i}, b: S{i}, c: S{i}, d: S{i}, rows: array<array<int>>) -> S{i} {{
+    return a
+}}
+let s{i} = make{i}({i}, [{i}], [[{i}]])
+let t{i} = pick{i}(s{i}, s{i}, s{i}, s{i}, [[1]])
+let u{i} = pick{i}(t{i}, s{i}, t{i}, s{i}, [[2]])
+let v{i} = pick{i}(u{i}, t{i}, u{i}, t{i}, [[3]])
+let w{i} = pick{i}(v{i}, u{i}, v{i}, u{i}, [[4]])
+print w{i}.id"""
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+def loops(iterations: int) -> dict[str, str]:
+    """
+    Programs running a loop of each kind for iterations iterations, at the
+    top level and inside a function, with a variable declared in the body.
+    Each of them counts the iterations in the global `total`.
+    """
+    bodies = {
+        "for range": [f"for i in 0..{iterations} {{", "    let x = 1"],
+        "for array": [
+            f"let array = [{', '.join(['0'] * iterations)}]",
+            "for i in array {",
+            "    let x = 1",
+        ],
+        "while": [
+            "let i = 0",
+            f"while i < {iterations} {{",
+            "    let x = 1",
+            "    i = i + 1",
+        ],
+        "calls": [f"for i in 0..{iterations} {{", "    let x = one()"],
+    }
+    header = ["fn one() -> int {", "    return 1", "}"]
+
+    programs: dict[str, str] = {}
+    for kind, lines in bodies.items():
+        loop = [*lines, "    total = total + x", "}"]
+        programs[f"{kind}, top level"] = "\n".join(
+            [*header, "let total = 0", *loop, ""]
+        )
+
+        body = ["    " + line for line in ["let total = 0", *loop, "return total"]]
+        programs[f"{kind}, in a function"] = "\n".join(
+            [*header, "fn run() -> int {", *body, "}", "let total = run()", ""]
+        )
+
+    return programs
+
+
+def calls(depth: int) -> tuple[str, int]:
+    """
+    A recursive function returning from inside an if block and a loop, called
+    for fibonacci(depth) into the global `result`. Returns the program and the
+    number of calls it makes.
+    """
+    lines = [
+        "fn fib(n: int) -> int {",
+        "    if n < 2 {",
+        "        return n",
+        "    }",
+        "    for i in 0..1 {",
+        "        return fib(n - 1) + fib(n - 2)",
+        "    }",
+        "    return 0",
+        "}",
+        f"let result = fib({depth})",
+    ]
+    a, b = 1, 1
+    for _ in range(depth):
+        a, b = b, a + b + 1
+    return "\n".join(lines) + "\n", a
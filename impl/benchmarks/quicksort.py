@@ -0,0 +1,48 @@
+"""
+Times evaluating examples/algorithms/quicksort.ryu on a large shuffled
+array, which is dominated by variable accesses inside the loop of a
+recursive function.
+
+Usage: python -m benchmarks.quicksort [--size N] [--repeat N] [--backend NAME]
+"""
+
+import argparse
+import gc
+import sys
+import time
+
+from compiler.compiler import BACKENDS, DEFAULT_BACKEND, get_default_environs
+from compiler.parser import parse_to_ast
+
+from benchmarks import programs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--backend", choices=list(BACKENDS), default=DEFAULT_BACKEND)
+    args = parser.parse_args()
+
+    source, values = programs.quicksort(args.size)
+    print(f"quicksort of {args.size} integers")
+
+    # Deep recursion on unlucky pivots
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 100_000))
+
+    for _ in range(args.repeat):
+        ast = parse_to_ast(source)
+        type_env, env = get_default_environs()
+        ast.typecheck(type_env)
+
+        gc.collect()
+        start = time.perf_counter()
+        BACKENDS[args.backend](ast, env)
+        elapsed = time.perf_counter() - start
+
+        assert env.get("sorted") == sorted(values)
+        print(f"  eval       {elapsed:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
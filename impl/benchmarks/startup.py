@@ -0,0 +1,58 @@
+"""
+Measures the time taken to import the compiler (what `ryuc` does before
+reading the source file) in a fresh interpreter, with a cold (empty) and a
+warm parser cache.
+
+Usage: python -m benchmarks.startup [--runs N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from compiler import cache
+
+ROOT = Path(__file__).parent.parent
+
+
+def time_import(runs: int, clear_cache: bool) -> list[float]:
+    timings: list[float] = []
+
+    for _ in range(runs):
+        if clear_cache:
+            cache.clear_parser_cache()
+
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", "import compiler.compiler"],
+            cwd=ROOT,
+            check=True,
+        )
+        timings.append(time.perf_counter() - start)
+
+    return timings
+
+
+def report(label: str, timings: list[float]):
+    best = min(timings) * 1000
+    median = statistics.median(timings) * 1000
+    print(f"{label:<6} best {best:8.2f} ms   median {median:8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    # Make sure bytecode for the compiler itself is not part of the measurement
+    time_import(1, clear_cache=False)
+
+    report("cold", time_import(args.runs, clear_cache=True))
+    report("warm", time_import(args.runs, clear_cache=False))
+
+
+if __name__ == "__main__":
+    main()
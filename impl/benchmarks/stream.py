@@ -0,0 +1,59 @@
+"""
+Compares the peak memory of running a large generated program in one go
+against streaming it one statement at a time.
+
+Usage: python -m benchmarks.stream [--statements N]
+"""
+
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from compiler.compiler import get_default_environs, run, run_stream
+
+from benchmarks import programs
+
+
+def whole(path: Path):
+    run(path.read_text(), *get_default_environs())
+
+
+def streamed(path: Path):
+    with path.open() as file:
+        run_stream(file, *get_default_environs())
+
+
+def measure(fn: Callable[[Path], None], path: Path) -> tuple[float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        fn(path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--statements", type=int, default=20_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "program.ryu"
+        path.write_text(programs.straight_line(args.statements))
+        print(f"{args.statements} statements ({path.stat().st_size / 2**20:.1f} MiB)")
+
+        for label, fn in (("whole", whole), ("streamed", streamed)):
+            elapsed, peak = measure(fn, path)
+            print(f"  {label:<9} {elapsed:7.3f} s   peak {peak / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
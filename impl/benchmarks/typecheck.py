@@ -0,0 +1,65 @@
+"""
+Times typechecking of large generated programs with many function
+signatures and struct types, and measures the memory that typechecking
+adds to the AST (mostly the types assigned to its nodes). The two phase
+checker is timed with the number of processes given by --jobs.
+
+Usage: python -m benchmarks.typecheck [--count N] [--runs N] [--jobs N]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from compiler.compiler import get_default_environs
+from compiler.parser import parse_to_ast
+from compiler.typechecker import typecheck_program
+
+from benchmarks import programs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=2_000)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--jobs", type=int, default=1)
+    args = parser.parse_args()
+
+    sources = {
+        "functions": programs.functions(args.count),
+        "structs": programs.structs(args.count),
+    }
+
+    for name, source in sources.items():
+        # Measured first, while none of the types of the program exist yet.
+        ast = parse_to_ast(source)
+        gc.collect()
+        tracemalloc.start()
+        ast.typecheck(get_default_environs()[0])
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        single: list[float] = []
+        phased: list[float] = []
+        for _ in range(args.runs):
+            type_env, _ = get_default_environs()
+            gc.collect()
+            start = time.perf_counter()
+            ast.typecheck(type_env)
+            single.append(time.perf_counter() - start)
+
+            type_env, _ = get_default_environs()
+            gc.collect()
+            start = time.perf_counter()
+            typecheck_program(ast, type_env, args.jobs)
+            phased.append(time.perf_counter() - start)
+
+        print(f"{name} ({args.count})")
+        print(f"  typecheck  {min(single):8.3f} s")
+        print(f"  two phase  {min(phased):8.3f} s  ({args.jobs} jobs)")
+        print(f"  retained   {size / 2**20:8.1f} MiB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Times creating and comparing compound types. Types are interned, so
+comparing two of them is an identity check however deep they are, while
+creating one looks it up among the existing types first.
+
+Usage: python -m benchmarks.types [--depth N] [--params N] [--runs N]
+"""
+
+import argparse
+import timeit
+
+from compiler import langtypes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--params", type=int, default=6)
+    parser.add_argument("--runs", type=int, default=100_000)
+    args = parser.parse_args()
+
+    def params() -> langtypes.Function.Params:
+        param: langtypes.Type = langtypes.INT
+        for _ in range(args.depth):
+            param = langtypes.Array(param)
+        return langtypes.Function.Params([param] * args.params)
+
+    a, b = params(), params()
+    print(f"parameters of {args.params} arrays nested {args.depth} deep")
+    for name, fn in [("create", params), ("compare", lambda: a == b)]:
+        elapsed = min(timeit.repeat(fn, number=args.runs, repeat=5))
+        print(f"  {name:<8} {elapsed / args.runs * 1e6:8.3f} us")
+
+
+if __name__ == "__main__":
+    main()
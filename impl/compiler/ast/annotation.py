@@ -1,21 +1,22 @@
 from typing import Optional
-from compiler.ast.base import Ast
-from compiler.compiler import langtypes
+from compiler.ast.base import Ast, Steps
+from compiler import langtypes
 from compiler.env import TypeEnvironment
-from compiler.lalr import Token
 
 
 from dataclasses import dataclass
+from typing_extensions import override
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeAnnotation(Ast):
-    ty: Token
+    ty: str
     generics: Optional["TypeAnnotation"]
 
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
+    @override
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[langtypes.Type]:
         if self.generics and self.ty == "array":  # TODO: harcoded
-            generics = self.generics.typecheck(env)
+            generics = yield self.generics.typecheck_steps(env)
             self.type = langtypes.Array(generics)
         else:
             self.type = env.get_type(self.ty)
@@ -1,68 +1,147 @@
+import itertools
 from dataclasses import dataclass
 from typing import Any, Optional
 from typing_extensions import override
 
 from compiler import errors, langtypes
 from compiler.ast.annotation import TypeAnnotation
+from compiler.ast.base import Steps
 from compiler.ast.expressions import Expression
+from compiler.ast.literals import BoolLiteral, IntLiteral, StringLiteral
+from compiler.ast.operators import UnaryOp
 from compiler.ast.statements import Statement
 from compiler.ast.variable import Variable
 from compiler.env import RuntimeEnvironment, TypeEnvironment
 
 
-@dataclass
+@dataclass(slots=True)
 class ArrayElement(Expression):
     element: Expression
 
     @override
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
-        self.type = self.element.typecheck(env)
-        return self.type
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[langtypes.Type]:
+        type: langtypes.Type = yield self.element.typecheck_steps(env)
+        self.type = type
+        return type
 
     @override
     def eval(self, env: RuntimeEnvironment) -> Any:
         return self.element.eval(env)
 
+    @override
+    def eval_steps(self, env: RuntimeEnvironment) -> Steps[Any]:
+        return self.element.eval_steps(env)
+
 
-@dataclass
+@dataclass(slots=True)
 class ArrayElements(Expression):
     members: list[ArrayElement]
 
     @override
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[langtypes.Type]:
         assert len(self.members) > 0
-        check_type = self.members[0].typecheck(env)
-        for mem in self.members:
-            if mem.typecheck(env) != check_type:
+        check_type: langtypes.Type = yield self.members[0].typecheck_steps(env)
+        for mem in itertools.islice(self.members, 1, None):
+            mem_type: langtypes.Type = yield mem.typecheck_steps(env)
+            if mem_type != check_type:
                 raise errors.ArrayTypeMismatch(
                     message="Unexpected type for array element",
                     span=mem.span,
                     expected_type=check_type,
-                    actual_type=mem.typecheck(env),
+                    actual_type=mem_type,
                     expected_type_span=self.members[0].span,
                 )
         self.type = check_type
-        return self.type
+        return check_type
 
     @override
     def eval(self, env: RuntimeEnvironment) -> Any:
-        result: list[Any] = []
+        return [mem.eval(env) for mem in self.members]
+
+    @override
+    def eval_steps(self, env: RuntimeEnvironment) -> Steps[list[Any]]:
+        values: list[Any] = []
         for mem in self.members:
-            result.append(mem.eval(env))
-        return result
+            values.append((yield mem.eval_steps(env)))
+        return values
+
+
+ConstantValue = bool | int | str
+
+_CONSTANT_TYPES: dict[type, langtypes.Type] = {
+    bool: langtypes.BOOL,
+    int: langtypes.INT,
+    str: langtypes.STRING,
+}
+
+
+@dataclass(slots=True)
+class ConstantArrayElements(Expression):
+    """
+    Elements of an array literal that are all literals of the same type, like
+    lookup tables. The values are stored as is instead of as a node per
+    element, so typechecking is constant time and evaluation is a single
+    copy of the values.
+    """
+
+    values: list[ConstantValue]
+
+    @override
+    def typecheck_steps(self, env: TypeEnvironment) -> langtypes.Type:
+        self.type = _CONSTANT_TYPES[type(self.values[0])]
+        return self.type
 
+    @override
+    def eval(self, env: RuntimeEnvironment) -> list[ConstantValue]:
+        # arrays are mutable, so every evaluation gets a fresh copy
+        return self.values.copy()
+
+
+def constant_value(expr: Expression) -> Optional[ConstantValue]:
+    """
+    Value of expr if it is a literal (or a negated int literal), else None.
+    """
+    match expr:
+        case BoolLiteral(value=value) | IntLiteral(value=value):
+            return value
+        case StringLiteral(value=value):
+            return value
+        case UnaryOp(op="-", operand=IntLiteral(value=value)):
+            return -value
+        case _:
+            return None
+
+
+def array_elements(
+    meta: Any, members: list[ArrayElement]
+) -> ArrayElements | ConstantArrayElements:
+    """
+    Node for the elements of an array literal. Both front ends build array
+    elements through this, so that they produce identical trees.
+    """
+    values: list[ConstantValue] = []
+    for mem in members:
+        value = constant_value(mem.element)
+        if value is None or (values and type(value) is not type(values[0])):
+            return ArrayElements(meta, members)
+        values.append(value)
 
-@dataclass
+    return ConstantArrayElements(meta, values)
+
+
+@dataclass(slots=True)
 class ArrayLiteral(Expression):
     declared_type: Optional[TypeAnnotation]
-    members: Optional[ArrayElements]
+    members: Optional[ArrayElements | ConstantArrayElements]
 
     @override
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
-        inferred_type = self.members.typecheck(env) if self.members else None
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[langtypes.Type]:
+        inferred_type = (
+            (yield self.members.typecheck_steps(env)) if self.members else None
+        )
         declared_type = None
         if self.declared_type:
-            declared_type = self.declared_type.typecheck(env)
+            declared_type = yield self.declared_type.typecheck_steps(env)
 
         match (declared_type, inferred_type):
             case (None, None):
@@ -71,11 +150,11 @@ class ArrayLiteral(Expression):
                     span=self.span,
                 )
             case (None, infer) if infer is not None:
-                self.type = langtypes.Array(infer)
+                type = langtypes.Array(infer)
             case (decl, None) if decl is not None:
-                self.type = langtypes.Array(decl)
+                type = langtypes.Array(decl)
             case (decl, infer) if decl == infer and decl is not None:
-                self.type = langtypes.Array(decl)
+                type = langtypes.Array(decl)
             case _:
                 assert self.members
                 assert declared_type
@@ -89,22 +168,27 @@ class ArrayLiteral(Expression):
                     actual_type=inferred_type,
                     expected_type_span=self.declared_type.span,
                 )
-        return self.type
+        self.type = type
+        return type
 
     @override
     def eval(self, env: RuntimeEnvironment) -> Any:
         return self.members.eval(env) if self.members else []
 
+    @override
+    def eval_steps(self, env: RuntimeEnvironment) -> Steps[Any] | list[Any]:
+        return self.members.eval_steps(env) if self.members else []
 
-@dataclass
+
+@dataclass(slots=True)
 class Indexing(Expression):
     element: Expression
     index: Expression
 
     @override
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
-        array_type = self.element.typecheck(env)
-        index_type = self.index.typecheck(env)
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[langtypes.Type]:
+        array_type: langtypes.Type = yield self.element.typecheck_steps(env)
+        index_type: langtypes.Type = yield self.index.typecheck_steps(env)
         if not isinstance(array_type, langtypes.Array):
             raise errors.IndexingNonArray(
                 message="indexing non array",
@@ -119,8 +203,14 @@ class Indexing(Expression):
 
     @override
     def eval(self, env: RuntimeEnvironment) -> Any:
-        element_value = self.element.eval(env)
-        array_ind = self.index.eval(env)
+        return self.index_value(self.element.eval(env), self.index.eval(env))
+
+    @override
+    def eval_steps(self, env: RuntimeEnvironment) -> Steps[Any]:
+        element_value = yield self.element.eval_steps(env)
+        return self.index_value(element_value, (yield self.index.eval_steps(env)))
+
+    def index_value(self, element_value: Any, array_ind: Any) -> Any:
         if len(element_value) <= array_ind:
             raise errors.IndexingOutOfRange(
                 message="Indexing out of range",
@@ -132,17 +222,17 @@ class Indexing(Expression):
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexAssignment(Statement):
     arrayname: Variable
     index: Expression
     value: Expression
 
     @override
-    def typecheck(self, env: TypeEnvironment):
-        index_type = self.index.typecheck(env)
-        type = self.arrayname.typecheck(env)
-        value_type = self.value.typecheck(env)
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[None]:
+        index_type: langtypes.Type = yield self.index.typecheck_steps(env)
+        type: langtypes.Type = yield self.arrayname.typecheck_steps(env)
+        value_type: langtypes.Type = yield self.value.typecheck_steps(env)
         if not isinstance(type, langtypes.Array):
             raise errors.IndexingNonArray(
                 message="indexing non array",
@@ -168,3 +258,10 @@ class IndexAssignment(Statement):
         array_value = self.value.eval(env)
         array_index = self.index.eval(env)
         array_name[array_index] = array_value
+
+    @override
+    def eval_steps(self, env: RuntimeEnvironment) -> Steps[None]:
+        array_name = self.arrayname.eval(env)
+        array_value = yield self.value.eval_steps(env)
+        array_index = yield self.index.eval_steps(env)
+        array_name[array_index] = array_value
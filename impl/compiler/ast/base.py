@@ -1,32 +1,208 @@
-from typing import Any
+import functools
+import sys
+from types import GeneratorType
+from typing import TYPE_CHECKING, Any, Generator, Optional, TypeVar
 import typing
 import dataclasses
 from dataclasses import dataclass
 
-from compiler.lalr import Meta as LarkMeta
+from compiler.lalr import Meta as LarkMeta, Token
 
 
 from compiler import errors
 
+if TYPE_CHECKING:
+    from compiler.env import RuntimeEnvironment, TypeEnvironment
+
 SKIP_SERIALIZE = "skip_serialize"
 AstDict = dict[typing.Type["Ast"], dict[str, Any]]
 
+T = TypeVar("T")
+
+Steps = Generator[Any, Any, T]
+"""
+A pass over a subtree, written as a generator so that it can run on an
+explicit stack instead of the Python call stack (see `walk`). Instead of
+calling the pass on a child node, it yields the steps of the child and is
+sent back their result:
+
+    left_type: langtypes.Type = yield self.left.typecheck_steps(env)
+
+The result sent back depends on the child, so it is typed as Any and passes
+annotate the variable that receives it.
+
+Nodes without children can return their result directly instead of a
+generator.
+"""
+
+
+def walk(steps: Steps[T] | T) -> T:
+    """
+    Run steps to completion and return their result. The steps of child
+    nodes are kept on a worklist, so the depth of the tree is not bounded by
+    the recursion limit. Exceptions propagate to the parent steps as if the
+    children had been called directly.
+    """
+    if not isinstance(steps, GeneratorType):
+        return steps  # type: ignore
+
+    stack: list[Steps[Any]] = [steps]
+    result: Any = None
+    error: Optional[BaseException] = None
+
+    while True:
+        top = stack[-1]
+        try:
+            if error is None:
+                child = top.send(result)
+            else:
+                exc, error = error, None
+                child = top.throw(exc)
+        except StopIteration as stop:
+            stack.pop()
+            if not stack:
+                return stop.value
+            result = stop.value
+        except BaseException as exc:
+            stack.pop()
+            if not stack:
+                raise
+            error = exc
+        else:
+            if isinstance(child, GeneratorType):
+                stack.append(child)  # type: ignore
+                result = None
+            else:
+                result = child
+
+
+def token_span() -> Any:
+    """
+    Field holding the span of an identifier or operator, for the nodes that
+    report errors at it. The front ends either pass it explicitly or pass
+    the lark token, from which the node takes the span in `__post_init__`
+    before the token is replaced by a string. Nodes built from a plain string
+    without a span have None, and report errors at their own span instead.
+    """
+    return dataclasses.field(
+        default=None, kw_only=True, metadata={SKIP_SERIALIZE: True}
+    )
+
+
+def resolved() -> Any:
+    """
+    Field set during typechecking with where a variable lives at runtime, as
+    returned by `TypeEnvironment.resolve`, or with the layout of a frame.
+    """
+    return dataclasses.field(
+        default=None,
+        kw_only=True,
+        compare=False,
+        repr=False,
+        metadata={SKIP_SERIALIZE: True},
+    )
+
 
-@dataclass
+@functools.cache
+def field_names(cls: typing.Type["Ast"]) -> tuple[str, ...]:
+    """
+    Names of the fields of an AST class. Nodes are slotted, so this takes the
+    place of `vars(node)`.
+    """
+    return tuple(field.name for field in dataclasses.fields(cls))
+
+
+@dataclass(slots=True)
 class Ast:
     # InitVar makes meta available on the __post_init__ method
     # and excludes it in the generated __init__.
-    meta: dataclasses.InitVar[LarkMeta]
-    """Line and column numbers from lark framework.
+    meta: dataclasses.InitVar[LarkMeta | errors.Span]
+    """Line and column numbers from lark framework (or a ready made Span).
     Converted to Span for strorage within the class."""
 
     span: errors.Span = dataclasses.field(init=False, metadata={SKIP_SERIALIZE: True})
     """Line and column number information."""
 
-    def __post_init__(self, meta: LarkMeta):
+    type: Any = dataclasses.field(
+        default=None,
+        kw_only=True,
+        compare=False,
+        repr=False,
+        metadata={SKIP_SERIALIZE: True},
+    )
+    """Type assigned during typechecking to nodes that are not expressions,
+    like annotations and patterns. Expressions redeclare it as a regular
+    field."""
+
+    def __post_init__(self, meta: LarkMeta | errors.Span):
         self.span = errors.Span.from_meta(meta)
 
+        # Identifiers and operators are stored as interned strings: lark
+        # tokens carry their own positions and compare through a Python
+        # level __eq__, which makes every environment lookup slower.
+        for name in field_names(type(self)):
+            if type(value := getattr(self, name)) is Token:
+                setattr(self, name, sys.intern(str(value)))
+
+    def typecheck(self, env: "TypeEnvironment") -> Any:
+        """
+        Typecheck the subtree rooted at this node, returning the type of the
+        node (if it has one).
+        """
+        return walk(self.typecheck_steps(env))
+
+    def typecheck_steps(self, env: "TypeEnvironment") -> Steps[Any] | Any:
+        """
+        Same as `typecheck`, but running on the explicit stack of `walk`.
+        """
+        raise NotImplementedError(f"{type(self).__name__} cannot be typechecked")
+
+    def recovering_steps(
+        self, env: "TypeEnvironment", steps: Optional[Steps[Any]] = None
+    ) -> Steps[None]:
+        """
+        Typecheck the node (or run steps in its place) as an entry of a
+        statement list, in an env with diagnostics. A type error is recorded
+        there instead of raised, and the names the node defines are poisoned.
+        Errors raised after a poisoned name was looked up are caused by an
+        earlier one and are dropped, other exceptions are raised as usual.
+        """
+        diagnostics = env.diagnostics
+        assert diagnostics is not None
+        poisoned = diagnostics.poisoned
+
+        try:
+            yield self.typecheck_steps(env) if steps is None else steps
+        except errors.CompilerError as err:
+            if diagnostics.poisoned == poisoned:
+                diagnostics.add(err)
+            self.poison(env)
+        except Exception:
+            if diagnostics.poisoned == poisoned:
+                raise
+            self.poison(env)
+        finally:
+            # Statements do not pass types on to the one enclosing them
+            diagnostics.poisoned = poisoned
+
+    def poison(self, env: "TypeEnvironment"):
+        """
+        Define the names the node would have defined with the poison type,
+        after it failed to typecheck. Expressions define none.
+        """
+
+    def eval_steps(self, env: "RuntimeEnvironment") -> Steps[Any] | Any:
+        """
+        Same as `eval`, but running on the explicit stack of `walk`, so that
+        the depth of recursion in Ryu programs is only bounded by memory.
+        Nodes whose children cannot call functions evaluate directly.
+        """
+        return self.eval(env)  # type: ignore
+
     def to_dict(self) -> AstDict:
+        return walk(self.to_dict_steps())
+
+    def to_dict_steps(self) -> Steps[AstDict]:
         attrs: dict[str, Any] = {}
 
         for field in dataclasses.fields(self):
@@ -35,21 +211,27 @@ class Ast:
 
             value = getattr(self, field.name)
             if isinstance(value, Ast):
-                attrs[field.name] = value.to_dict()
+                attrs[field.name] = yield value.to_dict_steps()
             elif isinstance(value, list):
                 match value:
                     case []:
                         attrs[field.name] = []
                     case [Ast(), *_]:  # type: ignore
-                        attrs[field.name] = [v.to_dict() for v in value]  # type: ignore
+                        items: list[AstDict] = []
+                        for v in value:  # type: ignore
+                            items.append((yield v.to_dict_steps()))  # type: ignore
+                        attrs[field.name] = items
                     case _:  # type: ignore
-                        pass
+                        attrs[field.name] = value
             elif value is not None:
                 attrs[field.name] = value
 
         return {type(self): attrs}
 
     def to_type_dict(self) -> dict[Any, Any]:
+        return walk(self.to_type_dict_steps())
+
+    def to_type_dict_steps(self) -> Steps[dict[Any, Any]]:
         attrs = {}
 
         if ty := getattr(self, "type", None):
@@ -63,13 +245,16 @@ class Ast:
 
             value = getattr(self, field.name)
             if isinstance(value, Ast):
-                fields[field.name] = value.to_type_dict()
+                fields[field.name] = yield value.to_type_dict_steps()
             elif isinstance(value, list):
                 match value:
                     case []:
                         fields[field.name] = []
                     case [Ast(), *_]:  # type: ignore
-                        fields[field.name] = [v.to_type_dict() for v in value]  # type: ignore
+                        items: list[dict[Any, Any]] = []
+                        for v in value:  # type: ignore
+                            items.append((yield v.to_type_dict_steps()))  # type: ignore
+                        fields[field.name] = items
                     case _:  # type: ignore
                         pass
 
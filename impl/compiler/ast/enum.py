@@ -1,38 +1,42 @@
 from dataclasses import dataclass
+from typing import Any, Optional
 from typing_extensions import override
 
 from compiler import errors, langtypes, langvalues
 from compiler.ast.annotation import TypeAnnotation
-from compiler.ast.base import Ast
+from compiler.ast.base import Ast, Steps, token_span
+from compiler.lalr import Token
 from compiler.ast.expressions import Expression
 from compiler.ast.statements import Statement
 from compiler.env import RuntimeEnvironment, TypeEnvironment
-from compiler.lalr import Token
 
 
-@dataclass
+@dataclass(slots=True)
 class EnumMemberBare(Ast):
-    name: Token
+    name: str
 
-    def typecheck(self, env: TypeEnvironment):
+    @override
+    def typecheck_steps(self, env: TypeEnvironment) -> None:
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class EnumMemberTuple(Ast):
-    name: Token
+    name: str
     tuple_members: TypeAnnotation
 
-    def typecheck(self, env: TypeEnvironment):
-        self.tuple_members.typecheck(env)
+    @override
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[None]:
+        yield self.tuple_members.typecheck_steps(env)
 
 
-@dataclass
+@dataclass(slots=True)
 class EnumMembers(Ast):
     members: list[EnumMemberBare | EnumMemberTuple]
 
-    def typecheck(self, env: TypeEnvironment):
-        seen: dict[Token, EnumMemberBare | EnumMemberTuple] = {}
+    @override
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[None]:
+        seen: dict[str, EnumMemberBare | EnumMemberTuple] = {}
         for member in self.members:
             if member.name in seen:
                 raise errors.DuplicatedAttribute(
@@ -41,7 +45,7 @@ class EnumMembers(Ast):
                     previous_case_span=seen[member.name].span,
                 )
             seen[member.name] = member
-            member.typecheck(env)
+            yield member.typecheck_steps(env)
 
     def members_as_list(
         self,
@@ -64,28 +68,40 @@ class EnumMembers(Ast):
         return members
 
 
-@dataclass
+@dataclass(slots=True)
 class EnumStmt(Statement):
-    name: Token
+    name: str
     members: EnumMembers
+    name_span: Optional[errors.Span] = token_span()
+
+    def __post_init__(self, meta: Any):
+        if self.name_span is None and isinstance(self.name, Token):
+            self.name_span = errors.Span.from_token(self.name)
+        super(EnumStmt, self).__post_init__(meta)
 
     @override
-    def typecheck(self, env: TypeEnvironment):
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[None]:
         if isinstance(existing_type := env.get_type(self.name), langtypes.Enum):
             raise errors.TypeRedefinition(
                 message="Enum is redefined",
                 type_name=self.name,
-                span=errors.Span.from_token(self.name),  # Use the current span
+                span=self.name_span or self.span,  # Use the current span
                 previous_type_span=existing_type.span,  # Use the stored span
             )
-        self.members.typecheck(env)
+        yield self.members.typecheck_steps(env)
         ty = langtypes.Enum(
             enum_name=self.name,
             members=self.members.members_as_list(),
-            span=errors.Span.from_token(self.name),
+            span=self.name_span,
         )
         env.define_type(self.name, ty)
 
+    @override
+    def poison(self, env: TypeEnvironment):
+        # A redefinition keeps the first definition
+        if env.get_type(self.name) is None:
+            env.define_type(self.name, langtypes.POISON)
+
     @override
     def eval(self, env: RuntimeEnvironment):
         # Nothing to execute since enum statements are simply declarations
@@ -95,13 +111,13 @@ class EnumStmt(Statement):
 # =============================== Literals ================================
 
 
-@dataclass
+@dataclass(slots=True)
 class EnumLiteralSimple(Expression):
-    enum_type: Token
-    variant: Token
+    enum_type: str
+    variant: str
 
     @override
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
+    def typecheck_steps(self, env: TypeEnvironment) -> langtypes.Type:
         self.type = env.get_type(self.enum_type)
         if self.type is None:
             raise  # TODO
@@ -113,14 +129,14 @@ class EnumLiteralSimple(Expression):
         return langvalues.EnumValue(ty=self.enum_type, variant=self.variant)
 
 
-@dataclass
+@dataclass(slots=True)
 class EnumLiteralTuple(Expression):
-    enum_type: Token
-    variant: Token
+    enum_type: str
+    variant: str
     inner: Expression
 
     @override
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[langtypes.Type]:
         self.type = env.get_type(self.enum_type)
         if self.type is None:
             raise  # TODO
@@ -128,7 +144,7 @@ class EnumLiteralTuple(Expression):
         if not isinstance(self.type, langtypes.Enum):
             raise  # TODO
 
-        inner_type = self.inner.typecheck(env)
+        inner_type: langtypes.Type = yield self.inner.typecheck_steps(env)
         variant_type = self.type.variant_from_str(self.variant)
         if not isinstance(variant_type, langtypes.Enum.Tuple):
             raise  # TODO
@@ -145,3 +161,11 @@ class EnumLiteralTuple(Expression):
             variant=self.variant,
             tuple_value=self.inner.eval(env),
         )
+
+    @override
+    def eval_steps(self, env: RuntimeEnvironment) -> Steps[langvalues.EnumTupleValue]:
+        return langvalues.EnumTupleValue(
+            ty=self.enum_type,
+            variant=self.variant,
+            tuple_value=(yield self.inner.eval_steps(env)),
+        )
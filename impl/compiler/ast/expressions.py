@@ -3,12 +3,14 @@ import dataclasses
 from dataclasses import dataclass
 from typing import Any
 
+from typing_extensions import override
+
 from compiler import langtypes
-from compiler.ast.base import Ast
+from compiler.ast.base import Ast, Steps
 from compiler.env import RuntimeEnvironment, TypeEnvironment
 
 
-@dataclass
+@dataclass(slots=True)
 class Expression(Ast):
     # kw_only is required to make dataclasses play nice with inheritance and
     # fields with default values. https://stackoverflow.com/a/69822584/7115678
@@ -17,8 +19,11 @@ class Expression(Ast):
         kw_only=True,
     )
 
+    @override
     @abc.abstractmethod
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
+    def typecheck_steps(
+        self, env: TypeEnvironment
+    ) -> Steps[langtypes.Type] | langtypes.Type:
         pass
 
     @abc.abstractmethod
@@ -2,33 +2,36 @@ from dataclasses import dataclass
 from typing import Any, Optional
 from typing_extensions import override
 
-from compiler import langtypes, langvalues, runtime
+from compiler import errors, langtypes, langvalues, runtime
 from compiler.ast.annotation import TypeAnnotation
-from compiler.ast.base import Ast
+from compiler.ast.base import Ast, Steps, resolved
 from compiler.ast.expressions import Expression
 from compiler.ast.statements import Statement, StatementBlock
 from compiler.ast.struct import StructInitMembers
 from compiler.ast.variable import Variable
 from compiler.env import FunctionDefScope, RuntimeEnvironment, TypeEnvironment
-from compiler.lalr import Token
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionParam(Ast):
-    name: Token
+    name: str
     arg_type: TypeAnnotation
 
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
-        self.type = self.arg_type.typecheck(env)
+    @override
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[langtypes.Type]:
+        self.type = yield self.arg_type.typecheck_steps(env)
         return self.type
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionParams(Ast):
     args: list[FunctionParam]
 
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Function.Params:
-        types = [arg.typecheck(env) for arg in self.args]
+    @override
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[langtypes.Function.Params]:
+        types: list[langtypes.Type] = []
+        for arg in self.args:
+            types.append((yield arg.typecheck_steps(env)))
         self.type = langtypes.Function.Params(types)
         return self.type
 
@@ -36,27 +39,59 @@ class FunctionParams(Ast):
         return [param.name for param in self.args]
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionDefinition(Statement):
-    name: Token
+    name: str
     args: Optional[FunctionParams]
     return_type: TypeAnnotation
     body: StatementBlock
 
+    slot: Optional[int] = resolved()
+    param_slots: list[int] = resolved()
+    """Slots of the parameters in the frame of a call. The function itself is
+    in slot 0, so that its body can call it."""
+    frame_size: int = resolved()
+    reuse_frame: bool = resolved()
+
     @override
-    def typecheck(self, env: TypeEnvironment):
-        ret_type = self.return_type.typecheck(env)
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[None]:
+        type: langtypes.Function = yield self.signature_steps(env)
+        yield self.body_steps(env, type)
+        env.define_var_type(self.name, type)
+        if env.layout is not None:
+            env.layout.captured = True
+        _, self.slot = env.resolve(self.name)
+
+    @override
+    def poison(self, env: TypeEnvironment):
+        env.define_var_type(self.name, langtypes.POISON)
+
+    def signature_steps(self, env: TypeEnvironment) -> Steps[langtypes.Function]:
+        """
+        Typecheck the parameters and return type, without looking at the body.
+        """
+        ret_type: langtypes.Type = yield self.return_type.typecheck_steps(env)
         params = (
-            self.args.typecheck(env) if self.args else langtypes.Function.Params([])
+            (yield self.args.typecheck_steps(env))
+            if self.args
+            else langtypes.Function.Params([])
         )
 
-        type = langtypes.Function(
+        return langtypes.Function(
             function_name=self.name,
             arguments=params,
             return_type=ret_type,
         )
 
-        body_env = TypeEnvironment(enclosing=env, fn_scope=FunctionDefScope(ret_type))
+    def body_steps(self, env: TypeEnvironment, type: langtypes.Function) -> Steps[None]:
+        """
+        Typecheck the body in the scope of env, given the type returned by
+        `signature_steps`. The function is only visible to its own body, it is
+        up to the caller to define it in env.
+        """
+        body_env = TypeEnvironment(
+            enclosing=env, fn_scope=FunctionDefScope(type.return_type), frame=True
+        )
         body_env.define_var_type(self.name, type)
 
         if self.args:
@@ -64,46 +99,85 @@ class FunctionDefinition(Statement):
                 assert arg.type is not None
                 body_env.define_var_type(arg.name, arg.type)
 
-        self.body.typecheck(body_env)
+        slots = body_env.slots
+        assert slots is not None
+        param_names = self.args.param_names() if self.args else []
+        self.param_slots = [slots[name] for name in param_names]
 
-        env.define_var_type(self.name, type)
+        yield self.body.typecheck_steps(body_env)
+        # the blocks of the body have their variables in the same frame
+        layout = body_env.layout
+        assert layout is not None
+        self.frame_size = layout.size
+        self.reuse_frame = not layout.captured
 
     @override
     def eval(self, env: RuntimeEnvironment) -> Any:
-        param_names = self.args.param_names() if self.args else []
-        env.define(self.name, langvalues.RyuFunction(param_names, self.body))
+        fn = langvalues.RyuFunction(
+            self.param_slots,
+            self.frame_size,
+            self.body,
+            closure=env,
+            reuse_frame=self.reuse_frame,
+        )
+        if self.slot is None:
+            env.define(self.name, fn)
+        else:
+            env.slots[self.slot] = fn
 
 
-@dataclass
+@dataclass(slots=True)
 class ReturnStmt(Statement):
     return_value: Expression
 
     @override
-    def typecheck(self, env: TypeEnvironment):
-        return_type = self.return_value.typecheck(env)
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[None]:
+        return_type: langtypes.Type = yield self.return_value.typecheck_steps(env)
         if return_type != env.fn_return_type():
             raise  # TODO
 
     @override
-    def eval(self, env: RuntimeEnvironment):
-        value = self.return_value.eval(env)
-        raise runtime.FunctionReturn(value)
+    def eval(self, env: RuntimeEnvironment) -> runtime.Return:
+        return runtime.Return(self.return_value.eval(env))
+
+    @override
+    def eval_steps(self, env: RuntimeEnvironment) -> Steps[runtime.Completion]:
+        call = self.return_value
+        if isinstance(call, FunctionCall) and call.is_fn:
+            # a call in tail position is left to the caller of the function
+            fn = call.callee.eval(env)
+            args = yield call.args_steps(env)
+            if isinstance(fn, langvalues.RyuFunction):
+                return runtime.TailCall(fn, args)
+            return runtime.Return((yield fn.call_steps(args, env)))
 
+        return runtime.Return((yield call.eval_steps(env)))
 
-@dataclass
+
+@dataclass(slots=True)
 class FunctionArgs(Ast):
     args: list[Expression]
 
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Function.Params:
-        types = [arg.typecheck(env) for arg in self.args]
+    @override
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[langtypes.Function.Params]:
+        types: list[langtypes.Type] = []
+        for arg in self.args:
+            types.append((yield arg.typecheck_steps(env)))
         self.type = langtypes.Function.Params(types)
         return self.type
 
     def eval(self, env: RuntimeEnvironment) -> list[Any]:
         return [arg.eval(env) for arg in self.args]
 
+    @override
+    def eval_steps(self, env: RuntimeEnvironment) -> Steps[list[Any]]:
+        values: list[Any] = []
+        for arg in self.args:
+            values.append((yield arg.eval_steps(env)))
+        return values
+
 
-@dataclass
+@dataclass(slots=True)
 class FunctionCall(Expression):  # TODO: rename to FunctionCallOrStructInit
     callee: Variable
     args: Optional[FunctionArgs | StructInitMembers]
@@ -111,7 +185,7 @@ class FunctionCall(Expression):  # TODO: rename to FunctionCallOrStructInit
     is_fn: bool | None = None
 
     @override
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[langtypes.Type]:
         self.callee.type = ctype = env.get_var_type(self.callee.value) or env.get_type(
             self.callee.value
         )
@@ -119,10 +193,19 @@ class FunctionCall(Expression):  # TODO: rename to FunctionCallOrStructInit
         match (ctype, args):
             case (langtypes.Function(), FunctionArgs() | None):
                 self.is_fn = True
-                return self.typecheck_function_call(ctype, args, env)
+                callee = self.callee
+                callee.depth, callee.slot = env.resolve(callee.value)
+                return (yield from self.typecheck_function_call(ctype, args, env))
             case (langtypes.Struct(), StructInitMembers() | None):
                 self.is_fn = False
-                return self.typecheck_struct_init(ctype, args, env)
+                return (yield from self.typecheck_struct_init(ctype, args, env))
+            case (None, _):
+                name = self.callee.value
+                raise errors.UnknownVariable(
+                    message=f"Variable '{name}' not declared in this scope",
+                    span=self.callee.span,
+                    variable=name,
+                )
             case _:
                 raise  # TODO
 
@@ -131,9 +214,9 @@ class FunctionCall(Expression):  # TODO: rename to FunctionCallOrStructInit
         ty: langtypes.Function,
         args: Optional[FunctionArgs],
         env: TypeEnvironment,
-    ):
+    ) -> Steps[langtypes.Type]:
         if args:
-            args_type = args.typecheck(env)
+            args_type: langtypes.Function.Params = yield args.typecheck_steps(env)
         else:
             args_type = langtypes.Function.Params([])
 
@@ -146,16 +229,16 @@ class FunctionCall(Expression):  # TODO: rename to FunctionCallOrStructInit
             raise  # TODO type mismatch
 
         self.type = ty.return_type
-        return self.type
+        return ty.return_type
 
     def typecheck_struct_init(
         self,
         ty: langtypes.Struct,
         members: Optional[StructInitMembers],
         env: TypeEnvironment,
-    ):
+    ) -> Steps[langtypes.Struct]:
         if members:
-            members_type = members.typecheck(env)
+            members_type: langtypes.Struct.Members = yield members.typecheck_steps(env)
         else:
             members_type = langtypes.Struct.Members({})
 
@@ -168,7 +251,7 @@ class FunctionCall(Expression):  # TODO: rename to FunctionCallOrStructInit
             raise  # TODO type mismatch
 
         self.type = ty
-        return self.type
+        return ty
 
     @override
     def eval(self, env: RuntimeEnvironment) -> Any:
@@ -187,6 +270,23 @@ class FunctionCall(Expression):  # TODO: rename to FunctionCallOrStructInit
 
         return fn.call(args, env)
 
+    @override
+    def eval_steps(self, env: RuntimeEnvironment) -> Steps[Any]:
+        if self.is_fn is True:
+            fn = self.callee.eval(env)
+            args = yield self.args_steps(env)
+            return (yield fn.call_steps(args, env))
+        elif self.is_fn is False:
+            assert isinstance(self.type, langtypes.Struct)
+            attrs = yield self.args.eval_steps(env) if self.args else {}
+            return langvalues.StructValue(name=self.type.struct_name, attrs=attrs)
+        else:
+            assert False
+
+    def args_steps(self, env: RuntimeEnvironment) -> Steps[list[Any]] | list[Any]:
+        assert not isinstance(self.args, StructInitMembers)
+        return self.args.eval_steps(env) if self.args else []
+
     def eval_struct_init(self, env: RuntimeEnvironment) -> langvalues.StructValue:
         assert isinstance(self.args, StructInitMembers)
         assert isinstance(self.type, langtypes.Struct)
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Optional
 from compiler import errors, langtypes
 from compiler.ast.expressions import Expression
 from compiler.ast.statements import Statement, StatementBlock
@@ -8,16 +8,17 @@ from compiler.env import RuntimeEnvironment, TypeEnvironment
 from dataclasses import dataclass
 from typing_extensions import override
 
-from compiler.ast.base import Ast
+from compiler.ast.base import Ast, Steps
 
 
-@dataclass
+@dataclass(slots=True)
 class IfStmt(Ast):
     cond: Expression
     true_block: StatementBlock
 
-    def typecheck(self, env: TypeEnvironment):
-        expr_type = self.cond.typecheck(env)
+    @override
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[None]:
+        expr_type: langtypes.Type = yield self.cond.typecheck_steps(env)
         if expr_type != langtypes.BOOL:
             raise errors.UnexpectedType(
                 message="Unexpected type for if condition",
@@ -26,63 +27,62 @@ class IfStmt(Ast):
                 actual_type=expr_type,
             )
 
-        self.true_block.typecheck(env)
-
-    def eval(self, env: RuntimeEnvironment) -> bool:
-        if self.cond.eval(env) is True:
-            self.true_block.eval(env)
-            return True
-
-        return False
+        yield self.true_block.typecheck_steps(env)
 
 
-@dataclass
+@dataclass(slots=True)
 class IfChain(Statement):
     if_stmt: IfStmt
     else_if_ladder: Optional["ElseIfLadder"]
     else_block: Optional[StatementBlock]
 
     @override
-    def typecheck(self, env: TypeEnvironment):
-        self.if_stmt.typecheck(env)
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[None]:
+        yield self.if_stmt.typecheck_steps(env)
         if self.else_block:
-            self.else_block.typecheck(env)
+            yield self.else_block.typecheck_steps(env)
+        if self.else_if_ladder:
+            yield self.else_if_ladder.typecheck_steps(env)
+
+    @override
+    def eval(self, env: RuntimeEnvironment) -> Any:
+        # only the first block whose condition is true runs, and its
+        # completion is the one of the if-chain
+        if self.if_stmt.cond.eval(env) is True:
+            return self.if_stmt.true_block.eval(env)
+
         if self.else_if_ladder:
-            self.else_if_ladder.typecheck(env)
+            for block in self.else_if_ladder.blocks:
+                if block.cond.eval(env) is True:
+                    return block.true_block.eval(env)
+
+        if self.else_block:
+            return self.else_block.eval(env)
 
     @override
-    def eval(self, env: RuntimeEnvironment):
-        if self.if_stmt.eval(env):
-            # if condition evaluates to true, stop the if-chain
-            return
+    def eval_steps(self, env: RuntimeEnvironment) -> Steps[Any]:
+        if (yield self.if_stmt.cond.eval_steps(env)) is True:
+            return (yield self.if_stmt.true_block.eval_steps(env))
 
         if self.else_if_ladder:
-            if self.else_if_ladder.eval(env) is True:
-                # one of the else-if blocks executed, stop the if-chain
-                return
+            for block in self.else_if_ladder.blocks:
+                if (yield block.cond.eval_steps(env)) is True:
+                    return (yield block.true_block.eval_steps(env))
 
         if self.else_block:
-            self.else_block.eval(env)
+            return (yield self.else_block.eval_steps(env))
 
 
-@dataclass
+@dataclass(slots=True)
 class ElseIfStmt(IfStmt):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class ElseIfLadder(Ast):
     blocks: list[ElseIfStmt]
 
-    def typecheck(self, env: TypeEnvironment):
-        for block in self.blocks:
-            block.typecheck(env)
-
-    def eval(self, env: RuntimeEnvironment) -> bool:
-        """
-        Returns True if any of the else if blocks execute.
-        """
+    @override
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[None]:
         for block in self.blocks:
-            if block.eval(env) is True:
-                return True
-        return False
+            yield block.typecheck_steps(env)
@@ -7,12 +7,12 @@ from compiler.ast.expressions import Expression
 from compiler.env import RuntimeEnvironment, TypeEnvironment
 
 
-@dataclass
+@dataclass(slots=True)
 class BoolLiteral(Expression):
     value: bool
 
     @override
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
+    def typecheck_steps(self, env: TypeEnvironment) -> langtypes.Type:
         self.type = langtypes.BOOL
         return self.type
 
@@ -21,12 +21,12 @@ class BoolLiteral(Expression):
         return self.value
 
 
-@dataclass
+@dataclass(slots=True)
 class IntLiteral(Expression):
     value: int
 
     @override
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
+    def typecheck_steps(self, env: TypeEnvironment) -> langtypes.Type:
         self.type = langtypes.INT
         return self.type
 
@@ -35,12 +35,12 @@ class IntLiteral(Expression):
         return self.value
 
 
-@dataclass
+@dataclass(slots=True)
 class StringLiteral(Expression):
     value: str
 
     @override
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
+    def typecheck_steps(self, env: TypeEnvironment) -> langtypes.Type:
         self.type = langtypes.STRING
         return self.type
 
@@ -1,21 +1,36 @@
 from dataclasses import dataclass
+from typing import Any, Optional
 from typing_extensions import override
 
 from compiler import errors, langtypes
+from compiler.ast.base import Steps, resolved
 from compiler.ast.expressions import Expression
 from compiler.ast.statements import Statement, StatementBlock
 from compiler.env import RuntimeEnvironment, TypeEnvironment
-from compiler.lalr import Token
+from compiler.runtime import Completion
 
 
-@dataclass
+def _loop_frame(env: RuntimeEnvironment, size: Optional[int]) -> RuntimeEnvironment:
+    """
+    Frame of a loop, allocated once for all of its iterations.
+    """
+    if size is None:
+        return env
+    return RuntimeEnvironment(env, size=size)
+
+
+@dataclass(slots=True)
 class WhileStmt(Statement):
     cond: Expression
     true_block: StatementBlock
 
+    frame_size: Optional[int] = resolved()
+    """The frame of the loop, allocated once for all the iterations, or None
+    when it runs in the frame of the enclosing scope."""
+
     @override
-    def typecheck(self, env: TypeEnvironment):
-        expr_type = self.cond.typecheck(env)
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[None]:
+        expr_type: langtypes.Type = yield self.cond.typecheck_steps(env)
         if expr_type != langtypes.BOOL:
             raise errors.UnexpectedType(
                 message="Unexpected type for while condition",
@@ -24,23 +39,38 @@ class WhileStmt(Statement):
                 actual_type=expr_type,
             )
 
-        self.true_block.typecheck(env)
+        loop_env = TypeEnvironment(enclosing=env, block=True)
+        yield self.true_block.typecheck_steps(loop_env)
+        self.frame_size = loop_env.frame_size()
 
     @override
-    def eval(self, env: RuntimeEnvironment):
+    def eval(self, env: RuntimeEnvironment) -> Optional[Completion]:
+        loop_env = _loop_frame(env, self.frame_size)
         while self.cond.eval(env) is True:
-            self.true_block.eval(env)
+            if isinstance(completion := self.true_block.eval(loop_env), Completion):
+                return completion
 
+    @override
+    def eval_steps(self, env: RuntimeEnvironment) -> Steps[Any]:
+        loop_env = _loop_frame(env, self.frame_size)
+        while (yield self.cond.eval_steps(env)) is True:
+            completion = yield self.true_block.eval_steps(loop_env)
+            if isinstance(completion, Completion):
+                return completion
 
-@dataclass
+
+@dataclass(slots=True)
 class ForStmt(Statement):
-    var: Token
+    var: str
     arr_name: Expression
     stmts: StatementBlock
 
+    slot: int = resolved()
+    frame_size: Optional[int] = resolved()
+
     @override
-    def typecheck(self, env: TypeEnvironment):
-        array_type = self.arr_name.typecheck(env)
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[None]:
+        array_type: langtypes.Type = yield self.arr_name.typecheck_steps(env)
         if not isinstance(array_type, langtypes.Array) and not isinstance(
             array_type, langtypes.String
         ):
@@ -51,46 +81,81 @@ class ForStmt(Statement):
                 actual_type=array_type,
             )
 
-        child_env = TypeEnvironment(enclosing=env)
+        child_env = TypeEnvironment(enclosing=env, block=True)
         child_env.define_var_type(self.var, array_type)
+        _, self.slot = child_env.resolve(self.var)  # type: ignore
 
-        self.stmts.typecheck(child_env)
+        yield self.stmts.typecheck_steps(child_env)
+        self.frame_size = child_env.frame_size()
 
     @override
-    def eval(self, env: RuntimeEnvironment):
+    def eval(self, env: RuntimeEnvironment) -> Optional[Completion]:
         arr = self.arr_name.eval(env)
+        loop_env = _loop_frame(env, self.frame_size)
+        slots, slot = loop_env.slots, self.slot
         for element in arr:
-            loop_env = RuntimeEnvironment(env)
-            loop_env.define(self.var, element)
-            self.stmts.eval(loop_env)
+            # every iteration reuses the same frame
+            slots[slot] = element
+            if isinstance(completion := self.stmts.eval(loop_env), Completion):
+                return completion
+
+    @override
+    def eval_steps(self, env: RuntimeEnvironment) -> Steps[Any]:
+        arr = yield self.arr_name.eval_steps(env)
+        loop_env = _loop_frame(env, self.frame_size)
+        slots, slot = loop_env.slots, self.slot
+        for element in arr:
+            slots[slot] = element
+            completion = yield self.stmts.eval_steps(loop_env)
+            if isinstance(completion, Completion):
+                return completion
 
 
-@dataclass
+@dataclass(slots=True)
 class ForStmtInt(Statement):
-    var: Token
+    var: str
     start: Expression
     end: Expression
     stmts: StatementBlock
 
+    slot: int = resolved()
+    frame_size: Optional[int] = resolved()
+
     @override
-    def typecheck(self, env: TypeEnvironment):
-        start_type = self.start.typecheck(env)
-        end_type = self.end.typecheck(env)
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[None]:
+        start_type: langtypes.Type = yield self.start.typecheck_steps(env)
+        end_type: langtypes.Type = yield self.end.typecheck_steps(env)
         if not isinstance(start_type, langtypes.Int) and not isinstance(
             end_type, langtypes.Int
         ):
             raise  # TODO
 
-        child_env = TypeEnvironment(enclosing=env)
+        child_env = TypeEnvironment(enclosing=env, block=True)
         child_env.define_var_type(self.var, start_type)
+        _, self.slot = child_env.resolve(self.var)  # type: ignore
 
-        self.stmts.typecheck(child_env)
+        yield self.stmts.typecheck_steps(child_env)
+        self.frame_size = child_env.frame_size()
 
     @override
-    def eval(self, env: RuntimeEnvironment):
+    def eval(self, env: RuntimeEnvironment) -> Optional[Completion]:
         start_index = self.start.eval(env)
         end_index = self.end.eval(env)
+        loop_env = _loop_frame(env, self.frame_size)
+        slots, slot = loop_env.slots, self.slot
+        for i in range(start_index, end_index):
+            slots[slot] = i
+            if isinstance(completion := self.stmts.eval(loop_env), Completion):
+                return completion
+
+    @override
+    def eval_steps(self, env: RuntimeEnvironment) -> Steps[Any]:
+        start_index = yield self.start.eval_steps(env)
+        end_index = yield self.end.eval_steps(env)
+        loop_env = _loop_frame(env, self.frame_size)
+        slots, slot = loop_env.slots, self.slot
         for i in range(start_index, end_index):
-            loop_env = RuntimeEnvironment(env)
-            loop_env.define(self.var, i)
-            self.stmts.eval(loop_env)
+            slots[slot] = i
+            completion = yield self.stmts.eval_steps(loop_env)
+            if isinstance(completion, Completion):
+                return completion
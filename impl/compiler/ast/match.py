@@ -9,20 +9,14 @@ from compiler.env import RuntimeEnvironment, TypeEnvironment
 from dataclasses import dataclass
 from typing_extensions import override
 
-from compiler.ast.base import Ast
-from compiler.lalr import Token
-from compiler.matcher import (
-    WILDCARD,
-    ArrayPatternMatcher,
-    BoolPatternMatcher,
-    EnumPatternMatcher,
-    MatcherCaseDuplicated,
-    Wildcard,
-)
+from compiler import matcher
+from compiler.ast.base import Ast, Steps
 
 
+@dataclass(slots=True)
 class WildcardPattern(Ast):
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
+    @override
+    def typecheck_steps(self, env: TypeEnvironment) -> langtypes.Type:
         self.type = langtypes.PLACEHOLDER
         return self.type
 
@@ -30,12 +24,13 @@ class WildcardPattern(Ast):
         pass  # TODO: remove
 
 
-@dataclass
+@dataclass(slots=True)
 class ArrayPatternElement(Ast):
-    literal: "IntLiteral | WildcardPattern"
+    literal: "IntLiteral | WildcardPattern | ArrayPattern"
 
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
-        self.type = self.literal.typecheck(env)
+    @override
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[langtypes.Type]:
+        self.type = yield self.literal.typecheck_steps(env)
         return self.type
 
     def eval(self, env: RuntimeEnvironment) -> Any:
@@ -47,43 +42,45 @@ class ArrayPatternElement(Ast):
                 return value == expr
             case WildcardPattern():
                 return True
+            case ArrayPattern():
+                return self.literal.matches(expr)
 
 
-@dataclass
+@dataclass(slots=True)
 class ArrayPattern(Ast):
     elements: list[ArrayPatternElement]
 
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
-        ty = langtypes.UntypedArray()
+    @override
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[langtypes.Type]:
+        element: langtypes.Type | None = None
+        first: ArrayPatternElement | None = None
 
         for el in self.elements:
-            el_type = el.typecheck(env)
-            match (ty, el.literal):
-                case (_, WildcardPattern()):
-                    pass  # type stays the same
-                case (langtypes.UntypedArray(), _):
-                    ty = langtypes.Array(el_type)
-                case (_, _) if el_type == ty.ty:
-                    pass
-                case _:
-                    raise  # TODO
-
-        self.type = ty
+            el_type: langtypes.Type = yield el.typecheck_steps(env)
+            if isinstance(el.literal, WildcardPattern):
+                continue  # type stays the same
+            if element is None or first is None:
+                element, first = el_type, el
+            elif (matched := pattern_type(element, el_type)) is not None:
+                element = matched
+            else:
+                raise errors.ArrayTypeMismatch(
+                    message="Unexpected type for array pattern element",
+                    span=el.span,
+                    expected_type=element,
+                    actual_type=el_type,
+                    expected_type_span=first.span,
+                )
+
+        if element is None:
+            self.type = langtypes.UntypedArray()
+        else:
+            self.type = langtypes.Array(element)
         return self.type
 
     def eval(self, env: RuntimeEnvironment) -> list[Any]:
         return [el.eval(env) for el in self.elements]
 
-    def pattern_as_list(self) -> list[int | Wildcard]:
-        results: list[int | Wildcard] = []
-        for el in self.elements:
-            match el.literal:
-                case IntLiteral(value=value):
-                    results.append(value)
-                case WildcardPattern():
-                    results.append(WILDCARD)
-        return results
-
     def matches(self, expr: list[Any]) -> bool:
         if len(self.elements) != len(expr):
             return False
@@ -91,6 +88,26 @@ class ArrayPattern(Ast):
         return all(pat.matches(e) for pat, e in zip(self.elements, expr))
 
 
+def pattern_type(a: langtypes.Type, b: langtypes.Type) -> langtypes.Type | None:
+    """
+    Type of the values matched by both patterns of types a and b, or None if
+    there are none. Array patterns made of wildcards only have an untyped
+    array type, which matches arrays of any type, at any depth.
+    """
+    match a, b:
+        case _ if a is b:
+            return a
+        case langtypes.UntypedArray(), langtypes.Array():
+            return b
+        case langtypes.Array(), langtypes.UntypedArray():
+            return a
+        case langtypes.Array(ty=a_element), langtypes.Array(ty=b_element):
+            element = pattern_type(a_element, b_element)
+            return None if element is None else langtypes.Array(element)
+        case _:
+            return None
+
+
 MatchPattern: TypeAlias = (
     "BoolLiteral | EnumPattern | EnumPatternTuple | WildcardPattern | ArrayPattern"
 )
@@ -115,17 +132,19 @@ def matches_pattern(pattern: MatchPattern, expr: Any) -> bool:
             return pattern.matches(expr)  # pyright: ignore [reportUnknownArgumentType]
 
 
-@dataclass
+@dataclass(slots=True)
 class EnumPattern(Expression):
-    enum_type: Token
-    variant: Token
+    enum_type: str
+    variant: str
 
     @property
     def value(self) -> langvalues.EnumValue:
         return langvalues.EnumValue(ty=self.enum_type, variant=self.variant)
 
     @override
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
+    def typecheck_steps(
+        self, env: TypeEnvironment
+    ) -> Steps[langtypes.Type] | langtypes.Type:
         self.type = env.get_type(self.enum_type)
         if self.type is None:
             raise  # TODO
@@ -140,14 +159,14 @@ class EnumPattern(Expression):
         return self.value == expr
 
 
-@dataclass
+@dataclass(slots=True)
 class EnumPatternTuple(EnumPattern):
     tuple_pattern: MatchPattern
 
     @override
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
-        self.tuple_pattern.typecheck(env)
-        return super().typecheck(env)
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[langtypes.Type]:
+        yield self.tuple_pattern.typecheck_steps(env)
+        return (yield super(EnumPatternTuple, self).typecheck_steps(env))
 
     @override
     def matches(self, expr: langvalues.EnumTupleValue) -> bool:  # type: ignore
@@ -156,116 +175,79 @@ class EnumPatternTuple(EnumPattern):
         return matches_pattern(self.tuple_pattern, expr.tuple_value)
 
 
-@dataclass
+@dataclass(slots=True)
 class CaseStmt(Ast):
     pattern: MatchPattern
     block: StatementBlock
 
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
-        self.block.typecheck(env)
-        self.type = self.pattern.typecheck(env)
+    @override
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[langtypes.Type]:
+        yield self.block.typecheck_steps(env)
+        self.type = yield self.pattern.typecheck_steps(env)
         return self.type
 
     def eval(self, env: RuntimeEnvironment) -> Any:
-        self.block.eval(env)
+        return self.block.eval(env)
+
+    @override
+    def eval_steps(self, env: RuntimeEnvironment) -> Steps[Any]:
+        return self.block.eval_steps(env)
 
     def matches(self, expr: Any) -> bool:
         return matches_pattern(self.pattern, expr)
 
 
-@dataclass
+@dataclass(slots=True)
 class CaseLadder(Ast):
     cases: list[CaseStmt]
 
-    def typecheck(self, env: TypeEnvironment):
+    @override
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[None]:
         for case_ in self.cases:
-            case_.typecheck(env)
-
-    def ensure_exhaustive_matching_bool(self, match_stmt: "MatchStmt"):
-        matcher = BoolPatternMatcher()
-
-        for case in self.cases:
-            assert isinstance(pat := case.pattern, WildcardPattern | BoolLiteral)
-            try:
-                matcher.add_case(pat)
-            except MatcherCaseDuplicated as e:
-                raise errors.DuplicatedCase(
-                    message="Case condition duplicated",
-                    span=pat.span,
-                    previous_case_span=e.previous_case_span,
-                )
-
-        if remaining := matcher.unhandled_cases():
-            raise errors.InexhaustiveMatch(
-                message="Match not exhaustive",
-                span=match_stmt.span,
-                expected_type=langtypes.BOOL,
-                expected_type_span=match_stmt.expr.span,
-                remaining_values=remaining,
+            yield case_.typecheck_steps(env)
+
+    def ensure_exhaustive_matching(self, match_stmt: "MatchStmt", ty: langtypes.Type):
+        """
+        Check that every case can match a value that the cases before it do
+        not, and that every value of ty is matched by some case.
+        """
+        patterns = [matcher.from_ast(case.pattern) for case in self.cases]
+
+        if redundant := matcher.find_redundant(ty, patterns):
+            case, previous = redundant
+            raise errors.DuplicatedCase(
+                message="Case condition duplicated",
+                span=self.cases[case].pattern.span,
+                previous_case_span=self.cases[previous].pattern.span,
             )
 
-    def ensure_exhaustive_matching_enum(
-        self,
-        match_stmt: "MatchStmt",
-        enum_type: langtypes.Enum,
-    ):
-        matcher = EnumPatternMatcher(enum_type)
-
-        for case in self.cases:
-            assert isinstance(pat := case.pattern, WildcardPattern | EnumPattern)
-            try:
-                matcher.add_case(pat)
-            except MatcherCaseDuplicated as e:
-                raise errors.DuplicatedCase(
-                    message="Case condition duplicated",
-                    span=pat.span,
-                    previous_case_span=e.previous_case_span,
-                )
-
-        if remaining := matcher.unhandled_cases():
-            raise errors.InexhaustiveMatch(
-                message="Match not exhaustive",
-                span=match_stmt.span,
-                expected_type=enum_type,
-                expected_type_span=match_stmt.expr.span,
-                remaining_values=remaining,
-            )
-
-    def ensure_exhaustive_matching_array(
-        self, match_stmt: "MatchStmt", ty: langtypes.Type
-    ):
-        matcher = ArrayPatternMatcher()
-
-        for case in self.cases:
-            assert isinstance(pat := case.pattern, WildcardPattern | ArrayPattern)
-            try:
-                matcher.add_case(pat)
-            except MatcherCaseDuplicated as e:
-                raise errors.DuplicatedCase(
-                    message="Case condition duplicated",
-                    span=pat.span,
-                    previous_case_span=e.previous_case_span,
-                )
+        if missing := matcher.missing(ty, patterns):
+            remaining: set[bool | str] = set()
+            for pattern in missing:
+                match pattern:
+                    case matcher.Constructed(constructor=bool() as value):
+                        remaining.add(value)
+                    case _:
+                        remaining.add(matcher.describe(pattern, ty))
 
-        if remaining := matcher.unhandled_cases():
             raise errors.InexhaustiveMatch(
                 message="Match not exhaustive",
                 span=match_stmt.span,
-                expected_type=langtypes.Array(ty),
+                expected_type=ty,
                 expected_type_span=match_stmt.expr.span,
                 remaining_values=remaining,
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchStmt(Statement):
     expr: Expression
     cases: CaseLadder
 
     @override
-    def typecheck(self, env: TypeEnvironment):
-        expr_type = self.expr.typecheck(env)
-        self.cases.typecheck(env)
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[None]:
+        expr_type: langtypes.Type = yield self.expr.typecheck_steps(env)
+        yield self.cases.typecheck_steps(env)
 
         for case_ in self.cases.cases:
             case_type = case_.pattern.type
@@ -274,12 +256,7 @@ class MatchStmt(Statement):
             if isinstance(case_.pattern, WildcardPattern):
                 continue
 
-            if case_type == expr_type:
-                continue
-
-            case_is_untyped_array = isinstance(case_type, langtypes.UntypedArray)
-            expr_is_array = isinstance(expr_type, langtypes.Array)
-            if case_is_untyped_array and expr_is_array:
+            if pattern_type(case_type, expr_type) is expr_type:
                 continue
 
             # TODO: Add spanshot test when adding more types of patterns
@@ -292,12 +269,8 @@ class MatchStmt(Statement):
             )
 
         match expr_type:
-            case langtypes.BOOL:
-                self.cases.ensure_exhaustive_matching_bool(self)
-            case langtypes.Enum():
-                self.cases.ensure_exhaustive_matching_enum(self, enum_type=expr_type)
-            case langtypes.Array(ty=langtypes.INT):
-                self.cases.ensure_exhaustive_matching_array(self, expr_type.ty)
+            case langtypes.BOOL | langtypes.Enum() | langtypes.Array():
+                self.cases.ensure_exhaustive_matching(self, expr_type)
             case _:
                 raise errors.InternalCompilerError(
                     "TODO: unsupported type for match expression"
@@ -309,9 +282,20 @@ class MatchStmt(Statement):
 
         for case_ in self.cases.cases:
             if case_.matches(expr):
-                case_.eval(env)
-                break
-        else:
-            raise errors.InternalCompilerError(
-                "Match statement did not execute any case blocks"
-            )
+                return case_.eval(env)
+
+        raise errors.InternalCompilerError(
+            "Match statement did not execute any case blocks"
+        )
+
+    @override
+    def eval_steps(self, env: RuntimeEnvironment) -> Steps[Any]:
+        expr = yield self.expr.eval_steps(env)
+
+        for case_ in self.cases.cases:
+            if case_.matches(expr):
+                return (yield case_.eval_steps(env))
+
+        raise errors.InternalCompilerError(
+            "Match statement did not execute any case blocks"
+        )
@@ -1,89 +1,150 @@
+import abc
 from dataclasses import dataclass
+from typing import Any, NoReturn, Optional
 from typing_extensions import override
 
 from compiler import errors, langtypes
+from compiler.ast.base import Steps, token_span
+from compiler.lalr import Token
 from compiler.ast.expressions import Expression
 from compiler.env import RuntimeEnvironment, TypeEnvironment
-from compiler.lalr import Token
 
 
-@dataclass
-class Term(Expression):
+@dataclass(slots=True)
+class BinaryOp(Expression):
+    """
+    Binary operators are left associative, so a chain like `a + b + c` nests
+    on the left: `(a + b) + c`. Typechecking and evaluation walk down that
+    left spine iteratively, so that long generated expressions do not run
+    into the recursion limit.
+    """
+
     left: Expression
-    op: Token
+    op: str
     right: Expression
+    op_span: Optional[errors.Span] = token_span()
+
+    def __post_init__(self, meta: Any):
+        if self.op_span is None and isinstance(self.op, Token):
+            self.op_span = errors.Span.from_token(self.op)
+        super(BinaryOp, self).__post_init__(meta)
+
+    @abc.abstractmethod
+    def result_type(
+        self, left_type: langtypes.Type, right_type: langtypes.Type
+    ) -> Optional[langtypes.Type]:
+        """
+        Type of the result of the operation, or None if it is not valid for
+        the operand types.
+        """
+
+    @abc.abstractmethod
+    def apply(self, left: Any, right: Any) -> Any:
+        pass
+
+    def spine(self) -> list["BinaryOp"]:
+        """
+        Operators in a left nested chain ending at (and including) this one,
+        innermost first.
+        """
+        spine: list[BinaryOp] = [self]
+        while isinstance(node := spine[-1].left, BinaryOp):
+            spine.append(node)
+        spine.reverse()
+        return spine
+
+    @override
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[langtypes.Type]:
+        spine = self.spine()
+        left_type: langtypes.Type = yield spine[0].left.typecheck_steps(env)
+
+        for node in spine:
+            right_type: langtypes.Type = yield node.right.typecheck_steps(env)
+            result_type = node.result_type(left_type, right_type)
+            if result_type is None:
+                node.invalid_operation(left_type, right_type)
+            node.type = left_type = result_type
+
+        return left_type
+
+    def invalid_operation(
+        self, left_type: langtypes.Type, right_type: langtypes.Type
+    ) -> NoReturn:
+        raise errors.InvalidOperationError(
+            message=f"Invalid operation {self.op} for types {left_type.name} and {right_type.name}",
+            span=self.span,
+            operator=errors.OperatorSpan(self.op, self.op_span or self.span),
+            operands=[
+                errors.OperandSpan(left_type, self.left.span),
+                errors.OperandSpan(right_type, self.right.span),
+            ],
+        )
+
+    @override
+    def eval(self, env: RuntimeEnvironment):
+        spine = self.spine()
+        left = spine[0].left.eval(env)
+
+        for node in spine:
+            left = node.apply(left, node.right.eval(env))
+
+        return left
 
     @override
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
-        left_type = self.left.typecheck(env)
-        right_type = self.right.typecheck(env)
+    def eval_steps(self, env: RuntimeEnvironment) -> Steps[Any]:
+        spine = self.spine()
+        left = yield spine[0].left.eval_steps(env)
+
+        for node in spine:
+            left = node.apply(left, (yield node.right.eval_steps(env)))
+
+        return left
+
+    def invalid_operator(self) -> NoReturn:
+        raise errors.InternalCompilerError(
+            f"{type(self).__name__} recieved invalid operator {self.op}"
+        )
+
 
+@dataclass(slots=True)
+class Term(BinaryOp):
+    @override
+    def result_type(
+        self, left_type: langtypes.Type, right_type: langtypes.Type
+    ) -> Optional[langtypes.Type]:
         match left_type, self.op, right_type:
             case langtypes.INT, "+" | "-", langtypes.INT:
-                self.type = langtypes.INT
+                return langtypes.INT
             case langtypes.STRING, "+", langtypes.STRING:
-                self.type = langtypes.STRING
+                return langtypes.STRING
             case _:
-                op_span = errors.Span.from_token(self.op)
-                raise errors.InvalidOperationError(
-                    message=f"Invalid operation {self.op} for types {left_type.name} and {right_type.name}",
-                    span=self.span,
-                    operator=errors.OperatorSpan(self.op, op_span),
-                    operands=[
-                        errors.OperandSpan(left_type, self.left.span),
-                        errors.OperandSpan(right_type, self.right.span),
-                    ],
-                )
-
-        return self.type
+                return None
 
     @override
-    def eval(self, env: RuntimeEnvironment):
-        left = self.left.eval(env)
-        right = self.right.eval(env)
+    def apply(self, left: Any, right: Any) -> Any:
         match self.op:
             case "+":
                 return left + right
             case "-":
                 return left - right
             case _:
-                raise errors.InternalCompilerError(
-                    f"{type(self).__name__} recieved invalid operator {self.op}"
-                )
+                self.invalid_operator()
 
 
-@dataclass
-class Factor(Expression):
-    left: Expression
-    op: Token
-    right: Expression
-
+@dataclass(slots=True)
+class Factor(BinaryOp):
     @override
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
-        left_type = self.left.typecheck(env)
-        right_type = self.right.typecheck(env)
-
+    def result_type(
+        self, left_type: langtypes.Type, right_type: langtypes.Type
+    ) -> Optional[langtypes.Type]:
         match left_type, self.op, right_type:
             case langtypes.INT, "*" | "/" | "%", langtypes.INT:
-                self.type = langtypes.INT
+                return langtypes.INT
             case _:
-                op_span = errors.Span.from_token(self.op)
-                raise errors.InvalidOperationError(
-                    message=f"Invalid operation {self.op} for types {left_type.name} and {right_type.name}",
-                    span=self.span,
-                    operator=errors.OperatorSpan(self.op, op_span),
-                    operands=[
-                        errors.OperandSpan(left_type, self.left.span),
-                        errors.OperandSpan(right_type, self.right.span),
-                    ],
-                )
-
-        return self.type
+                return None
 
     @override
-    def eval(self, env: RuntimeEnvironment):
-        left = self.left.eval(env)
-        right = self.right.eval(env)
+    def apply(self, left: Any, right: Any) -> Any:
         match self.op:
             case "*":
                 return left * right
@@ -92,55 +153,31 @@ class Factor(Expression):
                     case langtypes.INT, langtypes.INT:
                         return left // right
                     case _:
-                        raise errors.InternalCompilerError(
-                            f"{type(self).__name__} recieved invalid operator {self.op}"
-                        )
+                        self.invalid_operator()
             case "%":
                 match self.left.type, self.right.type:
                     case langtypes.INT, langtypes.INT:
                         return left % right
                     case _:
-                        raise errors.InternalCompilerError(
-                            f"{type(self).__name__} recieved invalid operator {self.op}"
-                        )
+                        self.invalid_operator()
             case _:
-                raise errors.InternalCompilerError(
-                    f"{type(self).__name__} recieved invalid operator {self.op}"
-                )
+                self.invalid_operator()
 
 
-@dataclass
-class Comparison(Expression):
-    left: Expression
-    op: Token
-    right: Expression
-
+@dataclass(slots=True)
+class Comparison(BinaryOp):
     @override
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
-        left_type = self.left.typecheck(env)
-        right_type = self.right.typecheck(env)
-
+    def result_type(
+        self, left_type: langtypes.Type, right_type: langtypes.Type
+    ) -> Optional[langtypes.Type]:
         match left_type, self.op, right_type:
             case langtypes.INT, ">" | "<" | "<=" | ">=", langtypes.INT:
-                self.type = langtypes.BOOL
+                return langtypes.BOOL
             case _:
-                op_span = errors.Span.from_token(self.op)
-                raise errors.InvalidOperationError(
-                    message=f"Invalid operation {self.op} for types {left_type.name} and {right_type.name}",
-                    span=self.span,
-                    operator=errors.OperatorSpan(self.op, op_span),
-                    operands=[
-                        errors.OperandSpan(left_type, self.left.span),
-                        errors.OperandSpan(right_type, self.right.span),
-                    ],
-                )
-
-        return self.type
+                return None
 
     @override
-    def eval(self, env: RuntimeEnvironment):
-        left = self.left.eval(env)
-        right = self.right.eval(env)
+    def apply(self, left: Any, right: Any) -> Any:
         match self.op:
             case ">":
                 return left > right
@@ -151,106 +188,69 @@ class Comparison(Expression):
             case ">=":
                 return left >= right
             case _:
-                raise errors.InternalCompilerError(
-                    f"{type(self).__name__} recieved invalid operator {self.op}"
-                )
-
+                self.invalid_operator()
 
-@dataclass
-class Logical(Expression):
-    left: Expression
-    op: Token
-    right: Expression
 
+@dataclass(slots=True)
+class Logical(BinaryOp):
     @override
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
-        left_type = self.left.typecheck(env)
-        right_type = self.right.typecheck(env)
-
+    def result_type(
+        self, left_type: langtypes.Type, right_type: langtypes.Type
+    ) -> Optional[langtypes.Type]:
         match left_type, self.op, right_type:
             case langtypes.BOOL, "&&", langtypes.BOOL:
-                self.type = langtypes.BOOL
+                return langtypes.BOOL
             case langtypes.BOOL, "||", langtypes.BOOL:
-                self.type = langtypes.BOOL
+                return langtypes.BOOL
             case _:
-                op_span = errors.Span.from_token(self.op)
-                raise errors.InvalidOperationError(
-                    message=f"Invalid operation {self.op} for types {left_type.name} and {right_type.name}",
-                    span=self.span,
-                    operator=errors.OperatorSpan(self.op, op_span),
-                    operands=[
-                        errors.OperandSpan(left_type, self.left.span),
-                        errors.OperandSpan(right_type, self.right.span),
-                    ],
-                )
-
-        return self.type
+                return None
 
     @override
-    def eval(self, env: RuntimeEnvironment):
-        left = self.left.eval(env)
-        right = self.right.eval(env)
+    def apply(self, left: Any, right: Any) -> Any:
         match self.op:
             case "&&":
                 return left and right
             case "||":
                 return left or right
             case _:
-                raise errors.InternalCompilerError(
-                    f"{type(self).__name__} recieved invalid operator {self.op}"
-                )
+                self.invalid_operator()
 
 
-@dataclass
-class Equality(Expression):
-    left: Expression
-    op: Token
-    right: Expression
-
+@dataclass(slots=True)
+class Equality(BinaryOp):
     @override
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
-        left_type = self.left.typecheck(env)
-        right_type = self.right.typecheck(env)
-
+    def result_type(
+        self, left_type: langtypes.Type, right_type: langtypes.Type
+    ) -> Optional[langtypes.Type]:
         if left_type == right_type and self.op in ("==", "!="):  # pyright: ignore [reportUnnecessaryContains]
-            self.type = langtypes.BOOL
-        else:
-            op_span = errors.Span.from_token(self.op)
-            raise errors.InvalidOperationError(
-                message=f"Invalid operation {self.op} for types {left_type.name} and {right_type.name}",
-                span=self.span,
-                operator=errors.OperatorSpan(self.op, op_span),
-                operands=[
-                    errors.OperandSpan(left_type, self.left.span),
-                    errors.OperandSpan(right_type, self.right.span),
-                ],
-            )
-
-        return self.type
+            return langtypes.BOOL
+        return None
 
     @override
-    def eval(self, env: RuntimeEnvironment):
-        left = self.left.eval(env)
-        right = self.right.eval(env)
+    def apply(self, left: Any, right: Any) -> Any:
         match self.op:
             case "==":
                 return left == right
             case "!=":
                 return left != right
             case _:
-                raise errors.InternalCompilerError(
-                    f"{type(self).__name__} recieved invalid operator {self.op}"
-                )
+                self.invalid_operator()
 
 
-@dataclass
+@dataclass(slots=True)
 class UnaryOp(Expression):
-    op: Token
+    op: str
     operand: Expression
+    op_span: Optional[errors.Span] = token_span()
+
+    def __post_init__(self, meta: Any):
+        if self.op_span is None and isinstance(self.op, Token):
+            self.op_span = errors.Span.from_token(self.op)
+        super(UnaryOp, self).__post_init__(meta)
 
     @override
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
-        operand_type = self.operand.typecheck(env)
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[langtypes.Type]:
+        operand_type: langtypes.Type = yield self.operand.typecheck_steps(env)
 
         match self.op, operand_type:
             case "+" | "-", langtypes.INT:
@@ -258,19 +258,24 @@ class UnaryOp(Expression):
             case "!", langtypes.BOOL:
                 self.type = operand_type
             case _:
-                op_span = errors.Span.from_token(self.op)
                 raise errors.InvalidOperationError(
                     message=f"Invalid operation '{self.op}' for type '{operand_type.name}'",
                     span=self.span,
-                    operator=errors.OperatorSpan(self.op, op_span),
+                    operator=errors.OperatorSpan(self.op, self.op_span or self.span),
                     operands=[errors.OperandSpan(operand_type, self.operand.span)],
                 )
 
-        return self.type
+        return operand_type
 
     @override
     def eval(self, env: RuntimeEnvironment):
-        result = self.operand.eval(env)
+        return self.apply(self.operand.eval(env))
+
+    @override
+    def eval_steps(self, env: RuntimeEnvironment) -> Steps[Any]:
+        return self.apply((yield self.operand.eval_steps(env)))
+
+    def apply(self, result: Any) -> Any:
         match self.op:
             case "+":
                 return result
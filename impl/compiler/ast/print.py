@@ -1,19 +1,24 @@
 from dataclasses import dataclass
 from typing_extensions import override
 
+from compiler.ast.base import Steps
 from compiler.ast.expressions import Expression
 from compiler.ast.statements import Statement
 from compiler.env import RuntimeEnvironment, TypeEnvironment
 
 
-@dataclass
+@dataclass(slots=True)
 class PrintStmt(Statement):
     expr: Expression
 
     @override
-    def typecheck(self, env: TypeEnvironment):
-        self.expr.typecheck(env)
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[None]:
+        yield self.expr.typecheck_steps(env)
 
     @override
     def eval(self, env: RuntimeEnvironment):
         print(self.expr.eval(env))
+
+    @override
+    def eval_steps(self, env: RuntimeEnvironment) -> Steps[None]:
+        print((yield self.expr.eval_steps(env)))
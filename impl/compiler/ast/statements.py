@@ -1,44 +1,85 @@
 import abc
+from typing import Any, Optional
 from compiler.env import RuntimeEnvironment, TypeEnvironment
 
 
 from dataclasses import dataclass
 from typing_extensions import override
 
-from compiler.ast.base import Ast
+from compiler.runtime import Completion
+from compiler.ast.base import Ast, Steps, resolved
 
 
 class Statement(Ast):
+    __slots__ = ()
+
+    @override
     @abc.abstractmethod
-    def typecheck(self, env: TypeEnvironment):
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[None] | None:
         pass
 
     @abc.abstractmethod
-    def eval(self, env: RuntimeEnvironment):
+    def eval(self, env: RuntimeEnvironment) -> Optional[Completion]:
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class StatementList(Ast):
     stmts: list[Statement]
 
-    def typecheck(self, env: TypeEnvironment):
+    @override
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[None]:
+        if env.diagnostics is not None:
+            for stmt in self.stmts:
+                yield stmt.recovering_steps(env)
+            return
+
         for stmt in self.stmts:
-            stmt.typecheck(env)
+            yield stmt.typecheck_steps(env)
 
-    def eval(self, env: RuntimeEnvironment):
+    @override
+    def recovering_steps(
+        self, env: TypeEnvironment, steps: Optional[Steps[Any]] = None
+    ) -> Steps[None]:
+        """
+        Blocks hold their statements in a nested list, which recovers from
+        type errors statement by statement on its own.
+        """
+        yield self.typecheck_steps(env) if steps is None else steps
+
+    def eval(self, env: RuntimeEnvironment) -> Optional[Completion]:
         for child in self.stmts:
-            child.eval(env)
+            if isinstance(completion := child.eval(env), Completion):
+                return completion
+
+    @override
+    def eval_steps(self, env: RuntimeEnvironment) -> Steps[Any]:
+        for child in self.stmts:
+            if isinstance(completion := (yield child.eval_steps(env)), Completion):
+                return completion
 
 
-@dataclass
+@dataclass(slots=True)
 class StatementBlock(StatementList):
+    frame_size: Optional[int] = resolved()
+    """None when the block runs in the frame of the enclosing scope."""
+
     @override
-    def typecheck(self, env: TypeEnvironment):
-        child_env = TypeEnvironment(enclosing=env)
-        super().typecheck(child_env)
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[None]:
+        child_env = TypeEnvironment(enclosing=env, block=True)
+        yield super(StatementBlock, self).typecheck_steps(child_env)
+        self.frame_size = child_env.frame_size()
+
+    @override
+    def eval(self, env: RuntimeEnvironment) -> Optional[Completion]:
+        if self.frame_size is not None:
+            env = RuntimeEnvironment(enclosing=env, size=self.frame_size)
+        for child in self.stmts:
+            if isinstance(completion := child.eval(env), Completion):
+                return completion
 
     @override
-    def eval(self, env: RuntimeEnvironment):
-        child_env = RuntimeEnvironment(enclosing=env)
-        return super().eval(child_env)
+    def eval_steps(self, env: RuntimeEnvironment) -> Steps[Any]:
+        if self.frame_size is not None:
+            env = RuntimeEnvironment(enclosing=env, size=self.frame_size)
+        return super(StatementBlock, self).eval_steps(env)
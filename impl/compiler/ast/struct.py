@@ -1,92 +1,118 @@
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Optional
 from typing_extensions import override
 
 from compiler import errors, langtypes
 from compiler.ast.annotation import TypeAnnotation
-from compiler.ast.base import Ast
+from compiler.ast.base import Ast, Steps, resolved
 from compiler.ast.expressions import Expression
 from compiler.ast.statements import Statement
 from compiler.env import RuntimeEnvironment, TypeEnvironment
-from compiler.lalr import Token
 
 
-@dataclass
+@dataclass(slots=True)
 class StructMember(Ast):
-    name: Token
+    name: str
     ident_type: TypeAnnotation
 
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
-        self.type = self.ident_type.typecheck(env)
+    @override
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[langtypes.Type]:
+        self.type = yield self.ident_type.typecheck_steps(env)
         return self.type
 
 
-@dataclass
+@dataclass(slots=True)
 class StructMembers(Ast):
     members: list[StructMember]
 
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Struct.Members:
-        types = {str(mem.name): mem.typecheck(env) for mem in self.members}
+    @override
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[langtypes.Struct.Members]:
+        types: dict[str, langtypes.Type] = {}
+        for mem in self.members:
+            types[str(mem.name)] = yield mem.typecheck_steps(env)
         self.type = langtypes.Struct.Members(types)
         return self.type
 
 
-@dataclass
+@dataclass(slots=True)
 class StructStmt(Statement):
-    name: Token
+    name: str
     members: StructMembers
 
     @override
-    def typecheck(self, env: TypeEnvironment):
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[None]:
         if env.get_type(self.name):
             raise  # TODO
             # raise errors.TypeRedefinition()
 
         ty = langtypes.Struct(
             struct_name=self.name,
-            members=self.members.typecheck(env),
+            members=(yield self.members.typecheck_steps(env)),
         )
         env.define_type(self.name, ty)
 
+    @override
+    def poison(self, env: TypeEnvironment):
+        # A redefinition keeps the first definition
+        if env.get_type(self.name) is None:
+            env.define_type(self.name, langtypes.POISON)
+
     @override
     def eval(self, env: RuntimeEnvironment):
         # Nothing to execute since struct statements are simply declarations
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class StructInitMember(Ast):
-    name: Token
+    name: str
     value: Expression
 
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
-        self.type = self.value.typecheck(env)
+    @override
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[langtypes.Type]:
+        self.type = yield self.value.typecheck_steps(env)
         return self.type
 
     def eval(self, env: RuntimeEnvironment) -> Any:
         return self.value.eval(env)
 
+    @override
+    def eval_steps(self, env: RuntimeEnvironment) -> Steps[Any]:
+        return self.value.eval_steps(env)
+
 
-@dataclass
+@dataclass(slots=True)
 class StructInitMembers(Ast):
     members: list[StructInitMember]
 
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Struct.Members:
-        types = {str(mem.name): mem.typecheck(env) for mem in self.members}
+    @override
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[langtypes.Struct.Members]:
+        types: dict[str, langtypes.Type] = {}
+        for mem in self.members:
+            types[str(mem.name)] = yield mem.typecheck_steps(env)
         self.type = langtypes.Struct.Members(types)
         return self.type
 
     def eval(self, env: RuntimeEnvironment) -> dict[str, Any]:
         return {str(mem.name): mem.eval(env) for mem in self.members}
 
+    @override
+    def eval_steps(self, env: RuntimeEnvironment) -> Steps[dict[str, Any]]:
+        attrs: dict[str, Any] = {}
+        for mem in self.members:
+            attrs[str(mem.name)] = yield mem.eval_steps(env)
+        return attrs
+
 
-@dataclass
+@dataclass(slots=True)
 class StructAccess(Statement):  # TODO: make an expression
-    name: Token
-    member: Token
+    name: str
+    member: str
+    depth: int = resolved()
+    slot: Optional[int] = resolved()
 
     @override
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:  # type: ignore
+    def typecheck_steps(self, env: TypeEnvironment) -> langtypes.Type:  # type: ignore
         struct_type = env.get_var_type(self.name)
         if not isinstance(struct_type, langtypes.Struct):
             raise  # TODO
@@ -95,24 +121,27 @@ class StructAccess(Statement):  # TODO: make an expression
         if member_type is None:
             raise  # TODO
 
+        self.depth, self.slot = env.resolve(self.name)
         self.type = member_type
         return self.type
 
     @override
     def eval(self, env: RuntimeEnvironment) -> Any:
-        struct_value = env.get(self.name)
-        return struct_value.get_attr(self.member)
+        return self.struct_value(env).get_attr(self.member)
+
+    def struct_value(self, env: RuntimeEnvironment) -> Any:
+        return env.load(self.name, self.depth, self.slot)
 
 
-@dataclass
+@dataclass(slots=True)
 class StructAssignment(Statement):
     struct_access: StructAccess
     value: Expression
 
     @override
-    def typecheck(self, env: TypeEnvironment):
-        member_type = self.struct_access.typecheck(env)
-        value_type = self.value.typecheck(env)
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[None]:
+        member_type: langtypes.Type = yield self.struct_access.typecheck_steps(env)
+        value_type: langtypes.Type = yield self.value.typecheck_steps(env)
 
         if value_type != member_type:
             raise errors.TypeMismatch(
@@ -125,6 +154,12 @@ class StructAssignment(Statement):
 
     @override
     def eval(self, env: RuntimeEnvironment) -> Any:
-        struct_value = env.get(self.struct_access.name)
+        struct_value = self.struct_access.struct_value(env)
         value = self.value.eval(env)
         struct_value.set_attr(str(self.struct_access.member), value)
+
+    @override
+    def eval_steps(self, env: RuntimeEnvironment) -> Steps[None]:
+        struct_value = self.struct_access.struct_value(env)
+        value = yield self.value.eval_steps(env)
+        struct_value.set_attr(str(self.struct_access.member), value)
@@ -1,19 +1,23 @@
 from dataclasses import dataclass
+from typing import Any, Optional
 from typing_extensions import override
 
 from compiler import errors, langtypes
+from compiler.ast.base import Steps, resolved, token_span
+from compiler.lalr import Token
 from compiler.ast.expressions import Expression
 from compiler.ast.statements import Statement
 from compiler.env import RuntimeEnvironment, TypeEnvironment
-from compiler.lalr import Token
 
 
-@dataclass
+@dataclass(slots=True)
 class Variable(Expression):
     value: str
+    depth: int = resolved()
+    slot: Optional[int] = resolved()
 
     @override
-    def typecheck(self, env: TypeEnvironment) -> langtypes.Type:
+    def typecheck_steps(self, env: TypeEnvironment) -> langtypes.Type:
         self.type = env.get_var_type(self.value)
         if self.type is None:
             raise errors.UnknownVariable(
@@ -22,50 +26,91 @@ class Variable(Expression):
                 variable=self.value,
             )
         else:
+            self.depth, self.slot = env.resolve(self.value)
             return self.type
 
     @override
     def eval(self, env: RuntimeEnvironment):
-        return env.get(self.value)
+        # Same as env.load, inlined since every variable read goes through it
+        slot = self.slot
+        if slot is None:
+            return env.get(self.value)
+
+        depth = self.depth
+        while depth:
+            env = env.parent  # type: ignore
+            depth -= 1
+        return env.slots[slot]
 
 
-@dataclass
+@dataclass(slots=True)
 class VariableDeclaration(Statement):
     ident: str
     rvalue: Expression
+    slot: Optional[int] = resolved()
 
     @override
-    def typecheck(self, env: TypeEnvironment):
-        ty = self.rvalue.typecheck(env)
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[None]:
+        ty: langtypes.Type = yield self.rvalue.typecheck_steps(env)
         env.define_var_type(self.ident, ty)
+        _, self.slot = env.resolve(self.ident)
+
+    @override
+    def poison(self, env: TypeEnvironment):
+        env.define_var_type(self.ident, langtypes.POISON)
 
     @override
     def eval(self, env: RuntimeEnvironment):
         rhs = self.rvalue.eval(env)
-        env.define(self.ident, rhs)
+        if self.slot is None:
+            env.define(self.ident, rhs)
+        else:
+            env.slots[self.slot] = rhs
+
+    @override
+    def eval_steps(self, env: RuntimeEnvironment) -> Steps[None]:
+        rhs = yield self.rvalue.eval_steps(env)
+        if self.slot is None:
+            env.define(self.ident, rhs)
+        else:
+            env.slots[self.slot] = rhs
 
 
-@dataclass
+@dataclass(slots=True)
 class Assignment(Statement):
-    lvalue: Token
+    lvalue: str
     rvalue: Expression
+    lvalue_span: Optional[errors.Span] = token_span()
+    depth: int = resolved()
+    slot: Optional[int] = resolved()
+
+    def __post_init__(self, meta: Any):
+        if self.lvalue_span is None and isinstance(self.lvalue, Token):
+            self.lvalue_span = errors.Span.from_token(self.lvalue)
+        super(Assignment, self).__post_init__(meta)
 
     @override
-    def typecheck(self, env: TypeEnvironment):
+    def typecheck_steps(self, env: TypeEnvironment) -> Steps[None]:
         lvalue_type = env.get_var_type(self.lvalue)
         if lvalue_type is None:
             raise errors.UndeclaredVariable(
                 message=f"Variable '{self.lvalue}' not declared in this scope",
-                span=errors.Span.from_token(self.lvalue),
+                span=self.lvalue_span or self.span,
                 variable=self.lvalue,
                 # TODO: Add help message to use let
             )
+        self.depth, self.slot = env.resolve(self.lvalue)
 
-        rvalue_type = self.rvalue.typecheck(env)
+        rvalue_type: langtypes.Type = yield self.rvalue.typecheck_steps(env)
         if lvalue_type != rvalue_type:
             raise errors.InternalCompilerError("Type mismatch: TODO")  # TODO
 
     @override
     def eval(self, env: RuntimeEnvironment):
         rhs = self.rvalue.eval(env)
-        env.set(self.lvalue, rhs)
+        env.store(self.lvalue, self.depth, self.slot, rhs)
+
+    @override
+    def eval_steps(self, env: RuntimeEnvironment) -> Steps[None]:
+        rhs = yield self.rvalue.eval_steps(env)
+        env.store(self.lvalue, self.depth, self.slot, rhs)
@@ -0,0 +1,653 @@
+"""
+Bytecode for the virtual machine of `compiler.vm`, the compiler lowering a
+typechecked AST to it, and a disassembler to read it.
+
+Code is a flat list of ints, an opcode followed by its argument, so that the
+offset of an instruction is always even. Arguments are indexes into the
+constant pool of the code, frame slots, counts or jump targets, depending on
+the opcode. Everything that only depends on the program is decided while
+compiling: variables are resolved to the frame and slot they live in, and
+the types found by the typechecker pick specialised instructions, such as
+ADD_INT for ints and CONCAT for strings.
+
+Instructions take their operands from the stack of the running function and
+push their result back on it. Statements leave the stack as they found it,
+and each function has a stack of its own, so returning from anywhere in a
+function only drops that stack.
+"""
+
+import reprlib
+from typing import Any, Callable, Hashable, Optional
+
+from compiler import errors, langtypes, langvalues
+from compiler.ast.array import (
+    ArrayElements,
+    ArrayLiteral,
+    ConstantArrayElements,
+    IndexAssignment,
+    Indexing,
+)
+from compiler.ast.base import Ast, Steps, walk
+from compiler.ast.enum import EnumLiteralSimple, EnumLiteralTuple, EnumStmt
+from compiler.ast.expressions import Expression
+from compiler.ast.function import (
+    FunctionArgs,
+    FunctionCall,
+    FunctionDefinition,
+    ReturnStmt,
+)
+from compiler.ast.if_stmt import IfChain
+from compiler.ast.literals import BoolLiteral, IntLiteral, StringLiteral
+from compiler.ast.loops import ForStmt, ForStmtInt, WhileStmt
+from compiler.ast.match import MatchStmt
+from compiler.ast.operators import BinaryOp, Factor, UnaryOp
+from compiler.ast.print import PrintStmt
+from compiler.ast.statements import Statement, StatementBlock, StatementList
+from compiler.ast.struct import (
+    StructAccess,
+    StructAssignment,
+    StructInitMembers,
+    StructStmt,
+)
+from compiler.ast.variable import Assignment, Variable, VariableDeclaration
+
+OPNAMES: list[str] = []
+"""Name of each opcode, by value."""
+
+ARGS: list[Optional[str]] = []
+"""What the argument of each opcode is, by value, for the disassembler:
+"const" for an index into the constant pool, "jump" for the offset of an
+instruction, "slot" and "count" for plain ints, "slots" for two slots in the
+high and low 16 bits, or None if it is unused."""
+
+
+def _opcode(name: str, arg: Optional[str] = None) -> int:
+    OPNAMES.append(name)
+    ARGS.append(arg)
+    return len(OPNAMES) - 1
+
+
+# Variables
+LOAD_CONST = _opcode("LOAD_CONST", "const")
+LOAD_LOCAL = _opcode("LOAD_LOCAL", "slot")
+LOAD_LOCAL_PAIR = _opcode("LOAD_LOCAL_PAIR", "slots")
+STORE_LOCAL = _opcode("STORE_LOCAL", "slot")
+LOAD_OUTER = _opcode("LOAD_OUTER", "const")
+STORE_OUTER = _opcode("STORE_OUTER", "const")
+LOAD_GLOBAL = _opcode("LOAD_GLOBAL", "const")
+STORE_GLOBAL = _opcode("STORE_GLOBAL", "const")
+POP_TOP = _opcode("POP_TOP")
+
+# Operators
+ADD_INT = _opcode("ADD_INT")
+SUB_INT = _opcode("SUB_INT")
+ADD_INT_CONST = _opcode("ADD_INT_CONST", "const")
+SUB_INT_CONST = _opcode("SUB_INT_CONST", "const")
+MUL_INT = _opcode("MUL_INT")
+DIV_INT = _opcode("DIV_INT")
+MOD_INT = _opcode("MOD_INT")
+CONCAT = _opcode("CONCAT")
+LESS_INT = _opcode("LESS_INT")
+LESS_EQUAL_INT = _opcode("LESS_EQUAL_INT")
+GREATER_INT = _opcode("GREATER_INT")
+GREATER_EQUAL_INT = _opcode("GREATER_EQUAL_INT")
+EQUAL = _opcode("EQUAL")
+NOT_EQUAL = _opcode("NOT_EQUAL")
+AND = _opcode("AND")
+OR = _opcode("OR")
+NEGATE_INT = _opcode("NEGATE_INT")
+NOT = _opcode("NOT")
+
+# Values
+BUILD_ARRAY = _opcode("BUILD_ARRAY", "count")
+COPY_CONST = _opcode("COPY_CONST", "const")
+INDEX = _opcode("INDEX", "const")
+STORE_INDEX = _opcode("STORE_INDEX")
+BUILD_ENUM = _opcode("BUILD_ENUM", "const")
+BUILD_STRUCT = _opcode("BUILD_STRUCT", "const")
+GET_ATTR = _opcode("GET_ATTR", "const")
+SET_ATTR = _opcode("SET_ATTR", "const")
+
+# Control flow
+JUMP = _opcode("JUMP", "jump")
+POP_JUMP_IF_FALSE = _opcode("POP_JUMP_IF_FALSE", "jump")
+JUMP_IF_NOT_LESS_INT = _opcode("JUMP_IF_NOT_LESS_INT", "jump")
+JUMP_IF_NOT_LESS_EQUAL_INT = _opcode("JUMP_IF_NOT_LESS_EQUAL_INT", "jump")
+JUMP_IF_NOT_GREATER_INT = _opcode("JUMP_IF_NOT_GREATER_INT", "jump")
+JUMP_IF_NOT_GREATER_EQUAL_INT = _opcode("JUMP_IF_NOT_GREATER_EQUAL_INT", "jump")
+JUMP_IF_NOT_EQUAL = _opcode("JUMP_IF_NOT_EQUAL", "jump")
+JUMP_IF_EQUAL = _opcode("JUMP_IF_EQUAL", "jump")
+GET_ITER = _opcode("GET_ITER")
+RANGE = _opcode("RANGE")
+FOR_ITER = _opcode("FOR_ITER", "jump")
+MATCH_CASE = _opcode("MATCH_CASE", "const")
+NO_MATCH = _opcode("NO_MATCH")
+ENTER_FRAME = _opcode("ENTER_FRAME", "count")
+LEAVE_FRAME = _opcode("LEAVE_FRAME")
+
+# Functions
+MAKE_FUNCTION = _opcode("MAKE_FUNCTION", "const")
+CALL = _opcode("CALL", "count")
+RETURN = _opcode("RETURN")
+PRINT = _opcode("PRINT")
+EVAL = _opcode("EVAL", "const")
+
+
+_SUPERINSTRUCTIONS: dict[tuple[int, int], int] = {
+    (LOAD_LOCAL, LOAD_LOCAL): LOAD_LOCAL_PAIR,
+    (LOAD_CONST, ADD_INT): ADD_INT_CONST,
+    (LOAD_CONST, SUB_INT): SUB_INT_CONST,
+    (LESS_INT, POP_JUMP_IF_FALSE): JUMP_IF_NOT_LESS_INT,
+    (LESS_EQUAL_INT, POP_JUMP_IF_FALSE): JUMP_IF_NOT_LESS_EQUAL_INT,
+    (GREATER_INT, POP_JUMP_IF_FALSE): JUMP_IF_NOT_GREATER_INT,
+    (GREATER_EQUAL_INT, POP_JUMP_IF_FALSE): JUMP_IF_NOT_GREATER_EQUAL_INT,
+    (EQUAL, POP_JUMP_IF_FALSE): JUMP_IF_NOT_EQUAL,
+    (NOT_EQUAL, POP_JUMP_IF_FALSE): JUMP_IF_EQUAL,
+}
+"""Instructions replacing a pair of instructions, when the second one is
+emitted right after the first, which saves a dispatch. The argument of the
+pair is the one of the instruction that has one, or both slots for
+LOAD_LOCAL_PAIR."""
+
+
+class CodeObject:
+    """
+    Compiled code of the program or of a function, which runs in a frame of
+    frame_size slots. The function itself is in slot 0 of the frame of its
+    calls, and its parameters in param_slots.
+    """
+
+    __slots__ = (
+        "name",
+        "code",
+        "constants",
+        "frame_size",
+        "param_slots",
+        "params",
+        "lines",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        code: list[int],
+        constants: list[Any],
+        frame_size: int = 0,
+        param_slots: Optional[list[int]] = None,
+        lines: Optional[dict[int, errors.Span]] = None,
+    ):
+        self.name = name
+        self.code = code
+        self.constants = constants
+        self.frame_size = frame_size
+        self.param_slots = param_slots or []
+        # parameters usually follow the function in its frame, and are then
+        # bound all at once
+        count = len(self.param_slots)
+        consecutive = self.param_slots == list(range(1, count + 1))
+        self.params = slice(1, count + 1) if consecutive else None
+        # span of the statement starting at each offset
+        self.lines = lines or {}
+
+
+def compile_program(ast: Ast) -> CodeObject:
+    """
+    Code running the typechecked ast.
+    """
+    compiler = _Compiler()
+    walk(compiler.compile_steps(ast))
+    return compiler.code_object("<program>")
+
+
+def _binary_opcode(node: BinaryOp) -> int:
+    left_type = node.left.type
+    if isinstance(node, Factor) and (left_type, node.right.type) != (
+        langtypes.INT,
+        langtypes.INT,
+    ):
+        node.invalid_operator()
+
+    match node.op, left_type:
+        case "+", langtypes.STRING:
+            return CONCAT
+        case "+", _:
+            return ADD_INT
+        case "-", _:
+            return SUB_INT
+        case "*", _:
+            return MUL_INT
+        case "/", _:
+            return DIV_INT
+        case "%", _:
+            return MOD_INT
+        case "<", _:
+            return LESS_INT
+        case "<=", _:
+            return LESS_EQUAL_INT
+        case ">", _:
+            return GREATER_INT
+        case ">=", _:
+            return GREATER_EQUAL_INT
+        case "==", _:
+            return EQUAL
+        case "!=", _:
+            return NOT_EQUAL
+        case "&&", _:
+            return AND
+        case "||", _:
+            return OR
+        case _:
+            node.invalid_operator()
+
+
+_LITERALS = (bool, int, str, tuple, type(None))
+
+
+class _Compiler:
+    """
+    Emits the code of a single code object. Functions defined in it are
+    compiled by compilers of their own.
+    """
+
+    def __init__(self):
+        self.code: list[int] = []
+        self.constants: list[Any] = []
+        self.constant_indexes: dict[Hashable, int] = {}
+        self.lines: dict[int, errors.Span] = {}
+        self.labels: set[int] = set()
+
+    def code_object(
+        self, name: str, frame_size: int = 0, param_slots: Optional[list[int]] = None
+    ) -> CodeObject:
+        self.emit(LOAD_CONST, self.constant(None))
+        self.emit(RETURN)
+        return CodeObject(
+            name, self.code, self.constants, frame_size, param_slots, self.lines
+        )
+
+    def emit(self, opcode: int, arg: int = 0) -> int:
+        """
+        Append an instruction, returning its offset.
+        """
+        code = self.code
+        offset = len(code)
+        if code and offset not in self.labels:
+            previous, previous_arg = code[-2], code[-1]
+            fused = _SUPERINSTRUCTIONS.get((previous, opcode))
+            if fused is not None:
+                if fused == LOAD_LOCAL_PAIR:
+                    arg = previous_arg << 16 | arg
+                elif ARGS[previous] is not None:
+                    arg = previous_arg
+                code[-2:] = (fused, arg)
+                return offset - 2
+
+        code.extend((opcode, arg))
+        return offset
+
+    def label(self) -> int:
+        """
+        Offset of the next instruction emitted, which is kept apart from the
+        instruction before it, so that it can be jumped to.
+        """
+        self.labels.add(len(self.code))
+        return len(self.code)
+
+    def patch(self, offset: int):
+        """
+        Make the jump at offset go to the next instruction emitted.
+        """
+        self.code[offset + 1] = self.label()
+
+    def constant(self, value: Any) -> int:
+        # equal literals share an entry, other constants are kept by identity
+        if isinstance(value, _LITERALS):
+            key: Hashable = (type(value), value)
+        else:
+            key = id(value)
+
+        if (index := self.constant_indexes.get(key)) is None:
+            index = self.constant_indexes[key] = len(self.constants)
+            self.constants.append(value)
+        return index
+
+    def load(self, name: str, depth: int, slot: Optional[int]):
+        if slot is None:
+            self.emit(LOAD_GLOBAL, self.constant(name))
+        elif depth == 0:
+            self.emit(LOAD_LOCAL, slot)
+        else:
+            self.emit(LOAD_OUTER, self.constant((depth, slot)))
+
+    def store(self, name: str, depth: int, slot: Optional[int]):
+        if slot is None:
+            self.emit(STORE_GLOBAL, self.constant(name))
+        elif depth == 0:
+            self.emit(STORE_LOCAL, slot)
+        else:
+            self.emit(STORE_OUTER, self.constant((depth, slot)))
+
+    def compile_steps(self, node: Ast) -> Optional[Steps[None]]:
+        """
+        Emit the code of node, as the steps of `walk` if it has children.
+        """
+        compile_node = _NODE_COMPILERS.get(type(node))
+        if compile_node is None:
+            compile_node = _node_compiler(type(node))
+        return compile_node(self, node)
+
+    def literal(self, node: BoolLiteral | IntLiteral | StringLiteral):
+        self.emit(LOAD_CONST, self.constant(node.value))
+
+    def variable(self, node: Variable):
+        self.load(node.value, node.depth, node.slot)
+
+    def binary_op_steps(self, node: BinaryOp) -> Steps[None]:
+        spine = node.spine()
+        yield self.compile_steps(spine[0].left)
+        for op_node in spine:
+            yield self.compile_steps(op_node.right)
+            self.emit(_binary_opcode(op_node))
+
+    def unary_op_steps(self, node: UnaryOp) -> Steps[None]:
+        yield self.compile_steps(node.operand)
+        if node.op == "-":
+            self.emit(NEGATE_INT)
+        elif node.op == "!":
+            self.emit(NOT)
+
+    def array_steps(self, node: ArrayLiteral) -> Steps[None]:
+        match node.members:
+            case None:
+                self.emit(BUILD_ARRAY, 0)
+            case ConstantArrayElements(values=values):
+                # arrays are mutable, so every evaluation gets a fresh copy
+                self.emit(COPY_CONST, self.constant(values))
+            case ArrayElements(members=members):
+                for member in members:
+                    yield self.compile_steps(member.element)
+                self.emit(BUILD_ARRAY, len(members))
+
+    def indexing_steps(self, node: Indexing) -> Steps[None]:
+        yield self.compile_steps(node.element)
+        yield self.compile_steps(node.index)
+        # the node reports indexes out of range
+        self.emit(INDEX, self.constant(node))
+
+    def index_assignment_steps(self, node: IndexAssignment) -> Steps[None]:
+        yield self.compile_steps(node.arrayname)
+        yield self.compile_steps(node.value)
+        yield self.compile_steps(node.index)
+        self.emit(STORE_INDEX)
+
+    def enum_literal(self, node: EnumLiteralSimple):
+        # enum values are never changed, so they can be shared
+        value = langvalues.EnumValue(ty=node.enum_type, variant=node.variant)
+        self.emit(LOAD_CONST, self.constant(value))
+
+    def enum_tuple_steps(self, node: EnumLiteralTuple) -> Steps[None]:
+        yield self.compile_steps(node.inner)
+        self.emit(BUILD_ENUM, self.constant((node.enum_type, node.variant)))
+
+    def call_steps(self, node: FunctionCall) -> Steps[None]:
+        if not node.is_fn:
+            yield from self.struct_init_steps(node)
+            return
+
+        callee = node.callee
+        assert not isinstance(node.args, StructInitMembers)
+        args = node.args.args if node.args else []
+
+        self.load(callee.value, callee.depth, callee.slot)
+        for arg in args:
+            yield self.compile_steps(arg)
+        self.emit(CALL, len(args))
+
+    def struct_init_steps(self, node: FunctionCall) -> Steps[None]:
+        assert isinstance(node.type, langtypes.Struct)
+        assert not isinstance(node.args, FunctionArgs)
+        members = node.args.members if node.args else []
+
+        for member in members:
+            yield self.compile_steps(member.value)
+        names = tuple(str(member.name) for member in members)
+        self.emit(BUILD_STRUCT, self.constant((node.type.struct_name, names)))
+
+    def struct_access(self, node: StructAccess):
+        self.load(node.name, node.depth, node.slot)
+        self.emit(GET_ATTR, self.constant(str(node.member)))
+
+    def struct_assignment_steps(self, node: StructAssignment) -> Steps[None]:
+        access = node.struct_access
+        self.load(access.name, access.depth, access.slot)
+        yield self.compile_steps(node.value)
+        self.emit(SET_ATTR, self.constant(str(access.member)))
+
+    def block_steps(self, node: StatementBlock) -> Steps[None]:
+        if node.frame_size is None:
+            yield from self.statements_steps(node.stmts)
+            return
+
+        self.emit(ENTER_FRAME, node.frame_size)
+        yield from self.statements_steps(node.stmts)
+        self.emit(LEAVE_FRAME)
+
+    def statement_list_steps(self, node: StatementList) -> Steps[None]:
+        return self.statements_steps(node.stmts)
+
+    def declaration_steps(self, node: VariableDeclaration) -> Steps[None]:
+        yield self.compile_steps(node.rvalue)
+        self.store(node.ident, 0, node.slot)
+
+    def assignment_steps(self, node: Assignment) -> Steps[None]:
+        yield self.compile_steps(node.rvalue)
+        self.store(node.lvalue, node.depth, node.slot)
+
+    def print_steps(self, node: PrintStmt) -> Steps[None]:
+        yield self.compile_steps(node.expr)
+        self.emit(PRINT)
+
+    def return_steps(self, node: ReturnStmt) -> Steps[None]:
+        yield self.compile_steps(node.return_value)
+        self.emit(RETURN)
+
+    def declaration(self, node: EnumStmt | StructStmt):
+        # declarations only matter to the typechecker
+        pass
+
+    def fallback(self, node: Ast):
+        self.emit(EVAL, self.constant(node))
+        if isinstance(node, Statement):
+            self.emit(POP_TOP)
+
+    def statements_steps(self, stmts: list[Any]) -> Steps[None]:
+        for stmt in stmts:
+            self.lines[self.label()] = stmt.span
+            yield self.compile_steps(stmt)
+            # the value of an expression statement is not used
+            if isinstance(stmt, (Expression, StructAccess)):
+                self.emit(POP_TOP)
+
+    def if_chain_steps(self, node: IfChain) -> Steps[None]:
+        if_stmts = [node.if_stmt]
+        if node.else_if_ladder:
+            if_stmts.extend(node.else_if_ladder.blocks)
+
+        ends: list[int] = []
+        for i, if_stmt in enumerate(if_stmts):
+            yield self.compile_steps(if_stmt.cond)
+            skip = self.emit(POP_JUMP_IF_FALSE)
+            yield self.compile_steps(if_stmt.true_block)
+            if i < len(if_stmts) - 1 or node.else_block:
+                ends.append(self.emit(JUMP))
+            self.patch(skip)
+
+        if node.else_block:
+            yield self.compile_steps(node.else_block)
+        for end in ends:
+            self.patch(end)
+
+    def while_steps(self, node: WhileStmt) -> Steps[None]:
+        # A loop only has a frame of its own at the top level, where the
+        # variables of its condition are globals, so the condition can run
+        # in the frame of the loop.
+        if node.frame_size is not None:
+            self.emit(ENTER_FRAME, node.frame_size)
+
+        start = self.label()
+        yield self.compile_steps(node.cond)
+        exit = self.emit(POP_JUMP_IF_FALSE)
+        yield self.compile_steps(node.true_block)
+        self.emit(JUMP, start)
+        self.patch(exit)
+
+        if node.frame_size is not None:
+            self.emit(LEAVE_FRAME)
+
+    def for_steps(self, node: ForStmt | ForStmtInt) -> Steps[None]:
+        if isinstance(node, ForStmt):
+            yield self.compile_steps(node.arr_name)
+            self.emit(GET_ITER)
+        else:
+            yield self.compile_steps(node.start)
+            yield self.compile_steps(node.end)
+            self.emit(RANGE)
+
+        # every iteration reuses the same frame
+        if node.frame_size is not None:
+            self.emit(ENTER_FRAME, node.frame_size)
+
+        start = self.label()
+        self.emit(FOR_ITER)
+        self.emit(STORE_LOCAL, node.slot)
+        yield self.compile_steps(node.stmts)
+        self.emit(JUMP, start)
+        self.patch(start)
+
+        if node.frame_size is not None:
+            self.emit(LEAVE_FRAME)
+
+    def match_steps(self, node: MatchStmt) -> Steps[None]:
+        yield self.compile_steps(node.expr)
+
+        ends: list[int] = []
+        for case_ in node.cases.cases:
+            self.emit(MATCH_CASE, self.constant(case_))
+            skip = self.emit(POP_JUMP_IF_FALSE)
+            self.emit(POP_TOP)
+            yield self.compile_steps(case_.block)
+            ends.append(self.emit(JUMP))
+            self.patch(skip)
+
+        self.emit(NO_MATCH)
+        for end in ends:
+            self.patch(end)
+
+    def function_steps(self, node: FunctionDefinition) -> Steps[None]:
+        body = _Compiler()
+        yield body.compile_steps(node.body)
+        code = body.code_object(node.name, node.frame_size, node.param_slots)
+
+        self.emit(MAKE_FUNCTION, self.constant(code))
+        self.store(node.name, 0, node.slot)
+
+
+_NODE_COMPILERS: dict[type, Callable[[_Compiler, Any], Optional[Steps[None]]]] = {
+    BoolLiteral: _Compiler.literal,
+    IntLiteral: _Compiler.literal,
+    StringLiteral: _Compiler.literal,
+    Variable: _Compiler.variable,
+    BinaryOp: _Compiler.binary_op_steps,
+    UnaryOp: _Compiler.unary_op_steps,
+    ArrayLiteral: _Compiler.array_steps,
+    Indexing: _Compiler.indexing_steps,
+    IndexAssignment: _Compiler.index_assignment_steps,
+    EnumLiteralSimple: _Compiler.enum_literal,
+    EnumLiteralTuple: _Compiler.enum_tuple_steps,
+    FunctionCall: _Compiler.call_steps,
+    StructAccess: _Compiler.struct_access,
+    StructAssignment: _Compiler.struct_assignment_steps,
+    StatementBlock: _Compiler.block_steps,
+    StatementList: _Compiler.statement_list_steps,
+    VariableDeclaration: _Compiler.declaration_steps,
+    Assignment: _Compiler.assignment_steps,
+    PrintStmt: _Compiler.print_steps,
+    IfChain: _Compiler.if_chain_steps,
+    WhileStmt: _Compiler.while_steps,
+    ForStmt: _Compiler.for_steps,
+    ForStmtInt: _Compiler.for_steps,
+    MatchStmt: _Compiler.match_steps,
+    FunctionDefinition: _Compiler.function_steps,
+    ReturnStmt: _Compiler.return_steps,
+    EnumStmt: _Compiler.declaration,
+    StructStmt: _Compiler.declaration,
+}
+"""How each kind of node is compiled, looked up by the type of the node
+instead of matching it against every kind in turn, which dominated the time
+taken to compile small programs."""
+
+
+def _node_compiler(
+    cls: type,
+) -> Callable[[_Compiler, Any], Optional[Steps[None]]]:
+    """
+    How nodes of cls are compiled, as for the closest of its base classes in
+    `_NODE_COMPILERS`, or through their `eval` if there is none.
+    """
+    compile_node = next(
+        (_NODE_COMPILERS[base] for base in cls.__mro__ if base in _NODE_COMPILERS),
+        _Compiler.fallback,
+    )
+    _NODE_COMPILERS[cls] = compile_node
+    return compile_node
+
+
+def disassemble(code: CodeObject) -> str:
+    """
+    Listing of the instructions of code, then of the functions it defines.
+    Each line shows the source line of the statements starting there, ">>"
+    for jump targets, the offset, the opcode and its argument, along with
+    what the argument stands for.
+    """
+    targets = {
+        code.code[offset + 1]
+        for offset in range(0, len(code.code), 2)
+        if ARGS[code.code[offset]] == "jump"
+    }
+
+    width = max(map(len, OPNAMES))
+    lines = [f"Disassembly of {code.name}:"]
+    functions: list[CodeObject] = []
+    for offset in range(0, len(code.code), 2):
+        opcode, arg = code.code[offset], code.code[offset + 1]
+        span = code.lines.get(offset)
+        line = str(span.start_line) if span is not None else ""
+        marker = ">>" if offset in targets else ""
+
+        match ARGS[opcode]:
+            case "const":
+                constant = code.constants[arg]
+                if isinstance(constant, CodeObject):
+                    functions.append(constant)
+                    shown = f"{arg} (<code {constant.name}>)"
+                elif isinstance(constant, Ast):
+                    shown = f"{arg} (<{type(constant).__name__}>)"
+                else:
+                    shown = f"{arg} ({reprlib.repr(constant)})"
+            case "jump":
+                shown = f"to {arg}"
+            case "slots":
+                shown = f"{arg >> 16}, {arg & 0xFFFF}"
+            case None:
+                shown = ""
+            case _:
+                shown = str(arg)
+
+        name = OPNAMES[opcode]
+        row = f"{line:>4} {marker:>2} {offset:>5} {name:<{width}} {shown}"
+        lines.append(row.rstrip())
+
+    for function in functions:
+        lines.append("")
+        lines.append(disassemble(function))
+    return "\n".join(lines)
@@ -0,0 +1,227 @@
+import functools
+import gc
+import hashlib
+import importlib
+import io
+import os
+import pickle
+import sys
+import types
+import zlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
+from typing_extensions import override
+
+from compiler import lalr
+
+if TYPE_CHECKING:
+    from compiler.ast.base import Ast
+
+PARSER_CACHE_DIR = Path(__file__).parent / "__parsercache__"
+"""
+Directory holding the pickled, ready-to-use parser instances.
+"""
+
+AST_CACHE_DIR_NAME = "__ryucache__"
+"""
+Name of the directory next to a source file that holds its typechecked AST.
+"""
+
+AST_CACHE_MAX_SIZE = 64 * 2**20
+"""
+Size in bytes above which the least recently used entries of an AST cache
+directory are evicted.
+"""
+
+T = TypeVar("T")
+
+
+class _Pickler(pickle.Pickler):
+    """
+    Lark keeps references to the `re` module inside the lexer configuration.
+    Modules cannot be pickled, so they are stored by name instead.
+    """
+
+    @override
+    def persistent_id(self, obj: Any) -> str | None:
+        if isinstance(obj, types.ModuleType):
+            return obj.__name__
+        return None
+
+
+class _Unpickler(pickle.Unpickler):
+    @override
+    def persistent_load(self, pid: Any) -> Any:
+        return importlib.import_module(pid)
+
+
+def dumps(obj: Any) -> bytes:
+    buf = io.BytesIO()
+    _Pickler(buf, protocol=pickle.HIGHEST_PROTOCOL).dump(obj)
+    return buf.getvalue()
+
+
+def loads(data: bytes) -> Any:
+    return _Unpickler(io.BytesIO(data)).load()
+
+
+def write_atomic(path: Path, data: bytes):
+    """
+    Write data to path such that concurrent readers never see a partially
+    written file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def parser_cache_key(**options: Any) -> str:
+    """
+    Key for a parser built from the generated `compiler.lalr` module with
+    the given options. The generated module embeds the serialized grammar,
+    so hashing it covers both the lark version and the grammar itself.
+    """
+    py = f"{sys.version_info.major}{sys.version_info.minor}"
+    build = f"lalr-{lalr.__version__}-py{py}-{_lalr_digest()}"
+
+    digest = hashlib.sha256(repr(sorted(options.items())).encode())
+    return f"{build}-{digest.hexdigest()[:16]}"
+
+
+@functools.cache
+def _lalr_digest() -> str:
+    """
+    Hash of the contents of `compiler.lalr`. Its modification time and size
+    would be cheaper to read, but a checkout that preserves modification
+    times or a regeneration of the same size within the granularity of the
+    clock would then load the tables of another grammar.
+    """
+    return hashlib.sha256(Path(lalr.__file__).read_bytes()).hexdigest()[:16]
+
+
+def cached_parser(
+    key: str,
+    build: Callable[[], T],
+    directory: Path = PARSER_CACHE_DIR,
+) -> T:
+    """
+    Load the parser stored under key, or build it and store it for the next
+    run, removing the parsers stored for other builds of `compiler.lalr`.
+    The cache is best-effort: a missing, corrupt or unwritable cache only
+    costs the time to build the parser.
+    """
+    path = directory / f"{key}.pickle"
+
+    try:
+        return loads(path.read_bytes())
+    except Exception:
+        pass
+
+    parser = build()
+    try:
+        write_atomic(path, dumps(parser))
+    except (OSError, pickle.PicklingError, TypeError, AttributeError):
+        return parser
+
+    build_key = key.rsplit("-", 1)[0]
+    for stale in directory.glob("*.pickle"):
+        if stale.stem.rsplit("-", 1)[0] != build_key:
+            stale.unlink(missing_ok=True)
+
+    return parser
+
+
+def clear_parser_cache(directory: Path = PARSER_CACHE_DIR):
+    if not directory.is_dir():
+        return
+
+    for path in directory.glob("*.pickle"):
+        path.unlink(missing_ok=True)
+
+
+@functools.cache
+def compiler_version() -> str:
+    """
+    Hash of the compiler sources, so that cached ASTs are invalidated by any
+    change to the AST classes or the typechecker.
+    """
+    digest = hashlib.sha256()
+    package = Path(__file__).parent
+    for path in sorted(package.rglob("*.py")):
+        digest.update(path.relative_to(package).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def ast_cache_path(source_path: Path, source: str) -> Path:
+    """
+    Location of the cached AST for source, read from source_path. Like
+    `__pycache__`, the cache lives in a directory next to the source file.
+    """
+    digest = hashlib.sha256(source.encode())
+    digest.update(compiler_version().encode())
+    key = digest.hexdigest()[:16]
+    return source_path.parent / AST_CACHE_DIR_NAME / f"{source_path.name}.{key}.ast"
+
+
+def load_ast(path: Path) -> "Optional[Ast]":
+    """
+    The AST stored at path, or None on a cache miss. A hit marks the entry
+    as recently used.
+    """
+    # Unpickling creates a large number of objects at once, each of which
+    # would otherwise count towards triggering a garbage collection pass.
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        ast = loads(zlib.decompress(path.read_bytes()))
+        os.utime(path)
+    except Exception:
+        return None
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return ast
+
+
+def store_ast(path: Path, ast: "Ast", max_size: int = AST_CACHE_MAX_SIZE):
+    """
+    Store a typechecked AST at path, replacing the entries for older versions
+    of the same source file. Like the parser cache, failures are ignored.
+    """
+    try:
+        write_atomic(path, zlib.compress(dumps(ast)))
+    except (OSError, pickle.PicklingError, TypeError, AttributeError, RecursionError):
+        return
+
+    source_name = path.name.rsplit(".", 2)[0]
+    for stale in path.parent.glob("*.ast"):
+        if stale != path and stale.name.rsplit(".", 2)[0] == source_name:
+            stale.unlink(missing_ok=True)
+
+    evict(path.parent, max_size)
+
+
+def evict(directory: Path, max_size: int = AST_CACHE_MAX_SIZE):
+    """
+    Delete the least recently used entries of directory until it is no
+    larger than max_size bytes.
+    """
+    entries: list[tuple[float, int, Path]] = []
+    for path in directory.glob("*.ast"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_size:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
@@ -0,0 +1,678 @@
+"""
+Backend compiling a typechecked AST into a tree of Python closures, which is
+run instead of calling `eval` on the nodes. Everything that only depends on
+the program is decided once while compiling: operators are resolved to
+functions of the `operator` module, variables to the frame and slot they
+live in, and the closures of the children of a node are bound as local
+variables of its own closure.
+
+A closure takes the runtime environment and behaves like the `eval` of its
+node: expressions return their value, and statements that stop the ones
+after them return a `Completion`. Nodes without a closure of their own are
+run through their `eval`.
+
+Closures nest Python calls like the nodes they are compiled from, so the
+parts of a program that would exceed the recursion limit run on the
+explicit stack of the "stack" backend instead: nodes nested deeper than
+`MAX_NESTING` are not compiled, and calls run there once the Python frames
+left run out.
+"""
+
+import inspect
+import operator
+import sys
+from typing import Any, Callable, Optional
+from typing_extensions import override
+
+from compiler import errors, langtypes, langvalues
+from compiler.ast.array import (
+    ArrayElement,
+    ArrayElements,
+    ArrayLiteral,
+    ConstantArrayElements,
+    IndexAssignment,
+    Indexing,
+)
+from compiler.ast.base import Ast, Steps, walk
+from compiler.ast.enum import EnumLiteralTuple, EnumStmt
+from compiler.ast.function import (
+    FunctionArgs,
+    FunctionCall,
+    FunctionDefinition,
+    ReturnStmt,
+)
+from compiler.ast.if_stmt import IfChain
+from compiler.ast.literals import BoolLiteral, IntLiteral, StringLiteral
+from compiler.ast.loops import ForStmt, ForStmtInt, WhileStmt
+from compiler.ast.match import MatchStmt
+from compiler.ast.operators import BinaryOp, Factor, UnaryOp
+from compiler.ast.print import PrintStmt
+from compiler.ast.statements import StatementBlock, StatementList
+from compiler.ast.struct import (
+    StructAccess,
+    StructAssignment,
+    StructInitMembers,
+    StructStmt,
+)
+from compiler.ast.variable import Assignment, Variable, VariableDeclaration
+from compiler.env import RuntimeEnvironment
+from compiler.runtime import Completion, Return, TailCall
+
+Code = Callable[[RuntimeEnvironment], Any]
+
+_BINARY_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.floordiv,
+    "%": operator.mod,
+    ">": operator.gt,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+    # both operands are evaluated, as by `eval`
+    "&&": lambda left, right: left and right,
+    "||": lambda left, right: left or right,
+}
+
+
+MAX_NESTING = 100
+"""Nodes deeper than this in the AST run on the explicit stack."""
+
+FRAMES_RESERVED = 50
+"""Python frames kept for the code running between compiled closures, like
+builtins and the steps of the explicit stack."""
+
+
+class _Depth:
+    """
+    How deep compiling and running closures go, which the calls of compiled
+    functions update.
+    """
+
+    __slots__ = ("nesting", "deepest", "frames_left")
+
+    def __init__(self):
+        self.nesting = 0
+        """Depth of the node being compiled."""
+        self.deepest = 0
+        """Depth of the deepest node compiled so far."""
+        self.frames_left = 0
+        """Python frames the calls of compiled functions can still take before
+        the recursion limit, counting the deepest nesting of their bodies."""
+
+
+_depth = _Depth()
+
+
+def compile_program(ast: Ast) -> Code:
+    """
+    Closure running the typechecked ast.
+    """
+    _depth.deepest = 0
+    program: Code = walk(_compile_steps(ast))
+    nesting = _depth.deepest
+
+    def run(env: RuntimeEnvironment) -> Any:
+        frames_left = _depth.frames_left
+        depth, frame = 0, inspect.currentframe()
+        while frame is not None:
+            depth, frame = depth + 1, frame.f_back
+        _depth.frames_left = (
+            sys.getrecursionlimit() - depth - nesting - FRAMES_RESERVED
+        )
+        try:
+            return program(env)
+        finally:
+            _depth.frames_left = frames_left
+
+    return run
+
+
+class CompiledFunction(langvalues.Function):
+    """
+    A Ryu function defined by compiled code, calling the closure of its body
+    in a new frame.
+    """
+
+    __slots__ = (
+        "param_slots",
+        "params",
+        "frame_size",
+        "body",
+        "closure",
+        "definition",
+        "nesting",
+    )
+
+    def __init__(
+        self,
+        param_slots: list[int],
+        frame_size: int,
+        body: Code,
+        closure: RuntimeEnvironment,
+        definition: FunctionDefinition,
+        nesting: int,
+    ):
+        self.param_slots = param_slots
+        # parameters usually follow the function in its frame, and are then
+        # bound all at once
+        count = len(param_slots)
+        consecutive = param_slots == list(range(1, count + 1))
+        self.params = slice(1, count + 1) if consecutive else None
+        self.frame_size = frame_size
+        self.body = body
+        self.closure = closure
+        # the AST of the function runs its calls on the explicit stack
+        self.definition = definition
+        # Python frames taken by a call, at most
+        self.nesting = nesting
+
+    @override
+    def call(self, args: list[Any], env: RuntimeEnvironment) -> Any:
+        frames_left = _depth.frames_left
+        if frames_left < self.nesting:
+            return walk(self.call_steps(args, env))
+
+        frame = RuntimeEnvironment(enclosing=self.closure, size=self.frame_size)
+        slots = frame.slots
+        slots[0] = self
+        if self.params is not None:
+            slots[self.params] = args
+        else:
+            for slot, arg in zip(self.param_slots, args):
+                slots[slot] = arg
+
+        # exceptions end the program, which resets the count
+        _depth.frames_left = frames_left - self.nesting
+        completion = self.body(frame)
+        _depth.frames_left = frames_left
+        if isinstance(completion, Return):
+            return completion.return_value
+
+    @override
+    def call_steps(self, args: list[Any], env: RuntimeEnvironment) -> Any:
+        definition = self.definition
+        fn = langvalues.RyuFunction(
+            self.param_slots,
+            self.frame_size,
+            definition.body,
+            closure=self.closure,
+            reuse_frame=definition.reuse_frame,
+        )
+        return fn.call_steps(args, env)
+
+
+def _compile_steps(node: Ast) -> Steps[Code]:
+    if _depth.nesting == MAX_NESTING:
+        return _stack_code(node)
+
+    _depth.nesting += 1
+    _depth.deepest = max(_depth.deepest, _depth.nesting)
+    try:
+        return (yield from _node_steps(node))
+    finally:
+        _depth.nesting -= 1
+
+
+def _stack_code(node: Ast) -> Code:
+    """
+    Closure running node on the explicit stack of `walk`, like the "stack"
+    backend.
+    """
+
+    def stack(env: RuntimeEnvironment) -> Any:
+        result = walk(node.eval_steps(env))
+        if isinstance(result, TailCall):
+            # the function returning is compiled and expects a Return
+            return Return(walk(result.function.call_steps(result.args, env)))
+        return result
+
+    return stack
+
+
+def _node_steps(node: Ast) -> Steps[Code]:
+    match node:
+        case BoolLiteral(value=value) | IntLiteral(value=value):
+            return lambda env: value
+        case StringLiteral(value=value):
+            return lambda env: value
+        case Variable(value=name):
+            return _load(name, node.depth, node.slot)
+        case BinaryOp():
+            return (yield from _binary_op_steps(node))
+        case UnaryOp(op=op):
+            operand = yield _compile_steps(node.operand)
+            if op == "-":
+                return lambda env: -operand(env)
+            if op == "!":
+                return lambda env: not operand(env)
+            return operand
+        case ArrayElement(element=element):
+            return (yield _compile_steps(element))
+        case ArrayElements(members=members):
+            codes = yield from _compile_all(members)
+            return lambda env: [code(env) for code in codes]
+        case ConstantArrayElements(values=values):
+            # arrays are mutable, so every evaluation gets a fresh copy
+            return lambda env: values.copy()
+        case ArrayLiteral(members=None):
+            return lambda env: []
+        case ArrayLiteral(
+            members=ArrayElements() | ConstantArrayElements() as members
+        ):
+            return (yield _compile_steps(members))
+        case Indexing():
+            return (yield from _indexing_steps(node))
+        case IndexAssignment():
+            return (yield from _index_assignment_steps(node))
+        case EnumLiteralTuple(enum_type=enum_type, variant=variant):
+            inner = yield _compile_steps(node.inner)
+            return lambda env: langvalues.EnumTupleValue(
+                ty=enum_type, variant=variant, tuple_value=inner(env)
+            )
+        case FunctionCall(is_fn=True):
+            return (yield from _call_steps(node))
+        case FunctionCall(is_fn=False):
+            return (yield from _struct_init_steps(node))
+        case StructAccess(name=name, member=member):
+            struct = _load(name, node.depth, node.slot)
+            return lambda env: struct(env).get_attr(member)
+        case StructAssignment():
+            return (yield from _struct_assignment_steps(node))
+        case StatementBlock():
+            return (yield from _block_steps(node))
+        case StatementList():
+            return (yield from _statements_steps(node.stmts))
+        case VariableDeclaration():
+            return (yield from _declaration_steps(node))
+        case Assignment():
+            return (yield from _assignment_steps(node))
+        case PrintStmt():
+            value = yield _compile_steps(node.expr)
+            return lambda env: print(value(env))
+        case IfChain():
+            return (yield from _if_chain_steps(node))
+        case WhileStmt():
+            return (yield from _while_steps(node))
+        case ForStmt() | ForStmtInt():
+            return (yield from _for_steps(node))
+        case MatchStmt():
+            return (yield from _match_steps(node))
+        case FunctionDefinition():
+            return (yield from _function_steps(node))
+        case ReturnStmt():
+            value = yield _compile_steps(node.return_value)
+            return lambda env: Return(value(env))
+        case EnumStmt() | StructStmt():
+            # declarations only matter to the typechecker
+            return lambda env: None
+        case _:
+            return node.eval  # type: ignore
+
+
+# Statements that never return a completion stopping the statements after them
+_SIMPLE_STATEMENTS = (
+    VariableDeclaration,
+    Assignment,
+    IndexAssignment,
+    StructAssignment,
+    PrintStmt,
+    FunctionCall,
+    FunctionDefinition,
+    EnumStmt,
+    StructStmt,
+)
+
+
+def _compile_all(nodes: list[Any]) -> Steps[tuple[Code, ...]]:
+    codes: list[Code] = []
+    for node in nodes:
+        codes.append((yield _compile_steps(node)))
+    return tuple(codes)
+
+
+def _load(name: str, depth: int, slot: Optional[int]) -> Code:
+    if slot is None:
+        return lambda env: env.values[name]
+    if depth == 0:
+        return lambda env: env.slots[slot]
+    if depth == 1:
+        return lambda env: env.parent.slots[slot]  # type: ignore
+
+    def load(env: RuntimeEnvironment) -> Any:
+        for _ in range(depth):
+            env = env.parent  # type: ignore
+        return env.slots[slot]
+
+    return load
+
+
+def _local_slot(node: Ast) -> Optional[int]:
+    """
+    Slot of node if it is a variable of the current frame, whose operators
+    load it directly instead of calling a closure.
+    """
+    if isinstance(node, Variable) and node.depth == 0:
+        return node.slot
+    return None
+
+
+def _binary_op_steps(node: BinaryOp) -> Steps[Code]:
+    spine = node.spine()
+    operators: list[Callable[[Any, Any], Any]] = []
+    for op_node in spine:
+        if (
+            isinstance(op_node, Factor)
+            and op_node.op in ("/", "%")
+            and (op_node.left.type, op_node.right.type)
+            != (langtypes.INT, langtypes.INT)
+        ):
+            op_node.invalid_operator()
+        if (fn := _BINARY_OPERATORS.get(op_node.op)) is None:
+            op_node.invalid_operator()
+        operators.append(fn)
+
+    first = yield _compile_steps(spine[0].left)
+    rights = yield from _compile_all([op_node.right for op_node in spine])
+
+    if len(spine) == 1:
+        [op], [right] = operators, rights
+        left_slot = _local_slot(spine[0].left)
+        if left_slot is not None:
+            right_slot = _local_slot(spine[0].right)
+            if right_slot is not None:
+                return lambda env: op(env.slots[left_slot], env.slots[right_slot])
+            if isinstance(spine[0].right, (IntLiteral, BoolLiteral)):
+                constant = spine[0].right.value
+                return lambda env: op(env.slots[left_slot], constant)
+        return lambda env: op(first(env), right(env))
+
+    # long chains are applied in a loop, which does not nest Python calls
+    steps = tuple(zip(operators, rights))
+
+    def chain(env: RuntimeEnvironment) -> Any:
+        value = first(env)
+        for op, right in steps:
+            value = op(value, right(env))
+        return value
+
+    return chain
+
+
+def _indexing_steps(node: Indexing) -> Steps[Code]:
+    element = yield _compile_steps(node.element)
+    index = yield _compile_steps(node.index)
+    element_slot, index_slot = _local_slot(node.element), _local_slot(node.index)
+
+    if element_slot is not None and index_slot is not None:
+
+        def local_indexing(env: RuntimeEnvironment) -> Any:
+            slots = env.slots
+            array, i = slots[element_slot], slots[index_slot]
+            if len(array) <= i:
+                return node.index_value(array, i)
+            return array[i]
+
+        return local_indexing
+
+    def indexing(env: RuntimeEnvironment) -> Any:
+        array, i = element(env), index(env)
+        if len(array) <= i:
+            return node.index_value(array, i)
+        return array[i]
+
+    return indexing
+
+
+def _index_assignment_steps(node: IndexAssignment) -> Steps[Code]:
+    array = yield _compile_steps(node.arrayname)
+    value = yield _compile_steps(node.value)
+    index = yield _compile_steps(node.index)
+
+    def index_assignment(env: RuntimeEnvironment):
+        target = array(env)
+        new_value = value(env)
+        target[index(env)] = new_value
+
+    return index_assignment
+
+
+def _call_steps(node: FunctionCall) -> Steps[Code]:
+    callee = _load(node.callee.value, node.callee.depth, node.callee.slot)
+    assert not isinstance(node.args, StructInitMembers)
+    args = yield from _compile_all(node.args.args if node.args else [])
+
+    match args:
+        case ():
+            return lambda env: callee(env).call([], env)
+        case (arg,):
+            return lambda env: callee(env).call([arg(env)], env)
+        case (first, second):
+            return lambda env: callee(env).call([first(env), second(env)], env)
+        case (first, second, third):
+            return lambda env: callee(env).call(
+                [first(env), second(env), third(env)], env
+            )
+        case _:
+            return lambda env: callee(env).call([arg(env) for arg in args], env)
+
+
+def _struct_init_steps(node: FunctionCall) -> Steps[Code]:
+    assert isinstance(node.type, langtypes.Struct)
+    assert not isinstance(node.args, FunctionArgs)
+    name = node.type.struct_name
+
+    members = node.args.members if node.args else []
+    names = [str(member.name) for member in members]
+    values = yield from _compile_all([member.value for member in members])
+    attrs = tuple(zip(names, values))
+
+    return lambda env: langvalues.StructValue(
+        name=name, attrs={attr: value(env) for attr, value in attrs}
+    )
+
+
+def _struct_assignment_steps(node: StructAssignment) -> Steps[Code]:
+    access = node.struct_access
+    struct = _load(access.name, access.depth, access.slot)
+    member = str(access.member)
+    value = yield _compile_steps(node.value)
+
+    def struct_assignment(env: RuntimeEnvironment):
+        struct_value = struct(env)
+        struct_value.set_attr(member, value(env))
+
+    return struct_assignment
+
+
+def _statements_steps(stmts: list[Any]) -> Steps[Code]:
+    codes = yield from _compile_all(stmts)
+    if len(codes) == 1:
+        return codes[0]
+
+    if all(isinstance(stmt, _SIMPLE_STATEMENTS) for stmt in stmts[:-1]):
+        # only the last statement can stop the others, so its result is the
+        # result of the list
+        *init, last = codes
+
+        def simple_statements(env: RuntimeEnvironment) -> Any:
+            for code in init:
+                code(env)
+            return last(env)
+
+        return simple_statements
+
+    def statements(env: RuntimeEnvironment) -> Any:
+        for code in codes:
+            if isinstance(completion := code(env), Completion):
+                return completion
+
+    return statements
+
+
+def _block_steps(node: StatementBlock) -> Steps[Code]:
+    body = yield from _statements_steps(node.stmts)
+    size = node.frame_size
+    if size is None:
+        return body
+
+    return lambda env: body(RuntimeEnvironment(enclosing=env, size=size))
+
+
+def _declaration_steps(node: VariableDeclaration) -> Steps[Code]:
+    name, slot = node.ident, node.slot
+    rhs = yield _compile_steps(node.rvalue)
+
+    if slot is None:
+
+        def define(env: RuntimeEnvironment):
+            env.values[name] = rhs(env)
+
+        return define
+
+    def declare(env: RuntimeEnvironment):
+        env.slots[slot] = rhs(env)
+
+    return declare
+
+
+def _assignment_steps(node: Assignment) -> Steps[Code]:
+    name, depth, slot = node.lvalue, node.depth, node.slot
+    rhs = yield _compile_steps(node.rvalue)
+
+    if slot is None:
+
+        def assign_global(env: RuntimeEnvironment):
+            env.set(name, rhs(env))
+
+        return assign_global
+
+    if depth == 0:
+
+        def assign_local(env: RuntimeEnvironment):
+            env.slots[slot] = rhs(env)
+
+        return assign_local
+
+    def assign(env: RuntimeEnvironment):
+        env.store(name, depth, slot, rhs(env))
+
+    return assign
+
+
+def _if_chain_steps(node: IfChain) -> Steps[Code]:
+    if_stmts = [node.if_stmt]
+    if node.else_if_ladder:
+        if_stmts.extend(node.else_if_ladder.blocks)
+
+    conds = yield from _compile_all([if_stmt.cond for if_stmt in if_stmts])
+    blocks = yield from _compile_all([if_stmt.true_block for if_stmt in if_stmts])
+    otherwise = (yield _compile_steps(node.else_block)) if node.else_block else None
+
+    if len(conds) == 1:
+        [cond], [block] = conds, blocks
+        if otherwise is None:
+
+            def if_(env: RuntimeEnvironment) -> Any:
+                if cond(env) is True:
+                    return block(env)
+
+            return if_
+
+        def if_else(env: RuntimeEnvironment) -> Any:
+            if cond(env) is True:
+                return block(env)
+            return otherwise(env)
+
+        return if_else
+
+    branches = tuple(zip(conds, blocks))
+
+    def if_chain(env: RuntimeEnvironment) -> Any:
+        for cond, block in branches:
+            if cond(env) is True:
+                return block(env)
+        if otherwise is not None:
+            return otherwise(env)
+
+    return if_chain
+
+
+def _while_steps(node: WhileStmt) -> Steps[Code]:
+    cond = yield _compile_steps(node.cond)
+    body = yield _compile_steps(node.true_block)
+    size = node.frame_size
+
+    def while_(env: RuntimeEnvironment) -> Any:
+        loop_env = env if size is None else RuntimeEnvironment(env, size=size)
+        while cond(env) is True:
+            if isinstance(completion := body(loop_env), Completion):
+                return completion
+
+    return while_
+
+
+def _for_steps(node: ForStmt | ForStmtInt) -> Steps[Code]:
+    if isinstance(node, ForStmt):
+        values = yield _compile_steps(node.arr_name)
+    else:
+        start = yield _compile_steps(node.start)
+        end = yield _compile_steps(node.end)
+
+        def values(env: RuntimeEnvironment) -> range:
+            return range(start(env), end(env))
+
+    body = yield _compile_steps(node.stmts)
+    size, slot = node.frame_size, node.slot
+
+    def for_(env: RuntimeEnvironment) -> Any:
+        iterated = values(env)
+        loop_env = env if size is None else RuntimeEnvironment(env, size=size)
+        slots = loop_env.slots
+        for value in iterated:
+            slots[slot] = value
+            if isinstance(completion := body(loop_env), Completion):
+                return completion
+
+    return for_
+
+
+def _match_steps(node: MatchStmt) -> Steps[Code]:
+    expr = yield _compile_steps(node.expr)
+    cases = node.cases.cases
+    blocks = yield from _compile_all([case_.block for case_ in cases])
+    arms = tuple(zip(cases, blocks))
+
+    def match_(env: RuntimeEnvironment) -> Any:
+        value = expr(env)
+        for case_, block in arms:
+            if case_.matches(value):
+                return block(env)
+
+        raise errors.InternalCompilerError(
+            "Match statement did not execute any case blocks"
+        )
+
+    return match_
+
+
+def _function_steps(node: FunctionDefinition) -> Steps[Code]:
+    name, slot = node.name, node.slot
+    param_slots, frame_size = node.param_slots, node.frame_size
+    deepest, _depth.deepest = _depth.deepest, _depth.nesting
+    body = yield _compile_steps(node.body)
+    # the frame of the call, then the closures of the body
+    nesting = 1 + _depth.deepest - _depth.nesting
+    _depth.deepest = max(deepest, _depth.deepest)
+
+    def define(env: RuntimeEnvironment):
+        fn = CompiledFunction(param_slots, frame_size, body, env, node, nesting)
+        if slot is None:
+            env.define(name, fn)
+        else:
+            env.slots[slot] = fn
+
+    return define
@@ -1,9 +1,26 @@
-from typing import Any
+import re
+import sys
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Literal, NamedTuple, Optional
 
 from compiler.env import RuntimeEnvironment, TypeEnvironment
 
-from compiler import builtins, errors, langtypes, langvalues
-from compiler.parser import parse, parse_tree_to_ast
+from compiler import (
+    builtins,
+    bytecode,
+    cache,
+    closures,
+    errors,
+    langtypes,
+    langvalues,
+    report,
+    vm,
+)
+from compiler.typechecker import typecheck_program
+from compiler.ast.base import Ast, walk
+from compiler.ast.statements import StatementList
+from compiler.lalr import UnexpectedInput  # type: ignore
+from compiler.parser import DEFAULT_FRONTEND, Frontend, parse_to_ast
 
 BUILTIN_FUNCTIONS: list[type[langvalues.BuiltinFunction]] = [
     builtins.SumFunction,
@@ -18,6 +35,27 @@ BUILTIN_TYPES: list[langtypes.Primitive] = [
     langtypes.STRING,
 ]
 
+Backend = Literal["closures", "bytecode", "tree", "stack"]
+
+BACKENDS: dict[Backend, Callable[[Ast, RuntimeEnvironment], Any]] = {
+    "closures": lambda ast, env: closures.compile_program(ast)(env),
+    "bytecode": lambda ast, env: vm.execute(bytecode.compile_program(ast), env),
+    "tree": lambda ast, env: ast.eval(env),  # type: ignore
+    "stack": lambda ast, env: walk(ast.eval_steps(env)),
+}
+"""
+How typechecked programs are run. "closures" compiles the AST to Python
+closures first (see `compiler.closures`), which is the fastest. "tree" calls
+`eval` down the AST. Both nest Python calls for every Ryu call. "stack" runs
+`eval_steps` on the explicit stack of `walk` instead, so that recursion is
+only bounded by memory, and calls in tail position do not nest at all.
+"bytecode" compiles the AST to the bytecode of `compiler.bytecode` and runs
+it on the virtual machine of `compiler.vm`, which is faster than "tree" and
+does not nest Python calls either.
+"""
+
+DEFAULT_BACKEND: Backend = "closures"
+
 
 def get_default_environs() -> tuple[TypeEnvironment, RuntimeEnvironment]:
     type_env = TypeEnvironment()
@@ -33,19 +71,213 @@ def get_default_environs() -> tuple[TypeEnvironment, RuntimeEnvironment]:
     return (type_env, runtime_env)
 
 
-def run(source: str, type_env: TypeEnvironment, runtime_env: RuntimeEnvironment) -> Any:
+def run(
+    source: str,
+    type_env: TypeEnvironment,
+    runtime_env: RuntimeEnvironment,
+    frontend: Frontend = DEFAULT_FRONTEND,
+    jobs: int = 1,
+    all_errors: bool = False,
+    backend: Backend = DEFAULT_BACKEND,
+) -> Any:
+    """
+    Run the program in source, reporting the first type error, or all of them
+    with all_errors.
+    """
     try:
-        return _run(source, type_env, runtime_env)
-    except errors.CompilerError as err:
+        return _run(
+            source, type_env, runtime_env, frontend, jobs, all_errors, backend
+        )
+    except (errors.CompilerError, errors.Diagnostics) as err:
         err.report(source)
 
 
 def _run(
-    source: str, type_env: TypeEnvironment, runtime_env: RuntimeEnvironment
+    source: str,
+    type_env: TypeEnvironment,
+    runtime_env: RuntimeEnvironment,
+    frontend: Frontend = DEFAULT_FRONTEND,
+    jobs: int = 1,
+    all_errors: bool = False,
+    backend: Backend = DEFAULT_BACKEND,
+) -> Any:
+    ast = parse_to_ast(source, frontend)
+
+    typecheck_program(ast, type_env, jobs, _diagnostics(all_errors))
+
+    return BACKENDS[backend](ast, runtime_env)
+
+
+def disassemble(
+    source: str,
+    type_env: TypeEnvironment,
+    frontend: Frontend = DEFAULT_FRONTEND,
+) -> Optional[str]:
+    """
+    Listing of the bytecode of the program in source, as given by
+    `bytecode.disassemble`, or None after reporting its first type error.
+    """
+    try:
+        ast = parse_to_ast(source, frontend)
+        typecheck_program(ast, type_env)
+        return bytecode.disassemble(bytecode.compile_program(ast))
+    except errors.CompilerError as err:
+        err.report(source)
+
+
+def _diagnostics(all_errors: bool) -> Optional[errors.Diagnostics]:
+    return errors.Diagnostics() if all_errors else None
+
+
+def run_file(
+    path: Path,
+    type_env: TypeEnvironment,
+    runtime_env: RuntimeEnvironment,
+    frontend: Frontend = DEFAULT_FRONTEND,
+    report_cache: bool = False,
+    jobs: int = 1,
+    all_errors: bool = False,
+    backend: Backend = DEFAULT_BACKEND,
 ) -> Any:
-    tree = parse(source)
-    ast = parse_tree_to_ast(tree)
+    """
+    Run the program in path, reusing the typechecked AST from the previous
+    run of the same source if it is in the `__ryucache__` directory next to
+    path. When report_cache is set, cache hits and misses are printed to
+    stderr. jobs is passed on to `typecheck_program`, and all_errors and
+    backend are the same as for `run`.
+    """
+    source = path.read_text()
+    try:
+        return _run_file(
+            path,
+            source,
+            type_env,
+            runtime_env,
+            frontend,
+            report_cache,
+            jobs,
+            all_errors,
+            backend,
+        )
+    except (errors.CompilerError, errors.Diagnostics) as err:
+        err.report(source)
+
+
+def _run_file(
+    path: Path,
+    source: str,
+    type_env: TypeEnvironment,
+    runtime_env: RuntimeEnvironment,
+    frontend: Frontend,
+    report_cache: bool,
+    jobs: int,
+    all_errors: bool,
+    backend: Backend,
+) -> Any:
+    cache_path = cache.ast_cache_path(path, source)
+    ast = cache.load_ast(cache_path)
+
+    if report_cache:
+        status = "miss" if ast is None else "hit"
+        print(f"ryucache {status}: {cache_path}", file=sys.stderr)
+
+    if ast is None:
+        ast = parse_to_ast(source, frontend)
+        typecheck_program(ast, type_env, jobs, _diagnostics(all_errors))
+        cache.store_ast(cache_path, ast)
+
+    return BACKENDS[backend](ast, runtime_env)
+
+
+def run_stream(
+    lines: Iterable[str],
+    type_env: TypeEnvironment,
+    runtime_env: RuntimeEnvironment,
+    frontend: Frontend = DEFAULT_FRONTEND,
+    backend: Backend = DEFAULT_BACKEND,
+):
+    """
+    Run a program while it is being read, one top level statement at a time,
+    so that memory use is bounded by the largest statement instead of the
+    size of the program. lines can be an open file.
+
+    Unlike `run`, statements are typechecked just before they are evaluated,
+    so a type error stops the program after the statements before it have
+    run. Errors are reported at their lines in the whole program.
+    """
+    for chunk in statement_chunks(lines):
+        try:
+            try:
+                ast = parse_to_ast(chunk.source, frontend)
+            except UnexpectedInput:
+                # raise the error again, at its position in the program
+                parse_to_ast(chunk.in_program(), frontend)
+                raise
+
+            stmts = ast.stmts if isinstance(ast, StatementList) else [ast]
+            for stmt in stmts:
+                stmt.typecheck(type_env)
+                BACKENDS[backend](stmt, runtime_env)
+        except errors.CompilerError as err:
+            diagnostic = err.diagnostic().shift(chunk.offset)
+            report.report_error(chunk.in_program(), *diagnostic)
+            return
+
+
+class Chunk(NamedTuple):
+    """
+    Lines holding one or more complete top level statements, along with
+    the offset and the line (counted from 1) at which they start in the
+    whole program.
+    """
+
+    source: str
+    offset: int
+    line: int
+
+    def in_program(self) -> str:
+        """
+        The chunk preceded by as many characters and lines as come before it
+        in the program, so that positions in the result are positions in the
+        program. The filler is mostly a comment, so the result still parses.
+        As it is as large as the program read so far, this is only used to
+        report errors.
+        """
+        newlines = self.line - 1
+        filler = self.offset - newlines
+        prefix = "//" + " " * (filler - 2) if filler >= 2 else " " * filler
+        return prefix + "\n" * newlines + self.source
+
+
+_STRINGS_AND_COMMENTS = re.compile(r'".*?"|//.*')
+
+
+def statement_chunks(lines: Iterable[str]) -> Iterator[Chunk]:
+    """
+    Group lines into chunks of one or more complete top level statements.
+    Statements can only continue on the next line inside braces, so a chunk
+    ends at the first line end where all braces are closed. Lines with
+    nothing but whitespace and comments are dropped between chunks.
+    """
+    chunk: list[str] = []
+    depth = 0
+    offset = line = start_offset = start_line = 0
+
+    for text in lines:
+        code = _STRINGS_AND_COMMENTS.sub("", text)
+        if chunk or code.strip():
+            if not chunk:
+                start_offset, start_line = offset, line + 1
+            chunk.append(text)
+            depth += code.count("{") - code.count("}")
+
+        offset += len(text)
+        line += text.count("\n")
 
-    ast.typecheck(type_env)
+        if chunk and depth <= 0:
+            yield Chunk("".join(chunk), start_offset, start_line)
+            chunk.clear()
+            depth = 0
 
-    return ast.eval(runtime_env)
+    if chunk:
+        yield Chunk("".join(chunk), start_offset, start_line)
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Any, Optional
 from typing_extensions import Self
 
-from compiler.errors import InternalCompilerError
+from compiler.errors import Diagnostics, InternalCompilerError
 from compiler import langtypes
 
 
@@ -11,8 +11,35 @@ class FunctionDefScope:
     return_type: langtypes.Type
 
 
+class FrameLayout:
+    """
+    Slots of a runtime frame, shared by the scope of a function body and the
+    blocks inside it (or by a block at the top level and the blocks inside
+    it). Each variable of these scopes gets its own slot, so a frame is only
+    allocated once per call and blocks or loop iterations run in it.
+    """
+
+    __slots__ = ("size", "captured")
+
+    size: int
+
+    captured: bool
+    """
+    Whether functions are defined in the frame, whose calls can still use it
+    after the block or call it belongs to is done.
+    """
+
+    def __init__(self):
+        self.size = 0
+        self.captured = False
+
+    def allocate(self) -> int:
+        self.size += 1
+        return self.size - 1
+
+
 class TypeEnvironment:
-    parent: Optional[Self]
+    parent: Optional["TypeEnvironment"]
     values: dict[str, langtypes.Type]
     """
     Map from variable name to it's type.
@@ -25,25 +52,97 @@ class TypeEnvironment:
 
     fn_scope: Optional[FunctionDefScope]
 
+    diagnostics: Optional[Diagnostics]
+    """
+    Where type errors are recorded when typechecking keeps going after them,
+    shared by all the scopes of a program.
+    """
+
+    slots: Optional[dict[str, int]]
+    """
+    Index of each variable of the scope in its runtime frame. None for the
+    global scope, whose variables are looked up by name at runtime.
+    """
+
+    layout: Optional[FrameLayout]
+    """
+    The frame the variables of the scope are allocated in, shared with the
+    enclosing scope for blocks inside a frame.
+    """
+
     def __init__(
         self,
-        enclosing: Optional[Self] = None,
+        enclosing: Optional["TypeEnvironment"] = None,
         fn_scope: Optional[FunctionDefScope] = None,
+        frame: bool = False,
+        block: bool = False,
     ):
+        """
+        The scope of a function body (with frame) gets a frame of its own.
+        The scope of a block or loop (with block) allocates its variables in
+        the frame of the enclosing scope, so that running it does not need a
+        new frame, unless the enclosing scope is global.
+        """
         self.values = {}
         self.types = {}
         self.parent = enclosing
         self.fn_scope = fn_scope
+        self.diagnostics = enclosing.diagnostics if enclosing is not None else None
+
+        if frame or (block and (enclosing is None or enclosing.layout is None)):
+            self.slots, self.layout = {}, FrameLayout()
+        elif block:
+            self.slots, self.layout = {}, enclosing.layout  # type: ignore
+        else:
+            self.slots, self.layout = None, None
 
     def define_var_type(self, name: str, value: langtypes.Type):
         self.values[name] = value
+        if self.slots is not None and name not in self.slots:
+            self.slots[name] = self.layout.allocate()  # type: ignore
+
+    def owns_frame(self) -> bool:
+        """
+        Whether the scope is the outermost one of its frame.
+        """
+        return self.layout is not None and (
+            self.parent is None or self.parent.layout is not self.layout
+        )
+
+    def frame_size(self) -> Optional[int]:
+        """
+        Size of the frame to allocate when running the scope, or None if it
+        runs in the frame of the enclosing scope. Frames without variables
+        are never allocated either: nothing can be resolved to them.
+        """
+        if not self.owns_frame() or self.layout.size == 0:  # type: ignore
+            return None
+        return self.layout.size  # type: ignore
+
+    def resolve(self, name: str) -> tuple[int, Optional[int]]:
+        """
+        Where the variable name lives at runtime: the number of frames to go
+        up from the current one and the slot in that frame, or a slot of None
+        if it is a global.
+        """
+        current: Optional[TypeEnvironment] = self
+        depth = 0
+
+        while current is not None and current.slots is not None:
+            if (slot := current.slots.get(name)) is not None:
+                return (depth, slot)
+            if current.owns_frame():
+                depth += 1
+            current = current.parent
+
+        return (0, None)
 
     def get_var_type(self, name: str) -> Optional[langtypes.Type]:
-        current = self
+        current: Optional[TypeEnvironment] = self
 
         while current is not None:
             if (type_ := current.values.get(name)) is not None:
-                return type_
+                return self._found(type_)
             current = current.parent
 
         return None
@@ -52,17 +151,22 @@ class TypeEnvironment:
         self.types[type_name] = type
 
     def get_type(self, type: str) -> Optional[langtypes.Type]:
-        current = self
+        current: Optional[TypeEnvironment] = self
 
         while current is not None:
             if (type_ := current.types.get(type)) is not None:
-                return type_
+                return self._found(type_)
             current = current.parent
 
         return None
 
+    def _found(self, type: langtypes.Type) -> langtypes.Type:
+        if self.diagnostics is not None and langtypes.is_poisoned(type):
+            self.diagnostics.poisoned += 1
+        return type
+
     def fn_return_type(self) -> Optional[langtypes.Type]:
-        current = self
+        current: Optional[TypeEnvironment] = self
 
         while current is not None:
             if (ret := current.fn_scope) is not None:
@@ -73,44 +177,75 @@ class TypeEnvironment:
 
 
 class RuntimeEnvironment:
+    """
+    The global scope of a running program, or the frame of a function call or
+    of a top level block inside it. Global variables are stored by name and shared
+    by all the frames. The variables of a frame are stored in a list, at the
+    slots given by `TypeEnvironment.resolve` during typechecking.
+    """
+
+    __slots__ = ("parent", "values", "slots")
+
     parent: Optional[Self]
+
     values: dict[str, Any]
+    """
+    Map from global variable name to its value.
+    """
 
-    def __init__(self, enclosing: Optional[Self] = None):
-        self.values = {}
+    slots: list[Any]
+
+    def __init__(self, enclosing: Optional[Self] = None, size: int = 0):
         self.parent = enclosing
+        self.values = enclosing.values if enclosing is not None else {}
+        self.slots = [None] * size
 
     def define(self, name: str, value: Any):
         """
-        Define a new variable in the current scope.
+        Define a new global variable.
         """
         # shadowing is allowed
         self.values[name] = value
 
     def set(self, name: str, value: Any):
         """
-        Find the scope in which the variable is defined and set it to a new
-        value in that scope. Searches up the lexical scope heirarchy.
+        Set an existing global variable to a new value.
         """
-        current = self
-
-        while current is not None:
-            if current.values.get(name) is not None:
-                current.values[name] = value
-                return
-            current = current.parent
-
-        raise InternalCompilerError(f"Variable {name} could not be found in any scope")
+        if name not in self.values:
+            raise InternalCompilerError(
+                f"Variable {name} could not be found in any scope"
+            )
+        self.values[name] = value
 
     def get(self, name: str) -> Any:
-        current = self
+        try:
+            return self.values[name]
+        except KeyError:
+            raise InternalCompilerError(f"Variable {name} not defined at runtime")
 
-        while current is not None:
-            if (value := current.values.get(name)) is not None:
-                return value
-            current = current.parent
+    def load(self, name: str, depth: int, slot: Optional[int]) -> Any:
+        """
+        Value of a variable resolved to depth and slot, or of the global name
+        if slot is None.
+        """
+        if slot is None:
+            return self.get(name)
+        return self.frame(depth).slots[slot]
 
-        raise InternalCompilerError(f"Variable {name} not defined at runtime")
+    def store(self, name: str, depth: int, slot: Optional[int], value: Any):
+        if slot is None:
+            self.set(name, value)
+        else:
+            self.frame(depth).slots[slot] = value
+
+    def frame(self, depth: int) -> Self:
+        """
+        The frame depth levels up from this one.
+        """
+        env: Self = self
+        for _ in range(depth):
+            env = env.parent  # type: ignore
+        return env
 
     def is_global(self) -> bool:
         return self.parent is None
@@ -1,6 +1,8 @@
 from abc import abstractmethod
-from typing import ClassVar, Container
+from typing import Any, ClassVar, Container, Optional
+import bisect
 import dataclasses
+import re
 from dataclasses import dataclass
 from typing_extensions import override
 
@@ -15,20 +17,209 @@ from compiler.report import Labels, Text, Label
 LineCol = tuple[int, int]
 
 
-@dataclass
+class LineTable:
+    """
+    Offsets at which the lines of a source start. Nodes only store the
+    offsets of their spans, and these are resolved to lines and columns
+    through the table of their source when they are needed, usually only
+    when an error is reported.
+
+    Like a gap buffer, the table is split at the last edit: the lines after
+    it are stored relative to the end of the source (see `anchor_to_end`),
+    so an edit does not move them, and the next edit only converts the lines
+    between the two.
+    """
+
+    __slots__ = ("source", "_starts", "_gap")
+
+    def __init__(self, source: str):
+        self.source = source
+        self._starts: Optional[list[int]] = None
+        self._gap = 0
+
+    def _table(self) -> list[int]:
+        if self._starts is None:
+            self._starts = [0]
+            self._starts.extend(m.end() for m in _NEWLINE.finditer(self.source))
+            self._gap = len(self._starts)
+        return self._starts
+
+    def starts(self) -> list[int]:
+        table = self._table()
+        end = len(self.source) + 1
+        return table[: self._gap] + [pos + end for pos in table[self._gap :]]
+
+    def line_count(self) -> int:
+        return len(self._table())
+
+    def line_start(self, line: int) -> int:
+        """
+        Offset at which line (counted from 1) starts.
+        """
+        pos = self._table()[line - 1]
+        return pos if line <= self._gap else pos + len(self.source) + 1
+
+    def line(self, pos: int) -> int:
+        """
+        Line (counted from 1) of the offset pos.
+        """
+        table, gap = self._table(), self._gap
+        end = len(self.source) + 1
+        if gap < len(table) and pos >= table[gap] + end:
+            return bisect.bisect_right(table, pos - end, gap)
+        return bisect.bisect_right(table, pos, 0, gap)
+
+    def coord(self, pos: int) -> LineCol:
+        line = self.line(pos)
+        return (line, pos - self.line_start(line) + 1)
+
+    def edit(self, start: int, end: int, text: str, source: Optional[str] = None):
+        """
+        Replace the source between the offsets start and end with text. The
+        edited source can be passed in if the caller has already built it.
+        """
+        if source is None:
+            source = self.source[:start] + text + self.source[end:]
+
+        if self._starts is None:
+            self.source = source
+            return
+
+        starts, gap = self._starts, self._gap
+        # Lines starting inside the replaced text are gone
+        lo, hi = self.line(start), self.line(end)
+
+        # Move the gap to the edit, converting the lines in between
+        length = len(self.source) + 1
+        if gap < lo:
+            starts[gap:lo] = [pos + length for pos in starts[gap:lo]]
+        elif gap > hi:
+            starts[hi:gap] = [pos - length for pos in starts[hi:gap]]
+
+        inserted = [start + m.end() for m in _NEWLINE.finditer(text)]
+        starts[lo:hi] = inserted
+        self._gap = lo + len(inserted)
+        self.source = source
+
+    def __getstate__(self) -> str:
+        return self.source
+
+    def __setstate__(self, source: str):
+        self.source = source
+        self._starts = None
+        self._gap = 0
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "LineTable":
+        # Shared by all the spans of a source, so that copying a span (which
+        # dataclasses.astuple does for errors) does not copy the source.
+        return self
+
+
+_NEWLINE = re.compile("\n")
+
+
 class Span:
-    start_line: int
-    end_line: int
-    start_column: int
-    end_column: int
-    start_pos: int
-    end_pos: int
+    """
+    Start and end offsets of a node in its source, along with lines and
+    columns. Spans made with `Span.lazy` resolve the latter through the
+    `LineTable` of their source only when they are read.
+    """
+
+    __slots__ = ("_start_pos", "_end_pos", "lines", "_coords")
+
+    def __init__(
+        self,
+        start_line: int,
+        end_line: int,
+        start_column: int,
+        end_column: int,
+        start_pos: int,
+        end_pos: int,
+    ):
+        self._start_pos = start_pos
+        self._end_pos = end_pos
+        self.lines: Optional[LineTable] = None
+        self._coords: Optional[tuple[int, int, int, int]] = (
+            start_line,
+            start_column,
+            end_line,
+            end_column,
+        )
+
+    @classmethod
+    def lazy(cls, start_pos: int, end_pos: int, lines: LineTable) -> "Span":
+        """
+        Span whose lines and columns are only computed if they are read.
+        """
+        span = cls.__new__(cls)
+        span._start_pos = start_pos
+        span._end_pos = end_pos
+        span.lines = lines
+        span._coords = None
+        return span
+
+    @property
+    def start_pos(self) -> int:
+        pos = self._start_pos
+        if pos < 0:
+            return pos + len(self.lines.source) + 1  # type: ignore
+        return pos
+
+    @property
+    def end_pos(self) -> int:
+        pos = self._end_pos
+        if pos < 0:
+            return pos + len(self.lines.source) + 1  # type: ignore
+        return pos
 
     def pos(self) -> tuple[int, int]:
         return (self.start_pos, self.end_pos)
 
+    @property
+    def anchored_to_end(self) -> bool:
+        return self._start_pos < 0
+
+    def anchor_to_end(self):
+        """
+        Store the offsets of a lazy span relative to the end of its source
+        (as negative numbers), so that edits before the span do not move it.
+        """
+        if self.lines is not None and self._start_pos >= 0:
+            length = len(self.lines.source) + 1
+            self._start_pos -= length
+            self._end_pos -= length
+
+    def anchor_to_start(self):
+        """
+        Undo `anchor_to_end`, before an edit after the span.
+        """
+        if self.lines is not None and self._start_pos < 0:
+            length = len(self.lines.source) + 1
+            self._start_pos += length
+            self._end_pos += length
+
+    @property
+    def start_line(self) -> int:
+        return self.coord()[0][0]
+
+    @property
+    def start_column(self) -> int:
+        return self.coord()[0][1]
+
+    @property
+    def end_line(self) -> int:
+        return self.coord()[1][0]
+
+    @property
+    def end_column(self) -> int:
+        return self.coord()[1][1]
+
     @classmethod
-    def from_meta(cls, meta: Meta) -> "Span":
+    def from_meta(cls, meta: "Meta | Span") -> "Span":
+        # The hand written parser builds spans directly
+        if isinstance(meta, Span):
+            return meta
+
         return cls(
             start_line=meta.line,
             end_line=meta.end_line,
@@ -57,9 +248,23 @@ class Span:
         )
 
     def coord(self) -> tuple[LineCol, LineCol]:
-        start = (self.start_line, self.start_column)
-        end = (self.end_line, self.end_column)
-        return (start, end)
+        if self._coords is not None:
+            start_line, start_column, end_line, end_column = self._coords
+            return ((start_line, start_column), (end_line, end_column))
+
+        if self.lines is None:
+            raise InternalCompilerError("Span without line information")
+        return (self.lines.coord(self.start_pos), self.lines.coord(self.end_pos))
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Span):
+            return NotImplemented
+        return self.pos() == other.pos()
+
+    @override
+    def __repr__(self) -> str:
+        return f"Span(start_pos={self.start_pos}, end_pos={self.end_pos})"
 
 
 class InternalCompilerError(Exception):
@@ -84,9 +289,10 @@ class CompilerError(Exception):
     def __str__(self) -> str:
         return f"{type(self).__name__}: {self.message}"
 
-    def _report(self, source: str, description: report.Text, labels: report.Labels):
-        report.report_error(
-            source=source,
+    def _diagnostic(
+        self, description: report.Text, labels: report.Labels
+    ) -> report.Diagnostic:
+        return report.Diagnostic(
             start_pos=self.span.start_pos,
             description=description,
             code=self.code,
@@ -94,8 +300,49 @@ class CompilerError(Exception):
         )
 
     @abstractmethod
+    def diagnostic(self) -> report.Diagnostic:
+        """
+        The report of the error: a description and labels on the source.
+        """
+
+    def report(self, source: str):
+        report.report_error(source, *self.diagnostic())
+
+
+class Diagnostics(Exception):
+    """
+    Collects the type errors of a program when typechecking keeps going after
+    them (see `Statement.recovering_steps`), and is raised with all of them
+    once the program is checked.
+    """
+
+    errors: list[CompilerError]
+
+    poisoned: int
+    """Number of lookups that found a poisoned type in the statement being
+    checked. An error raised after one is caused by an earlier error."""
+
+    def __init__(self):
+        super().__init__()
+        self.errors = []
+        self.poisoned = 0
+
+    @override
+    def __str__(self) -> str:
+        return "\n".join(map(str, self.sorted()))
+
+    def add(self, err: CompilerError):
+        self.errors.append(err)
+
+    def sorted(self) -> list[CompilerError]:
+        """
+        The errors in the order of the source. Function bodies can be checked
+        after the statements following them, so they are recorded out of order.
+        """
+        return sorted(self.errors, key=lambda err: err.span.start_pos)
+
     def report(self, source: str):
-        print(self)
+        report.report_errors(source, [err.diagnostic() for err in self.sorted()])
 
 
 @dataclass
@@ -118,7 +365,7 @@ class InvalidOperationError(CompilerError):
     operands: list[OperandSpan]
 
     @override
-    def report(self, source: str):
+    def diagnostic(self) -> report.Diagnostic:
         operator = self.operator
         description: Text
         match self.operands:
@@ -147,7 +394,7 @@ class InvalidOperationError(CompilerError):
                 )
             )
 
-        self._report(source, description, labels)
+        return self._diagnostic(description, labels)
 
 
 @dataclass
@@ -166,7 +413,7 @@ class UnknownVariable(CompilerError):
     variable: str
 
     @override
-    def report(self, source: str):
+    def diagnostic(self) -> report.Diagnostic:
         description = Text(
             "Variable ",
             Text.colored(self.variable),
@@ -178,7 +425,7 @@ class UnknownVariable(CompilerError):
             )
         ]
 
-        self._report(source, description, labels)
+        return self._diagnostic(description, labels)
 
 
 @dataclass
@@ -203,7 +450,7 @@ class UndeclaredVariable(CompilerError):
     variable: str
 
     @override
-    def report(self, source: str):
+    def diagnostic(self) -> report.Diagnostic:
         description = Text(
             "Variable ",
             Text.colored(self.variable),
@@ -216,7 +463,7 @@ class UndeclaredVariable(CompilerError):
                 span=self.span,
             ),
         ]
-        self._report(source, description, labels)
+        return self._diagnostic(description, labels)
 
 
 @dataclass
@@ -241,7 +488,7 @@ class UnexpectedType(CompilerError):
     actual_type: langtypes.Type
 
     @override
-    def report(self, source: str):
+    def diagnostic(self) -> report.Diagnostic:
         description = Text(
             "Expected a type of ",
             Text.colored(self.expected_type.name),
@@ -257,7 +504,7 @@ class UnexpectedType(CompilerError):
             )
         ]
 
-        self._report(source, description, labels)
+        return self._diagnostic(description, labels)
 
 
 @dataclass
@@ -290,7 +537,7 @@ class TypeMismatch(CompilerError):
     expected_type_span: Span
 
     @override
-    def report(self, source: str):
+    def diagnostic(self) -> report.Diagnostic:
         description = Text(
             "Expected a type of ",
             Text.colored(self.expected_type.name),
@@ -321,7 +568,7 @@ class TypeMismatch(CompilerError):
 
         labels = [expected_type_label, actual_type_label]
 
-        self._report(source, description, labels)
+        return self._diagnostic(description, labels)
 
 
 @dataclass
@@ -351,7 +598,7 @@ class DuplicatedCase(CompilerError):
     previous_case_span: Span
 
     @override
-    def report(self, source: str):
+    def diagnostic(self) -> report.Diagnostic:
         description = Text("Duplicated case found in match expression")
 
         first_occurance_label = Label.colored_text(
@@ -368,7 +615,7 @@ class DuplicatedCase(CompilerError):
 
         labels = [first_occurance_label, second_occurance_label]
 
-        self._report(source, description, labels)
+        return self._diagnostic(description, labels)
 
 
 @dataclass
@@ -399,7 +646,7 @@ class InexhaustiveMatch(CompilerError):
     remaining_values: Container[bool | str]
 
     @override
-    def report(self, source: str):
+    def diagnostic(self) -> report.Diagnostic:
         description = Text(
             "Match does not cover all cases for type ",
             Text.colored(self.expected_type.name),
@@ -427,7 +674,7 @@ class InexhaustiveMatch(CompilerError):
 
         labels = [expected_type_label, add_block_label]
 
-        self._report(source, description, labels)
+        return self._diagnostic(description, labels)
 
 
 @dataclass
@@ -439,7 +686,7 @@ class ArrayTypeMismatch(CompilerError):
     expected_type_span: Span
 
     @override
-    def report(self, source: str):
+    def diagnostic(self) -> report.Diagnostic:
         description = Text(
             "Expected array element to be type of ",
             Text.colored(self.expected_type.name),
@@ -469,7 +716,7 @@ class ArrayTypeMismatch(CompilerError):
             ),
         ]
 
-        self._report(source, description, labels)
+        return self._diagnostic(description, labels)
 
 
 @dataclass
@@ -486,7 +733,7 @@ class EmptyArrayWithoutTypeAnnotation(CompilerError):
     code = 9
 
     @override
-    def report(self, source: str):
+    def diagnostic(self) -> report.Diagnostic:
         description = Text(
             "Empty array cannot be declared without specifying data type",
         )
@@ -505,7 +752,7 @@ class EmptyArrayWithoutTypeAnnotation(CompilerError):
             )
         ]
 
-        self._report(source, description, labels)
+        return self._diagnostic(description, labels)
 
 
 @dataclass
@@ -520,7 +767,7 @@ class IndexingNonArray(CompilerError):
     actual_type: langtypes.Type
 
     @override
-    def report(self, source: str):
+    def diagnostic(self) -> report.Diagnostic:
         description = Text(
             " Expression needs to be of ",
             Text.colored("Array"),
@@ -535,7 +782,7 @@ class IndexingNonArray(CompilerError):
             )
         ]
 
-        self._report(source, description, labels)
+        return self._diagnostic(description, labels)
 
 
 @dataclass
@@ -553,7 +800,7 @@ class IndexingOutOfRange(CompilerError):
     index_value: int
 
     @override
-    def report(self, source: str):
+    def diagnostic(self) -> report.Diagnostic:
         description = Text(
             "Indexing is out of range, maximum range is ",
             Text.colored(str(self.length_array - 1)),
@@ -568,7 +815,7 @@ class IndexingOutOfRange(CompilerError):
                 span=self.span,
             )
         ]
-        self._report(source, description, labels)
+        return self._diagnostic(description, labels)
 
 
 @dataclass
@@ -580,7 +827,7 @@ class ArrayIndexAssignmentTypeMismatch(CompilerError):
     expected_type_span: Span
 
     @override
-    def report(self, source: str):
+    def diagnostic(self) -> report.Diagnostic:
         description = Text(
             "Expected a type of ",
             Text.colored(self.expected_type.name),
@@ -613,7 +860,7 @@ class ArrayIndexAssignmentTypeMismatch(CompilerError):
 
         labels = [expected_type_label, actual_type_label]
 
-        self._report(source, description, labels)
+        return self._diagnostic(description, labels)
 
 
 @dataclass
@@ -645,7 +892,7 @@ class DuplicatedAttribute(CompilerError):
     previous_case_span: Span
 
     @override
-    def report(self, source: str):
+    def diagnostic(self) -> report.Diagnostic:
         description = Text("Duplicated attribute found in enum")
 
         first_occurance_label = Label.colored_text(
@@ -662,7 +909,7 @@ class DuplicatedAttribute(CompilerError):
 
         labels = [first_occurance_label, second_occurance_label]
 
-        self._report(source, description, labels)
+        return self._diagnostic(description, labels)
 
 
 @dataclass
@@ -697,7 +944,7 @@ class TypeRedefinition(CompilerError):
     previous_type_span: Span
 
     @override
-    def report(self, source: str):
+    def diagnostic(self) -> report.Diagnostic:
         description = Text("Type ", Text.colored(self.type_name), " is redefined")
 
         first_occurance_label = Label.colored_text(
@@ -714,4 +961,4 @@ class TypeRedefinition(CompilerError):
 
         labels = [first_occurance_label, second_occurance_label]
 
-        self._report(source, description, labels)
+        return self._diagnostic(description, labels)
@@ -0,0 +1,165 @@
+"""
+Incremental reparsing for editors and the REPL, where the same buffer is
+parsed again after every small edit.
+
+Top level statements can never span a line break that is outside of any
+brackets, so only the statements on the lines touched by an edit have to be
+parsed again. The statements before and after the edit are reused as is.
+
+So that the statements after an edit do not have to be moved, their spans
+(and the line table) are stored relative to the end of the source, and the
+ones before it relative to the start. An edit only converts the statements
+between it and the previous edit, so the time it takes is proportional to
+the size of the edit when the edits are close to each other, as they are
+while typing.
+"""
+
+import bisect
+from dataclasses import dataclass
+
+from compiler import errors, pratt
+from compiler.ast.base import Ast, field_names
+from compiler.ast.statements import StatementList
+from compiler.lalr import UnexpectedInput  # type: ignore
+from compiler.parser import parse_to_ast
+
+
+@dataclass
+class TextEdit:
+    """
+    Replacement of the source between the offsets start and end (exclusive)
+    with text.
+    """
+
+    start: int
+    end: int
+    text: str
+
+    def apply(self, source: str) -> str:
+        return source[: self.start] + self.text + source[self.end :]
+
+
+def reparse(
+    previous: Ast, source: str, edit: TextEdit, exact_errors: bool = True
+) -> Ast:
+    """
+    Parse `edit.apply(source)`, given that previous is the AST of source.
+    The result is identical to parsing the edited source from scratch.
+
+    Nodes of previous are reused in the returned AST and their spans are
+    updated in place, so previous must not be used afterwards. If the edited
+    source does not parse, previous is left as the AST of source and can be
+    reparsed with another edit.
+
+    When the edited statements do not parse, the whole source is parsed
+    again to raise the error as `parse_to_ast` would. With exact_errors
+    false, the error of the pratt front end is raised instead, which saves
+    the full parse but can be at a different position, and pratt rejects a
+    few sources that lark accepts (see `compiler.pratt`).
+    """
+    new_source = edit.apply(source)
+
+    # A single statement is not wrapped in a statement list, so there is
+    # nothing to reuse.
+    if not isinstance(previous, StatementList):
+        return parse_to_ast(new_source)
+
+    lines = previous.span.lines
+    if lines is None:
+        # built by the lark front end, whose spans store lines and columns
+        # too, and cannot be anchored to the end of the source
+        return parse_to_ast(new_source)
+
+    stmts = previous.stmts
+
+    # Statements that end on the line where the edit starts, or start on the
+    # line where it ends, are affected too.
+    lo = bisect.bisect_right(stmts, edit.start, key=lambda s: s.span.end_pos)
+    while lo > 0 and source.find("\n", stmts[lo - 1].span.end_pos, edit.start) == -1:
+        lo -= 1
+
+    hi = bisect.bisect_left(stmts, edit.end, key=lambda s: s.span.start_pos)
+    while (
+        hi < len(stmts)
+        and source.find("\n", edit.end, stmts[hi].span.start_pos) == -1
+    ):
+        hi += 1
+
+    # Statements anchored to the end form a suffix of the list
+    i = lo - 1
+    while i >= 0 and stmts[i].span.anchored_to_end:
+        _anchor(stmts[i], to_end=False)
+        i -= 1
+    i = hi
+    while i < len(stmts) and not stmts[i].span.anchored_to_end:
+        _anchor(stmts[i], to_end=True)
+        i += 1
+
+    if lo > 0:
+        span = stmts[lo - 1].span
+        region_start = span.end_pos
+        line, column = span.coord()[1]
+        line_start = region_start - column + 1
+    else:
+        region_start, line, line_start = 0, 1, 0
+
+    start_pos, end_pos = previous.span.pos()
+    pos_delta = len(edit.text) - (edit.end - edit.start)
+    lines.edit(edit.start, edit.end, edit.text, new_source)
+
+    region_end = stmts[hi].span.start_pos if hi < len(stmts) else len(new_source)
+
+    try:
+        tokens = pratt.tokenize(new_source, region_start, region_end, line, line_start)
+        middle = pratt.PrattParser(new_source, tokens, lines).statements()
+    except UnexpectedInput:
+        # the statements have not been replaced yet
+        removed = source[edit.start : edit.end]
+        lines.edit(edit.start, edit.start + len(edit.text), removed, source)
+        if not exact_errors:
+            raise
+        return parse_to_ast(new_source)
+
+    if len(stmts) - (hi - lo) + len(middle) < 2:
+        return parse_to_ast(new_source)
+
+    # The statement list spans all tokens in the file, including newlines
+    # before the first and after the last statement.
+    has_tokens = len(tokens) > 1  # besides the end marker
+
+    if lo == 0 and has_tokens:
+        start_pos = tokens[0][pratt.START_POS]
+    elif lo == 0:
+        start_pos = stmts[hi].span.start_pos
+
+    if hi < len(stmts):
+        end_pos += pos_delta
+    elif has_tokens:
+        end_pos = tokens[-2][pratt.END_POS]
+    else:
+        end_pos = stmts[lo - 1].span.end_pos
+
+    stmts[lo:hi] = middle
+    previous.span = errors.Span.lazy(start_pos, end_pos, lines)
+    return previous
+
+
+def _anchor(node: Ast, to_end: bool):
+    """
+    Anchor the spans of node to the end of the source, or back to its start.
+    """
+    # Besides the span of the node, this covers the spans of identifiers and
+    # operators that some nodes keep for error messages.
+    for name in field_names(type(node)):
+        value = getattr(node, name)
+        if isinstance(value, errors.Span):
+            if to_end:
+                value.anchor_to_end()
+            else:
+                value.anchor_to_start()
+        elif isinstance(value, Ast):
+            _anchor(value, to_end)
+        elif isinstance(value, list):
+            for item in value:  # type: ignore
+                if isinstance(item, Ast):
+                    _anchor(item, to_end)
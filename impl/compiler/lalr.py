@@ -3422,10 +3422,10 @@ class PythonIndenter(Indenter):
 
 import pickle, zlib, base64
 DATA = (
-{'parser': {'lexer_conf': {'terminals': [{'@': 0}, {'@': 1}, {'@': 2}, {'@': 3}, {'@': 4}, {'@': 5}, {'@': 6}, {'@': 7}, {'@': 8}, {'@': 9}, {'@': 10}, {'@': 11}, {'@': 12}, {'@': 13}, {'@': 14}, {'@': 15}, {'@': 16}, {'@': 17}, {'@': 18}, {'@': 19}, {'@': 20}, {'@': 21}, {'@': 22}, {'@': 23}, {'@': 24}, {'@': 25}, {'@': 26}, {'@': 27}, {'@': 28}, {'@': 29}, {'@': 30}, {'@': 31}, {'@': 32}, {'@': 33}, {'@': 34}, {'@': 35}, {'@': 36}, {'@': 37}, {'@': 38}, {'@': 39}, {'@': 40}, {'@': 41}, {'@': 42}, {'@': 43}, {'@': 44}, {'@': 45}, {'@': 46}, {'@': 47}, {'@': 48}, {'@': 49}, {'@': 50}], 'ignore': ['__IGNORE_0', '__IGNORE_1', 'COMMENT'], 'g_regex_flags': 0, 'use_bytes': False, 'lexer_type': 'contextual', '__type__': 'LexerConf'}, 'parser_conf': {'rules': [{'@': 51}, {'@': 52}, {'@': 53}, {'@': 54}, {'@': 55}, {'@': 56}, {'@': 57}, {'@': 58}, {'@': 59}, {'@': 60}, {'@': 61}, {'@': 62}, {'@': 63}, {'@': 64}, {'@': 65}, {'@': 66}, {'@': 67}, {'@': 68}, {'@': 69}, {'@': 70}, {'@': 71}, {'@': 72}, {'@': 73}, {'@': 74}, {'@': 75}, {'@': 76}, {'@': 77}, {'@': 78}, {'@': 79}, {'@': 80}, {'@': 81}, {'@': 82}, {'@': 83}, {'@': 84}, {'@': 85}, {'@': 86}, {'@': 87}, {'@': 88}, {'@': 89}, {'@': 90}, {'@': 91}, {'@': 92}, {'@': 93}, {'@': 94}, {'@': 95}, {'@': 96}, {'@': 97}, {'@': 98}, {'@': 99}, {'@': 100}, {'@': 101}, {'@': 102}, {'@': 103}, {'@': 104}, {'@': 105}, {'@': 106}, {'@': 107}, {'@': 108}, {'@': 109}, {'@': 110}, {'@': 111}, {'@': 112}, {'@': 113}, {'@': 114}, {'@': 115}, {'@': 116}, {'@': 117}, {'@': 118}, {'@': 119}, {'@': 120}, {'@': 121}, {'@': 122}, {'@': 123}, {'@': 124}, {'@': 125}, {'@': 126}, {'@': 127}, {'@': 128}, {'@': 129}, {'@': 130}, {'@': 131}, {'@': 132}, {'@': 133}, {'@': 134}, {'@': 135}, {'@': 136}, {'@': 137}, {'@': 138}, {'@': 139}, {'@': 140}, {'@': 141}, {'@': 142}, {'@': 143}, {'@': 144}, {'@': 145}, {'@': 146}, {'@': 147}, {'@': 148}, {'@': 149}, {'@': 150}, {'@': 151}, {'@': 152}, {'@': 153}, {'@': 154}, {'@': 155}, {'@': 156}, {'@': 157}, {'@': 158}, {'@': 159}, {'@': 160}, {'@': 161}, {'@': 162}, {'@': 163}, {'@': 164}, {'@': 165}, {'@': 166}, {'@': 167}, {'@': 168}, {'@': 169}, {'@': 170}, {'@': 171}, {'@': 172}, {'@': 173}, {'@': 174}, {'@': 175}, {'@': 176}, {'@': 177}, {'@': 178}, {'@': 179}, {'@': 180}, {'@': 181}, {'@': 182}, {'@': 183}, {'@': 184}, {'@': 185}, {'@': 186}, {'@': 187}, {'@': 188}, {'@': 189}, {'@': 190}, {'@': 191}, {'@': 192}, {'@': 193}, {'@': 194}, {'@': 195}, {'@': 196}, {'@': 197}, {'@': 198}, {'@': 199}, {'@': 200}, {'@': 201}, {'@': 202}, {'@': 203}, {'@': 204}], 'start': ['start'], 'parser_type': 'lalr', '__type__': 'ParserConf'}, 'parser': {'tokens': {0: 'LPAR', 1: '__ANON_6', 2: '__ANON_7', 3: 'COMMA', 4: 'LESSTHAN', 5: '__ANON_3', 6: 'PERCENT', 7: 'SLASH', 8: 'PLUS', 9: 'STAR', 10: '__ANON_5', 11: 'LSQB', 12: '__ANON_8', 13: 'MINUS', 14: '__ANON_4', 15: 'RPAR', 16: 'MORETHAN', 17: 'LBRACE', 18: 'RSQB', 19: 'FALSE', 20: 'IF', 21: 'STRUCT', 22: 'FOR', 23: 'RBRACE', 24: 'TRUE', 25: '_NL', 26: 'ENUM', 27: 'INT', 28: 'MATCH', 29: 'RETURN', 30: 'PRINT', 31: 'WHILE', 32: 'IDENTIFIER', 33: 'BANG', 34: '__ANON_1', 35: 'STRING', 36: 'FN', 37: 'LET', 38: '$END', 39: 'DOT', 40: 'EQUAL', 41: '__ANON_0', 42: 'ELSE', 43: 'else_block', 44: 'match_pattern', 45: 'enum_pattern_tuple', 46: 'UNDERSCORE', 47: 'bool_literal', 48: 'array_pattern', 49: 'wildcard_pattern', 50: 'enum_pattern', 51: 'logical', 52: 'unary_op', 53: 'enum_literal_simple', 54: 'factor', 55: 'int_literal', 56: 'term', 57: 'struct_init_members', 58: 'struct_init_member', 59: 'function_call', 60: 'string_literal', 61: 'comparison', 62: 'variable', 63: 'atom', 64: 'array_literal', 65: 'enum_literal_tuple', 66: 'expression', 67: 'equality', 68: 'function_args', 69: 'indexing', 70: 'if_stmt', 71: 'print_stmt', 72: 'enum_stmt', 73: 'statement', 74: 'struct_stmt', 75: 'return_stmt', 76: 'for_stmt_int', 77: '__statement_list_plus_0', 78: 'while_stmt', 79: 'struct_assignment', 80: 'index_assignment', 81: 'struct_access', 82: 'match_stmt', 83: 'if_chain', 84: 'function_definition', 85: 'assignment', 86: 'variable_declaration', 87: 'statement_block', 88: 'for_stmt', 89: 'statement_list', 90: 'array_pattern_element', 91: '__function_args_star_6', 92: 'enum_member_bare', 93: 'enum_member_tuple', 94: 'struct_member', 95: '__struct_init_members_star_7', 96: '__enum_members_plus_4', 97: 'enum_members', 98: 'array_element', 99: '__function_params_star_5', 100: 'array_elements', 101: 'CASE', 102: 'function_param', 103: 'type_annotation', 104: '__ANON_2', 105: 'struct_members', 106: '__struct_members_plus_3', 107: '__array_elements_star_8', 108: 'ELIF', 109: '__case_ladder_plus_2', 110: 'case_stmt', 111: 'case_ladder', 112: 'COLON', 113: 'else_if_stmt', 114: 'else_if_ladder', 115: '__else_if_ladder_plus_1', 116: 'start', 117: '__array_pattern_star_9', 118: 'IN', 119: 'function_params'}, 'states': {0: {0: (0, 7), 1: (1, {'@': 152}), 2: (1, {'@': 152}), 3: (1, {'@': 152}), 4: (1, {'@': 152}), 5: (1, {'@': 152}), 6: (1, {'@': 152}), 7: (1, {'@': 152}), 8: (1, {'@': 152}), 9: (1, {'@': 152}), 10: (1, {'@': 152}), 11: (1, {'@': 152}), 12: (1, {'@': 152}), 13: (1, {'@': 152}), 14: (1, {'@': 152}), 15: (1, {'@': 152}), 16: (1, {'@': 152}), 17: (1, {'@': 152}), 18: (1, {'@': 152}), 19: (1, {'@': 152}), 20: (1, {'@': 152}), 21: (1, {'@': 152}), 22: (1, {'@': 152}), 23: (1, {'@': 152}), 24: (1, {'@': 152}), 25: (1, {'@': 152}), 26: (1, {'@': 152}), 27: (1, {'@': 152}), 28: (1, {'@': 152}), 29: (1, {'@': 152}), 30: (1, {'@': 152}), 31: (1, {'@': 152}), 32: (1, {'@': 152}), 33: (1, {'@': 152}), 34: (1, {'@': 152}), 35: (1, {'@': 152}), 36: (1, {'@': 152}), 37: (1, {'@': 152}), 38: (1, {'@': 152})}, 1: {23: (0, 134)}, 2: {39: (0, 250), 40: (0, 171), 41: (0, 6), 1: (1, {'@': 162}), 19: (1, {'@': 162}), 20: (1, {'@': 162}), 8: (1, {'@': 162}), 9: (1, {'@': 162}), 21: (1, {'@': 162}), 22: (1, {'@': 162}), 23: (1, {'@': 162}), 13: (1, {'@': 162}), 16: (1, {'@': 162}), 24: (1, {'@': 162}), 2: (1, {'@': 162}), 25: (1, {'@': 162}), 4: (1, {'@': 162}), 26: (1, {'@': 162}), 27: (1, {'@': 162}), 5: (1, {'@': 162}), 6: (1, {'@': 162}), 28: (1, {'@': 162}), 29: (1, {'@': 162}), 7: (1, {'@': 162}), 30: (1, {'@': 162}), 0: (1, {'@': 162}), 31: (1, {'@': 162}), 32: (1, {'@': 162}), 33: (1, {'@': 162}), 10: (1, {'@': 162}), 11: (1, {'@': 162}), 12: (1, {'@': 162}), 35: (1, {'@': 162}), 14: (1, {'@': 162}), 36: (1, {'@': 162}), 37: (1, {'@': 162}), 38: (1, {'@': 162})}, 3: {42: (0, 63), 43: (0, 281), 25: (1, {'@': 76}), 19: (1, {'@': 76}), 26: (1, {'@': 76}), 27: (1, {'@': 76}), 4: (1, {'@': 76}), 28: (1, {'@': 76}), 29: (1, {'@': 76}), 20: (1, {'@': 76}), 30: (1, {'@': 76}), 8: (1, {'@': 76}), 0: (1, {'@': 76}), 31: (1, {'@': 76}), 32: (1, {'@': 76}), 33: (1, {'@': 76}), 11: (1, {'@': 76}), 21: (1, {'@': 76}), 22: (1, {'@': 76}), 23: (1, {'@': 76}), 13: (1, {'@': 76}), 35: (1, {'@': 76}), 36: (1, {'@': 76}), 24: (1, {'@': 76}), 37: (1, {'@': 76}), 38: (1, {'@': 76})}, 4: {15: (1, {'@': 172}), 17: (1, {'@': 172})}, 5: {44: (0, 124), 45: (0, 54), 46: (0, 76), 11: (0, 11), 32: (0, 260), 47: (0, 252), 48: (0, 118), 24: (0, 67), 19: (0, 95), 49: (0, 80), 50: (0, 27)}, 6: {32: (0, 110)}, 7: {51: (0, 116), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 57: (0, 18), 47: (0, 286), 58: (0, 31), 59: (0, 120), 60: (0, 94), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 227), 66: (0, 14), 13: (0, 231), 4: (0, 170), 33: (0, 33), 67: (0, 125), 8: (0, 113), 11: (0, 198), 68: (0, 26), 24: (0, 67), 0: (0, 248), 15: (0, 35), 69: (0, 150)}, 8: {66: (0, 13), 51: (0, 116), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 47: (0, 286), 59: (0, 120), 60: (0, 94), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 67: (0, 125), 8: (0, 113), 11: (0, 198), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 9: {32: (0, 2), 51: (0, 116), 54: (0, 62), 70: (0, 166), 55: (0, 207), 71: (0, 270), 72: (0, 48), 28: (0, 16), 59: (0, 120), 60: (0, 94), 73: (0, 257), 56: (0, 78), 61: (0, 130), 74: (0, 101), 75: (0, 179), 76: (0, 160), 62: (0, 168), 77: (0, 206), 63: (0, 42), 52: (0, 279), 78: (0, 28), 66: (0, 138), 22: (0, 154), 33: (0, 33), 67: (0, 125), 79: (0, 147), 80: (0, 106), 0: (0, 248), 11: (0, 198), 30: (0, 239), 36: (0, 222), 20: (0, 71), 53: (0, 212), 27: (0, 283), 81: (0, 274), 35: (0, 87), 19: (0, 95), 82: (0, 225), 83: (0, 173), 47: (0, 286), 26: (0, 156), 64: (0, 181), 65: (0, 192), 84: (0, 17), 25: (0, 258), 85: (0, 182), 29: (0, 36), 31: (0, 119), 13: (0, 231), 4: (0, 170), 86: (0, 72), 8: (0, 113), 87: (0, 243), 88: (0, 285), 37: (0, 109), 24: (0, 67), 89: (0, 200), 21: (0, 193), 69: (0, 150)}, 10: {1: (1, {'@': 165}), 2: (1, {'@': 165}), 3: (1, {'@': 165}), 4: (1, {'@': 165}), 5: (1, {'@': 165}), 6: (1, {'@': 165}), 7: (1, {'@': 165}), 8: (1, {'@': 165}), 9: (1, {'@': 165}), 10: (1, {'@': 165}), 11: (1, {'@': 165}), 12: (1, {'@': 165}), 13: (1, {'@': 165}), 14: (1, {'@': 165}), 15: (1, {'@': 165}), 16: (1, {'@': 165}), 19: (1, {'@': 165}), 20: (1, {'@': 165}), 21: (1, {'@': 165}), 22: (1, {'@': 165}), 23: (1, {'@': 165}), 24: (1, {'@': 165}), 25: (1, {'@': 165}), 26: (1, {'@': 165}), 27: (1, {'@': 165}), 28: (1, {'@': 165}), 29: (1, {'@': 165}), 30: (1, {'@': 165}), 0: (1, {'@': 165}), 31: (1, {'@': 165}), 32: (1, {'@': 165}), 33: (1, {'@': 165}), 35: (1, {'@': 165}), 36: (1, {'@': 165}), 37: (1, {'@': 165}), 17: (1, {'@': 165}), 18: (1, {'@': 165}), 34: (1, {'@': 165}), 38: (1, {'@': 165})}, 11: {90: (0, 230), 55: (0, 216), 27: (0, 283), 46: (0, 76), 18: (0, 4), 49: (0, 223)}, 12: {23: (1, {'@': 194}), 25: (1, {'@': 194}), 32: (1, {'@': 194})}, 13: {3: (1, {'@': 198}), 15: (1, {'@': 198})}, 14: {3: (0, 203), 91: (0, 53), 15: (1, {'@': 144})}, 15: {17: (0, 9)}, 16: {51: (0, 116), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 47: (0, 286), 59: (0, 120), 60: (0, 94), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 67: (0, 125), 8: (0, 113), 11: (0, 198), 24: (0, 67), 66: (0, 58), 0: (0, 248), 69: (0, 150)}, 17: {25: (1, {'@': 65}), 19: (1, {'@': 65}), 26: (1, {'@': 65}), 27: (1, {'@': 65}), 4: (1, {'@': 65}), 28: (1, {'@': 65}), 29: (1, {'@': 65}), 20: (1, {'@': 65}), 30: (1, {'@': 65}), 8: (1, {'@': 65}), 0: (1, {'@': 65}), 31: (1, {'@': 65}), 32: (1, {'@': 65}), 33: (1, {'@': 65}), 11: (1, {'@': 65}), 21: (1, {'@': 65}), 22: (1, {'@': 65}), 23: (1, {'@': 65}), 13: (1, {'@': 65}), 35: (1, {'@': 65}), 36: (1, {'@': 65}), 24: (1, {'@': 65}), 37: (1, {'@': 65}), 38: (1, {'@': 65})}, 18: {15: (0, 256)}, 19: {32: (0, 29), 92: (0, 56), 25: (0, 12), 93: (0, 111), 23: (1, {'@': 103})}, 20: {32: (0, 2), 51: (0, 116), 54: (0, 62), 87: (0, 105), 70: (0, 166), 55: (0, 207), 71: (0, 270), 72: (0, 48), 28: (0, 16), 59: (0, 120), 60: (0, 94), 73: (0, 257), 56: (0, 78), 61: (0, 130), 74: (0, 101), 75: (0, 179), 76: (0, 160), 62: (0, 168), 77: (0, 206), 63: (0, 42), 52: (0, 279), 78: (0, 28), 66: (0, 138), 22: (0, 154), 33: (0, 33), 67: (0, 125), 79: (0, 147), 80: (0, 106), 0: (0, 248), 11: (0, 198), 30: (0, 239), 36: (0, 222), 20: (0, 71), 53: (0, 212), 27: (0, 283), 81: (0, 274), 35: (0, 87), 19: (0, 95), 82: (0, 225), 83: (0, 173), 47: (0, 286), 26: (0, 156), 64: (0, 181), 65: (0, 192), 84: (0, 17), 25: (0, 258), 85: (0, 182), 29: (0, 36), 31: (0, 119), 13: (0, 231), 4: (0, 170), 86: (0, 72), 8: (0, 113), 88: (0, 285), 37: (0, 109), 24: (0, 67), 89: (0, 200), 21: (0, 193), 69: (0, 150)}, 21: {23: (0, 161)}, 22: {3: (1, {'@': 204}), 18: (1, {'@': 204})}, 23: {19: (1, {'@': 177}), 20: (1, {'@': 177}), 8: (1, {'@': 177}), 21: (1, {'@': 177}), 22: (1, {'@': 177}), 23: (1, {'@': 177}), 13: (1, {'@': 177}), 24: (1, {'@': 177}), 25: (1, {'@': 177}), 26: (1, {'@': 177}), 27: (1, {'@': 177}), 4: (1, {'@': 177}), 28: (1, {'@': 177}), 29: (1, {'@': 177}), 30: (1, {'@': 177}), 0: (1, {'@': 177}), 31: (1, {'@': 177}), 32: (1, {'@': 177}), 33: (1, {'@': 177}), 11: (1, {'@': 177}), 35: (1, {'@': 177}), 36: (1, {'@': 177}), 37: (1, {'@': 177}), 38: (1, {'@': 177})}, 24: {94: (0, 204), 32: (0, 143), 25: (0, 228), 23: (1, {'@': 98})}, 25: {1: (1, {'@': 127}), 2: (1, {'@': 127}), 10: (1, {'@': 127}), 3: (1, {'@': 127}), 4: (1, {'@': 127}), 12: (1, {'@': 127}), 5: (1, {'@': 127}), 14: (1, {'@': 127}), 15: (1, {'@': 127}), 16: (1, {'@': 127}), 25: (1, {'@': 127}), 19: (1, {'@': 127}), 26: (1, {'@': 127}), 27: (1, {'@': 127}), 28: (1, {'@': 127}), 29: (1, {'@': 127}), 20: (1, {'@': 127}), 30: (1, {'@': 127}), 8: (1, {'@': 127}), 0: (1, {'@': 127}), 31: (1, {'@': 127}), 36: (1, {'@': 127}), 32: (1, {'@': 127}), 33: (1, {'@': 127}), 11: (1, {'@': 127}), 21: (1, {'@': 127}), 22: (1, {'@': 127}), 23: (1, {'@': 127}), 13: (1, {'@': 127}), 35: (1, {'@': 127}), 24: (1, {'@': 127}), 37: (1, {'@': 127}), 17: (1, {'@': 127}), 38: (1, {'@': 127}), 18: (1, {'@': 127}), 34: (1, {'@': 127})}, 26: {15: (0, 61)}, 27: {15: (1, {'@': 87}), 17: (1, {'@': 87})}, 28: {25: (1, {'@': 59}), 19: (1, {'@': 59}), 26: (1, {'@': 59}), 27: (1, {'@': 59}), 4: (1, {'@': 59}), 28: (1, {'@': 59}), 29: (1, {'@': 59}), 20: (1, {'@': 59}), 30: (1, {'@': 59}), 8: (1, {'@': 59}), 0: (1, {'@': 59}), 31: (1, {'@': 59}), 32: (1, {'@': 59}), 33: (1, {'@': 59}), 11: (1, {'@': 59}), 21: (1, {'@': 59}), 22: (1, {'@': 59}), 23: (1, {'@': 59}), 13: (1, {'@': 59}), 35: (1, {'@': 59}), 36: (1, {'@': 59}), 24: (1, {'@': 59}), 37: (1, {'@': 59}), 38: (1, {'@': 59})}, 29: {0: (0, 139), 23: (1, {'@': 104}), 25: (1, {'@': 104}), 32: (1, {'@': 104})}, 30: {17: (0, 32)}, 31: {95: (0, 262), 3: (0, 157), 15: (1, {'@': 154})}, 32: {96: (0, 19), 92: (0, 82), 32: (0, 29), 25: (0, 75), 93: (0, 89), 97: (0, 93)}, 33: {32: (0, 121), 53: (0, 212), 27: (0, 283), 35: (0, 87), 62: (0, 0), 55: (0, 207), 19: (0, 95), 13: (0, 231), 47: (0, 286), 4: (0, 170), 33: (0, 33), 8: (0, 113), 59: (0, 120), 11: (0, 198), 63: (0, 42), 60: (0, 94), 24: (0, 67), 52: (0, 49), 0: (0, 248), 64: (0, 181), 65: (0, 192), 69: (0, 150)}, 34: {23: (1, {'@': 185}), 25: (1, {'@': 185}), 32: (1, {'@': 185})}, 35: {1: (1, {'@': 141}), 2: (1, {'@': 141}), 3: (1, {'@': 141}), 4: (1, {'@': 141}), 5: (1, {'@': 141}), 6: (1, {'@': 141}), 7: (1, {'@': 141}), 8: (1, {'@': 141}), 9: (1, {'@': 141}), 10: (1, {'@': 141}), 11: (1, {'@': 141}), 12: (1, {'@': 141}), 13: (1, {'@': 141}), 14: (1, {'@': 141}), 15: (1, {'@': 141}), 16: (1, {'@': 141}), 19: (1, {'@': 141}), 20: (1, {'@': 141}), 21: (1, {'@': 141}), 22: (1, {'@': 141}), 23: (1, {'@': 141}), 24: (1, {'@': 141}), 25: (1, {'@': 141}), 26: (1, {'@': 141}), 27: (1, {'@': 141}), 28: (1, {'@': 141}), 29: (1, {'@': 141}), 30: (1, {'@': 141}), 0: (1, {'@': 141}), 31: (1, {'@': 141}), 32: (1, {'@': 141}), 33: (1, {'@': 141}), 35: (1, {'@': 141}), 36: (1, {'@': 141}), 37: (1, {'@': 141}), 17: (1, {'@': 141}), 18: (1, {'@': 141}), 34: (1, {'@': 141}), 38: (1, {'@': 141})}, 36: {51: (0, 116), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 47: (0, 286), 66: (0, 264), 59: (0, 120), 60: (0, 94), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 67: (0, 125), 8: (0, 113), 11: (0, 198), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 37: {25: (1, {'@': 70}), 19: (1, {'@': 70}), 26: (1, {'@': 70}), 27: (1, {'@': 70}), 4: (1, {'@': 70}), 28: (1, {'@': 70}), 29: (1, {'@': 70}), 20: (1, {'@': 70}), 30: (1, {'@': 70}), 8: (1, {'@': 70}), 0: (1, {'@': 70}), 31: (1, {'@': 70}), 32: (1, {'@': 70}), 33: (1, {'@': 70}), 11: (1, {'@': 70}), 21: (1, {'@': 70}), 22: (1, {'@': 70}), 23: (1, {'@': 70}), 13: (1, {'@': 70}), 35: (1, {'@': 70}), 36: (1, {'@': 70}), 24: (1, {'@': 70}), 37: (1, {'@': 70}), 38: (1, {'@': 70})}, 38: {3: (1, {'@': 202}), 18: (1, {'@': 202})}, 39: {51: (0, 116), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 47: (0, 286), 66: (0, 50), 59: (0, 120), 60: (0, 94), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 67: (0, 125), 8: (0, 113), 11: (0, 198), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 40: {3: (1, {'@': 197}), 15: (1, {'@': 197})}, 41: {25: (1, {'@': 95}), 19: (1, {'@': 95}), 26: (1, {'@': 95}), 27: (1, {'@': 95}), 4: (1, {'@': 95}), 28: (1, {'@': 95}), 29: (1, {'@': 95}), 20: (1, {'@': 95}), 30: (1, {'@': 95}), 8: (1, {'@': 95}), 0: (1, {'@': 95}), 31: (1, {'@': 95}), 32: (1, {'@': 95}), 33: (1, {'@': 95}), 11: (1, {'@': 95}), 21: (1, {'@': 95}), 22: (1, {'@': 95}), 23: (1, {'@': 95}), 13: (1, {'@': 95}), 35: (1, {'@': 95}), 36: (1, {'@': 95}), 24: (1, {'@': 95}), 37: (1, {'@': 95}), 38: (1, {'@': 95})}, 42: {1: (1, {'@': 142}), 2: (1, {'@': 142}), 3: (1, {'@': 142}), 4: (1, {'@': 142}), 5: (1, {'@': 142}), 6: (1, {'@': 142}), 7: (1, {'@': 142}), 8: (1, {'@': 142}), 9: (1, {'@': 142}), 10: (1, {'@': 142}), 11: (1, {'@': 142}), 12: (1, {'@': 142}), 13: (1, {'@': 142}), 14: (1, {'@': 142}), 15: (1, {'@': 142}), 16: (1, {'@': 142}), 19: (1, {'@': 142}), 20: (1, {'@': 142}), 21: (1, {'@': 142}), 22: (1, {'@': 142}), 23: (1, {'@': 142}), 24: (1, {'@': 142}), 25: (1, {'@': 142}), 26: (1, {'@': 142}), 27: (1, {'@': 142}), 28: (1, {'@': 142}), 29: (1, {'@': 142}), 30: (1, {'@': 142}), 0: (1, {'@': 142}), 31: (1, {'@': 142}), 32: (1, {'@': 142}), 33: (1, {'@': 142}), 35: (1, {'@': 142}), 36: (1, {'@': 142}), 37: (1, {'@': 142}), 17: (1, {'@': 142}), 18: (1, {'@': 142}), 34: (1, {'@': 142}), 38: (1, {'@': 142})}, 43: {52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 47: (0, 286), 59: (0, 120), 60: (0, 94), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 8: (0, 113), 11: (0, 198), 61: (0, 183), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 44: {51: (0, 116), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 98: (0, 92), 66: (0, 195), 47: (0, 286), 59: (0, 120), 60: (0, 94), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 67: (0, 125), 8: (0, 113), 11: (0, 198), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 45: {99: (0, 122), 3: (0, 51), 15: (1, {'@': 109})}, 46: {51: (0, 116), 98: (0, 96), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 66: (0, 195), 47: (0, 286), 59: (0, 120), 60: (0, 94), 100: (0, 169), 61: (0, 130), 18: (0, 190), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 67: (0, 125), 8: (0, 113), 11: (0, 198), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 47: {23: (1, {'@': 183}), 25: (1, {'@': 183}), 101: (1, {'@': 183})}, 48: {25: (1, {'@': 62}), 19: (1, {'@': 62}), 26: (1, {'@': 62}), 27: (1, {'@': 62}), 4: (1, {'@': 62}), 28: (1, {'@': 62}), 29: (1, {'@': 62}), 20: (1, {'@': 62}), 30: (1, {'@': 62}), 8: (1, {'@': 62}), 0: (1, {'@': 62}), 31: (1, {'@': 62}), 32: (1, {'@': 62}), 33: (1, {'@': 62}), 11: (1, {'@': 62}), 21: (1, {'@': 62}), 22: (1, {'@': 62}), 23: (1, {'@': 62}), 13: (1, {'@': 62}), 35: (1, {'@': 62}), 36: (1, {'@': 62}), 24: (1, {'@': 62}), 37: (1, {'@': 62}), 38: (1, {'@': 62})}, 49: {1: (1, {'@': 135}), 2: (1, {'@': 135}), 10: (1, {'@': 135}), 3: (1, {'@': 135}), 4: (1, {'@': 135}), 12: (1, {'@': 135}), 6: (1, {'@': 135}), 5: (1, {'@': 135}), 13: (1, {'@': 135}), 7: (1, {'@': 135}), 8: (1, {'@': 135}), 14: (1, {'@': 135}), 15: (1, {'@': 135}), 16: (1, {'@': 135}), 9: (1, {'@': 135}), 19: (1, {'@': 135}), 20: (1, {'@': 135}), 21: (1, {'@': 135}), 22: (1, {'@': 135}), 23: (1, {'@': 135}), 24: (1, {'@': 135}), 25: (1, {'@': 135}), 26: (1, {'@': 135}), 27: (1, {'@': 135}), 28: (1, {'@': 135}), 29: (1, {'@': 135}), 30: (1, {'@': 135}), 0: (1, {'@': 135}), 31: (1, {'@': 135}), 32: (1, {'@': 135}), 33: (1, {'@': 135}), 11: (1, {'@': 135}), 35: (1, {'@': 135}), 36: (1, {'@': 135}), 37: (1, {'@': 135}), 17: (1, {'@': 135}), 38: (1, {'@': 135}), 18: (1, {'@': 135}), 34: (1, {'@': 135})}, 50: {15: (0, 149)}, 51: {32: (0, 153), 102: (0, 191)}, 52: {25: (1, {'@': 100}), 19: (1, {'@': 100}), 26: (1, {'@': 100}), 27: (1, {'@': 100}), 4: (1, {'@': 100}), 28: (1, {'@': 100}), 29: (1, {'@': 100}), 20: (1, {'@': 100}), 30: (1, {'@': 100}), 8: (1, {'@': 100}), 0: (1, {'@': 100}), 31: (1, {'@': 100}), 32: (1, {'@': 100}), 33: (1, {'@': 100}), 11: (1, {'@': 100}), 21: (1, {'@': 100}), 22: (1, {'@': 100}), 23: (1, {'@': 100}), 13: (1, {'@': 100}), 40: (1, {'@': 100}), 35: (1, {'@': 100}), 36: (1, {'@': 100}), 24: (1, {'@': 100}), 37: (1, {'@': 100}), 38: (1, {'@': 100})}, 53: {3: (0, 8), 15: (1, {'@': 143})}, 54: {15: (1, {'@': 88}), 17: (1, {'@': 88})}, 55: {32: (0, 202), 103: (0, 196)}, 56: {23: (1, {'@': 192}), 25: (1, {'@': 192}), 32: (1, {'@': 192})}, 57: {23: (0, 269)}, 58: {17: (0, 131)}, 59: {52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 51: (0, 132), 56: (0, 78), 47: (0, 286), 59: (0, 120), 60: (0, 94), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 8: (0, 113), 11: (0, 198), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 60: {18: (0, 10)}, 61: {1: (1, {'@': 139}), 2: (1, {'@': 139}), 3: (1, {'@': 139}), 4: (1, {'@': 139}), 5: (1, {'@': 139}), 6: (1, {'@': 139}), 7: (1, {'@': 139}), 8: (1, {'@': 139}), 9: (1, {'@': 139}), 10: (1, {'@': 139}), 11: (1, {'@': 139}), 12: (1, {'@': 139}), 13: (1, {'@': 139}), 14: (1, {'@': 139}), 15: (1, {'@': 139}), 16: (1, {'@': 139}), 19: (1, {'@': 139}), 20: (1, {'@': 139}), 21: (1, {'@': 139}), 22: (1, {'@': 139}), 23: (1, {'@': 139}), 24: (1, {'@': 139}), 25: (1, {'@': 139}), 26: (1, {'@': 139}), 27: (1, {'@': 139}), 28: (1, {'@': 139}), 29: (1, {'@': 139}), 30: (1, {'@': 139}), 0: (1, {'@': 139}), 31: (1, {'@': 139}), 32: (1, {'@': 139}), 33: (1, {'@': 139}), 35: (1, {'@': 139}), 36: (1, {'@': 139}), 37: (1, {'@': 139}), 17: (1, {'@': 139}), 18: (1, {'@': 139}), 34: (1, {'@': 139}), 38: (1, {'@': 139})}, 62: {13: (0, 81), 8: (0, 213), 1: (1, {'@': 128}), 2: (1, {'@': 128}), 10: (1, {'@': 128}), 3: (1, {'@': 128}), 4: (1, {'@': 128}), 12: (1, {'@': 128}), 5: (1, {'@': 128}), 14: (1, {'@': 128}), 15: (1, {'@': 128}), 16: (1, {'@': 128}), 25: (1, {'@': 128}), 19: (1, {'@': 128}), 26: (1, {'@': 128}), 27: (1, {'@': 128}), 28: (1, {'@': 128}), 29: (1, {'@': 128}), 20: (1, {'@': 128}), 30: (1, {'@': 128}), 0: (1, {'@': 128}), 31: (1, {'@': 128}), 36: (1, {'@': 128}), 32: (1, {'@': 128}), 33: (1, {'@': 128}), 11: (1, {'@': 128}), 21: (1, {'@': 128}), 22: (1, {'@': 128}), 23: (1, {'@': 128}), 35: (1, {'@': 128}), 24: (1, {'@': 128}), 37: (1, {'@': 128}), 17: (1, {'@': 128}), 38: (1, {'@': 128}), 18: (1, {'@': 128}), 34: (1, {'@': 128})}, 63: {17: (0, 242)}, 64: {23: (1, {'@': 105}), 25: (1, {'@': 105}), 32: (1, {'@': 105})}, 65: {104: (0, 133)}, 66: {61: (0, 226), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 47: (0, 286), 59: (0, 120), 60: (0, 94), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 8: (0, 113), 11: (0, 198), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 67: {15: (1, {'@': 156}), 1: (1, {'@': 156}), 2: (1, {'@': 156}), 3: (1, {'@': 156}), 4: (1, {'@': 156}), 5: (1, {'@': 156}), 6: (1, {'@': 156}), 7: (1, {'@': 156}), 8: (1, {'@': 156}), 9: (1, {'@': 156}), 10: (1, {'@': 156}), 11: (1, {'@': 156}), 12: (1, {'@': 156}), 13: (1, {'@': 156}), 14: (1, {'@': 156}), 16: (1, {'@': 156}), 19: (1, {'@': 156}), 20: (1, {'@': 156}), 21: (1, {'@': 156}), 22: (1, {'@': 156}), 23: (1, {'@': 156}), 24: (1, {'@': 156}), 25: (1, {'@': 156}), 26: (1, {'@': 156}), 27: (1, {'@': 156}), 28: (1, {'@': 156}), 29: (1, {'@': 156}), 30: (1, {'@': 156}), 0: (1, {'@': 156}), 31: (1, {'@': 156}), 32: (1, {'@': 156}), 33: (1, {'@': 156}), 35: (1, {'@': 156}), 36: (1, {'@': 156}), 37: (1, {'@': 156}), 17: (1, {'@': 156}), 18: (1, {'@': 156}), 34: (1, {'@': 156}), 38: (1, {'@': 156})}, 68: {32: (0, 202), 103: (0, 99)}, 69: {51: (0, 116), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 47: (0, 286), 59: (0, 120), 60: (0, 94), 67: (0, 90), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 8: (0, 113), 11: (0, 198), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 70: {23: (0, 127)}, 71: {51: (0, 116), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 47: (0, 286), 59: (0, 120), 60: (0, 94), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 67: (0, 125), 8: (0, 113), 66: (0, 128), 11: (0, 198), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 72: {25: (1, {'@': 55}), 19: (1, {'@': 55}), 26: (1, {'@': 55}), 27: (1, {'@': 55}), 4: (1, {'@': 55}), 28: (1, {'@': 55}), 29: (1, {'@': 55}), 20: (1, {'@': 55}), 30: (1, {'@': 55}), 8: (1, {'@': 55}), 0: (1, {'@': 55}), 31: (1, {'@': 55}), 32: (1, {'@': 55}), 33: (1, {'@': 55}), 11: (1, {'@': 55}), 21: (1, {'@': 55}), 22: (1, {'@': 55}), 23: (1, {'@': 55}), 13: (1, {'@': 55}), 35: (1, {'@': 55}), 36: (1, {'@': 55}), 24: (1, {'@': 55}), 37: (1, {'@': 55}), 38: (1, {'@': 55})}, 73: {25: (1, {'@': 74}), 19: (1, {'@': 74}), 26: (1, {'@': 74}), 27: (1, {'@': 74}), 4: (1, {'@': 74}), 28: (1, {'@': 74}), 29: (1, {'@': 74}), 20: (1, {'@': 74}), 30: (1, {'@': 74}), 8: (1, {'@': 74}), 0: (1, {'@': 74}), 31: (1, {'@': 74}), 32: (1, {'@': 74}), 33: (1, {'@': 74}), 11: (1, {'@': 74}), 21: (1, {'@': 74}), 22: (1, {'@': 74}), 23: (1, {'@': 74}), 13: (1, {'@': 74}), 35: (1, {'@': 74}), 36: (1, {'@': 74}), 24: (1, {'@': 74}), 37: (1, {'@': 74}), 38: (1, {'@': 74})}, 74: {32: (0, 2), 51: (0, 116), 54: (0, 62), 70: (0, 166), 55: (0, 207), 71: (0, 270), 72: (0, 48), 28: (0, 16), 59: (0, 120), 60: (0, 94), 73: (0, 257), 56: (0, 78), 61: (0, 130), 74: (0, 101), 75: (0, 179), 76: (0, 160), 62: (0, 168), 77: (0, 206), 63: (0, 42), 52: (0, 279), 78: (0, 28), 66: (0, 138), 22: (0, 154), 87: (0, 282), 33: (0, 33), 67: (0, 125), 79: (0, 147), 80: (0, 106), 0: (0, 248), 11: (0, 198), 30: (0, 239), 36: (0, 222), 20: (0, 71), 53: (0, 212), 27: (0, 283), 81: (0, 274), 35: (0, 87), 19: (0, 95), 82: (0, 225), 83: (0, 173), 47: (0, 286), 26: (0, 156), 64: (0, 181), 65: (0, 192), 84: (0, 17), 25: (0, 258), 85: (0, 182), 29: (0, 36), 31: (0, 119), 13: (0, 231), 4: (0, 170), 86: (0, 72), 8: (0, 113), 88: (0, 285), 37: (0, 109), 24: (0, 67), 89: (0, 200), 21: (0, 193), 69: (0, 150)}, 75: {23: (1, {'@': 191}), 25: (1, {'@': 191}), 32: (1, {'@': 191})}, 76: {15: (1, {'@': 93}), 3: (1, {'@': 93}), 18: (1, {'@': 93}), 17: (1, {'@': 93})}, 77: {3: (1, {'@': 199}), 15: (1, {'@': 199})}, 78: {16: (0, 163), 12: (0, 66), 4: (0, 43), 2: (0, 102), 1: (1, {'@': 125}), 10: (1, {'@': 125}), 14: (1, {'@': 125}), 15: (1, {'@': 125}), 3: (1, {'@': 125}), 5: (1, {'@': 125}), 25: (1, {'@': 125}), 19: (1, {'@': 125}), 26: (1, {'@': 125}), 27: (1, {'@': 125}), 28: (1, {'@': 125}), 29: (1, {'@': 125}), 20: (1, {'@': 125}), 30: (1, {'@': 125}), 8: (1, {'@': 125}), 0: (1, {'@': 125}), 31: (1, {'@': 125}), 32: (1, {'@': 125}), 33: (1, {'@': 125}), 11: (1, {'@': 125}), 21: (1, {'@': 125}), 22: (1, {'@': 125}), 23: (1, {'@': 125}), 13: (1, {'@': 125}), 35: (1, {'@': 125}), 36: (1, {'@': 125}), 24: (1, {'@': 125}), 37: (1, {'@': 125}), 17: (1, {'@': 125}), 38: (1, {'@': 125}), 18: (1, {'@': 125}), 34: (1, {'@': 125})}, 79: {0: (0, 247)}, 80: {15: (1, {'@': 89}), 17: (1, {'@': 89})}, 81: {52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 47: (0, 286), 59: (0, 120), 60: (0, 94), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 56: (0, 25), 13: (0, 231), 4: (0, 170), 33: (0, 33), 8: (0, 113), 11: (0, 198), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 82: {23: (1, {'@': 189}), 25: (1, {'@': 189}), 32: (1, {'@': 189})}, 83: {32: (0, 2), 87: (0, 1), 51: (0, 116), 54: (0, 62), 70: (0, 166), 55: (0, 207), 71: (0, 270), 72: (0, 48), 28: (0, 16), 59: (0, 120), 60: (0, 94), 73: (0, 257), 56: (0, 78), 61: (0, 130), 74: (0, 101), 75: (0, 179), 76: (0, 160), 62: (0, 168), 77: (0, 206), 63: (0, 42), 52: (0, 279), 78: (0, 28), 66: (0, 138), 22: (0, 154), 33: (0, 33), 67: (0, 125), 79: (0, 147), 80: (0, 106), 0: (0, 248), 11: (0, 198), 30: (0, 239), 36: (0, 222), 20: (0, 71), 53: (0, 212), 27: (0, 283), 81: (0, 274), 35: (0, 87), 19: (0, 95), 82: (0, 225), 83: (0, 173), 47: (0, 286), 26: (0, 156), 64: (0, 181), 65: (0, 192), 84: (0, 17), 25: (0, 258), 85: (0, 182), 29: (0, 36), 31: (0, 119), 13: (0, 231), 4: (0, 170), 86: (0, 72), 8: (0, 113), 88: (0, 285), 37: (0, 109), 24: (0, 67), 89: (0, 200), 21: (0, 193), 69: (0, 150)}, 84: {1: (1, {'@': 166}), 2: (1, {'@': 166}), 3: (1, {'@': 166}), 4: (1, {'@': 166}), 5: (1, {'@': 166}), 6: (1, {'@': 166}), 7: (1, {'@': 166}), 8: (1, {'@': 166}), 9: (1, {'@': 166}), 10: (1, {'@': 166}), 11: (1, {'@': 166}), 12: (1, {'@': 166}), 13: (1, {'@': 166}), 14: (1, {'@': 166}), 15: (1, {'@': 166}), 16: (1, {'@': 166}), 19: (1, {'@': 166}), 20: (1, {'@': 166}), 21: (1, {'@': 166}), 22: (1, {'@': 166}), 23: (1, {'@': 166}), 24: (1, {'@': 166}), 25: (1, {'@': 166}), 26: (1, {'@': 166}), 27: (1, {'@': 166}), 28: (1, {'@': 166}), 29: (1, {'@': 166}), 30: (1, {'@': 166}), 0: (1, {'@': 166}), 31: (1, {'@': 166}), 32: (1, {'@': 166}), 33: (1, {'@': 166}), 35: (1, {'@': 166}), 36: (1, {'@': 166}), 37: (1, {'@': 166}), 17: (1, {'@': 166}), 18: (1, {'@': 166}), 34: (1, {'@': 166}), 38: (1, {'@': 166})}, 85: {1: (1, {'@': 121}), 10: (1, {'@': 121}), 14: (1, {'@': 121}), 15: (1, {'@': 121}), 3: (1, {'@': 121}), 5: (1, {'@': 121}), 25: (1, {'@': 121}), 19: (1, {'@': 121}), 26: (1, {'@': 121}), 27: (1, {'@': 121}), 4: (1, {'@': 121}), 28: (1, {'@': 121}), 29: (1, {'@': 121}), 20: (1, {'@': 121}), 30: (1, {'@': 121}), 8: (1, {'@': 121}), 0: (1, {'@': 121}), 31: (1, {'@': 121}), 32: (1, {'@': 121}), 33: (1, {'@': 121}), 11: (1, {'@': 121}), 21: (1, {'@': 121}), 22: (1, {'@': 121}), 23: (1, {'@': 121}), 13: (1, {'@': 121}), 35: (1, {'@': 121}), 36: (1, {'@': 121}), 24: (1, {'@': 121}), 37: (1, {'@': 121}), 17: (1, {'@': 121}), 38: (1, {'@': 121}), 18: (1, {'@': 121}), 34: (1, {'@': 121})}, 86: {1: (1, {'@': 137}), 2: (1, {'@': 137}), 10: (1, {'@': 137}), 3: (1, {'@': 137}), 4: (1, {'@': 137}), 12: (1, {'@': 137}), 6: (1, {'@': 137}), 5: (1, {'@': 137}), 13: (1, {'@': 137}), 7: (1, {'@': 137}), 8: (1, {'@': 137}), 14: (1, {'@': 137}), 15: (1, {'@': 137}), 16: (1, {'@': 137}), 9: (1, {'@': 137}), 19: (1, {'@': 137}), 20: (1, {'@': 137}), 21: (1, {'@': 137}), 22: (1, {'@': 137}), 23: (1, {'@': 137}), 24: (1, {'@': 137}), 25: (1, {'@': 137}), 26: (1, {'@': 137}), 27: (1, {'@': 137}), 28: (1, {'@': 137}), 29: (1, {'@': 137}), 30: (1, {'@': 137}), 0: (1, {'@': 137}), 31: (1, {'@': 137}), 32: (1, {'@': 137}), 33: (1, {'@': 137}), 11: (1, {'@': 137}), 35: (1, {'@': 137}), 36: (1, {'@': 137}), 37: (1, {'@': 137}), 17: (1, {'@': 137}), 18: (1, {'@': 137}), 34: (1, {'@': 137}), 38: (1, {'@': 137})}, 87: {1: (1, {'@': 159}), 2: (1, {'@': 159}), 3: (1, {'@': 159}), 4: (1, {'@': 159}), 5: (1, {'@': 159}), 6: (1, {'@': 159}), 7: (1, {'@': 159}), 8: (1, {'@': 159}), 9: (1, {'@': 159}), 10: (1, {'@': 159}), 11: (1, {'@': 159}), 12: (1, {'@': 159}), 13: (1, {'@': 159}), 14: (1, {'@': 159}), 15: (1, {'@': 159}), 16: (1, {'@': 159}), 19: (1, {'@': 159}), 20: (1, {'@': 159}), 21: (1, {'@': 159}), 22: (1, {'@': 159}), 23: (1, {'@': 159}), 24: (1, {'@': 159}), 25: (1, {'@': 159}), 26: (1, {'@': 159}), 27: (1, {'@': 159}), 28: (1, {'@': 159}), 29: (1, {'@': 159}), 30: (1, {'@': 159}), 0: (1, {'@': 159}), 31: (1, {'@': 159}), 32: (1, {'@': 159}), 33: (1, {'@': 159}), 35: (1, {'@': 159}), 36: (1, {'@': 159}), 37: (1, {'@': 159}), 17: (1, {'@': 159}), 18: (1, {'@': 159}), 34: (1, {'@': 159}), 38: (1, {'@': 159})}, 88: {105: (0, 21), 94: (0, 34), 106: (0, 24), 32: (0, 143), 25: (0, 184)}, 89: {23: (1, {'@': 190}), 25: (1, {'@': 190}), 32: (1, {'@': 190})}, 90: {3: (1, {'@': 116}), 15: (1, {'@': 116}), 25: (1, {'@': 116}), 19: (1, {'@': 116}), 26: (1, {'@': 116}), 27: (1, {'@': 116}), 4: (1, {'@': 116}), 28: (1, {'@': 116}), 29: (1, {'@': 116}), 20: (1, {'@': 116}), 30: (1, {'@': 116}), 8: (1, {'@': 116}), 0: (1, {'@': 116}), 31: (1, {'@': 116}), 32: (1, {'@': 116}), 33: (1, {'@': 116}), 11: (1, {'@': 116}), 21: (1, {'@': 116}), 22: (1, {'@': 116}), 23: (1, {'@': 116}), 13: (1, {'@': 116}), 35: (1, {'@': 116}), 36: (1, {'@': 116}), 24: (1, {'@': 116}), 37: (1, {'@': 116}), 17: (1, {'@': 116}), 38: (1, {'@': 116}), 18: (1, {'@': 116}), 34: (1, {'@': 116})}, 91: {1: (1, {'@': 151}), 2: (1, {'@': 151}), 3: (1, {'@': 151}), 4: (1, {'@': 151}), 5: (1, {'@': 151}), 6: (1, {'@': 151}), 7: (1, {'@': 151}), 8: (1, {'@': 151}), 9: (1, {'@': 151}), 10: (1, {'@': 151}), 11: (1, {'@': 151}), 12: (1, {'@': 151}), 13: (1, {'@': 151}), 14: (1, {'@': 151}), 15: (1, {'@': 151}), 16: (1, {'@': 151}), 19: (1, {'@': 151}), 20: (1, {'@': 151}), 21: (1, {'@': 151}), 22: (1, {'@': 151}), 23: (1, {'@': 151}), 24: (1, {'@': 151}), 25: (1, {'@': 151}), 26: (1, {'@': 151}), 27: (1, {'@': 151}), 28: (1, {'@': 151}), 29: (1, {'@': 151}), 30: (1, {'@': 151}), 0: (1, {'@': 151}), 31: (1, {'@': 151}), 32: (1, {'@': 151}), 33: (1, {'@': 151}), 35: (1, {'@': 151}), 36: (1, {'@': 151}), 37: (1, {'@': 151}), 17: (1, {'@': 151}), 18: (1, {'@': 151}), 34: (1, {'@': 151}), 38: (1, {'@': 151})}, 92: {3: (1, {'@': 201}), 18: (1, {'@': 201})}, 93: {23: (0, 266)}, 94: {1: (1, {'@': 147}), 2: (1, {'@': 147}), 3: (1, {'@': 147}), 4: (1, {'@': 147}), 5: (1, {'@': 147}), 6: (1, {'@': 147}), 7: (1, {'@': 147}), 8: (1, {'@': 147}), 9: (1, {'@': 147}), 10: (1, {'@': 147}), 11: (1, {'@': 147}), 12: (1, {'@': 147}), 13: (1, {'@': 147}), 14: (1, {'@': 147}), 15: (1, {'@': 147}), 16: (1, {'@': 147}), 19: (1, {'@': 147}), 20: (1, {'@': 147}), 21: (1, {'@': 147}), 22: (1, {'@': 147}), 23: (1, {'@': 147}), 24: (1, {'@': 147}), 25: (1, {'@': 147}), 26: (1, {'@': 147}), 27: (1, {'@': 147}), 28: (1, {'@': 147}), 29: (1, {'@': 147}), 30: (1, {'@': 147}), 0: (1, {'@': 147}), 31: (1, {'@': 147}), 32: (1, {'@': 147}), 33: (1, {'@': 147}), 35: (1, {'@': 147}), 36: (1, {'@': 147}), 37: (1, {'@': 147}), 17: (1, {'@': 147}), 18: (1, {'@': 147}), 34: (1, {'@': 147}), 38: (1, {'@': 147})}, 95: {15: (1, {'@': 157}), 1: (1, {'@': 157}), 2: (1, {'@': 157}), 3: (1, {'@': 157}), 4: (1, {'@': 157}), 5: (1, {'@': 157}), 6: (1, {'@': 157}), 7: (1, {'@': 157}), 8: (1, {'@': 157}), 9: (1, {'@': 157}), 10: (1, {'@': 157}), 11: (1, {'@': 157}), 12: (1, {'@': 157}), 13: (1, {'@': 157}), 14: (1, {'@': 157}), 16: (1, {'@': 157}), 19: (1, {'@': 157}), 20: (1, {'@': 157}), 21: (1, {'@': 157}), 22: (1, {'@': 157}), 23: (1, {'@': 157}), 24: (1, {'@': 157}), 25: (1, {'@': 157}), 26: (1, {'@': 157}), 27: (1, {'@': 157}), 28: (1, {'@': 157}), 29: (1, {'@': 157}), 30: (1, {'@': 157}), 0: (1, {'@': 157}), 31: (1, {'@': 157}), 32: (1, {'@': 157}), 33: (1, {'@': 157}), 35: (1, {'@': 157}), 36: (1, {'@': 157}), 37: (1, {'@': 157}), 17: (1, {'@': 157}), 18: (1, {'@': 157}), 34: (1, {'@': 157}), 38: (1, {'@': 157})}, 96: {3: (0, 44), 107: (0, 284), 18: (1, {'@': 168})}, 97: {32: (0, 2), 51: (0, 116), 54: (0, 62), 70: (0, 166), 55: (0, 207), 71: (0, 270), 72: (0, 48), 28: (0, 16), 59: (0, 120), 60: (0, 94), 73: (0, 257), 56: (0, 78), 61: (0, 130), 74: (0, 101), 75: (0, 179), 76: (0, 160), 62: (0, 168), 77: (0, 206), 63: (0, 42), 52: (0, 279), 78: (0, 28), 66: (0, 138), 22: (0, 154), 33: (0, 33), 67: (0, 125), 87: (0, 57), 79: (0, 147), 80: (0, 106), 0: (0, 248), 11: (0, 198), 30: (0, 239), 36: (0, 222), 20: (0, 71), 53: (0, 212), 27: (0, 283), 81: (0, 274), 35: (0, 87), 19: (0, 95), 82: (0, 225), 83: (0, 173), 47: (0, 286), 26: (0, 156), 64: (0, 181), 65: (0, 192), 84: (0, 17), 25: (0, 258), 85: (0, 182), 29: (0, 36), 31: (0, 119), 13: (0, 231), 4: (0, 170), 86: (0, 72), 8: (0, 113), 88: (0, 285), 37: (0, 109), 24: (0, 67), 89: (0, 200), 21: (0, 193), 69: (0, 150)}, 98: {52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 209), 55: (0, 207), 19: (0, 95), 47: (0, 286), 59: (0, 120), 60: (0, 94), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 8: (0, 113), 11: (0, 198), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 99: {17: (0, 97)}, 100: {15: (0, 64)}, 101: {25: (1, {'@': 61}), 19: (1, {'@': 61}), 26: (1, {'@': 61}), 27: (1, {'@': 61}), 4: (1, {'@': 61}), 28: (1, {'@': 61}), 29: (1, {'@': 61}), 20: (1, {'@': 61}), 30: (1, {'@': 61}), 8: (1, {'@': 61}), 0: (1, {'@': 61}), 31: (1, {'@': 61}), 32: (1, {'@': 61}), 33: (1, {'@': 61}), 11: (1, {'@': 61}), 21: (1, {'@': 61}), 22: (1, {'@': 61}), 23: (1, {'@': 61}), 13: (1, {'@': 61}), 35: (1, {'@': 61}), 36: (1, {'@': 61}), 24: (1, {'@': 61}), 37: (1, {'@': 61}), 38: (1, {'@': 61})}, 102: {52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 47: (0, 286), 59: (0, 120), 60: (0, 94), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 8: (0, 113), 11: (0, 198), 61: (0, 186), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 103: {34: (0, 215), 17: (0, 241)}, 104: {15: (1, {'@': 170}), 17: (1, {'@': 170})}, 105: {23: (0, 126)}, 106: {25: (1, {'@': 64}), 19: (1, {'@': 64}), 26: (1, {'@': 64}), 27: (1, {'@': 64}), 4: (1, {'@': 64}), 28: (1, {'@': 64}), 29: (1, {'@': 64}), 20: (1, {'@': 64}), 30: (1, {'@': 64}), 8: (1, {'@': 64}), 0: (1, {'@': 64}), 31: (1, {'@': 64}), 32: (1, {'@': 64}), 33: (1, {'@': 64}), 11: (1, {'@': 64}), 21: (1, {'@': 64}), 22: (1, {'@': 64}), 23: (1, {'@': 64}), 13: (1, {'@': 64}), 35: (1, {'@': 64}), 36: (1, {'@': 64}), 24: (1, {'@': 64}), 37: (1, {'@': 64}), 38: (1, {'@': 64})}, 107: {1: (1, {'@': 133}), 2: (1, {'@': 133}), 10: (1, {'@': 133}), 3: (1, {'@': 133}), 4: (1, {'@': 133}), 12: (1, {'@': 133}), 6: (1, {'@': 133}), 5: (1, {'@': 133}), 13: (1, {'@': 133}), 7: (1, {'@': 133}), 8: (1, {'@': 133}), 14: (1, {'@': 133}), 15: (1, {'@': 133}), 16: (1, {'@': 133}), 9: (1, {'@': 133}), 19: (1, {'@': 133}), 20: (1, {'@': 133}), 21: (1, {'@': 133}), 22: (1, {'@': 133}), 23: (1, {'@': 133}), 24: (1, {'@': 133}), 25: (1, {'@': 133}), 26: (1, {'@': 133}), 27: (1, {'@': 133}), 28: (1, {'@': 133}), 29: (1, {'@': 133}), 30: (1, {'@': 133}), 0: (1, {'@': 133}), 31: (1, {'@': 133}), 32: (1, {'@': 133}), 33: (1, {'@': 133}), 11: (1, {'@': 133}), 35: (1, {'@': 133}), 36: (1, {'@': 133}), 37: (1, {'@': 133}), 17: (1, {'@': 133}), 38: (1, {'@': 133}), 18: (1, {'@': 133}), 34: (1, {'@': 133})}, 108: {25: (1, {'@': 101}), 19: (1, {'@': 101}), 26: (1, {'@': 101}), 27: (1, {'@': 101}), 4: (1, {'@': 101}), 28: (1, {'@': 101}), 29: (1, {'@': 101}), 20: (1, {'@': 101}), 30: (1, {'@': 101}), 8: (1, {'@': 101}), 0: (1, {'@': 101}), 31: (1, {'@': 101}), 32: (1, {'@': 101}), 33: (1, {'@': 101}), 11: (1, {'@': 101}), 21: (1, {'@': 101}), 22: (1, {'@': 101}), 23: (1, {'@': 101}), 13: (1, {'@': 101}), 35: (1, {'@': 101}), 36: (1, {'@': 101}), 24: (1, {'@': 101}), 37: (1, {'@': 101}), 38: (1, {'@': 101})}, 109: {32: (0, 261)}, 110: {0: (0, 39), 1: (1, {'@': 160}), 2: (1, {'@': 160}), 3: (1, {'@': 160}), 4: (1, {'@': 160}), 5: (1, {'@': 160}), 6: (1, {'@': 160}), 7: (1, {'@': 160}), 8: (1, {'@': 160}), 9: (1, {'@': 160}), 10: (1, {'@': 160}), 11: (1, {'@': 160}), 12: (1, {'@': 160}), 13: (1, {'@': 160}), 14: (1, {'@': 160}), 15: (1, {'@': 160}), 16: (1, {'@': 160}), 19: (1, {'@': 160}), 20: (1, {'@': 160}), 21: (1, {'@': 160}), 22: (1, {'@': 160}), 23: (1, {'@': 160}), 24: (1, {'@': 160}), 25: (1, {'@': 160}), 26: (1, {'@': 160}), 27: (1, {'@': 160}), 28: (1, {'@': 160}), 29: (1, {'@': 160}), 30: (1, {'@': 160}), 31: (1, {'@': 160}), 32: (1, {'@': 160}), 33: (1, {'@': 160}), 35: (1, {'@': 160}), 36: (1, {'@': 160}), 37: (1, {'@': 160}), 17: (1, {'@': 160}), 18: (1, {'@': 160}), 34: (1, {'@': 160}), 38: (1, {'@': 160})}, 111: {23: (1, {'@': 193}), 25: (1, {'@': 193}), 32: (1, {'@': 193})}, 112: {18: (0, 104), 3: (0, 142)}, 113: {32: (0, 121), 53: (0, 212), 27: (0, 283), 35: (0, 87), 62: (0, 0), 55: (0, 207), 19: (0, 95), 13: (0, 231), 47: (0, 286), 4: (0, 170), 33: (0, 33), 8: (0, 113), 59: (0, 120), 11: (0, 198), 63: (0, 42), 60: (0, 94), 24: (0, 67), 52: (0, 107), 0: (0, 248), 64: (0, 181), 65: (0, 192), 69: (0, 150)}, 114: {51: (0, 116), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 47: (0, 286), 59: (0, 120), 60: (0, 94), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 67: (0, 125), 8: (0, 113), 11: (0, 198), 24: (0, 67), 66: (0, 37), 0: (0, 248), 69: (0, 150)}, 115: {32: (0, 2), 51: (0, 116), 54: (0, 62), 70: (0, 166), 55: (0, 207), 71: (0, 270), 72: (0, 48), 28: (0, 16), 59: (0, 120), 60: (0, 94), 73: (0, 257), 56: (0, 78), 61: (0, 130), 74: (0, 101), 75: (0, 179), 76: (0, 160), 62: (0, 168), 77: (0, 206), 63: (0, 42), 52: (0, 279), 78: (0, 28), 66: (0, 138), 22: (0, 154), 87: (0, 70), 33: (0, 33), 67: (0, 125), 79: (0, 147), 80: (0, 106), 0: (0, 248), 11: (0, 198), 30: (0, 239), 36: (0, 222), 20: (0, 71), 53: (0, 212), 27: (0, 283), 81: (0, 274), 35: (0, 87), 19: (0, 95), 82: (0, 225), 83: (0, 173), 47: (0, 286), 26: (0, 156), 64: (0, 181), 65: (0, 192), 84: (0, 17), 25: (0, 258), 85: (0, 182), 29: (0, 36), 31: (0, 119), 13: (0, 231), 4: (0, 170), 86: (0, 72), 8: (0, 113), 88: (0, 285), 37: (0, 109), 24: (0, 67), 89: (0, 200), 21: (0, 193), 69: (0, 150)}, 116: {5: (0, 275), 14: (0, 69), 3: (1, {'@': 117}), 15: (1, {'@': 117}), 25: (1, {'@': 117}), 19: (1, {'@': 117}), 26: (1, {'@': 117}), 27: (1, {'@': 117}), 4: (1, {'@': 117}), 28: (1, {'@': 117}), 29: (1, {'@': 117}), 20: (1, {'@': 117}), 30: (1, {'@': 117}), 8: (1, {'@': 117}), 0: (1, {'@': 117}), 31: (1, {'@': 117}), 32: (1, {'@': 117}), 33: (1, {'@': 117}), 11: (1, {'@': 117}), 21: (1, {'@': 117}), 22: (1, {'@': 117}), 23: (1, {'@': 117}), 13: (1, {'@': 117}), 35: (1, {'@': 117}), 36: (1, {'@': 117}), 24: (1, {'@': 117}), 37: (1, {'@': 117}), 17: (1, {'@': 117}), 38: (1, {'@': 117}), 18: (1, {'@': 117}), 34: (1, {'@': 117})}, 117: {1: (1, {'@': 126}), 2: (1, {'@': 126}), 10: (1, {'@': 126}), 3: (1, {'@': 126}), 4: (1, {'@': 126}), 12: (1, {'@': 126}), 5: (1, {'@': 126}), 14: (1, {'@': 126}), 15: (1, {'@': 126}), 16: (1, {'@': 126}), 25: (1, {'@': 126}), 19: (1, {'@': 126}), 26: (1, {'@': 126}), 27: (1, {'@': 126}), 28: (1, {'@': 126}), 29: (1, {'@': 126}), 20: (1, {'@': 126}), 30: (1, {'@': 126}), 8: (1, {'@': 126}), 0: (1, {'@': 126}), 31: (1, {'@': 126}), 36: (1, {'@': 126}), 32: (1, {'@': 126}), 33: (1, {'@': 126}), 11: (1, {'@': 126}), 21: (1, {'@': 126}), 22: (1, {'@': 126}), 23: (1, {'@': 126}), 13: (1, {'@': 126}), 35: (1, {'@': 126}), 24: (1, {'@': 126}), 37: (1, {'@': 126}), 17: (1, {'@': 126}), 38: (1, {'@': 126}), 18: (1, {'@': 126}), 34: (1, {'@': 126})}, 118: {15: (1, {'@': 90}), 17: (1, {'@': 90})}, 119: {51: (0, 116), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 47: (0, 286), 59: (0, 120), 66: (0, 177), 60: (0, 94), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 67: (0, 125), 8: (0, 113), 11: (0, 198), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 120: {11: (0, 271), 1: (1, {'@': 138}), 2: (1, {'@': 138}), 10: (1, {'@': 138}), 3: (1, {'@': 138}), 4: (1, {'@': 138}), 12: (1, {'@': 138}), 6: (1, {'@': 138}), 5: (1, {'@': 138}), 13: (1, {'@': 138}), 7: (1, {'@': 138}), 8: (1, {'@': 138}), 14: (1, {'@': 138}), 15: (1, {'@': 138}), 16: (1, {'@': 138}), 9: (1, {'@': 138}), 19: (1, {'@': 138}), 20: (1, {'@': 138}), 21: (1, {'@': 138}), 22: (1, {'@': 138}), 23: (1, {'@': 138}), 24: (1, {'@': 138}), 25: (1, {'@': 138}), 26: (1, {'@': 138}), 27: (1, {'@': 138}), 28: (1, {'@': 138}), 29: (1, {'@': 138}), 30: (1, {'@': 138}), 0: (1, {'@': 138}), 31: (1, {'@': 138}), 32: (1, {'@': 138}), 33: (1, {'@': 138}), 35: (1, {'@': 138}), 36: (1, {'@': 138}), 37: (1, {'@': 138}), 17: (1, {'@': 138}), 18: (1, {'@': 138}), 34: (1, {'@': 138}), 38: (1, {'@': 138})}, 121: {41: (0, 6), 1: (1, {'@': 162}), 2: (1, {'@': 162}), 3: (1, {'@': 162}), 4: (1, {'@': 162}), 5: (1, {'@': 162}), 6: (1, {'@': 162}), 7: (1, {'@': 162}), 8: (1, {'@': 162}), 0: (1, {'@': 162}), 9: (1, {'@': 162}), 10: (1, {'@': 162}), 11: (1, {'@': 162}), 12: (1, {'@': 162}), 13: (1, {'@': 162}), 14: (1, {'@': 162}), 15: (1, {'@': 162}), 16: (1, {'@': 162}), 17: (1, {'@': 162}), 18: (1, {'@': 162}), 19: (1, {'@': 162}), 20: (1, {'@': 162}), 21: (1, {'@': 162}), 22: (1, {'@': 162}), 23: (1, {'@': 162}), 24: (1, {'@': 162}), 25: (1, {'@': 162}), 26: (1, {'@': 162}), 27: (1, {'@': 162}), 28: (1, {'@': 162}), 29: (1, {'@': 162}), 30: (1, {'@': 162}), 31: (1, {'@': 162}), 32: (1, {'@': 162}), 33: (1, {'@': 162}), 34: (1, {'@': 162}), 35: (1, {'@': 162}), 36: (1, {'@': 162}), 37: (1, {'@': 162}), 38: (1, {'@': 162})}, 122: {3: (0, 236), 15: (1, {'@': 108})}, 123: {52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 47: (0, 286), 59: (0, 120), 60: (0, 94), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 51: (0, 255), 8: (0, 113), 11: (0, 198), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 124: {15: (0, 194)}, 125: {3: (1, {'@': 114}), 15: (1, {'@': 114}), 25: (1, {'@': 114}), 19: (1, {'@': 114}), 26: (1, {'@': 114}), 27: (1, {'@': 114}), 4: (1, {'@': 114}), 28: (1, {'@': 114}), 29: (1, {'@': 114}), 20: (1, {'@': 114}), 30: (1, {'@': 114}), 8: (1, {'@': 114}), 0: (1, {'@': 114}), 31: (1, {'@': 114}), 32: (1, {'@': 114}), 33: (1, {'@': 114}), 11: (1, {'@': 114}), 21: (1, {'@': 114}), 22: (1, {'@': 114}), 23: (1, {'@': 114}), 13: (1, {'@': 114}), 35: (1, {'@': 114}), 36: (1, {'@': 114}), 24: (1, {'@': 114}), 37: (1, {'@': 114}), 17: (1, {'@': 114}), 38: (1, {'@': 114}), 18: (1, {'@': 114}), 34: (1, {'@': 114})}, 126: {25: (1, {'@': 79}), 42: (1, {'@': 79}), 19: (1, {'@': 79}), 26: (1, {'@': 79}), 27: (1, {'@': 79}), 4: (1, {'@': 79}), 28: (1, {'@': 79}), 37: (1, {'@': 79}), 29: (1, {'@': 79}), 20: (1, {'@': 79}), 30: (1, {'@': 79}), 8: (1, {'@': 79}), 0: (1, {'@': 79}), 31: (1, {'@': 79}), 32: (1, {'@': 79}), 33: (1, {'@': 79}), 11: (1, {'@': 79}), 21: (1, {'@': 79}), 22: (1, {'@': 79}), 23: (1, {'@': 79}), 13: (1, {'@': 79}), 35: (1, {'@': 79}), 36: (1, {'@': 79}), 24: (1, {'@': 79}), 108: (1, {'@': 79}), 38: (1, {'@': 79})}, 127: {25: (1, {'@': 96}), 19: (1, {'@': 96}), 26: (1, {'@': 96}), 27: (1, {'@': 96}), 4: (1, {'@': 96}), 28: (1, {'@': 96}), 29: (1, {'@': 96}), 20: (1, {'@': 96}), 30: (1, {'@': 96}), 8: (1, {'@': 96}), 0: (1, {'@': 96}), 31: (1, {'@': 96}), 32: (1, {'@': 96}), 33: (1, {'@': 96}), 11: (1, {'@': 96}), 21: (1, {'@': 96}), 22: (1, {'@': 96}), 23: (1, {'@': 96}), 13: (1, {'@': 96}), 35: (1, {'@': 96}), 36: (1, {'@': 96}), 24: (1, {'@': 96}), 37: (1, {'@': 96}), 38: (1, {'@': 96})}, 128: {17: (0, 20)}, 129: {23: (0, 259)}, 130: {1: (0, 59), 10: (0, 123), 3: (1, {'@': 120}), 5: (1, {'@': 120}), 14: (1, {'@': 120}), 15: (1, {'@': 120}), 25: (1, {'@': 120}), 19: (1, {'@': 120}), 26: (1, {'@': 120}), 27: (1, {'@': 120}), 4: (1, {'@': 120}), 28: (1, {'@': 120}), 29: (1, {'@': 120}), 20: (1, {'@': 120}), 30: (1, {'@': 120}), 8: (1, {'@': 120}), 0: (1, {'@': 120}), 31: (1, {'@': 120}), 32: (1, {'@': 120}), 33: (1, {'@': 120}), 11: (1, {'@': 120}), 21: (1, {'@': 120}), 22: (1, {'@': 120}), 23: (1, {'@': 120}), 13: (1, {'@': 120}), 35: (1, {'@': 120}), 36: (1, {'@': 120}), 24: (1, {'@': 120}), 37: (1, {'@': 120}), 17: (1, {'@': 120}), 38: (1, {'@': 120}), 18: (1, {'@': 120}), 34: (1, {'@': 120})}, 131: {109: (0, 210), 110: (0, 152), 101: (0, 201), 111: (0, 145), 25: (0, 146)}, 132: {3: (1, {'@': 119}), 5: (1, {'@': 119}), 14: (1, {'@': 119}), 15: (1, {'@': 119}), 25: (1, {'@': 119}), 19: (1, {'@': 119}), 26: (1, {'@': 119}), 27: (1, {'@': 119}), 4: (1, {'@': 119}), 28: (1, {'@': 119}), 29: (1, {'@': 119}), 20: (1, {'@': 119}), 30: (1, {'@': 119}), 8: (1, {'@': 119}), 0: (1, {'@': 119}), 31: (1, {'@': 119}), 32: (1, {'@': 119}), 33: (1, {'@': 119}), 11: (1, {'@': 119}), 21: (1, {'@': 119}), 22: (1, {'@': 119}), 23: (1, {'@': 119}), 13: (1, {'@': 119}), 35: (1, {'@': 119}), 36: (1, {'@': 119}), 24: (1, {'@': 119}), 37: (1, {'@': 119}), 17: (1, {'@': 119}), 38: (1, {'@': 119}), 18: (1, {'@': 119}), 34: (1, {'@': 119})}, 133: {32: (0, 202), 103: (0, 15)}, 134: {23: (1, {'@': 85}), 25: (1, {'@': 85}), 101: (1, {'@': 85})}, 135: {38: (1, {'@': 51})}, 136: {1: (1, {'@': 134}), 2: (1, {'@': 134}), 10: (1, {'@': 134}), 3: (1, {'@': 134}), 4: (1, {'@': 134}), 12: (1, {'@': 134}), 6: (1, {'@': 134}), 5: (1, {'@': 134}), 13: (1, {'@': 134}), 7: (1, {'@': 134}), 8: (1, {'@': 134}), 14: (1, {'@': 134}), 15: (1, {'@': 134}), 16: (1, {'@': 134}), 9: (1, {'@': 134}), 19: (1, {'@': 134}), 20: (1, {'@': 134}), 21: (1, {'@': 134}), 22: (1, {'@': 134}), 23: (1, {'@': 134}), 24: (1, {'@': 134}), 25: (1, {'@': 134}), 26: (1, {'@': 134}), 27: (1, {'@': 134}), 28: (1, {'@': 134}), 29: (1, {'@': 134}), 30: (1, {'@': 134}), 0: (1, {'@': 134}), 31: (1, {'@': 134}), 32: (1, {'@': 134}), 33: (1, {'@': 134}), 11: (1, {'@': 134}), 35: (1, {'@': 134}), 36: (1, {'@': 134}), 37: (1, {'@': 134}), 17: (1, {'@': 134}), 38: (1, {'@': 134}), 18: (1, {'@': 134}), 34: (1, {'@': 134})}, 137: {16: (1, {'@': 111}), 17: (1, {'@': 111}), 15: (1, {'@': 111}), 25: (1, {'@': 111}), 23: (1, {'@': 111}), 32: (1, {'@': 111}), 3: (1, {'@': 111})}, 138: {25: (1, {'@': 54}), 19: (1, {'@': 54}), 26: (1, {'@': 54}), 27: (1, {'@': 54}), 4: (1, {'@': 54}), 28: (1, {'@': 54}), 29: (1, {'@': 54}), 20: (1, {'@': 54}), 30: (1, {'@': 54}), 8: (1, {'@': 54}), 0: (1, {'@': 54}), 31: (1, {'@': 54}), 32: (1, {'@': 54}), 33: (1, {'@': 54}), 11: (1, {'@': 54}), 21: (1, {'@': 54}), 22: (1, {'@': 54}), 23: (1, {'@': 54}), 13: (1, {'@': 54}), 35: (1, {'@': 54}), 36: (1, {'@': 54}), 24: (1, {'@': 54}), 37: (1, {'@': 54}), 38: (1, {'@': 54})}, 139: {32: (0, 202), 103: (0, 100)}, 140: {25: (1, {'@': 106}), 19: (1, {'@': 106}), 26: (1, {'@': 106}), 27: (1, {'@': 106}), 4: (1, {'@': 106}), 28: (1, {'@': 106}), 29: (1, {'@': 106}), 20: (1, {'@': 106}), 30: (1, {'@': 106}), 8: (1, {'@': 106}), 0: (1, {'@': 106}), 31: (1, {'@': 106}), 32: (1, {'@': 106}), 33: (1, {'@': 106}), 11: (1, {'@': 106}), 21: (1, {'@': 106}), 22: (1, {'@': 106}), 23: (1, {'@': 106}), 13: (1, {'@': 106}), 35: (1, {'@': 106}), 36: (1, {'@': 106}), 24: (1, {'@': 106}), 37: (1, {'@': 106}), 38: (1, {'@': 106})}, 141: {40: (0, 277)}, 142: {55: (0, 216), 46: (0, 76), 27: (0, 283), 90: (0, 22), 49: (0, 223)}, 143: {112: (0, 246)}, 144: {25: (1, {'@': 77}), 19: (1, {'@': 77}), 26: (1, {'@': 77}), 27: (1, {'@': 77}), 4: (1, {'@': 77}), 28: (1, {'@': 77}), 29: (1, {'@': 77}), 20: (1, {'@': 77}), 30: (1, {'@': 77}), 8: (1, {'@': 77}), 0: (1, {'@': 77}), 31: (1, {'@': 77}), 32: (1, {'@': 77}), 33: (1, {'@': 77}), 11: (1, {'@': 77}), 21: (1, {'@': 77}), 22: (1, {'@': 77}), 23: (1, {'@': 77}), 13: (1, {'@': 77}), 35: (1, {'@': 77}), 36: (1, {'@': 77}), 24: (1, {'@': 77}), 37: (1, {'@': 77}), 38: (1, {'@': 77})}, 145: {23: (0, 249)}, 146: {23: (1, {'@': 182}), 25: (1, {'@': 182}), 101: (1, {'@': 182})}, 147: {25: (1, {'@': 69}), 19: (1, {'@': 69}), 26: (1, {'@': 69}), 27: (1, {'@': 69}), 4: (1, {'@': 69}), 28: (1, {'@': 69}), 29: (1, {'@': 69}), 20: (1, {'@': 69}), 30: (1, {'@': 69}), 8: (1, {'@': 69}), 0: (1, {'@': 69}), 31: (1, {'@': 69}), 32: (1, {'@': 69}), 33: (1, {'@': 69}), 11: (1, {'@': 69}), 21: (1, {'@': 69}), 22: (1, {'@': 69}), 23: (1, {'@': 69}), 13: (1, {'@': 69}), 35: (1, {'@': 69}), 36: (1, {'@': 69}), 24: (1, {'@': 69}), 37: (1, {'@': 69}), 38: (1, {'@': 69})}, 148: {23: (0, 159)}, 149: {1: (1, {'@': 161}), 2: (1, {'@': 161}), 3: (1, {'@': 161}), 4: (1, {'@': 161}), 5: (1, {'@': 161}), 6: (1, {'@': 161}), 7: (1, {'@': 161}), 8: (1, {'@': 161}), 9: (1, {'@': 161}), 10: (1, {'@': 161}), 11: (1, {'@': 161}), 12: (1, {'@': 161}), 13: (1, {'@': 161}), 14: (1, {'@': 161}), 15: (1, {'@': 161}), 16: (1, {'@': 161}), 19: (1, {'@': 161}), 20: (1, {'@': 161}), 21: (1, {'@': 161}), 22: (1, {'@': 161}), 23: (1, {'@': 161}), 24: (1, {'@': 161}), 25: (1, {'@': 161}), 26: (1, {'@': 161}), 27: (1, {'@': 161}), 28: (1, {'@': 161}), 29: (1, {'@': 161}), 30: (1, {'@': 161}), 0: (1, {'@': 161}), 31: (1, {'@': 161}), 32: (1, {'@': 161}), 33: (1, {'@': 161}), 35: (1, {'@': 161}), 36: (1, {'@': 161}), 37: (1, {'@': 161}), 17: (1, {'@': 161}), 18: (1, {'@': 161}), 34: (1, {'@': 161}), 38: (1, {'@': 161})}, 150: {1: (1, {'@': 136}), 2: (1, {'@': 136}), 10: (1, {'@': 136}), 3: (1, {'@': 136}), 4: (1, {'@': 136}), 12: (1, {'@': 136}), 6: (1, {'@': 136}), 5: (1, {'@': 136}), 13: (1, {'@': 136}), 7: (1, {'@': 136}), 8: (1, {'@': 136}), 14: (1, {'@': 136}), 15: (1, {'@': 136}), 16: (1, {'@': 136}), 9: (1, {'@': 136}), 19: (1, {'@': 136}), 20: (1, {'@': 136}), 21: (1, {'@': 136}), 22: (1, {'@': 136}), 23: (1, {'@': 136}), 24: (1, {'@': 136}), 25: (1, {'@': 136}), 26: (1, {'@': 136}), 27: (1, {'@': 136}), 28: (1, {'@': 136}), 29: (1, {'@': 136}), 30: (1, {'@': 136}), 0: (1, {'@': 136}), 31: (1, {'@': 136}), 32: (1, {'@': 136}), 33: (1, {'@': 136}), 11: (1, {'@': 136}), 35: (1, {'@': 136}), 36: (1, {'@': 136}), 37: (1, {'@': 136}), 17: (1, {'@': 136}), 38: (1, {'@': 136}), 18: (1, {'@': 136}), 34: (1, {'@': 136})}, 151: {52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 55: (0, 207), 19: (0, 95), 47: (0, 286), 59: (0, 120), 60: (0, 94), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 8: (0, 113), 11: (0, 198), 54: (0, 234), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 152: {23: (1, {'@': 181}), 25: (1, {'@': 181}), 101: (1, {'@': 181})}, 153: {112: (0, 273)}, 154: {32: (0, 244)}, 155: {25: (1, {'@': 71}), 19: (1, {'@': 71}), 26: (1, {'@': 71}), 27: (1, {'@': 71}), 4: (1, {'@': 71}), 28: (1, {'@': 71}), 29: (1, {'@': 71}), 20: (1, {'@': 71}), 30: (1, {'@': 71}), 8: (1, {'@': 71}), 0: (1, {'@': 71}), 31: (1, {'@': 71}), 32: (1, {'@': 71}), 33: (1, {'@': 71}), 11: (1, {'@': 71}), 21: (1, {'@': 71}), 22: (1, {'@': 71}), 23: (1, {'@': 71}), 13: (1, {'@': 71}), 35: (1, {'@': 71}), 36: (1, {'@': 71}), 24: (1, {'@': 71}), 37: (1, {'@': 71}), 38: (1, {'@': 71})}, 156: {32: (0, 30)}, 157: {32: (0, 221), 58: (0, 77)}, 158: {32: (0, 2), 51: (0, 116), 54: (0, 62), 70: (0, 166), 55: (0, 207), 71: (0, 270), 72: (0, 48), 28: (0, 16), 59: (0, 120), 60: (0, 94), 73: (0, 257), 56: (0, 78), 61: (0, 130), 74: (0, 101), 75: (0, 179), 76: (0, 160), 62: (0, 168), 77: (0, 206), 63: (0, 42), 52: (0, 279), 78: (0, 28), 66: (0, 138), 22: (0, 154), 33: (0, 33), 67: (0, 125), 79: (0, 147), 80: (0, 106), 0: (0, 248), 11: (0, 198), 30: (0, 239), 36: (0, 222), 20: (0, 71), 53: (0, 212), 27: (0, 283), 81: (0, 274), 35: (0, 87), 19: (0, 95), 82: (0, 225), 83: (0, 173), 47: (0, 286), 26: (0, 156), 87: (0, 148), 64: (0, 181), 65: (0, 192), 84: (0, 17), 25: (0, 258), 85: (0, 182), 29: (0, 36), 31: (0, 119), 13: (0, 231), 4: (0, 170), 86: (0, 72), 8: (0, 113), 88: (0, 285), 37: (0, 109), 24: (0, 67), 89: (0, 200), 21: (0, 193), 69: (0, 150)}, 159: {25: (1, {'@': 81}), 42: (1, {'@': 81}), 19: (1, {'@': 81}), 26: (1, {'@': 81}), 27: (1, {'@': 81}), 4: (1, {'@': 81}), 28: (1, {'@': 81}), 37: (1, {'@': 81}), 29: (1, {'@': 81}), 20: (1, {'@': 81}), 30: (1, {'@': 81}), 8: (1, {'@': 81}), 0: (1, {'@': 81}), 31: (1, {'@': 81}), 32: (1, {'@': 81}), 33: (1, {'@': 81}), 11: (1, {'@': 81}), 21: (1, {'@': 81}), 22: (1, {'@': 81}), 23: (1, {'@': 81}), 13: (1, {'@': 81}), 35: (1, {'@': 81}), 36: (1, {'@': 81}), 24: (1, {'@': 81}), 108: (1, {'@': 81}), 38: (1, {'@': 81})}, 160: {25: (1, {'@': 67}), 19: (1, {'@': 67}), 26: (1, {'@': 67}), 27: (1, {'@': 67}), 4: (1, {'@': 67}), 28: (1, {'@': 67}), 29: (1, {'@': 67}), 20: (1, {'@': 67}), 30: (1, {'@': 67}), 8: (1, {'@': 67}), 0: (1, {'@': 67}), 31: (1, {'@': 67}), 32: (1, {'@': 67}), 33: (1, {'@': 67}), 11: (1, {'@': 67}), 21: (1, {'@': 67}), 22: (1, {'@': 67}), 23: (1, {'@': 67}), 13: (1, {'@': 67}), 35: (1, {'@': 67}), 36: (1, {'@': 67}), 24: (1, {'@': 67}), 37: (1, {'@': 67}), 38: (1, {'@': 67})}, 161: {25: (1, {'@': 97}), 19: (1, {'@': 97}), 26: (1, {'@': 97}), 27: (1, {'@': 97}), 4: (1, {'@': 97}), 28: (1, {'@': 97}), 29: (1, {'@': 97}), 20: (1, {'@': 97}), 30: (1, {'@': 97}), 8: (1, {'@': 97}), 0: (1, {'@': 97}), 31: (1, {'@': 97}), 32: (1, {'@': 97}), 33: (1, {'@': 97}), 11: (1, {'@': 97}), 21: (1, {'@': 97}), 22: (1, {'@': 97}), 23: (1, {'@': 97}), 13: (1, {'@': 97}), 35: (1, {'@': 97}), 36: (1, {'@': 97}), 24: (1, {'@': 97}), 37: (1, {'@': 97}), 38: (1, {'@': 97})}, 162: {51: (0, 116), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 66: (0, 187), 47: (0, 286), 59: (0, 120), 60: (0, 94), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 67: (0, 125), 8: (0, 113), 11: (0, 198), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 163: {52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 47: (0, 286), 59: (0, 120), 60: (0, 94), 62: (0, 0), 63: (0, 42), 64: (0, 181), 61: (0, 85), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 8: (0, 113), 11: (0, 198), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 164: {18: (0, 86)}, 165: {90: (0, 237), 55: (0, 216), 46: (0, 76), 27: (0, 283), 49: (0, 223)}, 166: {113: (0, 185), 114: (0, 3), 115: (0, 253), 42: (0, 63), 108: (0, 232), 43: (0, 144), 25: (1, {'@': 78}), 19: (1, {'@': 78}), 26: (1, {'@': 78}), 27: (1, {'@': 78}), 4: (1, {'@': 78}), 28: (1, {'@': 78}), 29: (1, {'@': 78}), 20: (1, {'@': 78}), 30: (1, {'@': 78}), 8: (1, {'@': 78}), 0: (1, {'@': 78}), 31: (1, {'@': 78}), 32: (1, {'@': 78}), 33: (1, {'@': 78}), 11: (1, {'@': 78}), 21: (1, {'@': 78}), 22: (1, {'@': 78}), 23: (1, {'@': 78}), 13: (1, {'@': 78}), 35: (1, {'@': 78}), 36: (1, {'@': 78}), 24: (1, {'@': 78}), 37: (1, {'@': 78}), 38: (1, {'@': 78})}, 167: {3: (1, {'@': 200}), 15: (1, {'@': 200})}, 168: {0: (0, 7), 11: (0, 162), 1: (1, {'@': 152}), 19: (1, {'@': 152}), 20: (1, {'@': 152}), 8: (1, {'@': 152}), 9: (1, {'@': 152}), 21: (1, {'@': 152}), 22: (1, {'@': 152}), 23: (1, {'@': 152}), 13: (1, {'@': 152}), 16: (1, {'@': 152}), 24: (1, {'@': 152}), 2: (1, {'@': 152}), 25: (1, {'@': 152}), 4: (1, {'@': 152}), 26: (1, {'@': 152}), 27: (1, {'@': 152}), 5: (1, {'@': 152}), 6: (1, {'@': 152}), 28: (1, {'@': 152}), 29: (1, {'@': 152}), 7: (1, {'@': 152}), 30: (1, {'@': 152}), 31: (1, {'@': 152}), 32: (1, {'@': 152}), 33: (1, {'@': 152}), 10: (1, {'@': 152}), 12: (1, {'@': 152}), 35: (1, {'@': 152}), 14: (1, {'@': 152}), 36: (1, {'@': 152}), 37: (1, {'@': 152}), 38: (1, {'@': 152})}, 169: {18: (0, 219)}, 170: {32: (0, 202), 103: (0, 240)}, 171: {51: (0, 116), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 47: (0, 286), 59: (0, 120), 60: (0, 94), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 66: (0, 155), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 67: (0, 125), 8: (0, 113), 11: (0, 198), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 172: {3: (1, {'@': 155}), 15: (1, {'@': 155})}, 173: {25: (1, {'@': 57}), 19: (1, {'@': 57}), 26: (1, {'@': 57}), 27: (1, {'@': 57}), 4: (1, {'@': 57}), 28: (1, {'@': 57}), 29: (1, {'@': 57}), 20: (1, {'@': 57}), 30: (1, {'@': 57}), 8: (1, {'@': 57}), 0: (1, {'@': 57}), 31: (1, {'@': 57}), 32: (1, {'@': 57}), 33: (1, {'@': 57}), 11: (1, {'@': 57}), 21: (1, {'@': 57}), 22: (1, {'@': 57}), 23: (1, {'@': 57}), 13: (1, {'@': 57}), 35: (1, {'@': 57}), 36: (1, {'@': 57}), 24: (1, {'@': 57}), 37: (1, {'@': 57}), 38: (1, {'@': 57})}, 174: {25: (1, {'@': 180}), 42: (1, {'@': 180}), 19: (1, {'@': 180}), 26: (1, {'@': 180}), 27: (1, {'@': 180}), 4: (1, {'@': 180}), 28: (1, {'@': 180}), 37: (1, {'@': 180}), 29: (1, {'@': 180}), 20: (1, {'@': 180}), 30: (1, {'@': 180}), 8: (1, {'@': 180}), 0: (1, {'@': 180}), 31: (1, {'@': 180}), 32: (1, {'@': 180}), 33: (1, {'@': 180}), 11: (1, {'@': 180}), 21: (1, {'@': 180}), 22: (1, {'@': 180}), 23: (1, {'@': 180}), 13: (1, {'@': 180}), 35: (1, {'@': 180}), 36: (1, {'@': 180}), 24: (1, {'@': 180}), 108: (1, {'@': 180}), 38: (1, {'@': 180})}, 175: {23: (1, {'@': 99}), 25: (1, {'@': 99}), 32: (1, {'@': 99})}, 176: {0: (0, 5), 15: (1, {'@': 91}), 17: (1, {'@': 91})}, 177: {17: (0, 74)}, 178: {25: (1, {'@': 72}), 19: (1, {'@': 72}), 26: (1, {'@': 72}), 27: (1, {'@': 72}), 4: (1, {'@': 72}), 28: (1, {'@': 72}), 29: (1, {'@': 72}), 20: (1, {'@': 72}), 30: (1, {'@': 72}), 8: (1, {'@': 72}), 0: (1, {'@': 72}), 31: (1, {'@': 72}), 32: (1, {'@': 72}), 33: (1, {'@': 72}), 11: (1, {'@': 72}), 21: (1, {'@': 72}), 22: (1, {'@': 72}), 23: (1, {'@': 72}), 13: (1, {'@': 72}), 35: (1, {'@': 72}), 36: (1, {'@': 72}), 24: (1, {'@': 72}), 37: (1, {'@': 72}), 38: (1, {'@': 72})}, 179: {25: (1, {'@': 66}), 19: (1, {'@': 66}), 26: (1, {'@': 66}), 27: (1, {'@': 66}), 4: (1, {'@': 66}), 28: (1, {'@': 66}), 29: (1, {'@': 66}), 20: (1, {'@': 66}), 30: (1, {'@': 66}), 8: (1, {'@': 66}), 0: (1, {'@': 66}), 31: (1, {'@': 66}), 32: (1, {'@': 66}), 33: (1, {'@': 66}), 11: (1, {'@': 66}), 21: (1, {'@': 66}), 22: (1, {'@': 66}), 23: (1, {'@': 66}), 13: (1, {'@': 66}), 35: (1, {'@': 66}), 36: (1, {'@': 66}), 24: (1, {'@': 66}), 37: (1, {'@': 66}), 38: (1, {'@': 66})}, 180: {3: (1, {'@': 110}), 15: (1, {'@': 110})}, 181: {1: (1, {'@': 148}), 2: (1, {'@': 148}), 3: (1, {'@': 148}), 4: (1, {'@': 148}), 5: (1, {'@': 148}), 6: (1, {'@': 148}), 7: (1, {'@': 148}), 8: (1, {'@': 148}), 9: (1, {'@': 148}), 10: (1, {'@': 148}), 11: (1, {'@': 148}), 12: (1, {'@': 148}), 13: (1, {'@': 148}), 14: (1, {'@': 148}), 15: (1, {'@': 148}), 16: (1, {'@': 148}), 19: (1, {'@': 148}), 20: (1, {'@': 148}), 21: (1, {'@': 148}), 22: (1, {'@': 148}), 23: (1, {'@': 148}), 24: (1, {'@': 148}), 25: (1, {'@': 148}), 26: (1, {'@': 148}), 27: (1, {'@': 148}), 28: (1, {'@': 148}), 29: (1, {'@': 148}), 30: (1, {'@': 148}), 0: (1, {'@': 148}), 31: (1, {'@': 148}), 32: (1, {'@': 148}), 33: (1, {'@': 148}), 35: (1, {'@': 148}), 36: (1, {'@': 148}), 37: (1, {'@': 148}), 17: (1, {'@': 148}), 18: (1, {'@': 148}), 34: (1, {'@': 148}), 38: (1, {'@': 148})}, 182: {25: (1, {'@': 56}), 19: (1, {'@': 56}), 26: (1, {'@': 56}), 27: (1, {'@': 56}), 4: (1, {'@': 56}), 28: (1, {'@': 56}), 29: (1, {'@': 56}), 20: (1, {'@': 56}), 30: (1, {'@': 56}), 8: (1, {'@': 56}), 0: (1, {'@': 56}), 31: (1, {'@': 56}), 32: (1, {'@': 56}), 33: (1, {'@': 56}), 11: (1, {'@': 56}), 21: (1, {'@': 56}), 22: (1, {'@': 56}), 23: (1, {'@': 56}), 13: (1, {'@': 56}), 35: (1, {'@': 56}), 36: (1, {'@': 56}), 24: (1, {'@': 56}), 37: (1, {'@': 56}), 38: (1, {'@': 56})}, 183: {1: (1, {'@': 122}), 10: (1, {'@': 122}), 14: (1, {'@': 122}), 15: (1, {'@': 122}), 3: (1, {'@': 122}), 5: (1, {'@': 122}), 25: (1, {'@': 122}), 19: (1, {'@': 122}), 26: (1, {'@': 122}), 27: (1, {'@': 122}), 4: (1, {'@': 122}), 28: (1, {'@': 122}), 29: (1, {'@': 122}), 20: (1, {'@': 122}), 30: (1, {'@': 122}), 8: (1, {'@': 122}), 0: (1, {'@': 122}), 31: (1, {'@': 122}), 32: (1, {'@': 122}), 33: (1, {'@': 122}), 11: (1, {'@': 122}), 21: (1, {'@': 122}), 22: (1, {'@': 122}), 23: (1, {'@': 122}), 13: (1, {'@': 122}), 35: (1, {'@': 122}), 36: (1, {'@': 122}), 24: (1, {'@': 122}), 37: (1, {'@': 122}), 17: (1, {'@': 122}), 38: (1, {'@': 122}), 18: (1, {'@': 122}), 34: (1, {'@': 122})}, 184: {23: (1, {'@': 186}), 25: (1, {'@': 186}), 32: (1, {'@': 186})}, 185: {25: (1, {'@': 179}), 42: (1, {'@': 179}), 19: (1, {'@': 179}), 26: (1, {'@': 179}), 27: (1, {'@': 179}), 4: (1, {'@': 179}), 28: (1, {'@': 179}), 37: (1, {'@': 179}), 29: (1, {'@': 179}), 20: (1, {'@': 179}), 30: (1, {'@': 179}), 8: (1, {'@': 179}), 0: (1, {'@': 179}), 31: (1, {'@': 179}), 32: (1, {'@': 179}), 33: (1, {'@': 179}), 11: (1, {'@': 179}), 21: (1, {'@': 179}), 22: (1, {'@': 179}), 23: (1, {'@': 179}), 13: (1, {'@': 179}), 35: (1, {'@': 179}), 36: (1, {'@': 179}), 24: (1, {'@': 179}), 108: (1, {'@': 179}), 38: (1, {'@': 179})}, 186: {1: (1, {'@': 123}), 10: (1, {'@': 123}), 14: (1, {'@': 123}), 15: (1, {'@': 123}), 3: (1, {'@': 123}), 5: (1, {'@': 123}), 25: (1, {'@': 123}), 19: (1, {'@': 123}), 26: (1, {'@': 123}), 27: (1, {'@': 123}), 4: (1, {'@': 123}), 28: (1, {'@': 123}), 29: (1, {'@': 123}), 20: (1, {'@': 123}), 30: (1, {'@': 123}), 8: (1, {'@': 123}), 0: (1, {'@': 123}), 31: (1, {'@': 123}), 32: (1, {'@': 123}), 33: (1, {'@': 123}), 11: (1, {'@': 123}), 21: (1, {'@': 123}), 22: (1, {'@': 123}), 23: (1, {'@': 123}), 13: (1, {'@': 123}), 35: (1, {'@': 123}), 36: (1, {'@': 123}), 24: (1, {'@': 123}), 37: (1, {'@': 123}), 17: (1, {'@': 123}), 38: (1, {'@': 123}), 18: (1, {'@': 123}), 34: (1, {'@': 123})}, 187: {18: (0, 141)}, 188: {23: (0, 41)}, 189: {51: (0, 116), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 66: (0, 195), 47: (0, 286), 59: (0, 120), 60: (0, 94), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 67: (0, 125), 8: (0, 113), 11: (0, 198), 98: (0, 38), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 190: {1: (1, {'@': 164}), 2: (1, {'@': 164}), 3: (1, {'@': 164}), 4: (1, {'@': 164}), 5: (1, {'@': 164}), 6: (1, {'@': 164}), 7: (1, {'@': 164}), 8: (1, {'@': 164}), 9: (1, {'@': 164}), 10: (1, {'@': 164}), 11: (1, {'@': 164}), 12: (1, {'@': 164}), 13: (1, {'@': 164}), 14: (1, {'@': 164}), 15: (1, {'@': 164}), 16: (1, {'@': 164}), 19: (1, {'@': 164}), 20: (1, {'@': 164}), 21: (1, {'@': 164}), 22: (1, {'@': 164}), 23: (1, {'@': 164}), 24: (1, {'@': 164}), 25: (1, {'@': 164}), 26: (1, {'@': 164}), 27: (1, {'@': 164}), 28: (1, {'@': 164}), 29: (1, {'@': 164}), 30: (1, {'@': 164}), 0: (1, {'@': 164}), 31: (1, {'@': 164}), 32: (1, {'@': 164}), 33: (1, {'@': 164}), 35: (1, {'@': 164}), 36: (1, {'@': 164}), 37: (1, {'@': 164}), 17: (1, {'@': 164}), 18: (1, {'@': 164}), 34: (1, {'@': 164}), 38: (1, {'@': 164})}, 191: {3: (1, {'@': 195}), 15: (1, {'@': 195})}, 192: {1: (1, {'@': 150}), 2: (1, {'@': 150}), 3: (1, {'@': 150}), 4: (1, {'@': 150}), 5: (1, {'@': 150}), 6: (1, {'@': 150}), 7: (1, {'@': 150}), 8: (1, {'@': 150}), 9: (1, {'@': 150}), 10: (1, {'@': 150}), 11: (1, {'@': 150}), 12: (1, {'@': 150}), 13: (1, {'@': 150}), 14: (1, {'@': 150}), 15: (1, {'@': 150}), 16: (1, {'@': 150}), 19: (1, {'@': 150}), 20: (1, {'@': 150}), 21: (1, {'@': 150}), 22: (1, {'@': 150}), 23: (1, {'@': 150}), 24: (1, {'@': 150}), 25: (1, {'@': 150}), 26: (1, {'@': 150}), 27: (1, {'@': 150}), 28: (1, {'@': 150}), 29: (1, {'@': 150}), 30: (1, {'@': 150}), 0: (1, {'@': 150}), 31: (1, {'@': 150}), 32: (1, {'@': 150}), 33: (1, {'@': 150}), 35: (1, {'@': 150}), 36: (1, {'@': 150}), 37: (1, {'@': 150}), 17: (1, {'@': 150}), 18: (1, {'@': 150}), 34: (1, {'@': 150}), 38: (1, {'@': 150})}, 193: {32: (0, 280)}, 194: {15: (1, {'@': 92}), 17: (1, {'@': 92})}, 195: {3: (1, {'@': 169}), 18: (1, {'@': 169})}, 196: {16: (0, 137)}, 197: {58: (0, 167), 32: (0, 221)}, 198: {51: (0, 116), 98: (0, 96), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 66: (0, 195), 47: (0, 286), 59: (0, 120), 60: (0, 94), 18: (0, 84), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 100: (0, 60), 13: (0, 231), 4: (0, 170), 33: (0, 33), 67: (0, 125), 8: (0, 113), 11: (0, 198), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 199: {3: (1, {'@': 115}), 15: (1, {'@': 115}), 25: (1, {'@': 115}), 19: (1, {'@': 115}), 26: (1, {'@': 115}), 27: (1, {'@': 115}), 4: (1, {'@': 115}), 28: (1, {'@': 115}), 29: (1, {'@': 115}), 20: (1, {'@': 115}), 30: (1, {'@': 115}), 8: (1, {'@': 115}), 0: (1, {'@': 115}), 31: (1, {'@': 115}), 32: (1, {'@': 115}), 33: (1, {'@': 115}), 11: (1, {'@': 115}), 21: (1, {'@': 115}), 22: (1, {'@': 115}), 23: (1, {'@': 115}), 13: (1, {'@': 115}), 35: (1, {'@': 115}), 36: (1, {'@': 115}), 24: (1, {'@': 115}), 37: (1, {'@': 115}), 17: (1, {'@': 115}), 38: (1, {'@': 115}), 18: (1, {'@': 115}), 34: (1, {'@': 115})}, 200: {23: (1, {'@': 53})}, 201: {45: (0, 54), 46: (0, 76), 11: (0, 11), 32: (0, 260), 47: (0, 252), 48: (0, 118), 24: (0, 67), 44: (0, 229), 19: (0, 95), 49: (0, 80), 50: (0, 27)}, 202: {4: (0, 55), 16: (1, {'@': 112}), 17: (1, {'@': 112}), 15: (1, {'@': 112}), 25: (1, {'@': 112}), 23: (1, {'@': 112}), 32: (1, {'@': 112}), 3: (1, {'@': 112})}, 203: {51: (0, 116), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 47: (0, 286), 59: (0, 120), 60: (0, 94), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 66: (0, 40), 4: (0, 170), 33: (0, 33), 67: (0, 125), 8: (0, 113), 11: (0, 198), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 204: {23: (1, {'@': 187}), 25: (1, {'@': 187}), 32: (1, {'@': 187})}, 205: {17: (0, 115)}, 206: {32: (0, 2), 51: (0, 116), 54: (0, 62), 70: (0, 166), 55: (0, 207), 71: (0, 270), 72: (0, 48), 28: (0, 16), 59: (0, 120), 60: (0, 94), 56: (0, 78), 61: (0, 130), 74: (0, 101), 76: (0, 160), 75: (0, 179), 62: (0, 168), 63: (0, 42), 52: (0, 279), 78: (0, 28), 66: (0, 138), 22: (0, 154), 33: (0, 33), 67: (0, 125), 79: (0, 147), 80: (0, 106), 0: (0, 248), 11: (0, 198), 30: (0, 239), 36: (0, 222), 20: (0, 71), 53: (0, 212), 27: (0, 283), 81: (0, 274), 35: (0, 87), 19: (0, 95), 82: (0, 225), 25: (0, 272), 83: (0, 173), 47: (0, 286), 26: (0, 156), 73: (0, 23), 64: (0, 181), 65: (0, 192), 84: (0, 17), 85: (0, 182), 29: (0, 36), 31: (0, 119), 13: (0, 231), 4: (0, 170), 86: (0, 72), 8: (0, 113), 88: (0, 285), 37: (0, 109), 24: (0, 67), 21: (0, 193), 69: (0, 150), 23: (1, {'@': 52}), 38: (1, {'@': 52})}, 207: {1: (1, {'@': 146}), 2: (1, {'@': 146}), 3: (1, {'@': 146}), 4: (1, {'@': 146}), 5: (1, {'@': 146}), 6: (1, {'@': 146}), 7: (1, {'@': 146}), 8: (1, {'@': 146}), 9: (1, {'@': 146}), 10: (1, {'@': 146}), 11: (1, {'@': 146}), 12: (1, {'@': 146}), 13: (1, {'@': 146}), 14: (1, {'@': 146}), 15: (1, {'@': 146}), 16: (1, {'@': 146}), 19: (1, {'@': 146}), 20: (1, {'@': 146}), 21: (1, {'@': 146}), 22: (1, {'@': 146}), 23: (1, {'@': 146}), 24: (1, {'@': 146}), 25: (1, {'@': 146}), 26: (1, {'@': 146}), 27: (1, {'@': 146}), 28: (1, {'@': 146}), 29: (1, {'@': 146}), 30: (1, {'@': 146}), 0: (1, {'@': 146}), 31: (1, {'@': 146}), 32: (1, {'@': 146}), 33: (1, {'@': 146}), 35: (1, {'@': 146}), 36: (1, {'@': 146}), 37: (1, {'@': 146}), 17: (1, {'@': 146}), 18: (1, {'@': 146}), 34: (1, {'@': 146}), 38: (1, {'@': 146})}, 208: {15: (1, {'@': 171}), 17: (1, {'@': 171})}, 209: {1: (1, {'@': 131}), 2: (1, {'@': 131}), 10: (1, {'@': 131}), 3: (1, {'@': 131}), 4: (1, {'@': 131}), 12: (1, {'@': 131}), 5: (1, {'@': 131}), 13: (1, {'@': 131}), 15: (1, {'@': 131}), 14: (1, {'@': 131}), 8: (1, {'@': 131}), 16: (1, {'@': 131}), 19: (1, {'@': 131}), 20: (1, {'@': 131}), 21: (1, {'@': 131}), 22: (1, {'@': 131}), 23: (1, {'@': 131}), 24: (1, {'@': 131}), 25: (1, {'@': 131}), 26: (1, {'@': 131}), 27: (1, {'@': 131}), 28: (1, {'@': 131}), 29: (1, {'@': 131}), 30: (1, {'@': 131}), 0: (1, {'@': 131}), 31: (1, {'@': 131}), 32: (1, {'@': 131}), 33: (1, {'@': 131}), 11: (1, {'@': 131}), 35: (1, {'@': 131}), 36: (1, {'@': 131}), 37: (1, {'@': 131}), 17: (1, {'@': 131}), 38: (1, {'@': 131}), 18: (1, {'@': 131}), 34: (1, {'@': 131})}, 210: {25: (0, 268), 101: (0, 201), 110: (0, 47), 23: (1, {'@': 84})}, 211: {32: (0, 176)}, 212: {1: (1, {'@': 149}), 2: (1, {'@': 149}), 3: (1, {'@': 149}), 4: (1, {'@': 149}), 5: (1, {'@': 149}), 6: (1, {'@': 149}), 7: (1, {'@': 149}), 8: (1, {'@': 149}), 9: (1, {'@': 149}), 10: (1, {'@': 149}), 11: (1, {'@': 149}), 12: (1, {'@': 149}), 13: (1, {'@': 149}), 14: (1, {'@': 149}), 15: (1, {'@': 149}), 16: (1, {'@': 149}), 19: (1, {'@': 149}), 20: (1, {'@': 149}), 21: (1, {'@': 149}), 22: (1, {'@': 149}), 23: (1, {'@': 149}), 24: (1, {'@': 149}), 25: (1, {'@': 149}), 26: (1, {'@': 149}), 27: (1, {'@': 149}), 28: (1, {'@': 149}), 29: (1, {'@': 149}), 30: (1, {'@': 149}), 0: (1, {'@': 149}), 31: (1, {'@': 149}), 32: (1, {'@': 149}), 33: (1, {'@': 149}), 35: (1, {'@': 149}), 36: (1, {'@': 149}), 37: (1, {'@': 149}), 17: (1, {'@': 149}), 18: (1, {'@': 149}), 34: (1, {'@': 149}), 38: (1, {'@': 149})}, 213: {52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 47: (0, 286), 59: (0, 120), 60: (0, 94), 56: (0, 117), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 8: (0, 113), 11: (0, 198), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 214: {17: (0, 158)}, 215: {51: (0, 116), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 47: (0, 286), 59: (0, 120), 66: (0, 205), 60: (0, 94), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 67: (0, 125), 8: (0, 113), 11: (0, 198), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 216: {3: (1, {'@': 173}), 18: (1, {'@': 173})}, 217: {52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 55: (0, 207), 19: (0, 95), 47: (0, 286), 59: (0, 120), 60: (0, 94), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 8: (0, 113), 11: (0, 198), 24: (0, 67), 54: (0, 218), 0: (0, 248), 69: (0, 150)}, 218: {1: (1, {'@': 132}), 2: (1, {'@': 132}), 10: (1, {'@': 132}), 3: (1, {'@': 132}), 4: (1, {'@': 132}), 12: (1, {'@': 132}), 5: (1, {'@': 132}), 13: (1, {'@': 132}), 15: (1, {'@': 132}), 14: (1, {'@': 132}), 8: (1, {'@': 132}), 16: (1, {'@': 132}), 19: (1, {'@': 132}), 20: (1, {'@': 132}), 21: (1, {'@': 132}), 22: (1, {'@': 132}), 23: (1, {'@': 132}), 24: (1, {'@': 132}), 25: (1, {'@': 132}), 26: (1, {'@': 132}), 27: (1, {'@': 132}), 28: (1, {'@': 132}), 29: (1, {'@': 132}), 30: (1, {'@': 132}), 0: (1, {'@': 132}), 31: (1, {'@': 132}), 32: (1, {'@': 132}), 33: (1, {'@': 132}), 11: (1, {'@': 132}), 35: (1, {'@': 132}), 36: (1, {'@': 132}), 37: (1, {'@': 132}), 17: (1, {'@': 132}), 38: (1, {'@': 132}), 18: (1, {'@': 132}), 34: (1, {'@': 132})}, 219: {1: (1, {'@': 163}), 2: (1, {'@': 163}), 3: (1, {'@': 163}), 4: (1, {'@': 163}), 5: (1, {'@': 163}), 6: (1, {'@': 163}), 7: (1, {'@': 163}), 8: (1, {'@': 163}), 9: (1, {'@': 163}), 10: (1, {'@': 163}), 11: (1, {'@': 163}), 12: (1, {'@': 163}), 13: (1, {'@': 163}), 14: (1, {'@': 163}), 15: (1, {'@': 163}), 16: (1, {'@': 163}), 19: (1, {'@': 163}), 20: (1, {'@': 163}), 21: (1, {'@': 163}), 22: (1, {'@': 163}), 23: (1, {'@': 163}), 24: (1, {'@': 163}), 25: (1, {'@': 163}), 26: (1, {'@': 163}), 27: (1, {'@': 163}), 28: (1, {'@': 163}), 29: (1, {'@': 163}), 30: (1, {'@': 163}), 0: (1, {'@': 163}), 31: (1, {'@': 163}), 32: (1, {'@': 163}), 33: (1, {'@': 163}), 35: (1, {'@': 163}), 36: (1, {'@': 163}), 37: (1, {'@': 163}), 17: (1, {'@': 163}), 18: (1, {'@': 163}), 34: (1, {'@': 163}), 38: (1, {'@': 163})}, 220: {104: (0, 68)}, 221: {40: (0, 276)}, 222: {32: (0, 79)}, 223: {3: (1, {'@': 174}), 18: (1, {'@': 174})}, 224: {32: (0, 2), 51: (0, 116), 54: (0, 62), 70: (0, 166), 55: (0, 207), 71: (0, 270), 72: (0, 48), 28: (0, 16), 59: (0, 120), 60: (0, 94), 73: (0, 257), 56: (0, 78), 61: (0, 130), 74: (0, 101), 75: (0, 179), 76: (0, 160), 62: (0, 168), 116: (0, 238), 77: (0, 206), 63: (0, 42), 52: (0, 279), 78: (0, 28), 66: (0, 138), 22: (0, 154), 33: (0, 33), 67: (0, 125), 79: (0, 147), 89: (0, 135), 80: (0, 106), 0: (0, 248), 11: (0, 198), 30: (0, 239), 36: (0, 222), 20: (0, 71), 53: (0, 212), 27: (0, 283), 81: (0, 274), 35: (0, 87), 19: (0, 95), 82: (0, 225), 83: (0, 173), 47: (0, 286), 26: (0, 156), 64: (0, 181), 65: (0, 192), 84: (0, 17), 25: (0, 258), 85: (0, 182), 29: (0, 36), 31: (0, 119), 13: (0, 231), 4: (0, 170), 86: (0, 72), 8: (0, 113), 88: (0, 285), 37: (0, 109), 24: (0, 67), 21: (0, 193), 69: (0, 150)}, 225: {25: (1, {'@': 58}), 19: (1, {'@': 58}), 26: (1, {'@': 58}), 27: (1, {'@': 58}), 4: (1, {'@': 58}), 28: (1, {'@': 58}), 29: (1, {'@': 58}), 20: (1, {'@': 58}), 30: (1, {'@': 58}), 8: (1, {'@': 58}), 0: (1, {'@': 58}), 31: (1, {'@': 58}), 32: (1, {'@': 58}), 33: (1, {'@': 58}), 11: (1, {'@': 58}), 21: (1, {'@': 58}), 22: (1, {'@': 58}), 23: (1, {'@': 58}), 13: (1, {'@': 58}), 35: (1, {'@': 58}), 36: (1, {'@': 58}), 24: (1, {'@': 58}), 37: (1, {'@': 58}), 38: (1, {'@': 58})}, 226: {1: (1, {'@': 124}), 10: (1, {'@': 124}), 14: (1, {'@': 124}), 15: (1, {'@': 124}), 3: (1, {'@': 124}), 5: (1, {'@': 124}), 25: (1, {'@': 124}), 19: (1, {'@': 124}), 26: (1, {'@': 124}), 27: (1, {'@': 124}), 4: (1, {'@': 124}), 28: (1, {'@': 124}), 29: (1, {'@': 124}), 20: (1, {'@': 124}), 30: (1, {'@': 124}), 8: (1, {'@': 124}), 0: (1, {'@': 124}), 31: (1, {'@': 124}), 32: (1, {'@': 124}), 33: (1, {'@': 124}), 11: (1, {'@': 124}), 21: (1, {'@': 124}), 22: (1, {'@': 124}), 23: (1, {'@': 124}), 13: (1, {'@': 124}), 35: (1, {'@': 124}), 36: (1, {'@': 124}), 24: (1, {'@': 124}), 37: (1, {'@': 124}), 17: (1, {'@': 124}), 38: (1, {'@': 124}), 18: (1, {'@': 124}), 34: (1, {'@': 124})}, 227: {40: (0, 276), 41: (0, 6), 1: (1, {'@': 162}), 2: (1, {'@': 162}), 3: (1, {'@': 162}), 4: (1, {'@': 162}), 5: (1, {'@': 162}), 6: (1, {'@': 162}), 7: (1, {'@': 162}), 8: (1, {'@': 162}), 0: (1, {'@': 162}), 9: (1, {'@': 162}), 10: (1, {'@': 162}), 11: (1, {'@': 162}), 12: (1, {'@': 162}), 13: (1, {'@': 162}), 14: (1, {'@': 162}), 15: (1, {'@': 162}), 16: (1, {'@': 162})}, 228: {23: (1, {'@': 188}), 25: (1, {'@': 188}), 32: (1, {'@': 188})}, 229: {17: (0, 83)}, 230: {117: (0, 112), 18: (0, 208), 3: (0, 165)}, 231: {32: (0, 121), 53: (0, 212), 27: (0, 283), 35: (0, 87), 62: (0, 0), 55: (0, 207), 19: (0, 95), 13: (0, 231), 47: (0, 286), 4: (0, 170), 33: (0, 33), 8: (0, 113), 59: (0, 120), 11: (0, 198), 63: (0, 42), 60: (0, 94), 24: (0, 67), 52: (0, 136), 0: (0, 248), 64: (0, 181), 65: (0, 192), 69: (0, 150)}, 232: {51: (0, 116), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 47: (0, 286), 59: (0, 120), 60: (0, 94), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 67: (0, 125), 8: (0, 113), 11: (0, 198), 66: (0, 214), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 233: {25: (1, {'@': 94}), 19: (1, {'@': 94}), 26: (1, {'@': 94}), 27: (1, {'@': 94}), 4: (1, {'@': 94}), 28: (1, {'@': 94}), 29: (1, {'@': 94}), 20: (1, {'@': 94}), 30: (1, {'@': 94}), 8: (1, {'@': 94}), 0: (1, {'@': 94}), 31: (1, {'@': 94}), 32: (1, {'@': 94}), 33: (1, {'@': 94}), 11: (1, {'@': 94}), 21: (1, {'@': 94}), 22: (1, {'@': 94}), 23: (1, {'@': 94}), 13: (1, {'@': 94}), 35: (1, {'@': 94}), 36: (1, {'@': 94}), 24: (1, {'@': 94}), 37: (1, {'@': 94}), 38: (1, {'@': 94})}, 234: {1: (1, {'@': 130}), 2: (1, {'@': 130}), 10: (1, {'@': 130}), 3: (1, {'@': 130}), 4: (1, {'@': 130}), 12: (1, {'@': 130}), 5: (1, {'@': 130}), 13: (1, {'@': 130}), 15: (1, {'@': 130}), 14: (1, {'@': 130}), 8: (1, {'@': 130}), 16: (1, {'@': 130}), 19: (1, {'@': 130}), 20: (1, {'@': 130}), 21: (1, {'@': 130}), 22: (1, {'@': 130}), 23: (1, {'@': 130}), 24: (1, {'@': 130}), 25: (1, {'@': 130}), 26: (1, {'@': 130}), 27: (1, {'@': 130}), 28: (1, {'@': 130}), 29: (1, {'@': 130}), 30: (1, {'@': 130}), 0: (1, {'@': 130}), 31: (1, {'@': 130}), 32: (1, {'@': 130}), 33: (1, {'@': 130}), 11: (1, {'@': 130}), 35: (1, {'@': 130}), 36: (1, {'@': 130}), 37: (1, {'@': 130}), 17: (1, {'@': 130}), 38: (1, {'@': 130}), 18: (1, {'@': 130}), 34: (1, {'@': 130})}, 235: {51: (0, 116), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 47: (0, 286), 59: (0, 120), 60: (0, 94), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 66: (0, 103), 13: (0, 231), 4: (0, 170), 33: (0, 33), 67: (0, 125), 8: (0, 113), 11: (0, 198), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 236: {32: (0, 153), 102: (0, 278)}, 237: {3: (1, {'@': 203}), 18: (1, {'@': 203})}, 238: {}, 239: {32: (0, 254), 51: (0, 116), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 47: (0, 286), 59: (0, 120), 60: (0, 94), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 66: (0, 263), 13: (0, 231), 4: (0, 170), 33: (0, 33), 67: (0, 125), 8: (0, 113), 11: (0, 198), 81: (0, 73), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 240: {16: (0, 265)}, 241: {87: (0, 188), 32: (0, 2), 51: (0, 116), 54: (0, 62), 70: (0, 166), 55: (0, 207), 71: (0, 270), 72: (0, 48), 28: (0, 16), 59: (0, 120), 60: (0, 94), 73: (0, 257), 56: (0, 78), 61: (0, 130), 74: (0, 101), 75: (0, 179), 76: (0, 160), 62: (0, 168), 77: (0, 206), 63: (0, 42), 52: (0, 279), 78: (0, 28), 66: (0, 138), 22: (0, 154), 33: (0, 33), 67: (0, 125), 79: (0, 147), 80: (0, 106), 0: (0, 248), 11: (0, 198), 30: (0, 239), 36: (0, 222), 20: (0, 71), 53: (0, 212), 27: (0, 283), 81: (0, 274), 35: (0, 87), 19: (0, 95), 82: (0, 225), 83: (0, 173), 47: (0, 286), 26: (0, 156), 64: (0, 181), 65: (0, 192), 84: (0, 17), 25: (0, 258), 85: (0, 182), 29: (0, 36), 31: (0, 119), 13: (0, 231), 4: (0, 170), 86: (0, 72), 8: (0, 113), 88: (0, 285), 37: (0, 109), 24: (0, 67), 89: (0, 200), 21: (0, 193), 69: (0, 150)}, 242: {32: (0, 2), 51: (0, 116), 54: (0, 62), 70: (0, 166), 55: (0, 207), 71: (0, 270), 72: (0, 48), 28: (0, 16), 59: (0, 120), 60: (0, 94), 73: (0, 257), 56: (0, 78), 61: (0, 130), 74: (0, 101), 75: (0, 179), 76: (0, 160), 62: (0, 168), 77: (0, 206), 63: (0, 42), 52: (0, 279), 87: (0, 129), 78: (0, 28), 66: (0, 138), 22: (0, 154), 33: (0, 33), 67: (0, 125), 79: (0, 147), 80: (0, 106), 0: (0, 248), 11: (0, 198), 30: (0, 239), 36: (0, 222), 20: (0, 71), 53: (0, 212), 27: (0, 283), 81: (0, 274), 35: (0, 87), 19: (0, 95), 82: (0, 225), 83: (0, 173), 47: (0, 286), 26: (0, 156), 64: (0, 181), 65: (0, 192), 84: (0, 17), 25: (0, 258), 85: (0, 182), 29: (0, 36), 31: (0, 119), 13: (0, 231), 4: (0, 170), 86: (0, 72), 8: (0, 113), 88: (0, 285), 37: (0, 109), 24: (0, 67), 89: (0, 200), 21: (0, 193), 69: (0, 150)}, 243: {23: (0, 140)}, 244: {118: (0, 235)}, 245: {15: (0, 91)}, 246: {32: (0, 202), 103: (0, 175)}, 247: {32: (0, 153), 102: (0, 45), 15: (0, 220), 119: (0, 267)}, 248: {51: (0, 116), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 47: (0, 286), 59: (0, 120), 60: (0, 94), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 66: (0, 245), 13: (0, 231), 4: (0, 170), 33: (0, 33), 67: (0, 125), 8: (0, 113), 11: (0, 198), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 249: {25: (1, {'@': 83}), 19: (1, {'@': 83}), 26: (1, {'@': 83}), 27: (1, {'@': 83}), 4: (1, {'@': 83}), 28: (1, {'@': 83}), 29: (1, {'@': 83}), 20: (1, {'@': 83}), 30: (1, {'@': 83}), 8: (1, {'@': 83}), 0: (1, {'@': 83}), 31: (1, {'@': 83}), 32: (1, {'@': 83}), 33: (1, {'@': 83}), 11: (1, {'@': 83}), 21: (1, {'@': 83}), 22: (1, {'@': 83}), 23: (1, {'@': 83}), 13: (1, {'@': 83}), 35: (1, {'@': 83}), 36: (1, {'@': 83}), 24: (1, {'@': 83}), 37: (1, {'@': 83}), 38: (1, {'@': 83})}, 250: {32: (0, 52)}, 251: {51: (0, 116), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 47: (0, 286), 59: (0, 120), 60: (0, 94), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 66: (0, 108), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 67: (0, 125), 8: (0, 113), 11: (0, 198), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 252: {15: (1, {'@': 86}), 17: (1, {'@': 86})}, 253: {108: (0, 232), 113: (0, 174), 19: (1, {'@': 80}), 20: (1, {'@': 80}), 8: (1, {'@': 80}), 21: (1, {'@': 80}), 22: (1, {'@': 80}), 23: (1, {'@': 80}), 13: (1, {'@': 80}), 24: (1, {'@': 80}), 25: (1, {'@': 80}), 42: (1, {'@': 80}), 26: (1, {'@': 80}), 27: (1, {'@': 80}), 4: (1, {'@': 80}), 28: (1, {'@': 80}), 29: (1, {'@': 80}), 30: (1, {'@': 80}), 0: (1, {'@': 80}), 31: (1, {'@': 80}), 32: (1, {'@': 80}), 33: (1, {'@': 80}), 11: (1, {'@': 80}), 35: (1, {'@': 80}), 36: (1, {'@': 80}), 37: (1, {'@': 80}), 38: (1, {'@': 80})}, 254: {39: (0, 250), 41: (0, 6), 1: (1, {'@': 162}), 19: (1, {'@': 162}), 20: (1, {'@': 162}), 8: (1, {'@': 162}), 9: (1, {'@': 162}), 21: (1, {'@': 162}), 22: (1, {'@': 162}), 23: (1, {'@': 162}), 13: (1, {'@': 162}), 16: (1, {'@': 162}), 24: (1, {'@': 162}), 2: (1, {'@': 162}), 25: (1, {'@': 162}), 4: (1, {'@': 162}), 26: (1, {'@': 162}), 27: (1, {'@': 162}), 5: (1, {'@': 162}), 6: (1, {'@': 162}), 28: (1, {'@': 162}), 29: (1, {'@': 162}), 7: (1, {'@': 162}), 30: (1, {'@': 162}), 0: (1, {'@': 162}), 31: (1, {'@': 162}), 32: (1, {'@': 162}), 33: (1, {'@': 162}), 10: (1, {'@': 162}), 11: (1, {'@': 162}), 12: (1, {'@': 162}), 35: (1, {'@': 162}), 14: (1, {'@': 162}), 36: (1, {'@': 162}), 37: (1, {'@': 162}), 38: (1, {'@': 162})}, 255: {3: (1, {'@': 118}), 5: (1, {'@': 118}), 14: (1, {'@': 118}), 15: (1, {'@': 118}), 25: (1, {'@': 118}), 19: (1, {'@': 118}), 26: (1, {'@': 118}), 27: (1, {'@': 118}), 4: (1, {'@': 118}), 28: (1, {'@': 118}), 29: (1, {'@': 118}), 20: (1, {'@': 118}), 30: (1, {'@': 118}), 8: (1, {'@': 118}), 0: (1, {'@': 118}), 31: (1, {'@': 118}), 32: (1, {'@': 118}), 33: (1, {'@': 118}), 11: (1, {'@': 118}), 21: (1, {'@': 118}), 22: (1, {'@': 118}), 23: (1, {'@': 118}), 13: (1, {'@': 118}), 35: (1, {'@': 118}), 36: (1, {'@': 118}), 24: (1, {'@': 118}), 37: (1, {'@': 118}), 17: (1, {'@': 118}), 38: (1, {'@': 118}), 18: (1, {'@': 118}), 34: (1, {'@': 118})}, 256: {1: (1, {'@': 140}), 2: (1, {'@': 140}), 3: (1, {'@': 140}), 4: (1, {'@': 140}), 5: (1, {'@': 140}), 6: (1, {'@': 140}), 7: (1, {'@': 140}), 8: (1, {'@': 140}), 9: (1, {'@': 140}), 10: (1, {'@': 140}), 11: (1, {'@': 140}), 12: (1, {'@': 140}), 13: (1, {'@': 140}), 14: (1, {'@': 140}), 15: (1, {'@': 140}), 16: (1, {'@': 140}), 19: (1, {'@': 140}), 20: (1, {'@': 140}), 21: (1, {'@': 140}), 22: (1, {'@': 140}), 23: (1, {'@': 140}), 24: (1, {'@': 140}), 25: (1, {'@': 140}), 26: (1, {'@': 140}), 27: (1, {'@': 140}), 28: (1, {'@': 140}), 29: (1, {'@': 140}), 30: (1, {'@': 140}), 0: (1, {'@': 140}), 31: (1, {'@': 140}), 32: (1, {'@': 140}), 33: (1, {'@': 140}), 35: (1, {'@': 140}), 36: (1, {'@': 140}), 37: (1, {'@': 140}), 17: (1, {'@': 140}), 18: (1, {'@': 140}), 34: (1, {'@': 140}), 38: (1, {'@': 140})}, 257: {19: (1, {'@': 175}), 20: (1, {'@': 175}), 8: (1, {'@': 175}), 21: (1, {'@': 175}), 22: (1, {'@': 175}), 23: (1, {'@': 175}), 13: (1, {'@': 175}), 24: (1, {'@': 175}), 25: (1, {'@': 175}), 26: (1, {'@': 175}), 27: (1, {'@': 175}), 4: (1, {'@': 175}), 28: (1, {'@': 175}), 29: (1, {'@': 175}), 30: (1, {'@': 175}), 0: (1, {'@': 175}), 31: (1, {'@': 175}), 32: (1, {'@': 175}), 33: (1, {'@': 175}), 11: (1, {'@': 175}), 35: (1, {'@': 175}), 36: (1, {'@': 175}), 37: (1, {'@': 175}), 38: (1, {'@': 175})}, 258: {19: (1, {'@': 176}), 20: (1, {'@': 176}), 8: (1, {'@': 176}), 21: (1, {'@': 176}), 22: (1, {'@': 176}), 23: (1, {'@': 176}), 13: (1, {'@': 176}), 24: (1, {'@': 176}), 25: (1, {'@': 176}), 26: (1, {'@': 176}), 27: (1, {'@': 176}), 4: (1, {'@': 176}), 28: (1, {'@': 176}), 29: (1, {'@': 176}), 30: (1, {'@': 176}), 0: (1, {'@': 176}), 31: (1, {'@': 176}), 32: (1, {'@': 176}), 33: (1, {'@': 176}), 11: (1, {'@': 176}), 35: (1, {'@': 176}), 36: (1, {'@': 176}), 37: (1, {'@': 176}), 38: (1, {'@': 176})}, 259: {19: (1, {'@': 82}), 20: (1, {'@': 82}), 8: (1, {'@': 82}), 21: (1, {'@': 82}), 22: (1, {'@': 82}), 23: (1, {'@': 82}), 13: (1, {'@': 82}), 24: (1, {'@': 82}), 25: (1, {'@': 82}), 26: (1, {'@': 82}), 27: (1, {'@': 82}), 4: (1, {'@': 82}), 28: (1, {'@': 82}), 29: (1, {'@': 82}), 30: (1, {'@': 82}), 0: (1, {'@': 82}), 31: (1, {'@': 82}), 32: (1, {'@': 82}), 33: (1, {'@': 82}), 11: (1, {'@': 82}), 35: (1, {'@': 82}), 36: (1, {'@': 82}), 37: (1, {'@': 82}), 38: (1, {'@': 82})}, 260: {41: (0, 211)}, 261: {40: (0, 114)}, 262: {3: (0, 197), 15: (1, {'@': 153})}, 263: {25: (1, {'@': 73}), 19: (1, {'@': 73}), 26: (1, {'@': 73}), 27: (1, {'@': 73}), 4: (1, {'@': 73}), 28: (1, {'@': 73}), 29: (1, {'@': 73}), 20: (1, {'@': 73}), 30: (1, {'@': 73}), 8: (1, {'@': 73}), 0: (1, {'@': 73}), 31: (1, {'@': 73}), 32: (1, {'@': 73}), 33: (1, {'@': 73}), 11: (1, {'@': 73}), 21: (1, {'@': 73}), 22: (1, {'@': 73}), 23: (1, {'@': 73}), 13: (1, {'@': 73}), 35: (1, {'@': 73}), 36: (1, {'@': 73}), 24: (1, {'@': 73}), 37: (1, {'@': 73}), 38: (1, {'@': 73})}, 264: {25: (1, {'@': 113}), 19: (1, {'@': 113}), 26: (1, {'@': 113}), 27: (1, {'@': 113}), 4: (1, {'@': 113}), 28: (1, {'@': 113}), 29: (1, {'@': 113}), 20: (1, {'@': 113}), 30: (1, {'@': 113}), 8: (1, {'@': 113}), 0: (1, {'@': 113}), 31: (1, {'@': 113}), 32: (1, {'@': 113}), 33: (1, {'@': 113}), 11: (1, {'@': 113}), 21: (1, {'@': 113}), 22: (1, {'@': 113}), 23: (1, {'@': 113}), 13: (1, {'@': 113}), 35: (1, {'@': 113}), 36: (1, {'@': 113}), 24: (1, {'@': 113}), 37: (1, {'@': 113}), 38: (1, {'@': 113})}, 265: {11: (0, 46)}, 266: {25: (1, {'@': 102}), 19: (1, {'@': 102}), 26: (1, {'@': 102}), 27: (1, {'@': 102}), 4: (1, {'@': 102}), 28: (1, {'@': 102}), 29: (1, {'@': 102}), 20: (1, {'@': 102}), 30: (1, {'@': 102}), 8: (1, {'@': 102}), 0: (1, {'@': 102}), 31: (1, {'@': 102}), 32: (1, {'@': 102}), 33: (1, {'@': 102}), 11: (1, {'@': 102}), 21: (1, {'@': 102}), 22: (1, {'@': 102}), 23: (1, {'@': 102}), 13: (1, {'@': 102}), 35: (1, {'@': 102}), 36: (1, {'@': 102}), 24: (1, {'@': 102}), 37: (1, {'@': 102}), 38: (1, {'@': 102})}, 267: {15: (0, 65)}, 268: {23: (1, {'@': 184}), 25: (1, {'@': 184}), 101: (1, {'@': 184})}, 269: {25: (1, {'@': 107}), 19: (1, {'@': 107}), 26: (1, {'@': 107}), 27: (1, {'@': 107}), 4: (1, {'@': 107}), 28: (1, {'@': 107}), 29: (1, {'@': 107}), 20: (1, {'@': 107}), 30: (1, {'@': 107}), 8: (1, {'@': 107}), 0: (1, {'@': 107}), 31: (1, {'@': 107}), 32: (1, {'@': 107}), 33: (1, {'@': 107}), 11: (1, {'@': 107}), 21: (1, {'@': 107}), 22: (1, {'@': 107}), 23: (1, {'@': 107}), 13: (1, {'@': 107}), 35: (1, {'@': 107}), 36: (1, {'@': 107}), 24: (1, {'@': 107}), 37: (1, {'@': 107}), 38: (1, {'@': 107})}, 270: {25: (1, {'@': 63}), 19: (1, {'@': 63}), 26: (1, {'@': 63}), 27: (1, {'@': 63}), 4: (1, {'@': 63}), 28: (1, {'@': 63}), 29: (1, {'@': 63}), 20: (1, {'@': 63}), 30: (1, {'@': 63}), 8: (1, {'@': 63}), 0: (1, {'@': 63}), 31: (1, {'@': 63}), 32: (1, {'@': 63}), 33: (1, {'@': 63}), 11: (1, {'@': 63}), 21: (1, {'@': 63}), 22: (1, {'@': 63}), 23: (1, {'@': 63}), 13: (1, {'@': 63}), 35: (1, {'@': 63}), 36: (1, {'@': 63}), 24: (1, {'@': 63}), 37: (1, {'@': 63}), 38: (1, {'@': 63})}, 271: {51: (0, 116), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 66: (0, 164), 55: (0, 207), 19: (0, 95), 56: (0, 78), 47: (0, 286), 59: (0, 120), 60: (0, 94), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 67: (0, 125), 8: (0, 113), 11: (0, 198), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 272: {19: (1, {'@': 178}), 20: (1, {'@': 178}), 8: (1, {'@': 178}), 21: (1, {'@': 178}), 22: (1, {'@': 178}), 23: (1, {'@': 178}), 13: (1, {'@': 178}), 24: (1, {'@': 178}), 25: (1, {'@': 178}), 26: (1, {'@': 178}), 27: (1, {'@': 178}), 4: (1, {'@': 178}), 28: (1, {'@': 178}), 29: (1, {'@': 178}), 30: (1, {'@': 178}), 0: (1, {'@': 178}), 31: (1, {'@': 178}), 32: (1, {'@': 178}), 33: (1, {'@': 178}), 11: (1, {'@': 178}), 35: (1, {'@': 178}), 36: (1, {'@': 178}), 37: (1, {'@': 178}), 38: (1, {'@': 178})}, 273: {32: (0, 202), 103: (0, 180)}, 274: {40: (0, 251), 25: (1, {'@': 68}), 19: (1, {'@': 68}), 26: (1, {'@': 68}), 27: (1, {'@': 68}), 4: (1, {'@': 68}), 28: (1, {'@': 68}), 29: (1, {'@': 68}), 20: (1, {'@': 68}), 30: (1, {'@': 68}), 8: (1, {'@': 68}), 0: (1, {'@': 68}), 31: (1, {'@': 68}), 32: (1, {'@': 68}), 33: (1, {'@': 68}), 11: (1, {'@': 68}), 21: (1, {'@': 68}), 22: (1, {'@': 68}), 23: (1, {'@': 68}), 13: (1, {'@': 68}), 35: (1, {'@': 68}), 36: (1, {'@': 68}), 24: (1, {'@': 68}), 37: (1, {'@': 68}), 38: (1, {'@': 68})}, 275: {51: (0, 116), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 47: (0, 286), 59: (0, 120), 60: (0, 94), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 67: (0, 199), 13: (0, 231), 4: (0, 170), 33: (0, 33), 8: (0, 113), 11: (0, 198), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 276: {51: (0, 116), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 69: (0, 150), 56: (0, 78), 47: (0, 286), 59: (0, 120), 60: (0, 94), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 67: (0, 125), 8: (0, 113), 11: (0, 198), 24: (0, 67), 0: (0, 248), 66: (0, 172)}, 277: {51: (0, 116), 52: (0, 279), 53: (0, 212), 27: (0, 283), 35: (0, 87), 54: (0, 62), 55: (0, 207), 19: (0, 95), 56: (0, 78), 47: (0, 286), 66: (0, 178), 59: (0, 120), 60: (0, 94), 61: (0, 130), 62: (0, 0), 63: (0, 42), 64: (0, 181), 65: (0, 192), 32: (0, 121), 13: (0, 231), 4: (0, 170), 33: (0, 33), 67: (0, 125), 8: (0, 113), 11: (0, 198), 24: (0, 67), 0: (0, 248), 69: (0, 150)}, 278: {3: (1, {'@': 196}), 15: (1, {'@': 196})}, 279: {9: (0, 151), 6: (0, 217), 7: (0, 98), 1: (1, {'@': 129}), 2: (1, {'@': 129}), 10: (1, {'@': 129}), 3: (1, {'@': 129}), 4: (1, {'@': 129}), 12: (1, {'@': 129}), 5: (1, {'@': 129}), 13: (1, {'@': 129}), 15: (1, {'@': 129}), 14: (1, {'@': 129}), 8: (1, {'@': 129}), 16: (1, {'@': 129}), 19: (1, {'@': 129}), 20: (1, {'@': 129}), 21: (1, {'@': 129}), 22: (1, {'@': 129}), 23: (1, {'@': 129}), 24: (1, {'@': 129}), 25: (1, {'@': 129}), 26: (1, {'@': 129}), 27: (1, {'@': 129}), 28: (1, {'@': 129}), 29: (1, {'@': 129}), 30: (1, {'@': 129}), 0: (1, {'@': 129}), 31: (1, {'@': 129}), 32: (1, {'@': 129}), 33: (1, {'@': 129}), 11: (1, {'@': 129}), 35: (1, {'@': 129}), 36: (1, {'@': 129}), 37: (1, {'@': 129}), 17: (1, {'@': 129}), 38: (1, {'@': 129}), 18: (1, {'@': 129}), 34: (1, {'@': 129})}, 280: {17: (0, 88)}, 281: {25: (1, {'@': 75}), 19: (1, {'@': 75}), 26: (1, {'@': 75}), 27: (1, {'@': 75}), 4: (1, {'@': 75}), 28: (1, {'@': 75}), 29: (1, {'@': 75}), 20: (1, {'@': 75}), 30: (1, {'@': 75}), 8: (1, {'@': 75}), 0: (1, {'@': 75}), 31: (1, {'@': 75}), 32: (1, {'@': 75}), 33: (1, {'@': 75}), 11: (1, {'@': 75}), 21: (1, {'@': 75}), 22: (1, {'@': 75}), 23: (1, {'@': 75}), 13: (1, {'@': 75}), 35: (1, {'@': 75}), 36: (1, {'@': 75}), 24: (1, {'@': 75}), 37: (1, {'@': 75}), 38: (1, {'@': 75})}, 282: {23: (0, 233)}, 283: {1: (1, {'@': 158}), 2: (1, {'@': 158}), 3: (1, {'@': 158}), 4: (1, {'@': 158}), 5: (1, {'@': 158}), 6: (1, {'@': 158}), 7: (1, {'@': 158}), 8: (1, {'@': 158}), 9: (1, {'@': 158}), 10: (1, {'@': 158}), 11: (1, {'@': 158}), 12: (1, {'@': 158}), 13: (1, {'@': 158}), 14: (1, {'@': 158}), 15: (1, {'@': 158}), 16: (1, {'@': 158}), 19: (1, {'@': 158}), 20: (1, {'@': 158}), 21: (1, {'@': 158}), 22: (1, {'@': 158}), 23: (1, {'@': 158}), 24: (1, {'@': 158}), 25: (1, {'@': 158}), 26: (1, {'@': 158}), 27: (1, {'@': 158}), 28: (1, {'@': 158}), 29: (1, {'@': 158}), 30: (1, {'@': 158}), 0: (1, {'@': 158}), 31: (1, {'@': 158}), 32: (1, {'@': 158}), 33: (1, {'@': 158}), 35: (1, {'@': 158}), 36: (1, {'@': 158}), 37: (1, {'@': 158}), 18: (1, {'@': 158}), 17: (1, {'@': 158}), 34: (1, {'@': 158}), 38: (1, {'@': 158})}, 284: {3: (0, 189), 18: (1, {'@': 167})}, 285: {25: (1, {'@': 60}), 19: (1, {'@': 60}), 26: (1, {'@': 60}), 27: (1, {'@': 60}), 4: (1, {'@': 60}), 28: (1, {'@': 60}), 29: (1, {'@': 60}), 20: (1, {'@': 60}), 30: (1, {'@': 60}), 8: (1, {'@': 60}), 0: (1, {'@': 60}), 31: (1, {'@': 60}), 32: (1, {'@': 60}), 33: (1, {'@': 60}), 11: (1, {'@': 60}), 21: (1, {'@': 60}), 22: (1, {'@': 60}), 23: (1, {'@': 60}), 13: (1, {'@': 60}), 35: (1, {'@': 60}), 36: (1, {'@': 60}), 24: (1, {'@': 60}), 37: (1, {'@': 60}), 38: (1, {'@': 60})}, 286: {1: (1, {'@': 145}), 2: (1, {'@': 145}), 3: (1, {'@': 145}), 4: (1, {'@': 145}), 5: (1, {'@': 145}), 6: (1, {'@': 145}), 7: (1, {'@': 145}), 8: (1, {'@': 145}), 9: (1, {'@': 145}), 10: (1, {'@': 145}), 11: (1, {'@': 145}), 12: (1, {'@': 145}), 13: (1, {'@': 145}), 14: (1, {'@': 145}), 15: (1, {'@': 145}), 16: (1, {'@': 145}), 19: (1, {'@': 145}), 20: (1, {'@': 145}), 21: (1, {'@': 145}), 22: (1, {'@': 145}), 23: (1, {'@': 145}), 24: (1, {'@': 145}), 25: (1, {'@': 145}), 26: (1, {'@': 145}), 27: (1, {'@': 145}), 28: (1, {'@': 145}), 29: (1, {'@': 145}), 30: (1, {'@': 145}), 0: (1, {'@': 145}), 31: (1, {'@': 145}), 32: (1, {'@': 145}), 33: (1, {'@': 145}), 35: (1, {'@': 145}), 36: (1, {'@': 145}), 37: (1, {'@': 145}), 17: (1, {'@': 145}), 18: (1, {'@': 145}), 34: (1, {'@': 145}), 38: (1, {'@': 145})}}, 'start_states': {'start': 224}, 'end_states': {'start': 238}}, '__type__': 'ParsingFrontend'}, 'rules': [{'@': 51}, {'@': 52}, {'@': 53}, {'@': 54}, {'@': 55}, {'@': 56}, {'@': 57}, {'@': 58}, {'@': 59}, {'@': 60}, {'@': 61}, {'@': 62}, {'@': 63}, {'@': 64}, {'@': 65}, {'@': 66}, {'@': 67}, {'@': 68}, {'@': 69}, {'@': 70}, {'@': 71}, {'@': 72}, {'@': 73}, {'@': 74}, {'@': 75}, {'@': 76}, {'@': 77}, {'@': 78}, {'@': 79}, {'@': 80}, {'@': 81}, {'@': 82}, {'@': 83}, {'@': 84}, {'@': 85}, {'@': 86}, {'@': 87}, {'@': 88}, {'@': 89}, {'@': 90}, {'@': 91}, {'@': 92}, {'@': 93}, {'@': 94}, {'@': 95}, {'@': 96}, {'@': 97}, {'@': 98}, {'@': 99}, {'@': 100}, {'@': 101}, {'@': 102}, {'@': 103}, {'@': 104}, {'@': 105}, {'@': 106}, {'@': 107}, {'@': 108}, {'@': 109}, {'@': 110}, {'@': 111}, {'@': 112}, {'@': 113}, {'@': 114}, {'@': 115}, {'@': 116}, {'@': 117}, {'@': 118}, {'@': 119}, {'@': 120}, {'@': 121}, {'@': 122}, {'@': 123}, {'@': 124}, {'@': 125}, {'@': 126}, {'@': 127}, {'@': 128}, {'@': 129}, {'@': 130}, {'@': 131}, {'@': 132}, {'@': 133}, {'@': 134}, {'@': 135}, {'@': 136}, {'@': 137}, {'@': 138}, {'@': 139}, {'@': 140}, {'@': 141}, {'@': 142}, {'@': 143}, {'@': 144}, {'@': 145}, {'@': 146}, {'@': 147}, {'@': 148}, {'@': 149}, {'@': 150}, {'@': 151}, {'@': 152}, {'@': 153}, {'@': 154}, {'@': 155}, {'@': 156}, {'@': 157}, {'@': 158}, {'@': 159}, {'@': 160}, {'@': 161}, {'@': 162}, {'@': 163}, {'@': 164}, {'@': 165}, {'@': 166}, {'@': 167}, {'@': 168}, {'@': 169}, {'@': 170}, {'@': 171}, {'@': 172}, {'@': 173}, {'@': 174}, {'@': 175}, {'@': 176}, {'@': 177}, {'@': 178}, {'@': 179}, {'@': 180}, {'@': 181}, {'@': 182}, {'@': 183}, {'@': 184}, {'@': 185}, {'@': 186}, {'@': 187}, {'@': 188}, {'@': 189}, {'@': 190}, {'@': 191}, {'@': 192}, {'@': 193}, {'@': 194}, {'@': 195}, {'@': 196}, {'@': 197}, {'@': 198}, {'@': 199}, {'@': 200}, {'@': 201}, {'@': 202}, {'@': 203}, {'@': 204}], 'options': {'debug': False, 'strict': False, 'keep_all_tokens': False, 'tree_class': None, 'cache': False, 'postlex': None, 'parser': 'lalr', 'lexer': 'contextual', 'transformer': None, 'start': ['start'], 'priority': 'normal', 'ambiguity': 'auto', 'regex': False, 'propagate_positions': False, 'lexer_callbacks': {}, 'maybe_placeholders': False, 'edit_terminals': None, 'g_regex_flags': 0, 'use_bytes': False, 'ordered_sets': True, 'import_paths': [], 'source_path': None, '_plugins': {}}, '__type__': 'Lark'}
+{'parser': {'lexer_conf': {'terminals': [{'@': 0}, {'@': 1}, {'@': 2}, {'@': 3}, {'@': 4}, {'@': 5}, {'@': 6}, {'@': 7}, {'@': 8}, {'@': 9}, {'@': 10}, {'@': 11}, {'@': 12}, {'@': 13}, {'@': 14}, {'@': 15}, {'@': 16}, {'@': 17}, {'@': 18}, {'@': 19}, {'@': 20}, {'@': 21}, {'@': 22}, {'@': 23}, {'@': 24}, {'@': 25}, {'@': 26}, {'@': 27}, {'@': 28}, {'@': 29}, {'@': 30}, {'@': 31}, {'@': 32}, {'@': 33}, {'@': 34}, {'@': 35}, {'@': 36}, {'@': 37}, {'@': 38}, {'@': 39}, {'@': 40}, {'@': 41}, {'@': 42}, {'@': 43}, {'@': 44}, {'@': 45}, {'@': 46}, {'@': 47}, {'@': 48}, {'@': 49}, {'@': 50}], 'ignore': ['__IGNORE_0', '__IGNORE_1', 'COMMENT'], 'g_regex_flags': 0, 'use_bytes': False, 'lexer_type': 'contextual', '__type__': 'LexerConf'}, 'parser_conf': {'rules': [{'@': 51}, {'@': 52}, {'@': 53}, {'@': 54}, {'@': 55}, {'@': 56}, {'@': 57}, {'@': 58}, {'@': 59}, {'@': 60}, {'@': 61}, {'@': 62}, {'@': 63}, {'@': 64}, {'@': 65}, {'@': 66}, {'@': 67}, {'@': 68}, {'@': 69}, {'@': 70}, {'@': 71}, {'@': 72}, {'@': 73}, {'@': 74}, {'@': 75}, {'@': 76}, {'@': 77}, {'@': 78}, {'@': 79}, {'@': 80}, {'@': 81}, {'@': 82}, {'@': 83}, {'@': 84}, {'@': 85}, {'@': 86}, {'@': 87}, {'@': 88}, {'@': 89}, {'@': 90}, {'@': 91}, {'@': 92}, {'@': 93}, {'@': 94}, {'@': 95}, {'@': 96}, {'@': 97}, {'@': 98}, {'@': 99}, {'@': 100}, {'@': 101}, {'@': 102}, {'@': 103}, {'@': 104}, {'@': 105}, {'@': 106}, {'@': 107}, {'@': 108}, {'@': 109}, {'@': 110}, {'@': 111}, {'@': 112}, {'@': 113}, {'@': 114}, {'@': 115}, {'@': 116}, {'@': 117}, {'@': 118}, {'@': 119}, {'@': 120}, {'@': 121}, {'@': 122}, {'@': 123}, {'@': 124}, {'@': 125}, {'@': 126}, {'@': 127}, {'@': 128}, {'@': 129}, {'@': 130}, {'@': 131}, {'@': 132}, {'@': 133}, {'@': 134}, {'@': 135}, {'@': 136}, {'@': 137}, {'@': 138}, {'@': 139}, {'@': 140}, {'@': 141}, {'@': 142}, {'@': 143}, {'@': 144}, {'@': 145}, {'@': 146}, {'@': 147}, {'@': 148}, {'@': 149}, {'@': 150}, {'@': 151}, {'@': 152}, {'@': 153}, {'@': 154}, {'@': 155}, {'@': 156}, {'@': 157}, {'@': 158}, {'@': 159}, {'@': 160}, {'@': 161}, {'@': 162}, {'@': 163}, {'@': 164}, {'@': 165}, {'@': 166}, {'@': 167}, {'@': 168}, {'@': 169}, {'@': 170}, {'@': 171}, {'@': 172}, {'@': 173}, {'@': 174}, {'@': 175}, {'@': 176}, {'@': 177}, {'@': 178}, {'@': 179}, {'@': 180}, {'@': 181}, {'@': 182}, {'@': 183}, {'@': 184}, {'@': 185}, {'@': 186}, {'@': 187}, {'@': 188}, {'@': 189}, {'@': 190}, {'@': 191}, {'@': 192}, {'@': 193}, {'@': 194}, {'@': 195}, {'@': 196}, {'@': 197}, {'@': 198}, {'@': 199}, {'@': 200}, {'@': 201}, {'@': 202}, {'@': 203}, {'@': 204}, {'@': 205}], 'start': ['start'], 'parser_type': 'lalr', '__type__': 'ParserConf'}, 'parser': {'tokens': {0: 'LPAR', 1: 'LSQB', 2: 'MINUS', 3: 'SLASH', 4: '__ANON_6', 5: 'BANG', 6: '__ANON_4', 7: 'PRINT', 8: 'ENUM', 9: '_NL', 10: 'TRUE', 11: 'INT', 12: 'FN', 13: '__ANON_8', 14: 'WHILE', 15: 'MORETHAN', 16: 'PERCENT', 17: 'FALSE', 18: 'IF', 19: 'RBRACE', 20: 'LESSTHAN', 21: 'STRUCT', 22: 'STRING', 23: 'IDENTIFIER', 24: 'RETURN', 25: 'STAR', 26: '__ANON_3', 27: 'FOR', 28: 'PLUS', 29: '__ANON_7', 30: '__ANON_5', 31: 'MATCH', 32: 'LET', 33: '$END', 34: 'COMMA', 35: 'RSQB', 36: 'RPAR', 37: '__ANON_1', 38: 'LBRACE', 39: 'EQUAL', 40: 'type_annotation', 41: '__ANON_0', 42: 'int_literal', 43: 'term', 44: 'atom', 45: 'array_element', 46: 'function_call', 47: 'enum_literal_tuple', 48: 'string_literal', 49: 'variable', 50: 'expression', 51: 'enum_literal_simple', 52: 'indexing', 53: 'equality', 54: 'logical', 55: 'factor', 56: 'comparison', 57: 'array_elements', 58: 'array_literal', 59: 'unary_op', 60: 'bool_literal', 61: 'wildcard_pattern', 62: 'array_pattern_element', 63: 'array_pattern', 64: 'UNDERSCORE', 65: 'CASE', 66: '__array_elements_star_8', 67: 'struct_init_member', 68: 'IN', 69: '__struct_members_plus_3', 70: 'struct_members', 71: 'struct_member', 72: 'enum_stmt', 73: 'if_stmt', 74: 'print_stmt', 75: 'function_definition', 76: 'for_stmt_int', 77: 'if_chain', 78: 'index_assignment', 79: '__statement_list_plus_0', 80: 'statement_block', 81: 'match_stmt', 82: 'while_stmt', 83: 'return_stmt', 84: 'variable_declaration', 85: 'struct_assignment', 86: 'statement', 87: 'for_stmt', 88: 'statement_list', 89: 'struct_stmt', 90: 'struct_access', 91: 'assignment', 92: '__array_pattern_star_9', 93: 'DOT', 94: 'enum_member_bare', 95: 'enum_members', 96: '__enum_members_plus_4', 97: 'enum_member_tuple', 98: '__function_args_star_6', 99: '__function_params_star_5', 100: 'ELSE', 101: 'else_block', 102: 'ELIF', 103: 'else_if_ladder', 104: '__else_if_ladder_plus_1', 105: 'else_if_stmt', 106: 'COLON', 107: 'function_args', 108: 'struct_init_members', 109: 'function_param', 110: 'function_params', 111: '__ANON_2', 112: 'case_ladder', 113: '__case_ladder_plus_2', 114: 'case_stmt', 115: 'enum_pattern', 116: 'enum_pattern_tuple', 117: 'match_pattern', 118: '__struct_init_members_star_7', 119: 'start'}, 'states': {0: {0: (0, 179), 1: (0, 122), 2: (1, {'@': 152}), 3: (1, {'@': 152}), 4: (1, {'@': 152}), 5: (1, {'@': 152}), 6: (1, {'@': 152}), 7: (1, {'@': 152}), 8: (1, {'@': 152}), 9: (1, {'@': 152}), 10: (1, {'@': 152}), 11: (1, {'@': 152}), 12: (1, {'@': 152}), 13: (1, {'@': 152}), 14: (1, {'@': 152}), 15: (1, {'@': 152}), 16: (1, {'@': 152}), 17: (1, {'@': 152}), 18: (1, {'@': 152}), 19: (1, {'@': 152}), 20: (1, {'@': 152}), 21: (1, {'@': 152}), 22: (1, {'@': 152}), 23: (1, {'@': 152}), 24: (1, {'@': 152}), 25: (1, {'@': 152}), 26: (1, {'@': 152}), 27: (1, {'@': 152}), 28: (1, {'@': 152}), 29: (1, {'@': 152}), 30: (1, {'@': 152}), 31: (1, {'@': 152}), 32: (1, {'@': 152}), 33: (1, {'@': 152})}, 1: {16: (1, {'@': 149}), 2: (1, {'@': 149}), 3: (1, {'@': 149}), 4: (1, {'@': 149}), 6: (1, {'@': 149}), 20: (1, {'@': 149}), 1: (1, {'@': 149}), 34: (1, {'@': 149}), 25: (1, {'@': 149}), 26: (1, {'@': 149}), 35: (1, {'@': 149}), 28: (1, {'@': 149}), 29: (1, {'@': 149}), 30: (1, {'@': 149}), 13: (1, {'@': 149}), 15: (1, {'@': 149}), 5: (1, {'@': 149}), 7: (1, {'@': 149}), 8: (1, {'@': 149}), 9: (1, {'@': 149}), 10: (1, {'@': 149}), 11: (1, {'@': 149}), 12: (1, {'@': 149}), 14: (1, {'@': 149}), 17: (1, {'@': 149}), 18: (1, {'@': 149}), 0: (1, {'@': 149}), 19: (1, {'@': 149}), 21: (1, {'@': 149}), 22: (1, {'@': 149}), 23: (1, {'@': 149}), 24: (1, {'@': 149}), 27: (1, {'@': 149}), 31: (1, {'@': 149}), 32: (1, {'@': 149}), 33: (1, {'@': 149}), 36: (1, {'@': 149}), 37: (1, {'@': 149}), 38: (1, {'@': 149})}, 2: {2: (1, {'@': 106}), 17: (1, {'@': 106}), 5: (1, {'@': 106}), 18: (1, {'@': 106}), 0: (1, {'@': 106}), 7: (1, {'@': 106}), 19: (1, {'@': 106}), 8: (1, {'@': 106}), 20: (1, {'@': 106}), 21: (1, {'@': 106}), 9: (1, {'@': 106}), 10: (1, {'@': 106}), 22: (1, {'@': 106}), 23: (1, {'@': 106}), 1: (1, {'@': 106}), 11: (1, {'@': 106}), 24: (1, {'@': 106}), 12: (1, {'@': 106}), 27: (1, {'@': 106}), 28: (1, {'@': 106}), 31: (1, {'@': 106}), 32: (1, {'@': 106}), 14: (1, {'@': 106}), 33: (1, {'@': 106})}, 3: {2: (1, {'@': 54}), 17: (1, {'@': 54}), 5: (1, {'@': 54}), 18: (1, {'@': 54}), 0: (1, {'@': 54}), 7: (1, {'@': 54}), 19: (1, {'@': 54}), 8: (1, {'@': 54}), 20: (1, {'@': 54}), 21: (1, {'@': 54}), 9: (1, {'@': 54}), 10: (1, {'@': 54}), 22: (1, {'@': 54}), 23: (1, {'@': 54}), 1: (1, {'@': 54}), 11: (1, {'@': 54}), 24: (1, {'@': 54}), 12: (1, {'@': 54}), 27: (1, {'@': 54}), 28: (1, {'@': 54}), 31: (1, {'@': 54}), 32: (1, {'@': 54}), 14: (1, {'@': 54}), 33: (1, {'@': 54})}, 4: {39: (0, 250)}, 5: {16: (1, {'@': 131}), 2: (1, {'@': 131}), 3: (1, {'@': 131}), 4: (1, {'@': 131}), 25: (1, {'@': 131}), 6: (1, {'@': 131}), 26: (1, {'@': 131}), 35: (1, {'@': 131}), 28: (1, {'@': 131}), 29: (1, {'@': 131}), 30: (1, {'@': 131}), 13: (1, {'@': 131}), 20: (1, {'@': 131}), 15: (1, {'@': 131}), 34: (1, {'@': 131}), 5: (1, {'@': 131}), 7: (1, {'@': 131}), 8: (1, {'@': 131}), 9: (1, {'@': 131}), 10: (1, {'@': 131}), 11: (1, {'@': 131}), 12: (1, {'@': 131}), 14: (1, {'@': 131}), 17: (1, {'@': 131}), 18: (1, {'@': 131}), 0: (1, {'@': 131}), 19: (1, {'@': 131}), 21: (1, {'@': 131}), 22: (1, {'@': 131}), 23: (1, {'@': 131}), 1: (1, {'@': 131}), 24: (1, {'@': 131}), 27: (1, {'@': 131}), 31: (1, {'@': 131}), 32: (1, {'@': 131}), 33: (1, {'@': 131}), 36: (1, {'@': 131}), 37: (1, {'@': 131}), 38: (1, {'@': 131})}, 6: {23: (0, 98), 40: (0, 123)}, 7: {33: (1, {'@': 51})}, 8: {34: (0, 108), 35: (1, {'@': 167})}, 9: {23: (0, 98), 40: (0, 280)}, 10: {2: (1, {'@': 179}), 5: (1, {'@': 179}), 7: (1, {'@': 179}), 8: (1, {'@': 179}), 9: (1, {'@': 179}), 10: (1, {'@': 179}), 11: (1, {'@': 179}), 12: (1, {'@': 179}), 14: (1, {'@': 179}), 17: (1, {'@': 179}), 18: (1, {'@': 179}), 0: (1, {'@': 179}), 19: (1, {'@': 179}), 20: (1, {'@': 179}), 21: (1, {'@': 179}), 22: (1, {'@': 179}), 23: (1, {'@': 179}), 1: (1, {'@': 179}), 24: (1, {'@': 179}), 27: (1, {'@': 179}), 28: (1, {'@': 179}), 31: (1, {'@': 179}), 32: (1, {'@': 179}), 33: (1, {'@': 179})}, 11: {19: (1, {'@': 194}), 9: (1, {'@': 194}), 23: (1, {'@': 194})}, 12: {39: (0, 250), 41: (0, 32), 16: (1, {'@': 162}), 2: (1, {'@': 162}), 3: (1, {'@': 162}), 4: (1, {'@': 162}), 6: (1, {'@': 162}), 0: (1, {'@': 162}), 20: (1, {'@': 162}), 1: (1, {'@': 162}), 34: (1, {'@': 162}), 36: (1, {'@': 162}), 25: (1, {'@': 162}), 26: (1, {'@': 162}), 28: (1, {'@': 162}), 29: (1, {'@': 162}), 30: (1, {'@': 162}), 13: (1, {'@': 162}), 15: (1, {'@': 162})}, 13: {16: (1, {'@': 151}), 2: (1, {'@': 151}), 3: (1, {'@': 151}), 4: (1, {'@': 151}), 6: (1, {'@': 151}), 20: (1, {'@': 151}), 1: (1, {'@': 151}), 34: (1, {'@': 151}), 25: (1, {'@': 151}), 26: (1, {'@': 151}), 35: (1, {'@': 151}), 28: (1, {'@': 151}), 29: (1, {'@': 151}), 30: (1, {'@': 151}), 13: (1, {'@': 151}), 15: (1, {'@': 151}), 5: (1, {'@': 151}), 7: (1, {'@': 151}), 8: (1, {'@': 151}), 9: (1, {'@': 151}), 10: (1, {'@': 151}), 11: (1, {'@': 151}), 12: (1, {'@': 151}), 14: (1, {'@': 151}), 17: (1, {'@': 151}), 18: (1, {'@': 151}), 0: (1, {'@': 151}), 19: (1, {'@': 151}), 21: (1, {'@': 151}), 22: (1, {'@': 151}), 23: (1, {'@': 151}), 24: (1, {'@': 151}), 27: (1, {'@': 151}), 31: (1, {'@': 151}), 32: (1, {'@': 151}), 33: (1, {'@': 151}), 36: (1, {'@': 151}), 37: (1, {'@': 151}), 38: (1, {'@': 151})}, 14: {19: (1, {'@': 189}), 9: (1, {'@': 189}), 23: (1, {'@': 189})}, 15: {16: (1, {'@': 142}), 2: (1, {'@': 142}), 3: (1, {'@': 142}), 4: (1, {'@': 142}), 6: (1, {'@': 142}), 20: (1, {'@': 142}), 1: (1, {'@': 142}), 34: (1, {'@': 142}), 25: (1, {'@': 142}), 26: (1, {'@': 142}), 35: (1, {'@': 142}), 28: (1, {'@': 142}), 29: (1, {'@': 142}), 30: (1, {'@': 142}), 13: (1, {'@': 142}), 15: (1, {'@': 142}), 5: (1, {'@': 142}), 7: (1, {'@': 142}), 8: (1, {'@': 142}), 9: (1, {'@': 142}), 10: (1, {'@': 142}), 11: (1, {'@': 142}), 12: (1, {'@': 142}), 14: (1, {'@': 142}), 17: (1, {'@': 142}), 18: (1, {'@': 142}), 0: (1, {'@': 142}), 19: (1, {'@': 142}), 21: (1, {'@': 142}), 22: (1, {'@': 142}), 23: (1, {'@': 142}), 24: (1, {'@': 142}), 27: (1, {'@': 142}), 31: (1, {'@': 142}), 32: (1, {'@': 142}), 33: (1, {'@': 142}), 36: (1, {'@': 142}), 37: (1, {'@': 142}), 38: (1, {'@': 142})}, 16: {38: (0, 254), 37: (0, 232)}, 17: {40: (0, 125), 23: (0, 98)}, 18: {42: (0, 187), 43: (0, 172), 44: (0, 15), 45: (0, 26), 46: (0, 204), 23: (0, 253), 47: (0, 238), 48: (0, 224), 0: (0, 140), 49: (0, 129), 50: (0, 106), 28: (0, 100), 51: (0, 1), 52: (0, 50), 35: (0, 173), 53: (0, 21), 5: (0, 272), 54: (0, 47), 20: (0, 6), 55: (0, 165), 56: (0, 114), 57: (0, 170), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 17: (0, 145)}, 19: {42: (0, 67), 61: (0, 44), 62: (0, 77), 35: (0, 73), 1: (0, 19), 63: (0, 197), 64: (0, 101), 11: (0, 226)}, 20: {38: (0, 267)}, 21: {26: (0, 135), 6: (0, 200), 35: (1, {'@': 114}), 34: (1, {'@': 114}), 2: (1, {'@': 114}), 5: (1, {'@': 114}), 7: (1, {'@': 114}), 8: (1, {'@': 114}), 9: (1, {'@': 114}), 10: (1, {'@': 114}), 11: (1, {'@': 114}), 12: (1, {'@': 114}), 14: (1, {'@': 114}), 17: (1, {'@': 114}), 18: (1, {'@': 114}), 0: (1, {'@': 114}), 19: (1, {'@': 114}), 20: (1, {'@': 114}), 21: (1, {'@': 114}), 22: (1, {'@': 114}), 23: (1, {'@': 114}), 1: (1, {'@': 114}), 24: (1, {'@': 114}), 27: (1, {'@': 114}), 28: (1, {'@': 114}), 31: (1, {'@': 114}), 32: (1, {'@': 114}), 33: (1, {'@': 114}), 36: (1, {'@': 114}), 38: (1, {'@': 114}), 37: (1, {'@': 114})}, 22: {23: (0, 41)}, 23: {20: (0, 72), 13: (0, 208), 15: (0, 271), 29: (0, 117), 35: (1, {'@': 118}), 30: (1, {'@': 118}), 4: (1, {'@': 118}), 6: (1, {'@': 118}), 26: (1, {'@': 118}), 34: (1, {'@': 118}), 2: (1, {'@': 118}), 17: (1, {'@': 118}), 5: (1, {'@': 118}), 18: (1, {'@': 118}), 0: (1, {'@': 118}), 7: (1, {'@': 118}), 19: (1, {'@': 118}), 8: (1, {'@': 118}), 21: (1, {'@': 118}), 9: (1, {'@': 118}), 10: (1, {'@': 118}), 22: (1, {'@': 118}), 23: (1, {'@': 118}), 1: (1, {'@': 118}), 11: (1, {'@': 118}), 24: (1, {'@': 118}), 12: (1, {'@': 118}), 27: (1, {'@': 118}), 28: (1, {'@': 118}), 31: (1, {'@': 118}), 32: (1, {'@': 118}), 33: (1, {'@': 118}), 14: (1, {'@': 118}), 36: (1, {'@': 118}), 38: (1, {'@': 118}), 37: (1, {'@': 118})}, 24: {65: (1, {'@': 183}), 9: (1, {'@': 183}), 19: (1, {'@': 183})}, 25: {2: (1, {'@': 177}), 5: (1, {'@': 177}), 7: (1, {'@': 177}), 8: (1, {'@': 177}), 9: (1, {'@': 177}), 10: (1, {'@': 177}), 11: (1, {'@': 177}), 12: (1, {'@': 177}), 14: (1, {'@': 177}), 17: (1, {'@': 177}), 18: (1, {'@': 177}), 0: (1, {'@': 177}), 19: (1, {'@': 177}), 20: (1, {'@': 177}), 21: (1, {'@': 177}), 22: (1, {'@': 177}), 23: (1, {'@': 177}), 1: (1, {'@': 177}), 24: (1, {'@': 177}), 27: (1, {'@': 177}), 28: (1, {'@': 177}), 31: (1, {'@': 177}), 32: (1, {'@': 177}), 33: (1, {'@': 177})}, 26: {66: (0, 8), 34: (0, 54), 35: (1, {'@': 168})}, 27: {67: (0, 115), 23: (0, 4)}, 28: {38: (1, {'@': 90}), 36: (1, {'@': 90})}, 29: {23: (0, 158)}, 30: {2: (1, {'@': 71}), 17: (1, {'@': 71}), 5: (1, {'@': 71}), 18: (1, {'@': 71}), 0: (1, {'@': 71}), 7: (1, {'@': 71}), 19: (1, {'@': 71}), 8: (1, {'@': 71}), 20: (1, {'@': 71}), 21: (1, {'@': 71}), 9: (1, {'@': 71}), 10: (1, {'@': 71}), 22: (1, {'@': 71}), 23: (1, {'@': 71}), 1: (1, {'@': 71}), 11: (1, {'@': 71}), 24: (1, {'@': 71}), 12: (1, {'@': 71}), 27: (1, {'@': 71}), 28: (1, {'@': 71}), 31: (1, {'@': 71}), 32: (1, {'@': 71}), 14: (1, {'@': 71}), 33: (1, {'@': 71})}, 31: {36: (1, {'@': 155}), 34: (1, {'@': 155})}, 32: {23: (0, 185)}, 33: {19: (1, {'@': 188}), 9: (1, {'@': 188}), 23: (1, {'@': 188})}, 34: {16: (1, {'@': 148}), 2: (1, {'@': 148}), 3: (1, {'@': 148}), 4: (1, {'@': 148}), 6: (1, {'@': 148}), 20: (1, {'@': 148}), 1: (1, {'@': 148}), 34: (1, {'@': 148}), 25: (1, {'@': 148}), 26: (1, {'@': 148}), 35: (1, {'@': 148}), 28: (1, {'@': 148}), 29: (1, {'@': 148}), 30: (1, {'@': 148}), 13: (1, {'@': 148}), 15: (1, {'@': 148}), 5: (1, {'@': 148}), 7: (1, {'@': 148}), 8: (1, {'@': 148}), 9: (1, {'@': 148}), 10: (1, {'@': 148}), 11: (1, {'@': 148}), 12: (1, {'@': 148}), 14: (1, {'@': 148}), 17: (1, {'@': 148}), 18: (1, {'@': 148}), 0: (1, {'@': 148}), 19: (1, {'@': 148}), 21: (1, {'@': 148}), 22: (1, {'@': 148}), 23: (1, {'@': 148}), 24: (1, {'@': 148}), 27: (1, {'@': 148}), 31: (1, {'@': 148}), 32: (1, {'@': 148}), 33: (1, {'@': 148}), 36: (1, {'@': 148}), 37: (1, {'@': 148}), 38: (1, {'@': 148})}, 35: {2: (1, {'@': 70}), 17: (1, {'@': 70}), 5: (1, {'@': 70}), 18: (1, {'@': 70}), 0: (1, {'@': 70}), 7: (1, {'@': 70}), 19: (1, {'@': 70}), 8: (1, {'@': 70}), 20: (1, {'@': 70}), 21: (1, {'@': 70}), 9: (1, {'@': 70}), 10: (1, {'@': 70}), 22: (1, {'@': 70}), 23: (1, {'@': 70}), 1: (1, {'@': 70}), 11: (1, {'@': 70}), 24: (1, {'@': 70}), 12: (1, {'@': 70}), 27: (1, {'@': 70}), 28: (1, {'@': 70}), 31: (1, {'@': 70}), 32: (1, {'@': 70}), 14: (1, {'@': 70}), 33: (1, {'@': 70})}, 36: {19: (1, {'@': 187}), 9: (1, {'@': 187}), 23: (1, {'@': 187})}, 37: {42: (0, 187), 43: (0, 172), 44: (0, 15), 45: (0, 26), 35: (0, 65), 46: (0, 204), 23: (0, 253), 47: (0, 238), 48: (0, 224), 57: (0, 83), 0: (0, 140), 49: (0, 129), 50: (0, 106), 28: (0, 100), 51: (0, 1), 52: (0, 50), 53: (0, 21), 5: (0, 272), 54: (0, 47), 20: (0, 6), 55: (0, 165), 56: (0, 114), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 17: (0, 145)}, 38: {42: (0, 187), 43: (0, 172), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 53: (0, 21), 5: (0, 272), 54: (0, 47), 20: (0, 6), 55: (0, 165), 56: (0, 114), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 50: (0, 35), 48: (0, 224), 17: (0, 145)}, 39: {23: (0, 98), 40: (0, 247)}, 40: {19: (1, {'@': 195}), 9: (1, {'@': 195}), 23: (1, {'@': 195})}, 41: {38: (0, 63)}, 42: {16: (0, 196), 25: (0, 258), 3: (0, 80), 2: (1, {'@': 126}), 4: (1, {'@': 126}), 6: (1, {'@': 126}), 26: (1, {'@': 126}), 35: (1, {'@': 126}), 28: (1, {'@': 126}), 29: (1, {'@': 126}), 30: (1, {'@': 126}), 13: (1, {'@': 126}), 20: (1, {'@': 126}), 15: (1, {'@': 126}), 34: (1, {'@': 126}), 5: (1, {'@': 126}), 7: (1, {'@': 126}), 8: (1, {'@': 126}), 9: (1, {'@': 126}), 10: (1, {'@': 126}), 11: (1, {'@': 126}), 12: (1, {'@': 126}), 14: (1, {'@': 126}), 17: (1, {'@': 126}), 18: (1, {'@': 126}), 0: (1, {'@': 126}), 19: (1, {'@': 126}), 21: (1, {'@': 126}), 22: (1, {'@': 126}), 23: (1, {'@': 126}), 1: (1, {'@': 126}), 24: (1, {'@': 126}), 27: (1, {'@': 126}), 31: (1, {'@': 126}), 32: (1, {'@': 126}), 33: (1, {'@': 126}), 36: (1, {'@': 126}), 37: (1, {'@': 126}), 38: (1, {'@': 126})}, 43: {23: (0, 98), 40: (0, 49)}, 44: {35: (1, {'@': 174}), 34: (1, {'@': 174})}, 45: {42: (0, 187), 43: (0, 172), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 53: (0, 21), 5: (0, 272), 54: (0, 47), 20: (0, 6), 55: (0, 165), 50: (0, 266), 56: (0, 114), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 48: (0, 224), 17: (0, 145)}, 46: {2: (1, {'@': 94}), 17: (1, {'@': 94}), 5: (1, {'@': 94}), 18: (1, {'@': 94}), 0: (1, {'@': 94}), 7: (1, {'@': 94}), 19: (1, {'@': 94}), 8: (1, {'@': 94}), 20: (1, {'@': 94}), 21: (1, {'@': 94}), 9: (1, {'@': 94}), 10: (1, {'@': 94}), 22: (1, {'@': 94}), 23: (1, {'@': 94}), 1: (1, {'@': 94}), 11: (1, {'@': 94}), 24: (1, {'@': 94}), 12: (1, {'@': 94}), 27: (1, {'@': 94}), 28: (1, {'@': 94}), 31: (1, {'@': 94}), 32: (1, {'@': 94}), 14: (1, {'@': 94}), 33: (1, {'@': 94})}, 47: {30: (0, 71), 4: (0, 229), 6: (1, {'@': 117}), 35: (1, {'@': 117}), 26: (1, {'@': 117}), 34: (1, {'@': 117}), 2: (1, {'@': 117}), 17: (1, {'@': 117}), 5: (1, {'@': 117}), 18: (1, {'@': 117}), 0: (1, {'@': 117}), 7: (1, {'@': 117}), 19: (1, {'@': 117}), 8: (1, {'@': 117}), 20: (1, {'@': 117}), 21: (1, {'@': 117}), 9: (1, {'@': 117}), 10: (1, {'@': 117}), 22: (1, {'@': 117}), 23: (1, {'@': 117}), 1: (1, {'@': 117}), 11: (1, {'@': 117}), 24: (1, {'@': 117}), 12: (1, {'@': 117}), 27: (1, {'@': 117}), 28: (1, {'@': 117}), 31: (1, {'@': 117}), 32: (1, {'@': 117}), 33: (1, {'@': 117}), 14: (1, {'@': 117}), 36: (1, {'@': 117}), 38: (1, {'@': 117}), 37: (1, {'@': 117})}, 48: {68: (0, 167)}, 49: {36: (0, 171)}, 50: {16: (1, {'@': 136}), 2: (1, {'@': 136}), 3: (1, {'@': 136}), 4: (1, {'@': 136}), 25: (1, {'@': 136}), 6: (1, {'@': 136}), 26: (1, {'@': 136}), 35: (1, {'@': 136}), 28: (1, {'@': 136}), 29: (1, {'@': 136}), 30: (1, {'@': 136}), 13: (1, {'@': 136}), 20: (1, {'@': 136}), 15: (1, {'@': 136}), 34: (1, {'@': 136}), 5: (1, {'@': 136}), 7: (1, {'@': 136}), 8: (1, {'@': 136}), 9: (1, {'@': 136}), 10: (1, {'@': 136}), 11: (1, {'@': 136}), 12: (1, {'@': 136}), 14: (1, {'@': 136}), 17: (1, {'@': 136}), 18: (1, {'@': 136}), 0: (1, {'@': 136}), 19: (1, {'@': 136}), 21: (1, {'@': 136}), 22: (1, {'@': 136}), 23: (1, {'@': 136}), 1: (1, {'@': 136}), 24: (1, {'@': 136}), 27: (1, {'@': 136}), 31: (1, {'@': 136}), 32: (1, {'@': 136}), 33: (1, {'@': 136}), 36: (1, {'@': 136}), 37: (1, {'@': 136}), 38: (1, {'@': 136})}, 51: {42: (0, 187), 43: (0, 172), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 53: (0, 21), 5: (0, 272), 54: (0, 47), 20: (0, 6), 55: (0, 165), 56: (0, 114), 58: (0, 34), 50: (0, 30), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 48: (0, 224), 17: (0, 145)}, 52: {19: (1, {'@': 191}), 9: (1, {'@': 191}), 23: (1, {'@': 191})}, 53: {2: (1, {'@': 67}), 17: (1, {'@': 67}), 5: (1, {'@': 67}), 18: (1, {'@': 67}), 0: (1, {'@': 67}), 7: (1, {'@': 67}), 19: (1, {'@': 67}), 8: (1, {'@': 67}), 20: (1, {'@': 67}), 21: (1, {'@': 67}), 9: (1, {'@': 67}), 10: (1, {'@': 67}), 22: (1, {'@': 67}), 23: (1, {'@': 67}), 1: (1, {'@': 67}), 11: (1, {'@': 67}), 24: (1, {'@': 67}), 12: (1, {'@': 67}), 27: (1, {'@': 67}), 28: (1, {'@': 67}), 31: (1, {'@': 67}), 32: (1, {'@': 67}), 14: (1, {'@': 67}), 33: (1, {'@': 67})}, 54: {42: (0, 187), 43: (0, 172), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 45: (0, 209), 0: (0, 140), 49: (0, 129), 50: (0, 106), 28: (0, 100), 51: (0, 1), 52: (0, 50), 53: (0, 21), 5: (0, 272), 54: (0, 47), 20: (0, 6), 55: (0, 165), 56: (0, 114), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 48: (0, 224), 17: (0, 145)}, 55: {2: (1, {'@': 64}), 17: (1, {'@': 64}), 5: (1, {'@': 64}), 18: (1, {'@': 64}), 0: (1, {'@': 64}), 7: (1, {'@': 64}), 19: (1, {'@': 64}), 8: (1, {'@': 64}), 20: (1, {'@': 64}), 21: (1, {'@': 64}), 9: (1, {'@': 64}), 10: (1, {'@': 64}), 22: (1, {'@': 64}), 23: (1, {'@': 64}), 1: (1, {'@': 64}), 11: (1, {'@': 64}), 24: (1, {'@': 64}), 12: (1, {'@': 64}), 27: (1, {'@': 64}), 28: (1, {'@': 64}), 31: (1, {'@': 64}), 32: (1, {'@': 64}), 14: (1, {'@': 64}), 33: (1, {'@': 64})}, 56: {2: (1, {'@': 61}), 17: (1, {'@': 61}), 5: (1, {'@': 61}), 18: (1, {'@': 61}), 0: (1, {'@': 61}), 7: (1, {'@': 61}), 19: (1, {'@': 61}), 8: (1, {'@': 61}), 20: (1, {'@': 61}), 21: (1, {'@': 61}), 9: (1, {'@': 61}), 10: (1, {'@': 61}), 22: (1, {'@': 61}), 23: (1, {'@': 61}), 1: (1, {'@': 61}), 11: (1, {'@': 61}), 24: (1, {'@': 61}), 12: (1, {'@': 61}), 27: (1, {'@': 61}), 28: (1, {'@': 61}), 31: (1, {'@': 61}), 32: (1, {'@': 61}), 14: (1, {'@': 61}), 33: (1, {'@': 61})}, 57: {38: (0, 203)}, 58: {16: (1, {'@': 161}), 2: (1, {'@': 161}), 3: (1, {'@': 161}), 4: (1, {'@': 161}), 6: (1, {'@': 161}), 20: (1, {'@': 161}), 1: (1, {'@': 161}), 34: (1, {'@': 161}), 25: (1, {'@': 161}), 26: (1, {'@': 161}), 35: (1, {'@': 161}), 28: (1, {'@': 161}), 29: (1, {'@': 161}), 30: (1, {'@': 161}), 13: (1, {'@': 161}), 15: (1, {'@': 161}), 5: (1, {'@': 161}), 7: (1, {'@': 161}), 8: (1, {'@': 161}), 9: (1, {'@': 161}), 10: (1, {'@': 161}), 11: (1, {'@': 161}), 12: (1, {'@': 161}), 14: (1, {'@': 161}), 17: (1, {'@': 161}), 18: (1, {'@': 161}), 0: (1, {'@': 161}), 19: (1, {'@': 161}), 21: (1, {'@': 161}), 22: (1, {'@': 161}), 23: (1, {'@': 161}), 24: (1, {'@': 161}), 27: (1, {'@': 161}), 31: (1, {'@': 161}), 32: (1, {'@': 161}), 33: (1, {'@': 161}), 36: (1, {'@': 161}), 37: (1, {'@': 161}), 38: (1, {'@': 161})}, 59: {2: (1, {'@': 65}), 17: (1, {'@': 65}), 5: (1, {'@': 65}), 18: (1, {'@': 65}), 0: (1, {'@': 65}), 7: (1, {'@': 65}), 19: (1, {'@': 65}), 8: (1, {'@': 65}), 20: (1, {'@': 65}), 21: (1, {'@': 65}), 9: (1, {'@': 65}), 10: (1, {'@': 65}), 22: (1, {'@': 65}), 23: (1, {'@': 65}), 1: (1, {'@': 65}), 11: (1, {'@': 65}), 24: (1, {'@': 65}), 12: (1, {'@': 65}), 27: (1, {'@': 65}), 28: (1, {'@': 65}), 31: (1, {'@': 65}), 32: (1, {'@': 65}), 14: (1, {'@': 65}), 33: (1, {'@': 65})}, 60: {38: (0, 96)}, 61: {23: (0, 98), 40: (0, 260)}, 62: {38: (1, {'@': 87}), 36: (1, {'@': 87})}, 63: {69: (0, 102), 70: (0, 127), 9: (0, 36), 23: (0, 164), 71: (0, 205)}, 64: {42: (0, 187), 72: (0, 190), 73: (0, 141), 46: (0, 204), 23: (0, 210), 47: (0, 238), 74: (0, 240), 31: (0, 234), 49: (0, 0), 24: (0, 275), 28: (0, 100), 52: (0, 50), 53: (0, 21), 54: (0, 47), 75: (0, 59), 76: (0, 53), 58: (0, 34), 77: (0, 194), 27: (0, 195), 78: (0, 55), 56: (0, 114), 59: (0, 94), 79: (0, 154), 55: (0, 165), 12: (0, 169), 22: (0, 207), 80: (0, 287), 81: (0, 211), 82: (0, 223), 60: (0, 248), 1: (0, 18), 32: (0, 29), 83: (0, 188), 48: (0, 224), 84: (0, 206), 14: (0, 198), 85: (0, 215), 17: (0, 145), 43: (0, 172), 86: (0, 157), 44: (0, 15), 7: (0, 270), 87: (0, 166), 0: (0, 140), 50: (0, 3), 51: (0, 1), 88: (0, 265), 21: (0, 22), 89: (0, 56), 5: (0, 272), 20: (0, 6), 90: (0, 137), 11: (0, 226), 10: (0, 286), 8: (0, 276), 18: (0, 138), 91: (0, 95), 9: (0, 25), 2: (0, 116)}, 65: {16: (1, {'@': 164}), 2: (1, {'@': 164}), 3: (1, {'@': 164}), 4: (1, {'@': 164}), 6: (1, {'@': 164}), 20: (1, {'@': 164}), 1: (1, {'@': 164}), 34: (1, {'@': 164}), 25: (1, {'@': 164}), 26: (1, {'@': 164}), 35: (1, {'@': 164}), 28: (1, {'@': 164}), 29: (1, {'@': 164}), 30: (1, {'@': 164}), 13: (1, {'@': 164}), 15: (1, {'@': 164}), 5: (1, {'@': 164}), 7: (1, {'@': 164}), 8: (1, {'@': 164}), 9: (1, {'@': 164}), 10: (1, {'@': 164}), 11: (1, {'@': 164}), 12: (1, {'@': 164}), 14: (1, {'@': 164}), 17: (1, {'@': 164}), 18: (1, {'@': 164}), 0: (1, {'@': 164}), 19: (1, {'@': 164}), 21: (1, {'@': 164}), 22: (1, {'@': 164}), 23: (1, {'@': 164}), 24: (1, {'@': 164}), 27: (1, {'@': 164}), 31: (1, {'@': 164}), 32: (1, {'@': 164}), 33: (1, {'@': 164}), 36: (1, {'@': 164}), 37: (1, {'@': 164}), 38: (1, {'@': 164})}, 66: {2: (0, 180), 28: (0, 264), 4: (1, {'@': 123}), 6: (1, {'@': 123}), 26: (1, {'@': 123}), 35: (1, {'@': 123}), 29: (1, {'@': 123}), 30: (1, {'@': 123}), 13: (1, {'@': 123}), 20: (1, {'@': 123}), 15: (1, {'@': 123}), 34: (1, {'@': 123}), 5: (1, {'@': 123}), 7: (1, {'@': 123}), 8: (1, {'@': 123}), 9: (1, {'@': 123}), 10: (1, {'@': 123}), 11: (1, {'@': 123}), 12: (1, {'@': 123}), 14: (1, {'@': 123}), 17: (1, {'@': 123}), 18: (1, {'@': 123}), 0: (1, {'@': 123}), 19: (1, {'@': 123}), 21: (1, {'@': 123}), 22: (1, {'@': 123}), 23: (1, {'@': 123}), 1: (1, {'@': 123}), 24: (1, {'@': 123}), 27: (1, {'@': 123}), 31: (1, {'@': 123}), 32: (1, {'@': 123}), 33: (1, {'@': 123}), 36: (1, {'@': 123}), 37: (1, {'@': 123}), 38: (1, {'@': 123})}, 67: {35: (1, {'@': 173}), 34: (1, {'@': 173})}, 68: {42: (0, 187), 43: (0, 172), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 0: (0, 140), 50: (0, 202), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 53: (0, 21), 5: (0, 272), 54: (0, 47), 20: (0, 6), 55: (0, 165), 56: (0, 114), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 48: (0, 224), 17: (0, 145)}, 69: {36: (1, {'@': 197}), 34: (1, {'@': 197})}, 70: {35: (1, {'@': 170}), 34: (1, {'@': 170}), 38: (1, {'@': 170}), 36: (1, {'@': 170})}, 71: {42: (0, 187), 43: (0, 172), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 56: (0, 23), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 5: (0, 272), 20: (0, 6), 55: (0, 165), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 48: (0, 224), 17: (0, 145)}, 72: {42: (0, 187), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 43: (0, 199), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 5: (0, 272), 20: (0, 6), 55: (0, 165), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 48: (0, 224), 17: (0, 145)}, 73: {35: (1, {'@': 172}), 34: (1, {'@': 172}), 38: (1, {'@': 172}), 36: (1, {'@': 172})}, 74: {42: (0, 187), 43: (0, 172), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 53: (0, 21), 5: (0, 272), 54: (0, 47), 50: (0, 244), 20: (0, 6), 55: (0, 165), 56: (0, 114), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 48: (0, 224), 17: (0, 145)}, 75: {2: (1, {'@': 82}), 5: (1, {'@': 82}), 7: (1, {'@': 82}), 8: (1, {'@': 82}), 9: (1, {'@': 82}), 10: (1, {'@': 82}), 11: (1, {'@': 82}), 12: (1, {'@': 82}), 14: (1, {'@': 82}), 17: (1, {'@': 82}), 18: (1, {'@': 82}), 0: (1, {'@': 82}), 19: (1, {'@': 82}), 20: (1, {'@': 82}), 21: (1, {'@': 82}), 22: (1, {'@': 82}), 23: (1, {'@': 82}), 1: (1, {'@': 82}), 24: (1, {'@': 82}), 27: (1, {'@': 82}), 28: (1, {'@': 82}), 31: (1, {'@': 82}), 32: (1, {'@': 82}), 33: (1, {'@': 82})}, 76: {23: (0, 191)}, 77: {35: (0, 168), 92: (0, 192), 34: (0, 143)}, 78: {38: (0, 283)}, 79: {16: (1, {'@': 140}), 2: (1, {'@': 140}), 3: (1, {'@': 140}), 4: (1, {'@': 140}), 6: (1, {'@': 140}), 20: (1, {'@': 140}), 1: (1, {'@': 140}), 34: (1, {'@': 140}), 25: (1, {'@': 140}), 26: (1, {'@': 140}), 35: (1, {'@': 140}), 28: (1, {'@': 140}), 29: (1, {'@': 140}), 30: (1, {'@': 140}), 13: (1, {'@': 140}), 15: (1, {'@': 140}), 5: (1, {'@': 140}), 7: (1, {'@': 140}), 8: (1, {'@': 140}), 9: (1, {'@': 140}), 10: (1, {'@': 140}), 11: (1, {'@': 140}), 12: (1, {'@': 140}), 14: (1, {'@': 140}), 17: (1, {'@': 140}), 18: (1, {'@': 140}), 0: (1, {'@': 140}), 19: (1, {'@': 140}), 21: (1, {'@': 140}), 22: (1, {'@': 140}), 23: (1, {'@': 140}), 24: (1, {'@': 140}), 27: (1, {'@': 140}), 31: (1, {'@': 140}), 32: (1, {'@': 140}), 33: (1, {'@': 140}), 36: (1, {'@': 140}), 37: (1, {'@': 140}), 38: (1, {'@': 140})}, 80: {42: (0, 187), 44: (0, 15), 20: (0, 6), 10: (0, 286), 23: (0, 253), 46: (0, 204), 22: (0, 207), 11: (0, 226), 47: (0, 238), 60: (0, 248), 1: (0, 18), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 2: (0, 116), 52: (0, 50), 5: (0, 272), 48: (0, 224), 59: (0, 5), 58: (0, 34), 17: (0, 145)}, 81: {34: (0, 160), 36: (1, {'@': 153})}, 82: {2: (1, {'@': 75}), 17: (1, {'@': 75}), 5: (1, {'@': 75}), 18: (1, {'@': 75}), 0: (1, {'@': 75}), 7: (1, {'@': 75}), 19: (1, {'@': 75}), 8: (1, {'@': 75}), 20: (1, {'@': 75}), 21: (1, {'@': 75}), 9: (1, {'@': 75}), 10: (1, {'@': 75}), 22: (1, {'@': 75}), 23: (1, {'@': 75}), 1: (1, {'@': 75}), 11: (1, {'@': 75}), 24: (1, {'@': 75}), 12: (1, {'@': 75}), 27: (1, {'@': 75}), 28: (1, {'@': 75}), 31: (1, {'@': 75}), 32: (1, {'@': 75}), 14: (1, {'@': 75}), 33: (1, {'@': 75})}, 83: {35: (0, 284)}, 84: {16: (1, {'@': 133}), 2: (1, {'@': 133}), 3: (1, {'@': 133}), 4: (1, {'@': 133}), 25: (1, {'@': 133}), 6: (1, {'@': 133}), 26: (1, {'@': 133}), 35: (1, {'@': 133}), 28: (1, {'@': 133}), 29: (1, {'@': 133}), 30: (1, {'@': 133}), 13: (1, {'@': 133}), 20: (1, {'@': 133}), 15: (1, {'@': 133}), 34: (1, {'@': 133}), 5: (1, {'@': 133}), 7: (1, {'@': 133}), 8: (1, {'@': 133}), 9: (1, {'@': 133}), 10: (1, {'@': 133}), 11: (1, {'@': 133}), 12: (1, {'@': 133}), 14: (1, {'@': 133}), 17: (1, {'@': 133}), 18: (1, {'@': 133}), 0: (1, {'@': 133}), 19: (1, {'@': 133}), 21: (1, {'@': 133}), 22: (1, {'@': 133}), 23: (1, {'@': 133}), 1: (1, {'@': 133}), 24: (1, {'@': 133}), 27: (1, {'@': 133}), 31: (1, {'@': 133}), 32: (1, {'@': 133}), 33: (1, {'@': 133}), 36: (1, {'@': 133}), 37: (1, {'@': 133}), 38: (1, {'@': 133})}, 85: {16: (1, {'@': 135}), 2: (1, {'@': 135}), 3: (1, {'@': 135}), 4: (1, {'@': 135}), 25: (1, {'@': 135}), 6: (1, {'@': 135}), 26: (1, {'@': 135}), 35: (1, {'@': 135}), 28: (1, {'@': 135}), 29: (1, {'@': 135}), 30: (1, {'@': 135}), 13: (1, {'@': 135}), 20: (1, {'@': 135}), 15: (1, {'@': 135}), 34: (1, {'@': 135}), 5: (1, {'@': 135}), 7: (1, {'@': 135}), 8: (1, {'@': 135}), 9: (1, {'@': 135}), 10: (1, {'@': 135}), 11: (1, {'@': 135}), 12: (1, {'@': 135}), 14: (1, {'@': 135}), 17: (1, {'@': 135}), 18: (1, {'@': 135}), 0: (1, {'@': 135}), 19: (1, {'@': 135}), 21: (1, {'@': 135}), 22: (1, {'@': 135}), 23: (1, {'@': 135}), 1: (1, {'@': 135}), 24: (1, {'@': 135}), 27: (1, {'@': 135}), 31: (1, {'@': 135}), 32: (1, {'@': 135}), 33: (1, {'@': 135}), 36: (1, {'@': 135}), 37: (1, {'@': 135}), 38: (1, {'@': 135})}, 86: {42: (0, 187), 72: (0, 190), 73: (0, 141), 46: (0, 204), 23: (0, 210), 47: (0, 238), 74: (0, 240), 31: (0, 234), 49: (0, 0), 24: (0, 275), 28: (0, 100), 52: (0, 50), 53: (0, 21), 54: (0, 47), 75: (0, 59), 76: (0, 53), 58: (0, 34), 77: (0, 194), 27: (0, 195), 78: (0, 55), 56: (0, 114), 59: (0, 94), 79: (0, 154), 55: (0, 165), 12: (0, 169), 22: (0, 207), 81: (0, 211), 82: (0, 223), 60: (0, 248), 1: (0, 18), 32: (0, 29), 83: (0, 188), 48: (0, 224), 84: (0, 206), 14: (0, 198), 85: (0, 215), 17: (0, 145), 43: (0, 172), 86: (0, 157), 44: (0, 15), 7: (0, 270), 87: (0, 166), 0: (0, 140), 50: (0, 3), 51: (0, 1), 88: (0, 265), 21: (0, 22), 89: (0, 56), 5: (0, 272), 20: (0, 6), 90: (0, 137), 11: (0, 226), 10: (0, 286), 8: (0, 276), 18: (0, 138), 91: (0, 95), 9: (0, 25), 80: (0, 110), 2: (0, 116)}, 87: {38: (0, 64)}, 88: {19: (0, 251)}, 89: {65: (1, {'@': 182}), 9: (1, {'@': 182}), 19: (1, {'@': 182})}, 90: {42: (0, 187), 72: (0, 190), 73: (0, 141), 46: (0, 204), 23: (0, 210), 47: (0, 238), 74: (0, 240), 31: (0, 234), 49: (0, 0), 24: (0, 275), 28: (0, 100), 52: (0, 50), 53: (0, 21), 54: (0, 47), 75: (0, 59), 76: (0, 53), 58: (0, 34), 77: (0, 194), 27: (0, 195), 78: (0, 55), 56: (0, 114), 59: (0, 94), 79: (0, 154), 55: (0, 165), 12: (0, 169), 22: (0, 207), 81: (0, 211), 82: (0, 223), 60: (0, 248), 1: (0, 18), 32: (0, 29), 83: (0, 188), 48: (0, 224), 84: (0, 206), 14: (0, 198), 85: (0, 215), 17: (0, 145), 43: (0, 172), 86: (0, 157), 44: (0, 15), 7: (0, 270), 87: (0, 166), 0: (0, 140), 50: (0, 3), 51: (0, 1), 88: (0, 265), 21: (0, 22), 89: (0, 56), 5: (0, 272), 20: (0, 6), 90: (0, 137), 11: (0, 226), 10: (0, 286), 8: (0, 276), 18: (0, 138), 91: (0, 95), 80: (0, 201), 9: (0, 25), 2: (0, 116)}, 91: {38: (1, {'@': 89}), 36: (1, {'@': 89})}, 92: {42: (0, 187), 43: (0, 172), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 50: (0, 259), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 53: (0, 21), 5: (0, 272), 54: (0, 47), 20: (0, 6), 55: (0, 165), 56: (0, 114), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 48: (0, 224), 17: (0, 145)}, 93: {41: (0, 32), 93: (0, 162), 2: (1, {'@': 162}), 3: (1, {'@': 162}), 4: (1, {'@': 162}), 5: (1, {'@': 162}), 6: (1, {'@': 162}), 7: (1, {'@': 162}), 8: (1, {'@': 162}), 9: (1, {'@': 162}), 10: (1, {'@': 162}), 11: (1, {'@': 162}), 12: (1, {'@': 162}), 13: (1, {'@': 162}), 14: (1, {'@': 162}), 15: (1, {'@': 162}), 16: (1, {'@': 162}), 17: (1, {'@': 162}), 18: (1, {'@': 162}), 0: (1, {'@': 162}), 19: (1, {'@': 162}), 20: (1, {'@': 162}), 21: (1, {'@': 162}), 22: (1, {'@': 162}), 23: (1, {'@': 162}), 1: (1, {'@': 162}), 24: (1, {'@': 162}), 25: (1, {'@': 162}), 26: (1, {'@': 162}), 27: (1, {'@': 162}), 28: (1, {'@': 162}), 29: (1, {'@': 162}), 30: (1, {'@': 162}), 31: (1, {'@': 162}), 32: (1, {'@': 162}), 33: (1, {'@': 162})}, 94: {16: (1, {'@': 129}), 2: (1, {'@': 129}), 3: (1, {'@': 129}), 4: (1, {'@': 129}), 25: (1, {'@': 129}), 6: (1, {'@': 129}), 26: (1, {'@': 129}), 35: (1, {'@': 129}), 28: (1, {'@': 129}), 29: (1, {'@': 129}), 30: (1, {'@': 129}), 13: (1, {'@': 129}), 20: (1, {'@': 129}), 15: (1, {'@': 129}), 34: (1, {'@': 129}), 5: (1, {'@': 129}), 7: (1, {'@': 129}), 8: (1, {'@': 129}), 9: (1, {'@': 129}), 10: (1, {'@': 129}), 11: (1, {'@': 129}), 12: (1, {'@': 129}), 14: (1, {'@': 129}), 17: (1, {'@': 129}), 18: (1, {'@': 129}), 0: (1, {'@': 129}), 19: (1, {'@': 129}), 21: (1, {'@': 129}), 22: (1, {'@': 129}), 23: (1, {'@': 129}), 1: (1, {'@': 129}), 24: (1, {'@': 129}), 27: (1, {'@': 129}), 31: (1, {'@': 129}), 32: (1, {'@': 129}), 33: (1, {'@': 129}), 36: (1, {'@': 129}), 37: (1, {'@': 129}), 38: (1, {'@': 129})}, 95: {2: (1, {'@': 56}), 17: (1, {'@': 56}), 5: (1, {'@': 56}), 18: (1, {'@': 56}), 0: (1, {'@': 56}), 7: (1, {'@': 56}), 19: (1, {'@': 56}), 8: (1, {'@': 56}), 20: (1, {'@': 56}), 21: (1, {'@': 56}), 9: (1, {'@': 56}), 10: (1, {'@': 56}), 22: (1, {'@': 56}), 23: (1, {'@': 56}), 1: (1, {'@': 56}), 11: (1, {'@': 56}), 24: (1, {'@': 56}), 12: (1, {'@': 56}), 27: (1, {'@': 56}), 28: (1, {'@': 56}), 31: (1, {'@': 56}), 32: (1, {'@': 56}), 14: (1, {'@': 56}), 33: (1, {'@': 56})}, 96: {42: (0, 187), 72: (0, 190), 73: (0, 141), 46: (0, 204), 23: (0, 210), 47: (0, 238), 74: (0, 240), 31: (0, 234), 80: (0, 227), 49: (0, 0), 24: (0, 275), 28: (0, 100), 52: (0, 50), 53: (0, 21), 54: (0, 47), 75: (0, 59), 76: (0, 53), 58: (0, 34), 77: (0, 194), 27: (0, 195), 78: (0, 55), 56: (0, 114), 59: (0, 94), 79: (0, 154), 55: (0, 165), 12: (0, 169), 22: (0, 207), 81: (0, 211), 82: (0, 223), 60: (0, 248), 1: (0, 18), 32: (0, 29), 83: (0, 188), 48: (0, 224), 84: (0, 206), 14: (0, 198), 85: (0, 215), 17: (0, 145), 43: (0, 172), 86: (0, 157), 44: (0, 15), 7: (0, 270), 87: (0, 166), 0: (0, 140), 50: (0, 3), 51: (0, 1), 88: (0, 265), 21: (0, 22), 89: (0, 56), 5: (0, 272), 20: (0, 6), 90: (0, 137), 11: (0, 226), 10: (0, 286), 8: (0, 276), 18: (0, 138), 91: (0, 95), 9: (0, 25), 2: (0, 116)}, 97: {94: (0, 216), 23: (0, 241), 95: (0, 243), 9: (0, 150), 96: (0, 103), 97: (0, 52)}, 98: {20: (0, 61), 15: (1, {'@': 112}), 36: (1, {'@': 112}), 34: (1, {'@': 112}), 38: (1, {'@': 112}), 19: (1, {'@': 112}), 9: (1, {'@': 112}), 23: (1, {'@': 112})}, 99: {16: (1, {'@': 141}), 2: (1, {'@': 141}), 3: (1, {'@': 141}), 4: (1, {'@': 141}), 6: (1, {'@': 141}), 20: (1, {'@': 141}), 1: (1, {'@': 141}), 34: (1, {'@': 141}), 25: (1, {'@': 141}), 26: (1, {'@': 141}), 35: (1, {'@': 141}), 28: (1, {'@': 141}), 29: (1, {'@': 141}), 30: (1, {'@': 141}), 13: (1, {'@': 141}), 15: (1, {'@': 141}), 5: (1, {'@': 141}), 7: (1, {'@': 141}), 8: (1, {'@': 141}), 9: (1, {'@': 141}), 10: (1, {'@': 141}), 11: (1, {'@': 141}), 12: (1, {'@': 141}), 14: (1, {'@': 141}), 17: (1, {'@': 141}), 18: (1, {'@': 141}), 0: (1, {'@': 141}), 19: (1, {'@': 141}), 21: (1, {'@': 141}), 22: (1, {'@': 141}), 23: (1, {'@': 141}), 24: (1, {'@': 141}), 27: (1, {'@': 141}), 31: (1, {'@': 141}), 32: (1, {'@': 141}), 33: (1, {'@': 141}), 36: (1, {'@': 141}), 37: (1, {'@': 141}), 38: (1, {'@': 141})}, 100: {59: (0, 84), 42: (0, 187), 44: (0, 15), 20: (0, 6), 10: (0, 286), 23: (0, 253), 46: (0, 204), 22: (0, 207), 11: (0, 226), 47: (0, 238), 60: (0, 248), 1: (0, 18), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 2: (0, 116), 52: (0, 50), 5: (0, 272), 48: (0, 224), 58: (0, 34), 17: (0, 145)}, 101: {35: (1, {'@': 93}), 34: (1, {'@': 93}), 38: (1, {'@': 93}), 36: (1, {'@': 93})}, 102: {71: (0, 33), 23: (0, 164), 9: (0, 14), 19: (1, {'@': 98})}, 103: {97: (0, 11), 9: (0, 40), 23: (0, 241), 94: (0, 178), 19: (1, {'@': 103})}, 104: {65: (1, {'@': 184}), 9: (1, {'@': 184}), 19: (1, {'@': 184})}, 105: {2: (1, {'@': 113}), 17: (1, {'@': 113}), 5: (1, {'@': 113}), 18: (1, {'@': 113}), 0: (1, {'@': 113}), 7: (1, {'@': 113}), 19: (1, {'@': 113}), 8: (1, {'@': 113}), 20: (1, {'@': 113}), 21: (1, {'@': 113}), 9: (1, {'@': 113}), 10: (1, {'@': 113}), 22: (1, {'@': 113}), 23: (1, {'@': 113}), 1: (1, {'@': 113}), 11: (1, {'@': 113}), 24: (1, {'@': 113}), 12: (1, {'@': 113}), 27: (1, {'@': 113}), 28: (1, {'@': 113}), 31: (1, {'@': 113}), 32: (1, {'@': 113}), 14: (1, {'@': 113}), 33: (1, {'@': 113})}, 106: {35: (1, {'@': 169}), 34: (1, {'@': 169})}, 107: {2: (1, {'@': 74}), 17: (1, {'@': 74}), 5: (1, {'@': 74}), 18: (1, {'@': 74}), 0: (1, {'@': 74}), 7: (1, {'@': 74}), 19: (1, {'@': 74}), 8: (1, {'@': 74}), 20: (1, {'@': 74}), 21: (1, {'@': 74}), 9: (1, {'@': 74}), 10: (1, {'@': 74}), 22: (1, {'@': 74}), 23: (1, {'@': 74}), 1: (1, {'@': 74}), 11: (1, {'@': 74}), 24: (1, {'@': 74}), 12: (1, {'@': 74}), 27: (1, {'@': 74}), 28: (1, {'@': 74}), 31: (1, {'@': 74}), 32: (1, {'@': 74}), 14: (1, {'@': 74}), 33: (1, {'@': 74})}, 108: {42: (0, 187), 43: (0, 172), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 0: (0, 140), 49: (0, 129), 50: (0, 106), 28: (0, 100), 51: (0, 1), 52: (0, 50), 53: (0, 21), 5: (0, 272), 54: (0, 47), 20: (0, 6), 55: (0, 165), 56: (0, 114), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 45: (0, 237), 48: (0, 224), 17: (0, 145)}, 109: {38: (0, 274)}, 110: {19: (0, 121)}, 111: {2: (1, {'@': 95}), 17: (1, {'@': 95}), 5: (1, {'@': 95}), 18: (1, {'@': 95}), 0: (1, {'@': 95}), 7: (1, {'@': 95}), 19: (1, {'@': 95}), 8: (1, {'@': 95}), 20: (1, {'@': 95}), 21: (1, {'@': 95}), 9: (1, {'@': 95}), 10: (1, {'@': 95}), 22: (1, {'@': 95}), 23: (1, {'@': 95}), 1: (1, {'@': 95}), 11: (1, {'@': 95}), 24: (1, {'@': 95}), 12: (1, {'@': 95}), 27: (1, {'@': 95}), 28: (1, {'@': 95}), 31: (1, {'@': 95}), 32: (1, {'@': 95}), 14: (1, {'@': 95}), 33: (1, {'@': 95})}, 112: {2: (1, {'@': 73}), 17: (1, {'@': 73}), 5: (1, {'@': 73}), 18: (1, {'@': 73}), 0: (1, {'@': 73}), 7: (1, {'@': 73}), 19: (1, {'@': 73}), 8: (1, {'@': 73}), 20: (1, {'@': 73}), 21: (1, {'@': 73}), 9: (1, {'@': 73}), 10: (1, {'@': 73}), 22: (1, {'@': 73}), 23: (1, {'@': 73}), 1: (1, {'@': 73}), 11: (1, {'@': 73}), 24: (1, {'@': 73}), 12: (1, {'@': 73}), 27: (1, {'@': 73}), 28: (1, {'@': 73}), 31: (1, {'@': 73}), 32: (1, {'@': 73}), 14: (1, {'@': 73}), 33: (1, {'@': 73})}, 113: {41: (0, 76)}, 114: {20: (0, 72), 13: (0, 208), 15: (0, 271), 29: (0, 117), 35: (1, {'@': 120}), 30: (1, {'@': 120}), 4: (1, {'@': 120}), 6: (1, {'@': 120}), 26: (1, {'@': 120}), 34: (1, {'@': 120}), 2: (1, {'@': 120}), 17: (1, {'@': 120}), 5: (1, {'@': 120}), 18: (1, {'@': 120}), 0: (1, {'@': 120}), 7: (1, {'@': 120}), 19: (1, {'@': 120}), 8: (1, {'@': 120}), 21: (1, {'@': 120}), 9: (1, {'@': 120}), 10: (1, {'@': 120}), 22: (1, {'@': 120}), 23: (1, {'@': 120}), 1: (1, {'@': 120}), 11: (1, {'@': 120}), 24: (1, {'@': 120}), 12: (1, {'@': 120}), 27: (1, {'@': 120}), 28: (1, {'@': 120}), 31: (1, {'@': 120}), 32: (1, {'@': 120}), 33: (1, {'@': 120}), 14: (1, {'@': 120}), 36: (1, {'@': 120}), 38: (1, {'@': 120}), 37: (1, {'@': 120})}, 115: {36: (1, {'@': 200}), 34: (1, {'@': 200})}, 116: {42: (0, 187), 44: (0, 15), 20: (0, 6), 10: (0, 286), 23: (0, 253), 46: (0, 204), 22: (0, 207), 11: (0, 226), 47: (0, 238), 60: (0, 248), 1: (0, 18), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 2: (0, 116), 52: (0, 50), 5: (0, 272), 48: (0, 224), 59: (0, 130), 58: (0, 34), 17: (0, 145)}, 117: {42: (0, 187), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 43: (0, 66), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 5: (0, 272), 20: (0, 6), 55: (0, 165), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 48: (0, 224), 17: (0, 145)}, 118: {98: (0, 218), 34: (0, 68), 36: (1, {'@': 144})}, 119: {36: (0, 13)}, 120: {34: (0, 181), 99: (0, 156), 36: (1, {'@': 109})}, 121: {65: (1, {'@': 85}), 9: (1, {'@': 85}), 19: (1, {'@': 85})}, 122: {42: (0, 187), 43: (0, 172), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 53: (0, 21), 5: (0, 272), 54: (0, 47), 20: (0, 6), 55: (0, 165), 56: (0, 114), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 50: (0, 175), 48: (0, 224), 17: (0, 145)}, 123: {15: (0, 278)}, 124: {2: (1, {'@': 100}), 17: (1, {'@': 100}), 5: (1, {'@': 100}), 18: (1, {'@': 100}), 0: (1, {'@': 100}), 7: (1, {'@': 100}), 19: (1, {'@': 100}), 8: (1, {'@': 100}), 20: (1, {'@': 100}), 21: (1, {'@': 100}), 9: (1, {'@': 100}), 10: (1, {'@': 100}), 22: (1, {'@': 100}), 23: (1, {'@': 100}), 1: (1, {'@': 100}), 11: (1, {'@': 100}), 39: (1, {'@': 100}), 24: (1, {'@': 100}), 12: (1, {'@': 100}), 27: (1, {'@': 100}), 28: (1, {'@': 100}), 31: (1, {'@': 100}), 32: (1, {'@': 100}), 14: (1, {'@': 100}), 33: (1, {'@': 100})}, 125: {38: (0, 217)}, 126: {2: (1, {'@': 178}), 5: (1, {'@': 178}), 7: (1, {'@': 178}), 8: (1, {'@': 178}), 9: (1, {'@': 178}), 10: (1, {'@': 178}), 11: (1, {'@': 178}), 12: (1, {'@': 178}), 14: (1, {'@': 178}), 17: (1, {'@': 178}), 18: (1, {'@': 178}), 0: (1, {'@': 178}), 19: (1, {'@': 178}), 20: (1, {'@': 178}), 21: (1, {'@': 178}), 22: (1, {'@': 178}), 23: (1, {'@': 178}), 1: (1, {'@': 178}), 24: (1, {'@': 178}), 27: (1, {'@': 178}), 28: (1, {'@': 178}), 31: (1, {'@': 178}), 32: (1, {'@': 178}), 33: (1, {'@': 178})}, 127: {19: (0, 177)}, 128: {100: (0, 60), 101: (0, 82), 2: (1, {'@': 76}), 17: (1, {'@': 76}), 5: (1, {'@': 76}), 18: (1, {'@': 76}), 0: (1, {'@': 76}), 7: (1, {'@': 76}), 19: (1, {'@': 76}), 8: (1, {'@': 76}), 20: (1, {'@': 76}), 21: (1, {'@': 76}), 9: (1, {'@': 76}), 10: (1, {'@': 76}), 22: (1, {'@': 76}), 23: (1, {'@': 76}), 1: (1, {'@': 76}), 11: (1, {'@': 76}), 24: (1, {'@': 76}), 12: (1, {'@': 76}), 27: (1, {'@': 76}), 28: (1, {'@': 76}), 31: (1, {'@': 76}), 32: (1, {'@': 76}), 14: (1, {'@': 76}), 33: (1, {'@': 76})}, 129: {0: (0, 179), 16: (1, {'@': 152}), 2: (1, {'@': 152}), 3: (1, {'@': 152}), 4: (1, {'@': 152}), 6: (1, {'@': 152}), 20: (1, {'@': 152}), 1: (1, {'@': 152}), 34: (1, {'@': 152}), 25: (1, {'@': 152}), 26: (1, {'@': 152}), 35: (1, {'@': 152}), 28: (1, {'@': 152}), 29: (1, {'@': 152}), 30: (1, {'@': 152}), 13: (1, {'@': 152}), 15: (1, {'@': 152}), 5: (1, {'@': 152}), 7: (1, {'@': 152}), 8: (1, {'@': 152}), 9: (1, {'@': 152}), 10: (1, {'@': 152}), 11: (1, {'@': 152}), 12: (1, {'@': 152}), 14: (1, {'@': 152}), 17: (1, {'@': 152}), 18: (1, {'@': 152}), 19: (1, {'@': 152}), 21: (1, {'@': 152}), 22: (1, {'@': 152}), 23: (1, {'@': 152}), 24: (1, {'@': 152}), 27: (1, {'@': 152}), 31: (1, {'@': 152}), 32: (1, {'@': 152}), 33: (1, {'@': 152}), 36: (1, {'@': 152}), 37: (1, {'@': 152}), 38: (1, {'@': 152})}, 130: {16: (1, {'@': 134}), 2: (1, {'@': 134}), 3: (1, {'@': 134}), 4: (1, {'@': 134}), 25: (1, {'@': 134}), 6: (1, {'@': 134}), 26: (1, {'@': 134}), 35: (1, {'@': 134}), 28: (1, {'@': 134}), 29: (1, {'@': 134}), 30: (1, {'@': 134}), 13: (1, {'@': 134}), 20: (1, {'@': 134}), 15: (1, {'@': 134}), 34: (1, {'@': 134}), 5: (1, {'@': 134}), 7: (1, {'@': 134}), 8: (1, {'@': 134}), 9: (1, {'@': 134}), 10: (1, {'@': 134}), 11: (1, {'@': 134}), 12: (1, {'@': 134}), 14: (1, {'@': 134}), 17: (1, {'@': 134}), 18: (1, {'@': 134}), 0: (1, {'@': 134}), 19: (1, {'@': 134}), 21: (1, {'@': 134}), 22: (1, {'@': 134}), 23: (1, {'@': 134}), 1: (1, {'@': 134}), 24: (1, {'@': 134}), 27: (1, {'@': 134}), 31: (1, {'@': 134}), 32: (1, {'@': 134}), 33: (1, {'@': 134}), 36: (1, {'@': 134}), 37: (1, {'@': 134}), 38: (1, {'@': 134})}, 131: {65: (1, {'@': 185}), 9: (1, {'@': 185}), 19: (1, {'@': 185})}, 132: {35: (1, {'@': 204}), 34: (1, {'@': 204})}, 133: {19: (0, 214)}, 134: {2: (1, {'@': 181}), 17: (1, {'@': 181}), 5: (1, {'@': 181}), 18: (1, {'@': 181}), 100: (1, {'@': 181}), 0: (1, {'@': 181}), 7: (1, {'@': 181}), 19: (1, {'@': 181}), 8: (1, {'@': 181}), 20: (1, {'@': 181}), 21: (1, {'@': 181}), 102: (1, {'@': 181}), 9: (1, {'@': 181}), 10: (1, {'@': 181}), 22: (1, {'@': 181}), 23: (1, {'@': 181}), 1: (1, {'@': 181}), 11: (1, {'@': 181}), 24: (1, {'@': 181}), 12: (1, {'@': 181}), 27: (1, {'@': 181}), 28: (1, {'@': 181}), 31: (1, {'@': 181}), 32: (1, {'@': 181}), 33: (1, {'@': 181}), 14: (1, {'@': 181})}, 135: {42: (0, 187), 43: (0, 172), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 5: (0, 272), 20: (0, 6), 55: (0, 165), 56: (0, 114), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 54: (0, 225), 60: (0, 248), 1: (0, 18), 2: (0, 116), 48: (0, 224), 17: (0, 145)}, 136: {42: (0, 67), 61: (0, 44), 1: (0, 19), 63: (0, 197), 62: (0, 144), 64: (0, 101), 11: (0, 226)}, 137: {39: (0, 155), 2: (1, {'@': 68}), 17: (1, {'@': 68}), 5: (1, {'@': 68}), 18: (1, {'@': 68}), 0: (1, {'@': 68}), 7: (1, {'@': 68}), 19: (1, {'@': 68}), 8: (1, {'@': 68}), 20: (1, {'@': 68}), 21: (1, {'@': 68}), 9: (1, {'@': 68}), 10: (1, {'@': 68}), 22: (1, {'@': 68}), 23: (1, {'@': 68}), 1: (1, {'@': 68}), 11: (1, {'@': 68}), 24: (1, {'@': 68}), 12: (1, {'@': 68}), 27: (1, {'@': 68}), 28: (1, {'@': 68}), 31: (1, {'@': 68}), 32: (1, {'@': 68}), 14: (1, {'@': 68}), 33: (1, {'@': 68})}, 138: {42: (0, 187), 43: (0, 172), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 0: (0, 140), 49: (0, 129), 51: (0, 1), 50: (0, 87), 28: (0, 100), 52: (0, 50), 53: (0, 21), 5: (0, 272), 54: (0, 47), 20: (0, 6), 55: (0, 165), 56: (0, 114), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 48: (0, 224), 17: (0, 145)}, 139: {36: (0, 220)}, 140: {42: (0, 187), 43: (0, 172), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 53: (0, 21), 5: (0, 272), 54: (0, 47), 20: (0, 6), 55: (0, 165), 56: (0, 114), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 50: (0, 119), 48: (0, 224), 17: (0, 145)}, 141: {103: (0, 128), 104: (0, 184), 100: (0, 60), 101: (0, 252), 105: (0, 161), 102: (0, 74), 2: (1, {'@': 78}), 17: (1, {'@': 78}), 5: (1, {'@': 78}), 18: (1, {'@': 78}), 0: (1, {'@': 78}), 7: (1, {'@': 78}), 19: (1, {'@': 78}), 8: (1, {'@': 78}), 20: (1, {'@': 78}), 21: (1, {'@': 78}), 9: (1, {'@': 78}), 10: (1, {'@': 78}), 22: (1, {'@': 78}), 23: (1, {'@': 78}), 1: (1, {'@': 78}), 11: (1, {'@': 78}), 24: (1, {'@': 78}), 12: (1, {'@': 78}), 27: (1, {'@': 78}), 28: (1, {'@': 78}), 31: (1, {'@': 78}), 32: (1, {'@': 78}), 14: (1, {'@': 78}), 33: (1, {'@': 78})}, 142: {38: (1, {'@': 86}), 36: (1, {'@': 86})}, 143: {42: (0, 67), 62: (0, 132), 61: (0, 44), 1: (0, 19), 63: (0, 197), 64: (0, 101), 11: (0, 226)}, 144: {35: (1, {'@': 205}), 34: (1, {'@': 205})}, 145: {16: (1, {'@': 157}), 2: (1, {'@': 157}), 3: (1, {'@': 157}), 4: (1, {'@': 157}), 6: (1, {'@': 157}), 20: (1, {'@': 157}), 1: (1, {'@': 157}), 34: (1, {'@': 157}), 25: (1, {'@': 157}), 26: (1, {'@': 157}), 35: (1, {'@': 157}), 28: (1, {'@': 157}), 29: (1, {'@': 157}), 30: (1, {'@': 157}), 13: (1, {'@': 157}), 15: (1, {'@': 157}), 5: (1, {'@': 157}), 7: (1, {'@': 157}), 8: (1, {'@': 157}), 9: (1, {'@': 157}), 10: (1, {'@': 157}), 11: (1, {'@': 157}), 12: (1, {'@': 157}), 14: (1, {'@': 157}), 17: (1, {'@': 157}), 18: (1, {'@': 157}), 0: (1, {'@': 157}), 19: (1, {'@': 157}), 21: (1, {'@': 157}), 22: (1, {'@': 157}), 23: (1, {'@': 157}), 24: (1, {'@': 157}), 27: (1, {'@': 157}), 31: (1, {'@': 157}), 32: (1, {'@': 157}), 33: (1, {'@': 157}), 36: (1, {'@': 157}), 37: (1, {'@': 157}), 38: (1, {'@': 157})}, 146: {42: (0, 187), 43: (0, 172), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 50: (0, 246), 52: (0, 50), 53: (0, 21), 5: (0, 272), 54: (0, 47), 20: (0, 6), 55: (0, 165), 56: (0, 114), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 48: (0, 224), 17: (0, 145)}, 147: {39: (0, 273)}, 148: {16: (1, {'@': 130}), 2: (1, {'@': 130}), 3: (1, {'@': 130}), 4: (1, {'@': 130}), 25: (1, {'@': 130}), 6: (1, {'@': 130}), 26: (1, {'@': 130}), 35: (1, {'@': 130}), 28: (1, {'@': 130}), 29: (1, {'@': 130}), 30: (1, {'@': 130}), 13: (1, {'@': 130}), 20: (1, {'@': 130}), 15: (1, {'@': 130}), 34: (1, {'@': 130}), 5: (1, {'@': 130}), 7: (1, {'@': 130}), 8: (1, {'@': 130}), 9: (1, {'@': 130}), 10: (1, {'@': 130}), 11: (1, {'@': 130}), 12: (1, {'@': 130}), 14: (1, {'@': 130}), 17: (1, {'@': 130}), 18: (1, {'@': 130}), 0: (1, {'@': 130}), 19: (1, {'@': 130}), 21: (1, {'@': 130}), 22: (1, {'@': 130}), 23: (1, {'@': 130}), 1: (1, {'@': 130}), 24: (1, {'@': 130}), 27: (1, {'@': 130}), 31: (1, {'@': 130}), 32: (1, {'@': 130}), 33: (1, {'@': 130}), 36: (1, {'@': 130}), 37: (1, {'@': 130}), 38: (1, {'@': 130})}, 149: {19: (0, 46)}, 150: {19: (1, {'@': 192}), 9: (1, {'@': 192}), 23: (1, {'@': 192})}, 151: {16: (0, 196), 25: (0, 258), 3: (0, 80), 2: (1, {'@': 127}), 4: (1, {'@': 127}), 6: (1, {'@': 127}), 26: (1, {'@': 127}), 35: (1, {'@': 127}), 28: (1, {'@': 127}), 29: (1, {'@': 127}), 30: (1, {'@': 127}), 13: (1, {'@': 127}), 20: (1, {'@': 127}), 15: (1, {'@': 127}), 34: (1, {'@': 127}), 5: (1, {'@': 127}), 7: (1, {'@': 127}), 8: (1, {'@': 127}), 9: (1, {'@': 127}), 10: (1, {'@': 127}), 11: (1, {'@': 127}), 12: (1, {'@': 127}), 14: (1, {'@': 127}), 17: (1, {'@': 127}), 18: (1, {'@': 127}), 0: (1, {'@': 127}), 19: (1, {'@': 127}), 21: (1, {'@': 127}), 22: (1, {'@': 127}), 23: (1, {'@': 127}), 1: (1, {'@': 127}), 24: (1, {'@': 127}), 27: (1, {'@': 127}), 31: (1, {'@': 127}), 32: (1, {'@': 127}), 33: (1, {'@': 127}), 36: (1, {'@': 127}), 37: (1, {'@': 127}), 38: (1, {'@': 127})}, 152: {36: (0, 79)}, 153: {2: (1, {'@': 81}), 17: (1, {'@': 81}), 5: (1, {'@': 81}), 18: (1, {'@': 81}), 100: (1, {'@': 81}), 0: (1, {'@': 81}), 7: (1, {'@': 81}), 19: (1, {'@': 81}), 8: (1, {'@': 81}), 20: (1, {'@': 81}), 21: (1, {'@': 81}), 102: (1, {'@': 81}), 9: (1, {'@': 81}), 10: (1, {'@': 81}), 22: (1, {'@': 81}), 23: (1, {'@': 81}), 1: (1, {'@': 81}), 11: (1, {'@': 81}), 24: (1, {'@': 81}), 12: (1, {'@': 81}), 27: (1, {'@': 81}), 28: (1, {'@': 81}), 31: (1, {'@': 81}), 32: (1, {'@': 81}), 33: (1, {'@': 81}), 14: (1, {'@': 81})}, 154: {42: (0, 187), 72: (0, 190), 73: (0, 141), 46: (0, 204), 23: (0, 210), 47: (0, 238), 74: (0, 240), 31: (0, 234), 49: (0, 0), 24: (0, 275), 28: (0, 100), 52: (0, 50), 53: (0, 21), 54: (0, 47), 75: (0, 59), 76: (0, 53), 58: (0, 34), 77: (0, 194), 27: (0, 195), 78: (0, 55), 56: (0, 114), 59: (0, 94), 55: (0, 165), 12: (0, 169), 22: (0, 207), 81: (0, 211), 82: (0, 223), 60: (0, 248), 1: (0, 18), 32: (0, 29), 83: (0, 188), 48: (0, 224), 84: (0, 206), 14: (0, 198), 85: (0, 215), 17: (0, 145), 43: (0, 172), 44: (0, 15), 7: (0, 270), 87: (0, 166), 9: (0, 10), 0: (0, 140), 50: (0, 3), 51: (0, 1), 21: (0, 22), 89: (0, 56), 5: (0, 272), 20: (0, 6), 90: (0, 137), 11: (0, 226), 10: (0, 286), 8: (0, 276), 18: (0, 138), 91: (0, 95), 2: (0, 116), 86: (0, 126), 19: (1, {'@': 52}), 33: (1, {'@': 52})}, 155: {42: (0, 187), 43: (0, 172), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 53: (0, 21), 5: (0, 272), 54: (0, 47), 20: (0, 6), 55: (0, 165), 56: (0, 114), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 50: (0, 183), 2: (0, 116), 48: (0, 224), 17: (0, 145)}, 156: {34: (0, 279), 36: (1, {'@': 108})}, 157: {2: (1, {'@': 176}), 5: (1, {'@': 176}), 7: (1, {'@': 176}), 8: (1, {'@': 176}), 9: (1, {'@': 176}), 10: (1, {'@': 176}), 11: (1, {'@': 176}), 12: (1, {'@': 176}), 14: (1, {'@': 176}), 17: (1, {'@': 176}), 18: (1, {'@': 176}), 0: (1, {'@': 176}), 19: (1, {'@': 176}), 20: (1, {'@': 176}), 21: (1, {'@': 176}), 22: (1, {'@': 176}), 23: (1, {'@': 176}), 1: (1, {'@': 176}), 24: (1, {'@': 176}), 27: (1, {'@': 176}), 28: (1, {'@': 176}), 31: (1, {'@': 176}), 32: (1, {'@': 176}), 33: (1, {'@': 176})}, 158: {39: (0, 38)}, 159: {38: (0, 97)}, 160: {67: (0, 193), 23: (0, 4)}, 161: {2: (1, {'@': 180}), 17: (1, {'@': 180}), 5: (1, {'@': 180}), 18: (1, {'@': 180}), 100: (1, {'@': 180}), 0: (1, {'@': 180}), 7: (1, {'@': 180}), 19: (1, {'@': 180}), 8: (1, {'@': 180}), 20: (1, {'@': 180}), 21: (1, {'@': 180}), 102: (1, {'@': 180}), 9: (1, {'@': 180}), 10: (1, {'@': 180}), 22: (1, {'@': 180}), 23: (1, {'@': 180}), 1: (1, {'@': 180}), 11: (1, {'@': 180}), 24: (1, {'@': 180}), 12: (1, {'@': 180}), 27: (1, {'@': 180}), 28: (1, {'@': 180}), 31: (1, {'@': 180}), 32: (1, {'@': 180}), 33: (1, {'@': 180}), 14: (1, {'@': 180})}, 162: {23: (0, 124)}, 163: {19: (0, 285)}, 164: {106: (0, 39)}, 165: {16: (0, 196), 25: (0, 258), 3: (0, 80), 2: (1, {'@': 128}), 4: (1, {'@': 128}), 6: (1, {'@': 128}), 26: (1, {'@': 128}), 35: (1, {'@': 128}), 28: (1, {'@': 128}), 29: (1, {'@': 128}), 30: (1, {'@': 128}), 13: (1, {'@': 128}), 20: (1, {'@': 128}), 15: (1, {'@': 128}), 34: (1, {'@': 128}), 5: (1, {'@': 128}), 7: (1, {'@': 128}), 8: (1, {'@': 128}), 9: (1, {'@': 128}), 10: (1, {'@': 128}), 11: (1, {'@': 128}), 12: (1, {'@': 128}), 14: (1, {'@': 128}), 17: (1, {'@': 128}), 18: (1, {'@': 128}), 0: (1, {'@': 128}), 19: (1, {'@': 128}), 21: (1, {'@': 128}), 22: (1, {'@': 128}), 23: (1, {'@': 128}), 1: (1, {'@': 128}), 24: (1, {'@': 128}), 27: (1, {'@': 128}), 31: (1, {'@': 128}), 32: (1, {'@': 128}), 33: (1, {'@': 128}), 36: (1, {'@': 128}), 37: (1, {'@': 128}), 38: (1, {'@': 128})}, 166: {2: (1, {'@': 60}), 17: (1, {'@': 60}), 5: (1, {'@': 60}), 18: (1, {'@': 60}), 0: (1, {'@': 60}), 7: (1, {'@': 60}), 19: (1, {'@': 60}), 8: (1, {'@': 60}), 20: (1, {'@': 60}), 21: (1, {'@': 60}), 9: (1, {'@': 60}), 10: (1, {'@': 60}), 22: (1, {'@': 60}), 23: (1, {'@': 60}), 1: (1, {'@': 60}), 11: (1, {'@': 60}), 24: (1, {'@': 60}), 12: (1, {'@': 60}), 27: (1, {'@': 60}), 28: (1, {'@': 60}), 31: (1, {'@': 60}), 32: (1, {'@': 60}), 14: (1, {'@': 60}), 33: (1, {'@': 60})}, 167: {42: (0, 187), 43: (0, 172), 44: (0, 15), 50: (0, 16), 46: (0, 204), 23: (0, 253), 47: (0, 238), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 53: (0, 21), 5: (0, 272), 54: (0, 47), 20: (0, 6), 55: (0, 165), 56: (0, 114), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 48: (0, 224), 17: (0, 145)}, 168: {35: (1, {'@': 171}), 34: (1, {'@': 171}), 38: (1, {'@': 171}), 36: (1, {'@': 171})}, 169: {23: (0, 230)}, 170: {35: (0, 231)}, 171: {19: (1, {'@': 105}), 9: (1, {'@': 105}), 23: (1, {'@': 105})}, 172: {2: (0, 180), 28: (0, 264), 4: (1, {'@': 125}), 6: (1, {'@': 125}), 26: (1, {'@': 125}), 35: (1, {'@': 125}), 29: (1, {'@': 125}), 30: (1, {'@': 125}), 13: (1, {'@': 125}), 20: (1, {'@': 125}), 15: (1, {'@': 125}), 34: (1, {'@': 125}), 5: (1, {'@': 125}), 7: (1, {'@': 125}), 8: (1, {'@': 125}), 9: (1, {'@': 125}), 10: (1, {'@': 125}), 11: (1, {'@': 125}), 12: (1, {'@': 125}), 14: (1, {'@': 125}), 17: (1, {'@': 125}), 18: (1, {'@': 125}), 0: (1, {'@': 125}), 19: (1, {'@': 125}), 21: (1, {'@': 125}), 22: (1, {'@': 125}), 23: (1, {'@': 125}), 1: (1, {'@': 125}), 24: (1, {'@': 125}), 27: (1, {'@': 125}), 31: (1, {'@': 125}), 32: (1, {'@': 125}), 33: (1, {'@': 125}), 36: (1, {'@': 125}), 37: (1, {'@': 125}), 38: (1, {'@': 125})}, 173: {16: (1, {'@': 166}), 2: (1, {'@': 166}), 3: (1, {'@': 166}), 4: (1, {'@': 166}), 6: (1, {'@': 166}), 20: (1, {'@': 166}), 1: (1, {'@': 166}), 34: (1, {'@': 166}), 25: (1, {'@': 166}), 26: (1, {'@': 166}), 35: (1, {'@': 166}), 28: (1, {'@': 166}), 29: (1, {'@': 166}), 30: (1, {'@': 166}), 13: (1, {'@': 166}), 15: (1, {'@': 166}), 5: (1, {'@': 166}), 7: (1, {'@': 166}), 8: (1, {'@': 166}), 9: (1, {'@': 166}), 10: (1, {'@': 166}), 11: (1, {'@': 166}), 12: (1, {'@': 166}), 14: (1, {'@': 166}), 17: (1, {'@': 166}), 18: (1, {'@': 166}), 0: (1, {'@': 166}), 19: (1, {'@': 166}), 21: (1, {'@': 166}), 22: (1, {'@': 166}), 23: (1, {'@': 166}), 24: (1, {'@': 166}), 27: (1, {'@': 166}), 31: (1, {'@': 166}), 32: (1, {'@': 166}), 33: (1, {'@': 166}), 36: (1, {'@': 166}), 37: (1, {'@': 166}), 38: (1, {'@': 166})}, 174: {19: (0, 111)}, 175: {35: (0, 147)}, 176: {36: (0, 256)}, 177: {2: (1, {'@': 97}), 17: (1, {'@': 97}), 5: (1, {'@': 97}), 18: (1, {'@': 97}), 0: (1, {'@': 97}), 7: (1, {'@': 97}), 19: (1, {'@': 97}), 8: (1, {'@': 97}), 20: (1, {'@': 97}), 21: (1, {'@': 97}), 9: (1, {'@': 97}), 10: (1, {'@': 97}), 22: (1, {'@': 97}), 23: (1, {'@': 97}), 1: (1, {'@': 97}), 11: (1, {'@': 97}), 24: (1, {'@': 97}), 12: (1, {'@': 97}), 27: (1, {'@': 97}), 28: (1, {'@': 97}), 31: (1, {'@': 97}), 32: (1, {'@': 97}), 14: (1, {'@': 97}), 33: (1, {'@': 97})}, 178: {19: (1, {'@': 193}), 9: (1, {'@': 193}), 23: (1, {'@': 193})}, 179: {42: (0, 187), 43: (0, 172), 44: (0, 15), 46: (0, 204), 23: (0, 12), 47: (0, 238), 107: (0, 263), 0: (0, 140), 67: (0, 249), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 50: (0, 118), 53: (0, 21), 5: (0, 272), 54: (0, 47), 20: (0, 6), 55: (0, 165), 56: (0, 114), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 108: (0, 152), 36: (0, 99), 60: (0, 248), 1: (0, 18), 2: (0, 116), 48: (0, 224), 17: (0, 145)}, 180: {42: (0, 187), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 5: (0, 272), 20: (0, 6), 55: (0, 151), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 48: (0, 224), 17: (0, 145)}, 181: {109: (0, 212), 23: (0, 245)}, 182: {2: (1, {'@': 79}), 17: (1, {'@': 79}), 5: (1, {'@': 79}), 18: (1, {'@': 79}), 100: (1, {'@': 79}), 0: (1, {'@': 79}), 7: (1, {'@': 79}), 19: (1, {'@': 79}), 8: (1, {'@': 79}), 20: (1, {'@': 79}), 21: (1, {'@': 79}), 102: (1, {'@': 79}), 9: (1, {'@': 79}), 10: (1, {'@': 79}), 22: (1, {'@': 79}), 23: (1, {'@': 79}), 1: (1, {'@': 79}), 11: (1, {'@': 79}), 24: (1, {'@': 79}), 12: (1, {'@': 79}), 27: (1, {'@': 79}), 28: (1, {'@': 79}), 31: (1, {'@': 79}), 32: (1, {'@': 79}), 14: (1, {'@': 79}), 33: (1, {'@': 79})}, 183: {2: (1, {'@': 101}), 17: (1, {'@': 101}), 5: (1, {'@': 101}), 18: (1, {'@': 101}), 0: (1, {'@': 101}), 7: (1, {'@': 101}), 19: (1, {'@': 101}), 8: (1, {'@': 101}), 20: (1, {'@': 101}), 21: (1, {'@': 101}), 9: (1, {'@': 101}), 10: (1, {'@': 101}), 22: (1, {'@': 101}), 23: (1, {'@': 101}), 1: (1, {'@': 101}), 11: (1, {'@': 101}), 24: (1, {'@': 101}), 12: (1, {'@': 101}), 27: (1, {'@': 101}), 28: (1, {'@': 101}), 31: (1, {'@': 101}), 32: (1, {'@': 101}), 14: (1, {'@': 101}), 33: (1, {'@': 101})}, 184: {105: (0, 134), 102: (0, 74), 2: (1, {'@': 80}), 5: (1, {'@': 80}), 7: (1, {'@': 80}), 8: (1, {'@': 80}), 9: (1, {'@': 80}), 10: (1, {'@': 80}), 11: (1, {'@': 80}), 12: (1, {'@': 80}), 14: (1, {'@': 80}), 17: (1, {'@': 80}), 18: (1, {'@': 80}), 100: (1, {'@': 80}), 0: (1, {'@': 80}), 19: (1, {'@': 80}), 20: (1, {'@': 80}), 21: (1, {'@': 80}), 22: (1, {'@': 80}), 23: (1, {'@': 80}), 1: (1, {'@': 80}), 24: (1, {'@': 80}), 27: (1, {'@': 80}), 28: (1, {'@': 80}), 31: (1, {'@': 80}), 32: (1, {'@': 80}), 33: (1, {'@': 80})}, 185: {0: (0, 146), 16: (1, {'@': 160}), 2: (1, {'@': 160}), 3: (1, {'@': 160}), 4: (1, {'@': 160}), 6: (1, {'@': 160}), 20: (1, {'@': 160}), 1: (1, {'@': 160}), 34: (1, {'@': 160}), 25: (1, {'@': 160}), 26: (1, {'@': 160}), 35: (1, {'@': 160}), 28: (1, {'@': 160}), 29: (1, {'@': 160}), 30: (1, {'@': 160}), 13: (1, {'@': 160}), 15: (1, {'@': 160}), 5: (1, {'@': 160}), 7: (1, {'@': 160}), 8: (1, {'@': 160}), 9: (1, {'@': 160}), 10: (1, {'@': 160}), 11: (1, {'@': 160}), 12: (1, {'@': 160}), 14: (1, {'@': 160}), 17: (1, {'@': 160}), 18: (1, {'@': 160}), 19: (1, {'@': 160}), 21: (1, {'@': 160}), 22: (1, {'@': 160}), 23: (1, {'@': 160}), 24: (1, {'@': 160}), 27: (1, {'@': 160}), 31: (1, {'@': 160}), 32: (1, {'@': 160}), 33: (1, {'@': 160}), 36: (1, {'@': 160}), 37: (1, {'@': 160}), 38: (1, {'@': 160})}, 186: {109: (0, 120), 23: (0, 245), 36: (0, 189), 110: (0, 176)}, 187: {16: (1, {'@': 146}), 2: (1, {'@': 146}), 3: (1, {'@': 146}), 4: (1, {'@': 146}), 6: (1, {'@': 146}), 20: (1, {'@': 146}), 1: (1, {'@': 146}), 34: (1, {'@': 146}), 25: (1, {'@': 146}), 26: (1, {'@': 146}), 35: (1, {'@': 146}), 28: (1, {'@': 146}), 29: (1, {'@': 146}), 30: (1, {'@': 146}), 13: (1, {'@': 146}), 15: (1, {'@': 146}), 5: (1, {'@': 146}), 7: (1, {'@': 146}), 8: (1, {'@': 146}), 9: (1, {'@': 146}), 10: (1, {'@': 146}), 11: (1, {'@': 146}), 12: (1, {'@': 146}), 14: (1, {'@': 146}), 17: (1, {'@': 146}), 18: (1, {'@': 146}), 0: (1, {'@': 146}), 19: (1, {'@': 146}), 21: (1, {'@': 146}), 22: (1, {'@': 146}), 23: (1, {'@': 146}), 24: (1, {'@': 146}), 27: (1, {'@': 146}), 31: (1, {'@': 146}), 32: (1, {'@': 146}), 33: (1, {'@': 146}), 36: (1, {'@': 146}), 37: (1, {'@': 146}), 38: (1, {'@': 146})}, 188: {2: (1, {'@': 66}), 17: (1, {'@': 66}), 5: (1, {'@': 66}), 18: (1, {'@': 66}), 0: (1, {'@': 66}), 7: (1, {'@': 66}), 19: (1, {'@': 66}), 8: (1, {'@': 66}), 20: (1, {'@': 66}), 21: (1, {'@': 66}), 9: (1, {'@': 66}), 10: (1, {'@': 66}), 22: (1, {'@': 66}), 23: (1, {'@': 66}), 1: (1, {'@': 66}), 11: (1, {'@': 66}), 24: (1, {'@': 66}), 12: (1, {'@': 66}), 27: (1, {'@': 66}), 28: (1, {'@': 66}), 31: (1, {'@': 66}), 32: (1, {'@': 66}), 14: (1, {'@': 66}), 33: (1, {'@': 66})}, 189: {111: (0, 262)}, 190: {2: (1, {'@': 62}), 17: (1, {'@': 62}), 5: (1, {'@': 62}), 18: (1, {'@': 62}), 0: (1, {'@': 62}), 7: (1, {'@': 62}), 19: (1, {'@': 62}), 8: (1, {'@': 62}), 20: (1, {'@': 62}), 21: (1, {'@': 62}), 9: (1, {'@': 62}), 10: (1, {'@': 62}), 22: (1, {'@': 62}), 23: (1, {'@': 62}), 1: (1, {'@': 62}), 11: (1, {'@': 62}), 24: (1, {'@': 62}), 12: (1, {'@': 62}), 27: (1, {'@': 62}), 28: (1, {'@': 62}), 31: (1, {'@': 62}), 32: (1, {'@': 62}), 14: (1, {'@': 62}), 33: (1, {'@': 62})}, 191: {0: (0, 269), 38: (1, {'@': 91}), 36: (1, {'@': 91})}, 192: {35: (0, 70), 34: (0, 136)}, 193: {36: (1, {'@': 201}), 34: (1, {'@': 201})}, 194: {2: (1, {'@': 57}), 17: (1, {'@': 57}), 5: (1, {'@': 57}), 18: (1, {'@': 57}), 0: (1, {'@': 57}), 7: (1, {'@': 57}), 19: (1, {'@': 57}), 8: (1, {'@': 57}), 20: (1, {'@': 57}), 21: (1, {'@': 57}), 9: (1, {'@': 57}), 10: (1, {'@': 57}), 22: (1, {'@': 57}), 23: (1, {'@': 57}), 1: (1, {'@': 57}), 11: (1, {'@': 57}), 24: (1, {'@': 57}), 12: (1, {'@': 57}), 27: (1, {'@': 57}), 28: (1, {'@': 57}), 31: (1, {'@': 57}), 32: (1, {'@': 57}), 14: (1, {'@': 57}), 33: (1, {'@': 57})}, 195: {23: (0, 48)}, 196: {42: (0, 187), 44: (0, 15), 20: (0, 6), 10: (0, 286), 23: (0, 253), 46: (0, 204), 22: (0, 207), 11: (0, 226), 47: (0, 238), 60: (0, 248), 1: (0, 18), 0: (0, 140), 59: (0, 221), 49: (0, 129), 51: (0, 1), 28: (0, 100), 2: (0, 116), 52: (0, 50), 5: (0, 272), 48: (0, 224), 58: (0, 34), 17: (0, 145)}, 197: {35: (1, {'@': 175}), 34: (1, {'@': 175})}, 198: {42: (0, 187), 43: (0, 172), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 53: (0, 21), 5: (0, 272), 54: (0, 47), 20: (0, 6), 55: (0, 165), 56: (0, 114), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 50: (0, 78), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 48: (0, 224), 17: (0, 145)}, 199: {2: (0, 180), 28: (0, 264), 4: (1, {'@': 122}), 6: (1, {'@': 122}), 26: (1, {'@': 122}), 35: (1, {'@': 122}), 29: (1, {'@': 122}), 30: (1, {'@': 122}), 13: (1, {'@': 122}), 20: (1, {'@': 122}), 15: (1, {'@': 122}), 34: (1, {'@': 122}), 5: (1, {'@': 122}), 7: (1, {'@': 122}), 8: (1, {'@': 122}), 9: (1, {'@': 122}), 10: (1, {'@': 122}), 11: (1, {'@': 122}), 12: (1, {'@': 122}), 14: (1, {'@': 122}), 17: (1, {'@': 122}), 18: (1, {'@': 122}), 0: (1, {'@': 122}), 19: (1, {'@': 122}), 21: (1, {'@': 122}), 22: (1, {'@': 122}), 23: (1, {'@': 122}), 1: (1, {'@': 122}), 24: (1, {'@': 122}), 27: (1, {'@': 122}), 31: (1, {'@': 122}), 32: (1, {'@': 122}), 33: (1, {'@': 122}), 36: (1, {'@': 122}), 37: (1, {'@': 122}), 38: (1, {'@': 122})}, 200: {42: (0, 187), 43: (0, 172), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 5: (0, 272), 20: (0, 6), 55: (0, 165), 56: (0, 114), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 54: (0, 261), 60: (0, 248), 1: (0, 18), 2: (0, 116), 48: (0, 224), 17: (0, 145)}, 201: {19: (0, 153)}, 202: {36: (1, {'@': 198}), 34: (1, {'@': 198})}, 203: {9: (0, 24), 112: (0, 88), 65: (0, 239), 113: (0, 282), 114: (0, 89)}, 204: {1: (0, 92), 16: (1, {'@': 138}), 2: (1, {'@': 138}), 3: (1, {'@': 138}), 4: (1, {'@': 138}), 25: (1, {'@': 138}), 6: (1, {'@': 138}), 26: (1, {'@': 138}), 35: (1, {'@': 138}), 28: (1, {'@': 138}), 29: (1, {'@': 138}), 30: (1, {'@': 138}), 13: (1, {'@': 138}), 20: (1, {'@': 138}), 15: (1, {'@': 138}), 34: (1, {'@': 138}), 5: (1, {'@': 138}), 7: (1, {'@': 138}), 8: (1, {'@': 138}), 9: (1, {'@': 138}), 10: (1, {'@': 138}), 11: (1, {'@': 138}), 12: (1, {'@': 138}), 14: (1, {'@': 138}), 17: (1, {'@': 138}), 18: (1, {'@': 138}), 0: (1, {'@': 138}), 19: (1, {'@': 138}), 21: (1, {'@': 138}), 22: (1, {'@': 138}), 23: (1, {'@': 138}), 24: (1, {'@': 138}), 27: (1, {'@': 138}), 31: (1, {'@': 138}), 32: (1, {'@': 138}), 33: (1, {'@': 138}), 36: (1, {'@': 138}), 37: (1, {'@': 138}), 38: (1, {'@': 138})}, 205: {19: (1, {'@': 186}), 9: (1, {'@': 186}), 23: (1, {'@': 186})}, 206: {2: (1, {'@': 55}), 17: (1, {'@': 55}), 5: (1, {'@': 55}), 18: (1, {'@': 55}), 0: (1, {'@': 55}), 7: (1, {'@': 55}), 19: (1, {'@': 55}), 8: (1, {'@': 55}), 20: (1, {'@': 55}), 21: (1, {'@': 55}), 9: (1, {'@': 55}), 10: (1, {'@': 55}), 22: (1, {'@': 55}), 23: (1, {'@': 55}), 1: (1, {'@': 55}), 11: (1, {'@': 55}), 24: (1, {'@': 55}), 12: (1, {'@': 55}), 27: (1, {'@': 55}), 28: (1, {'@': 55}), 31: (1, {'@': 55}), 32: (1, {'@': 55}), 14: (1, {'@': 55}), 33: (1, {'@': 55})}, 207: {16: (1, {'@': 159}), 2: (1, {'@': 159}), 3: (1, {'@': 159}), 4: (1, {'@': 159}), 6: (1, {'@': 159}), 20: (1, {'@': 159}), 1: (1, {'@': 159}), 34: (1, {'@': 159}), 25: (1, {'@': 159}), 26: (1, {'@': 159}), 35: (1, {'@': 159}), 28: (1, {'@': 159}), 29: (1, {'@': 159}), 30: (1, {'@': 159}), 13: (1, {'@': 159}), 15: (1, {'@': 159}), 5: (1, {'@': 159}), 7: (1, {'@': 159}), 8: (1, {'@': 159}), 9: (1, {'@': 159}), 10: (1, {'@': 159}), 11: (1, {'@': 159}), 12: (1, {'@': 159}), 14: (1, {'@': 159}), 17: (1, {'@': 159}), 18: (1, {'@': 159}), 0: (1, {'@': 159}), 19: (1, {'@': 159}), 21: (1, {'@': 159}), 22: (1, {'@': 159}), 23: (1, {'@': 159}), 24: (1, {'@': 159}), 27: (1, {'@': 159}), 31: (1, {'@': 159}), 32: (1, {'@': 159}), 33: (1, {'@': 159}), 36: (1, {'@': 159}), 37: (1, {'@': 159}), 38: (1, {'@': 159})}, 208: {42: (0, 187), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 43: (0, 281), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 5: (0, 272), 20: (0, 6), 55: (0, 165), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 48: (0, 224), 17: (0, 145)}, 209: {35: (1, {'@': 202}), 34: (1, {'@': 202})}, 210: {41: (0, 32), 39: (0, 51), 93: (0, 162), 2: (1, {'@': 162}), 3: (1, {'@': 162}), 4: (1, {'@': 162}), 5: (1, {'@': 162}), 6: (1, {'@': 162}), 7: (1, {'@': 162}), 8: (1, {'@': 162}), 9: (1, {'@': 162}), 10: (1, {'@': 162}), 11: (1, {'@': 162}), 12: (1, {'@': 162}), 13: (1, {'@': 162}), 14: (1, {'@': 162}), 15: (1, {'@': 162}), 16: (1, {'@': 162}), 17: (1, {'@': 162}), 18: (1, {'@': 162}), 0: (1, {'@': 162}), 19: (1, {'@': 162}), 20: (1, {'@': 162}), 21: (1, {'@': 162}), 22: (1, {'@': 162}), 23: (1, {'@': 162}), 1: (1, {'@': 162}), 24: (1, {'@': 162}), 25: (1, {'@': 162}), 26: (1, {'@': 162}), 27: (1, {'@': 162}), 28: (1, {'@': 162}), 29: (1, {'@': 162}), 30: (1, {'@': 162}), 31: (1, {'@': 162}), 32: (1, {'@': 162}), 33: (1, {'@': 162})}, 211: {2: (1, {'@': 58}), 17: (1, {'@': 58}), 5: (1, {'@': 58}), 18: (1, {'@': 58}), 0: (1, {'@': 58}), 7: (1, {'@': 58}), 19: (1, {'@': 58}), 8: (1, {'@': 58}), 20: (1, {'@': 58}), 21: (1, {'@': 58}), 9: (1, {'@': 58}), 10: (1, {'@': 58}), 22: (1, {'@': 58}), 23: (1, {'@': 58}), 1: (1, {'@': 58}), 11: (1, {'@': 58}), 24: (1, {'@': 58}), 12: (1, {'@': 58}), 27: (1, {'@': 58}), 28: (1, {'@': 58}), 31: (1, {'@': 58}), 32: (1, {'@': 58}), 14: (1, {'@': 58}), 33: (1, {'@': 58})}, 212: {36: (1, {'@': 196}), 34: (1, {'@': 196})}, 213: {2: (1, {'@': 72}), 17: (1, {'@': 72}), 5: (1, {'@': 72}), 18: (1, {'@': 72}), 0: (1, {'@': 72}), 7: (1, {'@': 72}), 19: (1, {'@': 72}), 8: (1, {'@': 72}), 20: (1, {'@': 72}), 21: (1, {'@': 72}), 9: (1, {'@': 72}), 10: (1, {'@': 72}), 22: (1, {'@': 72}), 23: (1, {'@': 72}), 1: (1, {'@': 72}), 11: (1, {'@': 72}), 24: (1, {'@': 72}), 12: (1, {'@': 72}), 27: (1, {'@': 72}), 28: (1, {'@': 72}), 31: (1, {'@': 72}), 32: (1, {'@': 72}), 14: (1, {'@': 72}), 33: (1, {'@': 72})}, 214: {2: (1, {'@': 96}), 17: (1, {'@': 96}), 5: (1, {'@': 96}), 18: (1, {'@': 96}), 0: (1, {'@': 96}), 7: (1, {'@': 96}), 19: (1, {'@': 96}), 8: (1, {'@': 96}), 20: (1, {'@': 96}), 21: (1, {'@': 96}), 9: (1, {'@': 96}), 10: (1, {'@': 96}), 22: (1, {'@': 96}), 23: (1, {'@': 96}), 1: (1, {'@': 96}), 11: (1, {'@': 96}), 24: (1, {'@': 96}), 12: (1, {'@': 96}), 27: (1, {'@': 96}), 28: (1, {'@': 96}), 31: (1, {'@': 96}), 32: (1, {'@': 96}), 14: (1, {'@': 96}), 33: (1, {'@': 96})}, 215: {2: (1, {'@': 69}), 17: (1, {'@': 69}), 5: (1, {'@': 69}), 18: (1, {'@': 69}), 0: (1, {'@': 69}), 7: (1, {'@': 69}), 19: (1, {'@': 69}), 8: (1, {'@': 69}), 20: (1, {'@': 69}), 21: (1, {'@': 69}), 9: (1, {'@': 69}), 10: (1, {'@': 69}), 22: (1, {'@': 69}), 23: (1, {'@': 69}), 1: (1, {'@': 69}), 11: (1, {'@': 69}), 24: (1, {'@': 69}), 12: (1, {'@': 69}), 27: (1, {'@': 69}), 28: (1, {'@': 69}), 31: (1, {'@': 69}), 32: (1, {'@': 69}), 14: (1, {'@': 69}), 33: (1, {'@': 69})}, 216: {19: (1, {'@': 190}), 9: (1, {'@': 190}), 23: (1, {'@': 190})}, 217: {42: (0, 187), 72: (0, 190), 73: (0, 141), 46: (0, 204), 23: (0, 210), 47: (0, 238), 74: (0, 240), 31: (0, 234), 49: (0, 0), 24: (0, 275), 28: (0, 100), 52: (0, 50), 53: (0, 21), 54: (0, 47), 75: (0, 59), 76: (0, 53), 58: (0, 34), 77: (0, 194), 27: (0, 195), 78: (0, 55), 56: (0, 114), 59: (0, 94), 79: (0, 154), 55: (0, 165), 12: (0, 169), 22: (0, 207), 81: (0, 211), 82: (0, 223), 60: (0, 248), 1: (0, 18), 32: (0, 29), 83: (0, 188), 48: (0, 224), 84: (0, 206), 14: (0, 198), 80: (0, 233), 85: (0, 215), 17: (0, 145), 43: (0, 172), 86: (0, 157), 44: (0, 15), 7: (0, 270), 87: (0, 166), 0: (0, 140), 50: (0, 3), 51: (0, 1), 88: (0, 265), 21: (0, 22), 89: (0, 56), 5: (0, 272), 20: (0, 6), 90: (0, 137), 11: (0, 226), 10: (0, 286), 8: (0, 276), 18: (0, 138), 91: (0, 95), 9: (0, 25), 2: (0, 116)}, 218: {34: (0, 45), 36: (1, {'@': 143})}, 219: {2: (1, {'@': 102}), 17: (1, {'@': 102}), 5: (1, {'@': 102}), 18: (1, {'@': 102}), 0: (1, {'@': 102}), 7: (1, {'@': 102}), 19: (1, {'@': 102}), 8: (1, {'@': 102}), 20: (1, {'@': 102}), 21: (1, {'@': 102}), 9: (1, {'@': 102}), 10: (1, {'@': 102}), 22: (1, {'@': 102}), 23: (1, {'@': 102}), 1: (1, {'@': 102}), 11: (1, {'@': 102}), 24: (1, {'@': 102}), 12: (1, {'@': 102}), 27: (1, {'@': 102}), 28: (1, {'@': 102}), 31: (1, {'@': 102}), 32: (1, {'@': 102}), 14: (1, {'@': 102}), 33: (1, {'@': 102})}, 220: {38: (1, {'@': 92}), 36: (1, {'@': 92})}, 221: {16: (1, {'@': 132}), 2: (1, {'@': 132}), 3: (1, {'@': 132}), 4: (1, {'@': 132}), 25: (1, {'@': 132}), 6: (1, {'@': 132}), 26: (1, {'@': 132}), 35: (1, {'@': 132}), 28: (1, {'@': 132}), 29: (1, {'@': 132}), 30: (1, {'@': 132}), 13: (1, {'@': 132}), 20: (1, {'@': 132}), 15: (1, {'@': 132}), 34: (1, {'@': 132}), 5: (1, {'@': 132}), 7: (1, {'@': 132}), 8: (1, {'@': 132}), 9: (1, {'@': 132}), 10: (1, {'@': 132}), 11: (1, {'@': 132}), 12: (1, {'@': 132}), 14: (1, {'@': 132}), 17: (1, {'@': 132}), 18: (1, {'@': 132}), 0: (1, {'@': 132}), 19: (1, {'@': 132}), 21: (1, {'@': 132}), 22: (1, {'@': 132}), 23: (1, {'@': 132}), 1: (1, {'@': 132}), 24: (1, {'@': 132}), 27: (1, {'@': 132}), 31: (1, {'@': 132}), 32: (1, {'@': 132}), 33: (1, {'@': 132}), 36: (1, {'@': 132}), 37: (1, {'@': 132}), 38: (1, {'@': 132})}, 222: {38: (1, {'@': 88}), 36: (1, {'@': 88})}, 223: {2: (1, {'@': 59}), 17: (1, {'@': 59}), 5: (1, {'@': 59}), 18: (1, {'@': 59}), 0: (1, {'@': 59}), 7: (1, {'@': 59}), 19: (1, {'@': 59}), 8: (1, {'@': 59}), 20: (1, {'@': 59}), 21: (1, {'@': 59}), 9: (1, {'@': 59}), 10: (1, {'@': 59}), 22: (1, {'@': 59}), 23: (1, {'@': 59}), 1: (1, {'@': 59}), 11: (1, {'@': 59}), 24: (1, {'@': 59}), 12: (1, {'@': 59}), 27: (1, {'@': 59}), 28: (1, {'@': 59}), 31: (1, {'@': 59}), 32: (1, {'@': 59}), 14: (1, {'@': 59}), 33: (1, {'@': 59})}, 224: {16: (1, {'@': 147}), 2: (1, {'@': 147}), 3: (1, {'@': 147}), 4: (1, {'@': 147}), 6: (1, {'@': 147}), 20: (1, {'@': 147}), 1: (1, {'@': 147}), 34: (1, {'@': 147}), 25: (1, {'@': 147}), 26: (1, {'@': 147}), 35: (1, {'@': 147}), 28: (1, {'@': 147}), 29: (1, {'@': 147}), 30: (1, {'@': 147}), 13: (1, {'@': 147}), 15: (1, {'@': 147}), 5: (1, {'@': 147}), 7: (1, {'@': 147}), 8: (1, {'@': 147}), 9: (1, {'@': 147}), 10: (1, {'@': 147}), 11: (1, {'@': 147}), 12: (1, {'@': 147}), 14: (1, {'@': 147}), 17: (1, {'@': 147}), 18: (1, {'@': 147}), 0: (1, {'@': 147}), 19: (1, {'@': 147}), 21: (1, {'@': 147}), 22: (1, {'@': 147}), 23: (1, {'@': 147}), 24: (1, {'@': 147}), 27: (1, {'@': 147}), 31: (1, {'@': 147}), 32: (1, {'@': 147}), 33: (1, {'@': 147}), 36: (1, {'@': 147}), 37: (1, {'@': 147}), 38: (1, {'@': 147})}, 225: {4: (0, 229), 30: (0, 71), 6: (1, {'@': 115}), 35: (1, {'@': 115}), 26: (1, {'@': 115}), 34: (1, {'@': 115}), 2: (1, {'@': 115}), 17: (1, {'@': 115}), 5: (1, {'@': 115}), 18: (1, {'@': 115}), 0: (1, {'@': 115}), 7: (1, {'@': 115}), 19: (1, {'@': 115}), 8: (1, {'@': 115}), 20: (1, {'@': 115}), 21: (1, {'@': 115}), 9: (1, {'@': 115}), 10: (1, {'@': 115}), 22: (1, {'@': 115}), 23: (1, {'@': 115}), 1: (1, {'@': 115}), 11: (1, {'@': 115}), 24: (1, {'@': 115}), 12: (1, {'@': 115}), 27: (1, {'@': 115}), 28: (1, {'@': 115}), 31: (1, {'@': 115}), 32: (1, {'@': 115}), 33: (1, {'@': 115}), 14: (1, {'@': 115}), 36: (1, {'@': 115}), 38: (1, {'@': 115}), 37: (1, {'@': 115})}, 226: {16: (1, {'@': 158}), 2: (1, {'@': 158}), 3: (1, {'@': 158}), 4: (1, {'@': 158}), 6: (1, {'@': 158}), 20: (1, {'@': 158}), 1: (1, {'@': 158}), 34: (1, {'@': 158}), 25: (1, {'@': 158}), 26: (1, {'@': 158}), 35: (1, {'@': 158}), 28: (1, {'@': 158}), 29: (1, {'@': 158}), 30: (1, {'@': 158}), 13: (1, {'@': 158}), 15: (1, {'@': 158}), 5: (1, {'@': 158}), 7: (1, {'@': 158}), 8: (1, {'@': 158}), 9: (1, {'@': 158}), 10: (1, {'@': 158}), 11: (1, {'@': 158}), 12: (1, {'@': 158}), 14: (1, {'@': 158}), 17: (1, {'@': 158}), 18: (1, {'@': 158}), 0: (1, {'@': 158}), 19: (1, {'@': 158}), 21: (1, {'@': 158}), 22: (1, {'@': 158}), 23: (1, {'@': 158}), 24: (1, {'@': 158}), 27: (1, {'@': 158}), 31: (1, {'@': 158}), 32: (1, {'@': 158}), 33: (1, {'@': 158}), 36: (1, {'@': 158}), 37: (1, {'@': 158}), 38: (1, {'@': 158})}, 227: {19: (0, 75)}, 228: {}, 229: {56: (0, 235), 42: (0, 187), 43: (0, 172), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 5: (0, 272), 20: (0, 6), 55: (0, 165), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 48: (0, 224), 17: (0, 145)}, 230: {0: (0, 186)}, 231: {16: (1, {'@': 165}), 2: (1, {'@': 165}), 3: (1, {'@': 165}), 4: (1, {'@': 165}), 6: (1, {'@': 165}), 20: (1, {'@': 165}), 1: (1, {'@': 165}), 34: (1, {'@': 165}), 25: (1, {'@': 165}), 26: (1, {'@': 165}), 35: (1, {'@': 165}), 28: (1, {'@': 165}), 29: (1, {'@': 165}), 30: (1, {'@': 165}), 13: (1, {'@': 165}), 15: (1, {'@': 165}), 5: (1, {'@': 165}), 7: (1, {'@': 165}), 8: (1, {'@': 165}), 9: (1, {'@': 165}), 10: (1, {'@': 165}), 11: (1, {'@': 165}), 12: (1, {'@': 165}), 14: (1, {'@': 165}), 17: (1, {'@': 165}), 18: (1, {'@': 165}), 0: (1, {'@': 165}), 19: (1, {'@': 165}), 21: (1, {'@': 165}), 22: (1, {'@': 165}), 23: (1, {'@': 165}), 24: (1, {'@': 165}), 27: (1, {'@': 165}), 31: (1, {'@': 165}), 32: (1, {'@': 165}), 33: (1, {'@': 165}), 36: (1, {'@': 165}), 37: (1, {'@': 165}), 38: (1, {'@': 165})}, 232: {42: (0, 187), 43: (0, 172), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 53: (0, 21), 5: (0, 272), 54: (0, 47), 50: (0, 20), 20: (0, 6), 55: (0, 165), 56: (0, 114), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 48: (0, 224), 17: (0, 145)}, 233: {19: (0, 2)}, 234: {42: (0, 187), 43: (0, 172), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 53: (0, 21), 5: (0, 272), 54: (0, 47), 20: (0, 6), 55: (0, 165), 56: (0, 114), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 48: (0, 224), 50: (0, 57), 17: (0, 145)}, 235: {20: (0, 72), 13: (0, 208), 15: (0, 271), 29: (0, 117), 35: (1, {'@': 119}), 30: (1, {'@': 119}), 4: (1, {'@': 119}), 6: (1, {'@': 119}), 26: (1, {'@': 119}), 34: (1, {'@': 119}), 2: (1, {'@': 119}), 17: (1, {'@': 119}), 5: (1, {'@': 119}), 18: (1, {'@': 119}), 0: (1, {'@': 119}), 7: (1, {'@': 119}), 19: (1, {'@': 119}), 8: (1, {'@': 119}), 21: (1, {'@': 119}), 9: (1, {'@': 119}), 10: (1, {'@': 119}), 22: (1, {'@': 119}), 23: (1, {'@': 119}), 1: (1, {'@': 119}), 11: (1, {'@': 119}), 24: (1, {'@': 119}), 12: (1, {'@': 119}), 27: (1, {'@': 119}), 28: (1, {'@': 119}), 31: (1, {'@': 119}), 32: (1, {'@': 119}), 33: (1, {'@': 119}), 14: (1, {'@': 119}), 36: (1, {'@': 119}), 38: (1, {'@': 119}), 37: (1, {'@': 119})}, 236: {16: (1, {'@': 137}), 2: (1, {'@': 137}), 3: (1, {'@': 137}), 4: (1, {'@': 137}), 25: (1, {'@': 137}), 6: (1, {'@': 137}), 26: (1, {'@': 137}), 35: (1, {'@': 137}), 28: (1, {'@': 137}), 29: (1, {'@': 137}), 30: (1, {'@': 137}), 13: (1, {'@': 137}), 20: (1, {'@': 137}), 15: (1, {'@': 137}), 34: (1, {'@': 137}), 5: (1, {'@': 137}), 7: (1, {'@': 137}), 8: (1, {'@': 137}), 9: (1, {'@': 137}), 10: (1, {'@': 137}), 11: (1, {'@': 137}), 12: (1, {'@': 137}), 14: (1, {'@': 137}), 17: (1, {'@': 137}), 18: (1, {'@': 137}), 0: (1, {'@': 137}), 19: (1, {'@': 137}), 21: (1, {'@': 137}), 22: (1, {'@': 137}), 23: (1, {'@': 137}), 1: (1, {'@': 137}), 24: (1, {'@': 137}), 27: (1, {'@': 137}), 31: (1, {'@': 137}), 32: (1, {'@': 137}), 33: (1, {'@': 137}), 36: (1, {'@': 137}), 37: (1, {'@': 137}), 38: (1, {'@': 137})}, 237: {35: (1, {'@': 203}), 34: (1, {'@': 203})}, 238: {16: (1, {'@': 150}), 2: (1, {'@': 150}), 3: (1, {'@': 150}), 4: (1, {'@': 150}), 6: (1, {'@': 150}), 20: (1, {'@': 150}), 1: (1, {'@': 150}), 34: (1, {'@': 150}), 25: (1, {'@': 150}), 26: (1, {'@': 150}), 35: (1, {'@': 150}), 28: (1, {'@': 150}), 29: (1, {'@': 150}), 30: (1, {'@': 150}), 13: (1, {'@': 150}), 15: (1, {'@': 150}), 5: (1, {'@': 150}), 7: (1, {'@': 150}), 8: (1, {'@': 150}), 9: (1, {'@': 150}), 10: (1, {'@': 150}), 11: (1, {'@': 150}), 12: (1, {'@': 150}), 14: (1, {'@': 150}), 17: (1, {'@': 150}), 18: (1, {'@': 150}), 0: (1, {'@': 150}), 19: (1, {'@': 150}), 21: (1, {'@': 150}), 22: (1, {'@': 150}), 23: (1, {'@': 150}), 24: (1, {'@': 150}), 27: (1, {'@': 150}), 31: (1, {'@': 150}), 32: (1, {'@': 150}), 33: (1, {'@': 150}), 36: (1, {'@': 150}), 37: (1, {'@': 150}), 38: (1, {'@': 150})}, 239: {60: (0, 142), 23: (0, 113), 61: (0, 91), 10: (0, 286), 1: (0, 19), 115: (0, 62), 64: (0, 101), 63: (0, 28), 116: (0, 222), 117: (0, 257), 17: (0, 145)}, 240: {2: (1, {'@': 63}), 17: (1, {'@': 63}), 5: (1, {'@': 63}), 18: (1, {'@': 63}), 0: (1, {'@': 63}), 7: (1, {'@': 63}), 19: (1, {'@': 63}), 8: (1, {'@': 63}), 20: (1, {'@': 63}), 21: (1, {'@': 63}), 9: (1, {'@': 63}), 10: (1, {'@': 63}), 22: (1, {'@': 63}), 23: (1, {'@': 63}), 1: (1, {'@': 63}), 11: (1, {'@': 63}), 24: (1, {'@': 63}), 12: (1, {'@': 63}), 27: (1, {'@': 63}), 28: (1, {'@': 63}), 31: (1, {'@': 63}), 32: (1, {'@': 63}), 14: (1, {'@': 63}), 33: (1, {'@': 63})}, 241: {0: (0, 43), 19: (1, {'@': 104}), 9: (1, {'@': 104}), 23: (1, {'@': 104})}, 242: {15: (1, {'@': 111}), 36: (1, {'@': 111}), 34: (1, {'@': 111}), 38: (1, {'@': 111}), 19: (1, {'@': 111}), 9: (1, {'@': 111}), 23: (1, {'@': 111})}, 243: {19: (0, 219)}, 244: {38: (0, 90)}, 245: {106: (0, 9)}, 246: {36: (0, 58)}, 247: {19: (1, {'@': 99}), 9: (1, {'@': 99}), 23: (1, {'@': 99})}, 248: {16: (1, {'@': 145}), 2: (1, {'@': 145}), 3: (1, {'@': 145}), 4: (1, {'@': 145}), 6: (1, {'@': 145}), 20: (1, {'@': 145}), 1: (1, {'@': 145}), 34: (1, {'@': 145}), 25: (1, {'@': 145}), 26: (1, {'@': 145}), 35: (1, {'@': 145}), 28: (1, {'@': 145}), 29: (1, {'@': 145}), 30: (1, {'@': 145}), 13: (1, {'@': 145}), 15: (1, {'@': 145}), 5: (1, {'@': 145}), 7: (1, {'@': 145}), 8: (1, {'@': 145}), 9: (1, {'@': 145}), 10: (1, {'@': 145}), 11: (1, {'@': 145}), 12: (1, {'@': 145}), 14: (1, {'@': 145}), 17: (1, {'@': 145}), 18: (1, {'@': 145}), 0: (1, {'@': 145}), 19: (1, {'@': 145}), 21: (1, {'@': 145}), 22: (1, {'@': 145}), 23: (1, {'@': 145}), 24: (1, {'@': 145}), 27: (1, {'@': 145}), 31: (1, {'@': 145}), 32: (1, {'@': 145}), 33: (1, {'@': 145}), 36: (1, {'@': 145}), 37: (1, {'@': 145}), 38: (1, {'@': 145})}, 249: {118: (0, 81), 34: (0, 27), 36: (1, {'@': 154})}, 250: {42: (0, 187), 43: (0, 172), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 53: (0, 21), 5: (0, 272), 54: (0, 47), 20: (0, 6), 55: (0, 165), 56: (0, 114), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 50: (0, 31), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 48: (0, 224), 17: (0, 145)}, 251: {2: (1, {'@': 83}), 17: (1, {'@': 83}), 5: (1, {'@': 83}), 18: (1, {'@': 83}), 0: (1, {'@': 83}), 7: (1, {'@': 83}), 19: (1, {'@': 83}), 8: (1, {'@': 83}), 20: (1, {'@': 83}), 21: (1, {'@': 83}), 9: (1, {'@': 83}), 10: (1, {'@': 83}), 22: (1, {'@': 83}), 23: (1, {'@': 83}), 1: (1, {'@': 83}), 11: (1, {'@': 83}), 24: (1, {'@': 83}), 12: (1, {'@': 83}), 27: (1, {'@': 83}), 28: (1, {'@': 83}), 31: (1, {'@': 83}), 32: (1, {'@': 83}), 14: (1, {'@': 83}), 33: (1, {'@': 83})}, 252: {2: (1, {'@': 77}), 17: (1, {'@': 77}), 5: (1, {'@': 77}), 18: (1, {'@': 77}), 0: (1, {'@': 77}), 7: (1, {'@': 77}), 19: (1, {'@': 77}), 8: (1, {'@': 77}), 20: (1, {'@': 77}), 21: (1, {'@': 77}), 9: (1, {'@': 77}), 10: (1, {'@': 77}), 22: (1, {'@': 77}), 23: (1, {'@': 77}), 1: (1, {'@': 77}), 11: (1, {'@': 77}), 24: (1, {'@': 77}), 12: (1, {'@': 77}), 27: (1, {'@': 77}), 28: (1, {'@': 77}), 31: (1, {'@': 77}), 32: (1, {'@': 77}), 14: (1, {'@': 77}), 33: (1, {'@': 77})}, 253: {41: (0, 32), 16: (1, {'@': 162}), 2: (1, {'@': 162}), 3: (1, {'@': 162}), 4: (1, {'@': 162}), 6: (1, {'@': 162}), 0: (1, {'@': 162}), 20: (1, {'@': 162}), 1: (1, {'@': 162}), 34: (1, {'@': 162}), 25: (1, {'@': 162}), 26: (1, {'@': 162}), 35: (1, {'@': 162}), 28: (1, {'@': 162}), 29: (1, {'@': 162}), 30: (1, {'@': 162}), 13: (1, {'@': 162}), 15: (1, {'@': 162}), 5: (1, {'@': 162}), 7: (1, {'@': 162}), 8: (1, {'@': 162}), 9: (1, {'@': 162}), 10: (1, {'@': 162}), 11: (1, {'@': 162}), 12: (1, {'@': 162}), 14: (1, {'@': 162}), 17: (1, {'@': 162}), 18: (1, {'@': 162}), 19: (1, {'@': 162}), 21: (1, {'@': 162}), 22: (1, {'@': 162}), 23: (1, {'@': 162}), 24: (1, {'@': 162}), 27: (1, {'@': 162}), 31: (1, {'@': 162}), 32: (1, {'@': 162}), 33: (1, {'@': 162}), 36: (1, {'@': 162}), 37: (1, {'@': 162}), 38: (1, {'@': 162})}, 254: {42: (0, 187), 72: (0, 190), 73: (0, 141), 46: (0, 204), 23: (0, 210), 47: (0, 238), 74: (0, 240), 31: (0, 234), 49: (0, 0), 24: (0, 275), 28: (0, 100), 52: (0, 50), 53: (0, 21), 54: (0, 47), 75: (0, 59), 76: (0, 53), 58: (0, 34), 77: (0, 194), 27: (0, 195), 78: (0, 55), 56: (0, 114), 59: (0, 94), 79: (0, 154), 55: (0, 165), 12: (0, 169), 22: (0, 207), 81: (0, 211), 82: (0, 223), 60: (0, 248), 1: (0, 18), 32: (0, 29), 83: (0, 188), 48: (0, 224), 84: (0, 206), 14: (0, 198), 85: (0, 215), 17: (0, 145), 43: (0, 172), 86: (0, 157), 44: (0, 15), 7: (0, 270), 87: (0, 166), 0: (0, 140), 50: (0, 3), 51: (0, 1), 88: (0, 265), 21: (0, 22), 89: (0, 56), 5: (0, 272), 20: (0, 6), 90: (0, 137), 11: (0, 226), 10: (0, 286), 8: (0, 276), 18: (0, 138), 91: (0, 95), 9: (0, 25), 2: (0, 116), 80: (0, 174)}, 255: {16: (1, {'@': 139}), 2: (1, {'@': 139}), 3: (1, {'@': 139}), 4: (1, {'@': 139}), 6: (1, {'@': 139}), 20: (1, {'@': 139}), 1: (1, {'@': 139}), 34: (1, {'@': 139}), 25: (1, {'@': 139}), 26: (1, {'@': 139}), 35: (1, {'@': 139}), 28: (1, {'@': 139}), 29: (1, {'@': 139}), 30: (1, {'@': 139}), 13: (1, {'@': 139}), 15: (1, {'@': 139}), 5: (1, {'@': 139}), 7: (1, {'@': 139}), 8: (1, {'@': 139}), 9: (1, {'@': 139}), 10: (1, {'@': 139}), 11: (1, {'@': 139}), 12: (1, {'@': 139}), 14: (1, {'@': 139}), 17: (1, {'@': 139}), 18: (1, {'@': 139}), 0: (1, {'@': 139}), 19: (1, {'@': 139}), 21: (1, {'@': 139}), 22: (1, {'@': 139}), 23: (1, {'@': 139}), 24: (1, {'@': 139}), 27: (1, {'@': 139}), 31: (1, {'@': 139}), 32: (1, {'@': 139}), 33: (1, {'@': 139}), 36: (1, {'@': 139}), 37: (1, {'@': 139}), 38: (1, {'@': 139})}, 256: {111: (0, 17)}, 257: {38: (0, 86)}, 258: {42: (0, 187), 44: (0, 15), 20: (0, 6), 10: (0, 286), 23: (0, 253), 46: (0, 204), 22: (0, 207), 11: (0, 226), 47: (0, 238), 60: (0, 248), 1: (0, 18), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 2: (0, 116), 52: (0, 50), 17: (0, 145), 5: (0, 272), 48: (0, 224), 58: (0, 34), 59: (0, 148)}, 259: {35: (0, 236)}, 260: {15: (0, 242)}, 261: {4: (0, 229), 30: (0, 71), 6: (1, {'@': 116}), 35: (1, {'@': 116}), 26: (1, {'@': 116}), 34: (1, {'@': 116}), 2: (1, {'@': 116}), 17: (1, {'@': 116}), 5: (1, {'@': 116}), 18: (1, {'@': 116}), 0: (1, {'@': 116}), 7: (1, {'@': 116}), 19: (1, {'@': 116}), 8: (1, {'@': 116}), 20: (1, {'@': 116}), 21: (1, {'@': 116}), 9: (1, {'@': 116}), 10: (1, {'@': 116}), 22: (1, {'@': 116}), 23: (1, {'@': 116}), 1: (1, {'@': 116}), 11: (1, {'@': 116}), 24: (1, {'@': 116}), 12: (1, {'@': 116}), 27: (1, {'@': 116}), 28: (1, {'@': 116}), 31: (1, {'@': 116}), 32: (1, {'@': 116}), 33: (1, {'@': 116}), 14: (1, {'@': 116}), 36: (1, {'@': 116}), 38: (1, {'@': 116}), 37: (1, {'@': 116})}, 262: {40: (0, 109), 23: (0, 98)}, 263: {36: (0, 255)}, 264: {42: (0, 187), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 5: (0, 272), 20: (0, 6), 55: (0, 42), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 48: (0, 224), 17: (0, 145)}, 265: {19: (1, {'@': 53})}, 266: {36: (1, {'@': 199}), 34: (1, {'@': 199})}, 267: {42: (0, 187), 72: (0, 190), 73: (0, 141), 46: (0, 204), 23: (0, 210), 47: (0, 238), 74: (0, 240), 31: (0, 234), 49: (0, 0), 24: (0, 275), 28: (0, 100), 52: (0, 50), 53: (0, 21), 54: (0, 47), 75: (0, 59), 76: (0, 53), 58: (0, 34), 77: (0, 194), 27: (0, 195), 78: (0, 55), 56: (0, 114), 59: (0, 94), 79: (0, 154), 55: (0, 165), 12: (0, 169), 22: (0, 207), 81: (0, 211), 82: (0, 223), 60: (0, 248), 1: (0, 18), 80: (0, 133), 32: (0, 29), 83: (0, 188), 48: (0, 224), 84: (0, 206), 14: (0, 198), 85: (0, 215), 17: (0, 145), 43: (0, 172), 86: (0, 157), 44: (0, 15), 7: (0, 270), 87: (0, 166), 0: (0, 140), 50: (0, 3), 51: (0, 1), 88: (0, 265), 21: (0, 22), 89: (0, 56), 5: (0, 272), 20: (0, 6), 90: (0, 137), 11: (0, 226), 10: (0, 286), 8: (0, 276), 18: (0, 138), 91: (0, 95), 9: (0, 25), 2: (0, 116)}, 268: {42: (0, 187), 72: (0, 190), 73: (0, 141), 46: (0, 204), 23: (0, 210), 47: (0, 238), 119: (0, 228), 74: (0, 240), 31: (0, 234), 49: (0, 0), 24: (0, 275), 28: (0, 100), 52: (0, 50), 53: (0, 21), 54: (0, 47), 75: (0, 59), 76: (0, 53), 58: (0, 34), 77: (0, 194), 27: (0, 195), 78: (0, 55), 56: (0, 114), 59: (0, 94), 79: (0, 154), 55: (0, 165), 12: (0, 169), 22: (0, 207), 81: (0, 211), 82: (0, 223), 60: (0, 248), 1: (0, 18), 32: (0, 29), 83: (0, 188), 48: (0, 224), 84: (0, 206), 14: (0, 198), 85: (0, 215), 17: (0, 145), 43: (0, 172), 86: (0, 157), 44: (0, 15), 7: (0, 270), 87: (0, 166), 0: (0, 140), 50: (0, 3), 51: (0, 1), 21: (0, 22), 89: (0, 56), 5: (0, 272), 20: (0, 6), 90: (0, 137), 88: (0, 7), 11: (0, 226), 10: (0, 286), 8: (0, 276), 18: (0, 138), 91: (0, 95), 9: (0, 25), 2: (0, 116)}, 269: {60: (0, 142), 23: (0, 113), 61: (0, 91), 10: (0, 286), 1: (0, 19), 115: (0, 62), 63: (0, 28), 64: (0, 101), 117: (0, 139), 116: (0, 222), 17: (0, 145)}, 270: {42: (0, 187), 43: (0, 172), 44: (0, 15), 46: (0, 204), 23: (0, 93), 47: (0, 238), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 53: (0, 21), 5: (0, 272), 54: (0, 47), 20: (0, 6), 55: (0, 165), 56: (0, 114), 58: (0, 34), 11: (0, 226), 17: (0, 145), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 50: (0, 112), 2: (0, 116), 90: (0, 107), 48: (0, 224)}, 271: {42: (0, 187), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 43: (0, 277), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 5: (0, 272), 20: (0, 6), 55: (0, 165), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 48: (0, 224), 17: (0, 145)}, 272: {42: (0, 187), 44: (0, 15), 20: (0, 6), 10: (0, 286), 59: (0, 85), 23: (0, 253), 46: (0, 204), 22: (0, 207), 47: (0, 238), 11: (0, 226), 60: (0, 248), 1: (0, 18), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 2: (0, 116), 52: (0, 50), 5: (0, 272), 48: (0, 224), 58: (0, 34), 17: (0, 145)}, 273: {42: (0, 187), 43: (0, 172), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 53: (0, 21), 5: (0, 272), 54: (0, 47), 20: (0, 6), 55: (0, 165), 56: (0, 114), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 50: (0, 213), 48: (0, 224), 17: (0, 145)}, 274: {42: (0, 187), 72: (0, 190), 73: (0, 141), 46: (0, 204), 23: (0, 210), 47: (0, 238), 74: (0, 240), 31: (0, 234), 49: (0, 0), 24: (0, 275), 28: (0, 100), 52: (0, 50), 53: (0, 21), 54: (0, 47), 75: (0, 59), 76: (0, 53), 58: (0, 34), 77: (0, 194), 27: (0, 195), 78: (0, 55), 56: (0, 114), 59: (0, 94), 79: (0, 154), 55: (0, 165), 12: (0, 169), 22: (0, 207), 81: (0, 211), 82: (0, 223), 60: (0, 248), 1: (0, 18), 32: (0, 29), 83: (0, 188), 48: (0, 224), 84: (0, 206), 14: (0, 198), 85: (0, 215), 17: (0, 145), 43: (0, 172), 86: (0, 157), 44: (0, 15), 7: (0, 270), 87: (0, 166), 0: (0, 140), 50: (0, 3), 80: (0, 163), 51: (0, 1), 88: (0, 265), 21: (0, 22), 89: (0, 56), 5: (0, 272), 20: (0, 6), 90: (0, 137), 11: (0, 226), 10: (0, 286), 8: (0, 276), 18: (0, 138), 91: (0, 95), 9: (0, 25), 2: (0, 116)}, 275: {50: (0, 105), 42: (0, 187), 43: (0, 172), 44: (0, 15), 46: (0, 204), 23: (0, 253), 47: (0, 238), 0: (0, 140), 49: (0, 129), 51: (0, 1), 28: (0, 100), 52: (0, 50), 53: (0, 21), 5: (0, 272), 54: (0, 47), 20: (0, 6), 55: (0, 165), 56: (0, 114), 58: (0, 34), 11: (0, 226), 59: (0, 94), 10: (0, 286), 22: (0, 207), 60: (0, 248), 1: (0, 18), 2: (0, 116), 48: (0, 224), 17: (0, 145)}, 276: {23: (0, 159)}, 277: {2: (0, 180), 28: (0, 264), 4: (1, {'@': 121}), 6: (1, {'@': 121}), 26: (1, {'@': 121}), 35: (1, {'@': 121}), 29: (1, {'@': 121}), 30: (1, {'@': 121}), 13: (1, {'@': 121}), 20: (1, {'@': 121}), 15: (1, {'@': 121}), 34: (1, {'@': 121}), 5: (1, {'@': 121}), 7: (1, {'@': 121}), 8: (1, {'@': 121}), 9: (1, {'@': 121}), 10: (1, {'@': 121}), 11: (1, {'@': 121}), 12: (1, {'@': 121}), 14: (1, {'@': 121}), 17: (1, {'@': 121}), 18: (1, {'@': 121}), 0: (1, {'@': 121}), 19: (1, {'@': 121}), 21: (1, {'@': 121}), 22: (1, {'@': 121}), 23: (1, {'@': 121}), 1: (1, {'@': 121}), 24: (1, {'@': 121}), 27: (1, {'@': 121}), 31: (1, {'@': 121}), 32: (1, {'@': 121}), 33: (1, {'@': 121}), 36: (1, {'@': 121}), 37: (1, {'@': 121}), 38: (1, {'@': 121})}, 278: {1: (0, 37)}, 279: {23: (0, 245), 109: (0, 69)}, 280: {36: (1, {'@': 110}), 34: (1, {'@': 110})}, 281: {2: (0, 180), 28: (0, 264), 4: (1, {'@': 124}), 6: (1, {'@': 124}), 26: (1, {'@': 124}), 35: (1, {'@': 124}), 29: (1, {'@': 124}), 30: (1, {'@': 124}), 13: (1, {'@': 124}), 20: (1, {'@': 124}), 15: (1, {'@': 124}), 34: (1, {'@': 124}), 5: (1, {'@': 124}), 7: (1, {'@': 124}), 8: (1, {'@': 124}), 9: (1, {'@': 124}), 10: (1, {'@': 124}), 11: (1, {'@': 124}), 12: (1, {'@': 124}), 14: (1, {'@': 124}), 17: (1, {'@': 124}), 18: (1, {'@': 124}), 0: (1, {'@': 124}), 19: (1, {'@': 124}), 21: (1, {'@': 124}), 22: (1, {'@': 124}), 23: (1, {'@': 124}), 1: (1, {'@': 124}), 24: (1, {'@': 124}), 27: (1, {'@': 124}), 31: (1, {'@': 124}), 32: (1, {'@': 124}), 33: (1, {'@': 124}), 36: (1, {'@': 124}), 37: (1, {'@': 124}), 38: (1, {'@': 124})}, 282: {114: (0, 104), 65: (0, 239), 9: (0, 131), 19: (1, {'@': 84})}, 283: {42: (0, 187), 72: (0, 190), 73: (0, 141), 46: (0, 204), 23: (0, 210), 47: (0, 238), 74: (0, 240), 31: (0, 234), 49: (0, 0), 24: (0, 275), 28: (0, 100), 52: (0, 50), 53: (0, 21), 54: (0, 47), 75: (0, 59), 76: (0, 53), 58: (0, 34), 77: (0, 194), 27: (0, 195), 78: (0, 55), 56: (0, 114), 59: (0, 94), 79: (0, 154), 55: (0, 165), 12: (0, 169), 22: (0, 207), 81: (0, 211), 82: (0, 223), 60: (0, 248), 1: (0, 18), 32: (0, 29), 83: (0, 188), 80: (0, 149), 48: (0, 224), 84: (0, 206), 14: (0, 198), 85: (0, 215), 17: (0, 145), 43: (0, 172), 86: (0, 157), 44: (0, 15), 7: (0, 270), 87: (0, 166), 0: (0, 140), 50: (0, 3), 51: (0, 1), 88: (0, 265), 21: (0, 22), 89: (0, 56), 5: (0, 272), 20: (0, 6), 90: (0, 137), 11: (0, 226), 10: (0, 286), 8: (0, 276), 18: (0, 138), 91: (0, 95), 9: (0, 25), 2: (0, 116)}, 284: {16: (1, {'@': 163}), 2: (1, {'@': 163}), 3: (1, {'@': 163}), 4: (1, {'@': 163}), 6: (1, {'@': 163}), 20: (1, {'@': 163}), 1: (1, {'@': 163}), 34: (1, {'@': 163}), 25: (1, {'@': 163}), 26: (1, {'@': 163}), 35: (1, {'@': 163}), 28: (1, {'@': 163}), 29: (1, {'@': 163}), 30: (1, {'@': 163}), 13: (1, {'@': 163}), 15: (1, {'@': 163}), 5: (1, {'@': 163}), 7: (1, {'@': 163}), 8: (1, {'@': 163}), 9: (1, {'@': 163}), 10: (1, {'@': 163}), 11: (1, {'@': 163}), 12: (1, {'@': 163}), 14: (1, {'@': 163}), 17: (1, {'@': 163}), 18: (1, {'@': 163}), 0: (1, {'@': 163}), 19: (1, {'@': 163}), 21: (1, {'@': 163}), 22: (1, {'@': 163}), 23: (1, {'@': 163}), 24: (1, {'@': 163}), 27: (1, {'@': 163}), 31: (1, {'@': 163}), 32: (1, {'@': 163}), 33: (1, {'@': 163}), 36: (1, {'@': 163}), 37: (1, {'@': 163}), 38: (1, {'@': 163})}, 285: {2: (1, {'@': 107}), 17: (1, {'@': 107}), 5: (1, {'@': 107}), 18: (1, {'@': 107}), 0: (1, {'@': 107}), 7: (1, {'@': 107}), 19: (1, {'@': 107}), 8: (1, {'@': 107}), 20: (1, {'@': 107}), 21: (1, {'@': 107}), 9: (1, {'@': 107}), 10: (1, {'@': 107}), 22: (1, {'@': 107}), 23: (1, {'@': 107}), 1: (1, {'@': 107}), 11: (1, {'@': 107}), 24: (1, {'@': 107}), 12: (1, {'@': 107}), 27: (1, {'@': 107}), 28: (1, {'@': 107}), 31: (1, {'@': 107}), 32: (1, {'@': 107}), 14: (1, {'@': 107}), 33: (1, {'@': 107})}, 286: {16: (1, {'@': 156}), 2: (1, {'@': 156}), 3: (1, {'@': 156}), 4: (1, {'@': 156}), 6: (1, {'@': 156}), 20: (1, {'@': 156}), 1: (1, {'@': 156}), 34: (1, {'@': 156}), 25: (1, {'@': 156}), 26: (1, {'@': 156}), 35: (1, {'@': 156}), 28: (1, {'@': 156}), 29: (1, {'@': 156}), 30: (1, {'@': 156}), 13: (1, {'@': 156}), 15: (1, {'@': 156}), 5: (1, {'@': 156}), 7: (1, {'@': 156}), 8: (1, {'@': 156}), 9: (1, {'@': 156}), 10: (1, {'@': 156}), 11: (1, {'@': 156}), 12: (1, {'@': 156}), 14: (1, {'@': 156}), 17: (1, {'@': 156}), 18: (1, {'@': 156}), 0: (1, {'@': 156}), 19: (1, {'@': 156}), 21: (1, {'@': 156}), 22: (1, {'@': 156}), 23: (1, {'@': 156}), 24: (1, {'@': 156}), 27: (1, {'@': 156}), 31: (1, {'@': 156}), 32: (1, {'@': 156}), 33: (1, {'@': 156}), 36: (1, {'@': 156}), 37: (1, {'@': 156}), 38: (1, {'@': 156})}, 287: {19: (0, 182)}}, 'start_states': {'start': 268}, 'end_states': {'start': 228}}, '__type__': 'ParsingFrontend'}, 'rules': [{'@': 51}, {'@': 52}, {'@': 53}, {'@': 54}, {'@': 55}, {'@': 56}, {'@': 57}, {'@': 58}, {'@': 59}, {'@': 60}, {'@': 61}, {'@': 62}, {'@': 63}, {'@': 64}, {'@': 65}, {'@': 66}, {'@': 67}, {'@': 68}, {'@': 69}, {'@': 70}, {'@': 71}, {'@': 72}, {'@': 73}, {'@': 74}, {'@': 75}, {'@': 76}, {'@': 77}, {'@': 78}, {'@': 79}, {'@': 80}, {'@': 81}, {'@': 82}, {'@': 83}, {'@': 84}, {'@': 85}, {'@': 86}, {'@': 87}, {'@': 88}, {'@': 89}, {'@': 90}, {'@': 91}, {'@': 92}, {'@': 93}, {'@': 94}, {'@': 95}, {'@': 96}, {'@': 97}, {'@': 98}, {'@': 99}, {'@': 100}, {'@': 101}, {'@': 102}, {'@': 103}, {'@': 104}, {'@': 105}, {'@': 106}, {'@': 107}, {'@': 108}, {'@': 109}, {'@': 110}, {'@': 111}, {'@': 112}, {'@': 113}, {'@': 114}, {'@': 115}, {'@': 116}, {'@': 117}, {'@': 118}, {'@': 119}, {'@': 120}, {'@': 121}, {'@': 122}, {'@': 123}, {'@': 124}, {'@': 125}, {'@': 126}, {'@': 127}, {'@': 128}, {'@': 129}, {'@': 130}, {'@': 131}, {'@': 132}, {'@': 133}, {'@': 134}, {'@': 135}, {'@': 136}, {'@': 137}, {'@': 138}, {'@': 139}, {'@': 140}, {'@': 141}, {'@': 142}, {'@': 143}, {'@': 144}, {'@': 145}, {'@': 146}, {'@': 147}, {'@': 148}, {'@': 149}, {'@': 150}, {'@': 151}, {'@': 152}, {'@': 153}, {'@': 154}, {'@': 155}, {'@': 156}, {'@': 157}, {'@': 158}, {'@': 159}, {'@': 160}, {'@': 161}, {'@': 162}, {'@': 163}, {'@': 164}, {'@': 165}, {'@': 166}, {'@': 167}, {'@': 168}, {'@': 169}, {'@': 170}, {'@': 171}, {'@': 172}, {'@': 173}, {'@': 174}, {'@': 175}, {'@': 176}, {'@': 177}, {'@': 178}, {'@': 179}, {'@': 180}, {'@': 181}, {'@': 182}, {'@': 183}, {'@': 184}, {'@': 185}, {'@': 186}, {'@': 187}, {'@': 188}, {'@': 189}, {'@': 190}, {'@': 191}, {'@': 192}, {'@': 193}, {'@': 194}, {'@': 195}, {'@': 196}, {'@': 197}, {'@': 198}, {'@': 199}, {'@': 200}, {'@': 201}, {'@': 202}, {'@': 203}, {'@': 204}, {'@': 205}], 'options': {'debug': False, 'strict': False, 'keep_all_tokens': False, 'tree_class': None, 'cache': False, 'postlex': None, 'parser': 'lalr', 'lexer': 'contextual', 'transformer': None, 'start': ['start'], 'priority': 'normal', 'ambiguity': 'auto', 'regex': False, 'propagate_positions': False, 'lexer_callbacks': {}, 'maybe_placeholders': False, 'edit_terminals': None, 'g_regex_flags': 0, 'use_bytes': False, 'ordered_sets': True, 'import_paths': [], 'source_path': None, '_plugins': {}}, '__type__': 'Lark'}
 )
 MEMO = (
-{0: {'name': 'INT', 'pattern': {'value': '(?:[0-9])+', 'flags': [], 'raw': None, '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 1: {'name': 'IDENTIFIER', 'pattern': {'value': '(?:(?:[A-Z]|[a-z])|_)(?:(?:(?:[A-Z]|[a-z])|[0-9]|_))*', 'flags': [], 'raw': None, '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 2: {'name': '_NL', 'pattern': {'value': '(?:(?:\r)?\n)+', 'flags': [], 'raw': None, '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 3: {'name': '__IGNORE_0', 'pattern': {'value': ' ', 'flags': [], 'raw': '" "', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 4: {'name': '__IGNORE_1', 'pattern': {'value': '\t', 'flags': [], 'raw': '"\\t"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 5: {'name': 'COMMENT', 'pattern': {'value': '//(?:[^\n])*', 'flags': [], 'raw': None, '_width': [2, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 6: {'name': 'TRUE', 'pattern': {'value': 'true', 'flags': [], 'raw': '"true"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 7: {'name': 'FALSE', 'pattern': {'value': 'false', 'flags': [], 'raw': '"false"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 8: {'name': 'STRING', 'pattern': {'value': '".*?"', 'flags': [], 'raw': None, '_width': [2, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 9: {'name': 'LET', 'pattern': {'value': 'let', 'flags': [], 'raw': '"let"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 10: {'name': 'EQUAL', 'pattern': {'value': '=', 'flags': [], 'raw': '"="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 11: {'name': 'LSQB', 'pattern': {'value': '[', 'flags': [], 'raw': '"["', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 12: {'name': 'RSQB', 'pattern': {'value': ']', 'flags': [], 'raw': '"]"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 13: {'name': 'PRINT', 'pattern': {'value': 'print', 'flags': [], 'raw': '"print"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 14: {'name': 'IF', 'pattern': {'value': 'if', 'flags': [], 'raw': '"if"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 15: {'name': 'LBRACE', 'pattern': {'value': '{', 'flags': [], 'raw': '"{"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 16: {'name': 'RBRACE', 'pattern': {'value': '}', 'flags': [], 'raw': '"}"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 17: {'name': 'ELIF', 'pattern': {'value': 'elif', 'flags': [], 'raw': '"elif"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 18: {'name': 'ELSE', 'pattern': {'value': 'else', 'flags': [], 'raw': '"else"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 19: {'name': 'MATCH', 'pattern': {'value': 'match', 'flags': [], 'raw': '"match"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 20: {'name': 'CASE', 'pattern': {'value': 'case', 'flags': [], 'raw': '"case"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 21: {'name': '__ANON_0', 'pattern': {'value': '::', 'flags': [], 'raw': '"::"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 22: {'name': 'LPAR', 'pattern': {'value': '(', 'flags': [], 'raw': '"("', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 23: {'name': 'RPAR', 'pattern': {'value': ')', 'flags': [], 'raw': '")"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 24: {'name': 'UNDERSCORE', 'pattern': {'value': '_', 'flags': [], 'raw': '"_"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 25: {'name': 'WHILE', 'pattern': {'value': 'while', 'flags': [], 'raw': '"while"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 26: {'name': 'FOR', 'pattern': {'value': 'for', 'flags': [], 'raw': '"for"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 27: {'name': 'IN', 'pattern': {'value': 'in', 'flags': [], 'raw': '"in"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 28: {'name': '__ANON_1', 'pattern': {'value': '..', 'flags': [], 'raw': '".."', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 29: {'name': 'STRUCT', 'pattern': {'value': 'struct', 'flags': [], 'raw': '"struct"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 30: {'name': 'COLON', 'pattern': {'value': ':', 'flags': [], 'raw': '":"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 31: {'name': 'DOT', 'pattern': {'value': '.', 'flags': [], 'raw': '"."', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 32: {'name': 'ENUM', 'pattern': {'value': 'enum', 'flags': [], 'raw': '"enum"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 33: {'name': 'FN', 'pattern': {'value': 'fn', 'flags': [], 'raw': '"fn"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 34: {'name': '__ANON_2', 'pattern': {'value': '->', 'flags': [], 'raw': '"->"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 35: {'name': 'COMMA', 'pattern': {'value': ',', 'flags': [], 'raw': '","', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 36: {'name': 'LESSTHAN', 'pattern': {'value': '<', 'flags': [], 'raw': '"<"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 37: {'name': 'MORETHAN', 'pattern': {'value': '>', 'flags': [], 'raw': '">"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 38: {'name': 'RETURN', 'pattern': {'value': 'return', 'flags': [], 'raw': '"return"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 39: {'name': '__ANON_3', 'pattern': {'value': '==', 'flags': [], 'raw': '"=="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 40: {'name': '__ANON_4', 'pattern': {'value': '!=', 'flags': [], 'raw': '"!="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 41: {'name': '__ANON_5', 'pattern': {'value': '&&', 'flags': [], 'raw': '"&&"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 42: {'name': '__ANON_6', 'pattern': {'value': '||', 'flags': [], 'raw': '"||"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 43: {'name': '__ANON_7', 'pattern': {'value': '<=', 'flags': [], 'raw': '"<="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 44: {'name': '__ANON_8', 'pattern': {'value': '>=', 'flags': [], 'raw': '">="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 45: {'name': 'PLUS', 'pattern': {'value': '+', 'flags': [], 'raw': '"+"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 46: {'name': 'MINUS', 'pattern': {'value': '-', 'flags': [], 'raw': '"-"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 47: {'name': 'STAR', 'pattern': {'value': '*', 'flags': [], 'raw': '"*"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 48: {'name': 'SLASH', 'pattern': {'value': '/', 'flags': [], 'raw': '"/"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 49: {'name': 'PERCENT', 'pattern': {'value': '%', 'flags': [], 'raw': '"%"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 50: {'name': 'BANG', 'pattern': {'value': '!', 'flags': [], 'raw': '"!"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 51: {'origin': {'name': Token('RULE', 'start'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'statement_list', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 52: {'origin': {'name': Token('RULE', 'statement_list'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '__statement_list_plus_0', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 53: {'origin': {'name': Token('RULE', 'statement_block'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'statement_list', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 54: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 55: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'variable_declaration', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 56: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'assignment', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 57: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'if_chain', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 58: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'match_stmt', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 59: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'while_stmt', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 60: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'for_stmt', '__type__': 'NonTerminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 61: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'struct_stmt', '__type__': 'NonTerminal'}], 'order': 7, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 62: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'enum_stmt', '__type__': 'NonTerminal'}], 'order': 8, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 63: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'print_stmt', '__type__': 'NonTerminal'}], 'order': 9, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 64: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'index_assignment', '__type__': 'NonTerminal'}], 'order': 10, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 65: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'function_definition', '__type__': 'NonTerminal'}], 'order': 11, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 66: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'return_stmt', '__type__': 'NonTerminal'}], 'order': 12, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 67: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'for_stmt_int', '__type__': 'NonTerminal'}], 'order': 13, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 68: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'struct_access', '__type__': 'NonTerminal'}], 'order': 14, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 69: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'struct_assignment', '__type__': 'NonTerminal'}], 'order': 15, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 70: {'origin': {'name': Token('RULE', 'variable_declaration'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LET', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 71: {'origin': {'name': Token('RULE', 'assignment'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 72: {'origin': {'name': Token('RULE', 'index_assignment'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'variable', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 73: {'origin': {'name': Token('RULE', 'print_stmt'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'PRINT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 74: {'origin': {'name': Token('RULE', 'print_stmt'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'PRINT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'struct_access', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 75: {'origin': {'name': Token('RULE', 'if_chain'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'if_stmt', '__type__': 'NonTerminal'}, {'name': 'else_if_ladder', '__type__': 'NonTerminal'}, {'name': 'else_block', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 76: {'origin': {'name': Token('RULE', 'if_chain'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'if_stmt', '__type__': 'NonTerminal'}, {'name': 'else_if_ladder', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, False, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 77: {'origin': {'name': Token('RULE', 'if_chain'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'if_stmt', '__type__': 'NonTerminal'}, {'name': 'else_block', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 78: {'origin': {'name': Token('RULE', 'if_chain'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'if_stmt', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, True, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 79: {'origin': {'name': Token('RULE', 'if_stmt'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'statement_block', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 80: {'origin': {'name': Token('RULE', 'else_if_ladder'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '__else_if_ladder_plus_1', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 81: {'origin': {'name': Token('RULE', 'else_if_stmt'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ELIF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'statement_block', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 82: {'origin': {'name': Token('RULE', 'else_block'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ELSE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'statement_block', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 83: {'origin': {'name': Token('RULE', 'match_stmt'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MATCH', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'case_ladder', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 84: {'origin': {'name': Token('RULE', 'case_ladder'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '__case_ladder_plus_2', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 85: {'origin': {'name': Token('RULE', 'case_stmt'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CASE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'match_pattern', '__type__': 'NonTerminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'statement_block', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 86: {'origin': {'name': Token('RULE', 'match_pattern'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_literal', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 87: {'origin': {'name': Token('RULE', 'match_pattern'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'enum_pattern', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 88: {'origin': {'name': Token('RULE', 'match_pattern'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'enum_pattern_tuple', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 89: {'origin': {'name': Token('RULE', 'match_pattern'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'wildcard_pattern', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 90: {'origin': {'name': Token('RULE', 'match_pattern'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'array_pattern', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 91: {'origin': {'name': Token('RULE', 'enum_pattern'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__ANON_0', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 92: {'origin': {'name': Token('RULE', 'enum_pattern_tuple'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__ANON_0', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'match_pattern', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 93: {'origin': {'name': Token('RULE', 'wildcard_pattern'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'UNDERSCORE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 94: {'origin': {'name': Token('RULE', 'while_stmt'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'WHILE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'statement_block', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 95: {'origin': {'name': Token('RULE', 'for_stmt'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FOR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'IN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'statement_block', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 96: {'origin': {'name': Token('RULE', 'for_stmt_int'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FOR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'IN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': '__ANON_1', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'statement_block', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 97: {'origin': {'name': Token('RULE', 'struct_stmt'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'STRUCT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'struct_members', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 98: {'origin': {'name': Token('RULE', 'struct_members'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '__struct_members_plus_3', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 99: {'origin': {'name': Token('RULE', 'struct_member'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'type_annotation', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 100: {'origin': {'name': Token('RULE', 'struct_access'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 101: {'origin': {'name': Token('RULE', 'struct_assignment'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'struct_access', '__type__': 'NonTerminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 102: {'origin': {'name': Token('RULE', 'enum_stmt'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ENUM', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'enum_members', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 103: {'origin': {'name': Token('RULE', 'enum_members'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '__enum_members_plus_4', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 104: {'origin': {'name': Token('RULE', 'enum_member_bare'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 105: {'origin': {'name': Token('RULE', 'enum_member_tuple'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'type_annotation', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 106: {'origin': {'name': Token('RULE', 'function_definition'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'function_params', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__ANON_2', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'type_annotation', '__type__': 'NonTerminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'statement_block', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 107: {'origin': {'name': Token('RULE', 'function_definition'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__ANON_2', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'type_annotation', '__type__': 'NonTerminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'statement_block', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, False, False, True, False, False, False, False, False, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 108: {'origin': {'name': Token('RULE', 'function_params'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'function_param', '__type__': 'NonTerminal'}, {'name': '__function_params_star_5', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 109: {'origin': {'name': Token('RULE', 'function_params'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'function_param', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 110: {'origin': {'name': Token('RULE', 'function_param'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'type_annotation', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 111: {'origin': {'name': Token('RULE', 'type_annotation'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LESSTHAN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'type_annotation', '__type__': 'NonTerminal'}, {'name': 'MORETHAN', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 112: {'origin': {'name': Token('RULE', 'type_annotation'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 113: {'origin': {'name': Token('RULE', 'return_stmt'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'RETURN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 114: {'origin': {'name': Token('RULE', 'expression'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'equality', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 115: {'origin': {'name': Token('RULE', 'equality'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'logical', '__type__': 'NonTerminal'}, {'name': '__ANON_3', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'equality', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 116: {'origin': {'name': Token('RULE', 'equality'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'logical', '__type__': 'NonTerminal'}, {'name': '__ANON_4', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'equality', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 117: {'origin': {'name': Token('RULE', 'equality'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'logical', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 118: {'origin': {'name': Token('RULE', 'logical'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison', '__type__': 'NonTerminal'}, {'name': '__ANON_5', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'logical', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 119: {'origin': {'name': Token('RULE', 'logical'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison', '__type__': 'NonTerminal'}, {'name': '__ANON_6', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'logical', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 120: {'origin': {'name': Token('RULE', 'logical'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 121: {'origin': {'name': Token('RULE', 'comparison'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'term', '__type__': 'NonTerminal'}, {'name': 'MORETHAN', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'comparison', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 122: {'origin': {'name': Token('RULE', 'comparison'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'term', '__type__': 'NonTerminal'}, {'name': 'LESSTHAN', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'comparison', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 123: {'origin': {'name': Token('RULE', 'comparison'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'term', '__type__': 'NonTerminal'}, {'name': '__ANON_7', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'comparison', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 124: {'origin': {'name': Token('RULE', 'comparison'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'term', '__type__': 'NonTerminal'}, {'name': '__ANON_8', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'comparison', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 125: {'origin': {'name': Token('RULE', 'comparison'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'term', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 126: {'origin': {'name': Token('RULE', 'term'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'factor', '__type__': 'NonTerminal'}, {'name': 'PLUS', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'term', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 127: {'origin': {'name': Token('RULE', 'term'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'factor', '__type__': 'NonTerminal'}, {'name': 'MINUS', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'term', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 128: {'origin': {'name': Token('RULE', 'term'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'factor', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 129: {'origin': {'name': Token('RULE', 'factor'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unary_op', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 130: {'origin': {'name': Token('RULE', 'factor'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unary_op', '__type__': 'NonTerminal'}, {'name': 'STAR', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'factor', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 131: {'origin': {'name': Token('RULE', 'factor'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unary_op', '__type__': 'NonTerminal'}, {'name': 'SLASH', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'factor', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 132: {'origin': {'name': Token('RULE', 'factor'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unary_op', '__type__': 'NonTerminal'}, {'name': 'PERCENT', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'factor', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 133: {'origin': {'name': Token('RULE', 'unary_op'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'PLUS', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'unary_op', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 134: {'origin': {'name': Token('RULE', 'unary_op'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MINUS', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'unary_op', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 135: {'origin': {'name': Token('RULE', 'unary_op'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'BANG', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'unary_op', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 136: {'origin': {'name': Token('RULE', 'unary_op'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'indexing', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 137: {'origin': {'name': Token('RULE', 'indexing'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'function_call', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 138: {'origin': {'name': Token('RULE', 'indexing'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'function_call', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 139: {'origin': {'name': Token('RULE', 'function_call'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'variable', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'function_args', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 140: {'origin': {'name': Token('RULE', 'function_call'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'variable', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'struct_init_members', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 141: {'origin': {'name': Token('RULE', 'function_call'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'variable', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (False, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 142: {'origin': {'name': Token('RULE', 'function_call'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 143: {'origin': {'name': Token('RULE', 'function_args'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}, {'name': '__function_args_star_6', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 144: {'origin': {'name': Token('RULE', 'function_args'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 145: {'origin': {'name': Token('RULE', 'atom'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_literal', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 146: {'origin': {'name': Token('RULE', 'atom'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'int_literal', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 147: {'origin': {'name': Token('RULE', 'atom'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'string_literal', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 148: {'origin': {'name': Token('RULE', 'atom'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'array_literal', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 149: {'origin': {'name': Token('RULE', 'atom'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'enum_literal_simple', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 150: {'origin': {'name': Token('RULE', 'atom'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'enum_literal_tuple', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 151: {'origin': {'name': Token('RULE', 'atom'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 152: {'origin': {'name': Token('RULE', 'atom'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'variable', '__type__': 'NonTerminal'}], 'order': 7, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 153: {'origin': {'name': Token('RULE', 'struct_init_members'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'struct_init_member', '__type__': 'NonTerminal'}, {'name': '__struct_init_members_star_7', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 154: {'origin': {'name': Token('RULE', 'struct_init_members'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'struct_init_member', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 155: {'origin': {'name': Token('RULE', 'struct_init_member'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 156: {'origin': {'name': Token('RULE', 'bool_literal'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TRUE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 157: {'origin': {'name': Token('RULE', 'bool_literal'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FALSE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 158: {'origin': {'name': Token('RULE', 'int_literal'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'INT', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 159: {'origin': {'name': Token('RULE', 'string_literal'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 160: {'origin': {'name': Token('RULE', 'enum_literal_simple'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__ANON_0', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 161: {'origin': {'name': Token('RULE', 'enum_literal_tuple'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__ANON_0', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 162: {'origin': {'name': Token('RULE', 'variable'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 163: {'origin': {'name': Token('RULE', 'array_literal'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LESSTHAN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'type_annotation', '__type__': 'NonTerminal'}, {'name': 'MORETHAN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'array_elements', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 164: {'origin': {'name': Token('RULE', 'array_literal'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LESSTHAN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'type_annotation', '__type__': 'NonTerminal'}, {'name': 'MORETHAN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, False, False, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 165: {'origin': {'name': Token('RULE', 'array_literal'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'array_elements', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (True, False, False, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 166: {'origin': {'name': Token('RULE', 'array_literal'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (True, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 167: {'origin': {'name': Token('RULE', 'array_elements'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'array_element', '__type__': 'NonTerminal'}, {'name': '__array_elements_star_8', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 168: {'origin': {'name': Token('RULE', 'array_elements'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'array_element', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 169: {'origin': {'name': Token('RULE', 'array_element'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 170: {'origin': {'name': Token('RULE', 'array_pattern'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'array_pattern_element', '__type__': 'NonTerminal'}, {'name': '__array_pattern_star_9', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 171: {'origin': {'name': Token('RULE', 'array_pattern'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'array_pattern_element', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 172: {'origin': {'name': Token('RULE', 'array_pattern'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 173: {'origin': {'name': Token('RULE', 'array_pattern_element'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'int_literal', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 174: {'origin': {'name': Token('RULE', 'array_pattern_element'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'wildcard_pattern', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 175: {'origin': {'name': '__statement_list_plus_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'statement', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 176: {'origin': {'name': '__statement_list_plus_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': '_NL', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 177: {'origin': {'name': '__statement_list_plus_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__statement_list_plus_0', '__type__': 'NonTerminal'}, {'name': 'statement', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 178: {'origin': {'name': '__statement_list_plus_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__statement_list_plus_0', '__type__': 'NonTerminal'}, {'name': '_NL', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 179: {'origin': {'name': '__else_if_ladder_plus_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'else_if_stmt', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 180: {'origin': {'name': '__else_if_ladder_plus_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__else_if_ladder_plus_1', '__type__': 'NonTerminal'}, {'name': 'else_if_stmt', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 181: {'origin': {'name': '__case_ladder_plus_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'case_stmt', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 182: {'origin': {'name': '__case_ladder_plus_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': '_NL', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 183: {'origin': {'name': '__case_ladder_plus_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__case_ladder_plus_2', '__type__': 'NonTerminal'}, {'name': 'case_stmt', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 184: {'origin': {'name': '__case_ladder_plus_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__case_ladder_plus_2', '__type__': 'NonTerminal'}, {'name': '_NL', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 185: {'origin': {'name': '__struct_members_plus_3', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'struct_member', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 186: {'origin': {'name': '__struct_members_plus_3', '__type__': 'NonTerminal'}, 'expansion': [{'name': '_NL', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 187: {'origin': {'name': '__struct_members_plus_3', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__struct_members_plus_3', '__type__': 'NonTerminal'}, {'name': 'struct_member', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 188: {'origin': {'name': '__struct_members_plus_3', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__struct_members_plus_3', '__type__': 'NonTerminal'}, {'name': '_NL', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 189: {'origin': {'name': '__enum_members_plus_4', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'enum_member_bare', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 190: {'origin': {'name': '__enum_members_plus_4', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'enum_member_tuple', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 191: {'origin': {'name': '__enum_members_plus_4', '__type__': 'NonTerminal'}, 'expansion': [{'name': '_NL', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 192: {'origin': {'name': '__enum_members_plus_4', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__enum_members_plus_4', '__type__': 'NonTerminal'}, {'name': 'enum_member_bare', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 193: {'origin': {'name': '__enum_members_plus_4', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__enum_members_plus_4', '__type__': 'NonTerminal'}, {'name': 'enum_member_tuple', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 194: {'origin': {'name': '__enum_members_plus_4', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__enum_members_plus_4', '__type__': 'NonTerminal'}, {'name': '_NL', 'filter_out': True, '__type__': 'Terminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 195: {'origin': {'name': '__function_params_star_5', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'function_param', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 196: {'origin': {'name': '__function_params_star_5', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__function_params_star_5', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'function_param', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 197: {'origin': {'name': '__function_args_star_6', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 198: {'origin': {'name': '__function_args_star_6', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__function_args_star_6', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 199: {'origin': {'name': '__struct_init_members_star_7', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'struct_init_member', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 200: {'origin': {'name': '__struct_init_members_star_7', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__struct_init_members_star_7', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'struct_init_member', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 201: {'origin': {'name': '__array_elements_star_8', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'array_element', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 202: {'origin': {'name': '__array_elements_star_8', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__array_elements_star_8', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'array_element', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 203: {'origin': {'name': '__array_pattern_star_9', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'array_pattern_element', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 204: {'origin': {'name': '__array_pattern_star_9', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__array_pattern_star_9', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'array_pattern_element', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}}
+{0: {'name': 'INT', 'pattern': {'value': '(?:[0-9])+', 'flags': [], 'raw': None, '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 1: {'name': 'IDENTIFIER', 'pattern': {'value': '(?:(?:[A-Z]|[a-z])|_)(?:(?:(?:[A-Z]|[a-z])|[0-9]|_))*', 'flags': [], 'raw': None, '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 2: {'name': '_NL', 'pattern': {'value': '(?:(?:\r)?\n)+', 'flags': [], 'raw': None, '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 3: {'name': '__IGNORE_0', 'pattern': {'value': ' ', 'flags': [], 'raw': '" "', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 4: {'name': '__IGNORE_1', 'pattern': {'value': '\t', 'flags': [], 'raw': '"\\t"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 5: {'name': 'COMMENT', 'pattern': {'value': '//(?:[^\n])*', 'flags': [], 'raw': None, '_width': [2, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 6: {'name': 'TRUE', 'pattern': {'value': 'true', 'flags': [], 'raw': '"true"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 7: {'name': 'FALSE', 'pattern': {'value': 'false', 'flags': [], 'raw': '"false"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 8: {'name': 'STRING', 'pattern': {'value': '".*?"', 'flags': [], 'raw': None, '_width': [2, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 9: {'name': 'LET', 'pattern': {'value': 'let', 'flags': [], 'raw': '"let"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 10: {'name': 'EQUAL', 'pattern': {'value': '=', 'flags': [], 'raw': '"="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 11: {'name': 'LSQB', 'pattern': {'value': '[', 'flags': [], 'raw': '"["', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 12: {'name': 'RSQB', 'pattern': {'value': ']', 'flags': [], 'raw': '"]"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 13: {'name': 'PRINT', 'pattern': {'value': 'print', 'flags': [], 'raw': '"print"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 14: {'name': 'IF', 'pattern': {'value': 'if', 'flags': [], 'raw': '"if"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 15: {'name': 'LBRACE', 'pattern': {'value': '{', 'flags': [], 'raw': '"{"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 16: {'name': 'RBRACE', 'pattern': {'value': '}', 'flags': [], 'raw': '"}"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 17: {'name': 'ELIF', 'pattern': {'value': 'elif', 'flags': [], 'raw': '"elif"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 18: {'name': 'ELSE', 'pattern': {'value': 'else', 'flags': [], 'raw': '"else"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 19: {'name': 'MATCH', 'pattern': {'value': 'match', 'flags': [], 'raw': '"match"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 20: {'name': 'CASE', 'pattern': {'value': 'case', 'flags': [], 'raw': '"case"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 21: {'name': '__ANON_0', 'pattern': {'value': '::', 'flags': [], 'raw': '"::"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 22: {'name': 'LPAR', 'pattern': {'value': '(', 'flags': [], 'raw': '"("', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 23: {'name': 'RPAR', 'pattern': {'value': ')', 'flags': [], 'raw': '")"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 24: {'name': 'UNDERSCORE', 'pattern': {'value': '_', 'flags': [], 'raw': '"_"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 25: {'name': 'WHILE', 'pattern': {'value': 'while', 'flags': [], 'raw': '"while"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 26: {'name': 'FOR', 'pattern': {'value': 'for', 'flags': [], 'raw': '"for"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 27: {'name': 'IN', 'pattern': {'value': 'in', 'flags': [], 'raw': '"in"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 28: {'name': '__ANON_1', 'pattern': {'value': '..', 'flags': [], 'raw': '".."', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 29: {'name': 'STRUCT', 'pattern': {'value': 'struct', 'flags': [], 'raw': '"struct"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 30: {'name': 'COLON', 'pattern': {'value': ':', 'flags': [], 'raw': '":"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 31: {'name': 'DOT', 'pattern': {'value': '.', 'flags': [], 'raw': '"."', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 32: {'name': 'ENUM', 'pattern': {'value': 'enum', 'flags': [], 'raw': '"enum"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 33: {'name': 'FN', 'pattern': {'value': 'fn', 'flags': [], 'raw': '"fn"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 34: {'name': '__ANON_2', 'pattern': {'value': '->', 'flags': [], 'raw': '"->"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 35: {'name': 'COMMA', 'pattern': {'value': ',', 'flags': [], 'raw': '","', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 36: {'name': 'LESSTHAN', 'pattern': {'value': '<', 'flags': [], 'raw': '"<"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 37: {'name': 'MORETHAN', 'pattern': {'value': '>', 'flags': [], 'raw': '">"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 38: {'name': 'RETURN', 'pattern': {'value': 'return', 'flags': [], 'raw': '"return"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 39: {'name': '__ANON_3', 'pattern': {'value': '==', 'flags': [], 'raw': '"=="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 40: {'name': '__ANON_4', 'pattern': {'value': '!=', 'flags': [], 'raw': '"!="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 41: {'name': '__ANON_5', 'pattern': {'value': '&&', 'flags': [], 'raw': '"&&"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 42: {'name': '__ANON_6', 'pattern': {'value': '||', 'flags': [], 'raw': '"||"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 43: {'name': '__ANON_7', 'pattern': {'value': '<=', 'flags': [], 'raw': '"<="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 44: {'name': '__ANON_8', 'pattern': {'value': '>=', 'flags': [], 'raw': '">="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 45: {'name': 'PLUS', 'pattern': {'value': '+', 'flags': [], 'raw': '"+"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 46: {'name': 'MINUS', 'pattern': {'value': '-', 'flags': [], 'raw': '"-"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 47: {'name': 'STAR', 'pattern': {'value': '*', 'flags': [], 'raw': '"*"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 48: {'name': 'SLASH', 'pattern': {'value': '/', 'flags': [], 'raw': '"/"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 49: {'name': 'PERCENT', 'pattern': {'value': '%', 'flags': [], 'raw': '"%"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 50: {'name': 'BANG', 'pattern': {'value': '!', 'flags': [], 'raw': '"!"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 51: {'origin': {'name': Token('RULE', 'start'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'statement_list', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 52: {'origin': {'name': Token('RULE', 'statement_list'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '__statement_list_plus_0', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 53: {'origin': {'name': Token('RULE', 'statement_block'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'statement_list', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 54: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 55: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'variable_declaration', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 56: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'assignment', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 57: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'if_chain', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 58: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'match_stmt', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 59: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'while_stmt', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 60: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'for_stmt', '__type__': 'NonTerminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 61: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'struct_stmt', '__type__': 'NonTerminal'}], 'order': 7, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 62: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'enum_stmt', '__type__': 'NonTerminal'}], 'order': 8, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 63: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'print_stmt', '__type__': 'NonTerminal'}], 'order': 9, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 64: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'index_assignment', '__type__': 'NonTerminal'}], 'order': 10, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 65: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'function_definition', '__type__': 'NonTerminal'}], 'order': 11, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 66: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'return_stmt', '__type__': 'NonTerminal'}], 'order': 12, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 67: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'for_stmt_int', '__type__': 'NonTerminal'}], 'order': 13, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 68: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'struct_access', '__type__': 'NonTerminal'}], 'order': 14, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 69: {'origin': {'name': Token('RULE', 'statement'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'struct_assignment', '__type__': 'NonTerminal'}], 'order': 15, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 70: {'origin': {'name': Token('RULE', 'variable_declaration'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LET', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 71: {'origin': {'name': Token('RULE', 'assignment'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 72: {'origin': {'name': Token('RULE', 'index_assignment'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'variable', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 73: {'origin': {'name': Token('RULE', 'print_stmt'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'PRINT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 74: {'origin': {'name': Token('RULE', 'print_stmt'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'PRINT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'struct_access', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 75: {'origin': {'name': Token('RULE', 'if_chain'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'if_stmt', '__type__': 'NonTerminal'}, {'name': 'else_if_ladder', '__type__': 'NonTerminal'}, {'name': 'else_block', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 76: {'origin': {'name': Token('RULE', 'if_chain'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'if_stmt', '__type__': 'NonTerminal'}, {'name': 'else_if_ladder', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, False, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 77: {'origin': {'name': Token('RULE', 'if_chain'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'if_stmt', '__type__': 'NonTerminal'}, {'name': 'else_block', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 78: {'origin': {'name': Token('RULE', 'if_chain'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'if_stmt', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, True, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 79: {'origin': {'name': Token('RULE', 'if_stmt'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'statement_block', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 80: {'origin': {'name': Token('RULE', 'else_if_ladder'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '__else_if_ladder_plus_1', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 81: {'origin': {'name': Token('RULE', 'else_if_stmt'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ELIF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'statement_block', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 82: {'origin': {'name': Token('RULE', 'else_block'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ELSE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'statement_block', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 83: {'origin': {'name': Token('RULE', 'match_stmt'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MATCH', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'case_ladder', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 84: {'origin': {'name': Token('RULE', 'case_ladder'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '__case_ladder_plus_2', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 85: {'origin': {'name': Token('RULE', 'case_stmt'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CASE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'match_pattern', '__type__': 'NonTerminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'statement_block', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 86: {'origin': {'name': Token('RULE', 'match_pattern'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_literal', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 87: {'origin': {'name': Token('RULE', 'match_pattern'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'enum_pattern', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 88: {'origin': {'name': Token('RULE', 'match_pattern'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'enum_pattern_tuple', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 89: {'origin': {'name': Token('RULE', 'match_pattern'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'wildcard_pattern', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 90: {'origin': {'name': Token('RULE', 'match_pattern'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'array_pattern', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 91: {'origin': {'name': Token('RULE', 'enum_pattern'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__ANON_0', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 92: {'origin': {'name': Token('RULE', 'enum_pattern_tuple'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__ANON_0', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'match_pattern', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 93: {'origin': {'name': Token('RULE', 'wildcard_pattern'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'UNDERSCORE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 94: {'origin': {'name': Token('RULE', 'while_stmt'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'WHILE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'statement_block', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 95: {'origin': {'name': Token('RULE', 'for_stmt'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FOR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'IN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'statement_block', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 96: {'origin': {'name': Token('RULE', 'for_stmt_int'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FOR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'IN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': '__ANON_1', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'statement_block', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 97: {'origin': {'name': Token('RULE', 'struct_stmt'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'STRUCT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'struct_members', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 98: {'origin': {'name': Token('RULE', 'struct_members'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '__struct_members_plus_3', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 99: {'origin': {'name': Token('RULE', 'struct_member'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'type_annotation', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 100: {'origin': {'name': Token('RULE', 'struct_access'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 101: {'origin': {'name': Token('RULE', 'struct_assignment'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'struct_access', '__type__': 'NonTerminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 102: {'origin': {'name': Token('RULE', 'enum_stmt'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ENUM', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'enum_members', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 103: {'origin': {'name': Token('RULE', 'enum_members'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '__enum_members_plus_4', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 104: {'origin': {'name': Token('RULE', 'enum_member_bare'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 105: {'origin': {'name': Token('RULE', 'enum_member_tuple'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'type_annotation', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 106: {'origin': {'name': Token('RULE', 'function_definition'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'function_params', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__ANON_2', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'type_annotation', '__type__': 'NonTerminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'statement_block', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 107: {'origin': {'name': Token('RULE', 'function_definition'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__ANON_2', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'type_annotation', '__type__': 'NonTerminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'statement_block', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, False, False, True, False, False, False, False, False, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 108: {'origin': {'name': Token('RULE', 'function_params'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'function_param', '__type__': 'NonTerminal'}, {'name': '__function_params_star_5', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 109: {'origin': {'name': Token('RULE', 'function_params'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'function_param', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 110: {'origin': {'name': Token('RULE', 'function_param'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'type_annotation', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 111: {'origin': {'name': Token('RULE', 'type_annotation'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LESSTHAN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'type_annotation', '__type__': 'NonTerminal'}, {'name': 'MORETHAN', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 112: {'origin': {'name': Token('RULE', 'type_annotation'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 113: {'origin': {'name': Token('RULE', 'return_stmt'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'RETURN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 114: {'origin': {'name': Token('RULE', 'expression'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'equality', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 115: {'origin': {'name': Token('RULE', 'equality'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'equality', '__type__': 'NonTerminal'}, {'name': '__ANON_3', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'logical', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 116: {'origin': {'name': Token('RULE', 'equality'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'equality', '__type__': 'NonTerminal'}, {'name': '__ANON_4', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'logical', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 117: {'origin': {'name': Token('RULE', 'equality'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'logical', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 118: {'origin': {'name': Token('RULE', 'logical'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'logical', '__type__': 'NonTerminal'}, {'name': '__ANON_5', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'comparison', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 119: {'origin': {'name': Token('RULE', 'logical'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'logical', '__type__': 'NonTerminal'}, {'name': '__ANON_6', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'comparison', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 120: {'origin': {'name': Token('RULE', 'logical'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 121: {'origin': {'name': Token('RULE', 'comparison'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison', '__type__': 'NonTerminal'}, {'name': 'MORETHAN', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'term', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 122: {'origin': {'name': Token('RULE', 'comparison'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison', '__type__': 'NonTerminal'}, {'name': 'LESSTHAN', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'term', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 123: {'origin': {'name': Token('RULE', 'comparison'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison', '__type__': 'NonTerminal'}, {'name': '__ANON_7', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'term', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 124: {'origin': {'name': Token('RULE', 'comparison'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison', '__type__': 'NonTerminal'}, {'name': '__ANON_8', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'term', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 125: {'origin': {'name': Token('RULE', 'comparison'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'term', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 126: {'origin': {'name': Token('RULE', 'term'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'term', '__type__': 'NonTerminal'}, {'name': 'PLUS', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'factor', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 127: {'origin': {'name': Token('RULE', 'term'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'term', '__type__': 'NonTerminal'}, {'name': 'MINUS', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'factor', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 128: {'origin': {'name': Token('RULE', 'term'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'factor', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 129: {'origin': {'name': Token('RULE', 'factor'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unary_op', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 130: {'origin': {'name': Token('RULE', 'factor'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'factor', '__type__': 'NonTerminal'}, {'name': 'STAR', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'unary_op', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 131: {'origin': {'name': Token('RULE', 'factor'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'factor', '__type__': 'NonTerminal'}, {'name': 'SLASH', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'unary_op', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 132: {'origin': {'name': Token('RULE', 'factor'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'factor', '__type__': 'NonTerminal'}, {'name': 'PERCENT', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'unary_op', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 133: {'origin': {'name': Token('RULE', 'unary_op'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'PLUS', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'unary_op', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 134: {'origin': {'name': Token('RULE', 'unary_op'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MINUS', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'unary_op', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 135: {'origin': {'name': Token('RULE', 'unary_op'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'BANG', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'unary_op', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 136: {'origin': {'name': Token('RULE', 'unary_op'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'indexing', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 137: {'origin': {'name': Token('RULE', 'indexing'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'function_call', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 138: {'origin': {'name': Token('RULE', 'indexing'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'function_call', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 139: {'origin': {'name': Token('RULE', 'function_call'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'variable', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'function_args', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 140: {'origin': {'name': Token('RULE', 'function_call'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'variable', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'struct_init_members', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 141: {'origin': {'name': Token('RULE', 'function_call'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'variable', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (False, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 142: {'origin': {'name': Token('RULE', 'function_call'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 143: {'origin': {'name': Token('RULE', 'function_args'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}, {'name': '__function_args_star_6', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 144: {'origin': {'name': Token('RULE', 'function_args'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 145: {'origin': {'name': Token('RULE', 'atom'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_literal', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 146: {'origin': {'name': Token('RULE', 'atom'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'int_literal', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 147: {'origin': {'name': Token('RULE', 'atom'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'string_literal', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 148: {'origin': {'name': Token('RULE', 'atom'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'array_literal', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 149: {'origin': {'name': Token('RULE', 'atom'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'enum_literal_simple', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 150: {'origin': {'name': Token('RULE', 'atom'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'enum_literal_tuple', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 151: {'origin': {'name': Token('RULE', 'atom'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 152: {'origin': {'name': Token('RULE', 'atom'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'variable', '__type__': 'NonTerminal'}], 'order': 7, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 153: {'origin': {'name': Token('RULE', 'struct_init_members'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'struct_init_member', '__type__': 'NonTerminal'}, {'name': '__struct_init_members_star_7', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 154: {'origin': {'name': Token('RULE', 'struct_init_members'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'struct_init_member', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 155: {'origin': {'name': Token('RULE', 'struct_init_member'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 156: {'origin': {'name': Token('RULE', 'bool_literal'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TRUE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 157: {'origin': {'name': Token('RULE', 'bool_literal'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FALSE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 158: {'origin': {'name': Token('RULE', 'int_literal'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'INT', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 159: {'origin': {'name': Token('RULE', 'string_literal'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 160: {'origin': {'name': Token('RULE', 'enum_literal_simple'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__ANON_0', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 161: {'origin': {'name': Token('RULE', 'enum_literal_tuple'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__ANON_0', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 162: {'origin': {'name': Token('RULE', 'variable'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 163: {'origin': {'name': Token('RULE', 'array_literal'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LESSTHAN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'type_annotation', '__type__': 'NonTerminal'}, {'name': 'MORETHAN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'array_elements', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 164: {'origin': {'name': Token('RULE', 'array_literal'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LESSTHAN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'type_annotation', '__type__': 'NonTerminal'}, {'name': 'MORETHAN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, False, False, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 165: {'origin': {'name': Token('RULE', 'array_literal'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'array_elements', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (True, False, False, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 166: {'origin': {'name': Token('RULE', 'array_literal'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (True, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 167: {'origin': {'name': Token('RULE', 'array_elements'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'array_element', '__type__': 'NonTerminal'}, {'name': '__array_elements_star_8', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 168: {'origin': {'name': Token('RULE', 'array_elements'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'array_element', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 169: {'origin': {'name': Token('RULE', 'array_element'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 170: {'origin': {'name': Token('RULE', 'array_pattern'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'array_pattern_element', '__type__': 'NonTerminal'}, {'name': '__array_pattern_star_9', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 171: {'origin': {'name': Token('RULE', 'array_pattern'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'array_pattern_element', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 172: {'origin': {'name': Token('RULE', 'array_pattern'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 173: {'origin': {'name': Token('RULE', 'array_pattern_element'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'int_literal', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 174: {'origin': {'name': Token('RULE', 'array_pattern_element'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'wildcard_pattern', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 175: {'origin': {'name': Token('RULE', 'array_pattern_element'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'array_pattern', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 176: {'origin': {'name': '__statement_list_plus_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'statement', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 177: {'origin': {'name': '__statement_list_plus_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': '_NL', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 178: {'origin': {'name': '__statement_list_plus_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__statement_list_plus_0', '__type__': 'NonTerminal'}, {'name': 'statement', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 179: {'origin': {'name': '__statement_list_plus_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__statement_list_plus_0', '__type__': 'NonTerminal'}, {'name': '_NL', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 180: {'origin': {'name': '__else_if_ladder_plus_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'else_if_stmt', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 181: {'origin': {'name': '__else_if_ladder_plus_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__else_if_ladder_plus_1', '__type__': 'NonTerminal'}, {'name': 'else_if_stmt', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 182: {'origin': {'name': '__case_ladder_plus_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'case_stmt', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 183: {'origin': {'name': '__case_ladder_plus_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': '_NL', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 184: {'origin': {'name': '__case_ladder_plus_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__case_ladder_plus_2', '__type__': 'NonTerminal'}, {'name': 'case_stmt', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 185: {'origin': {'name': '__case_ladder_plus_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__case_ladder_plus_2', '__type__': 'NonTerminal'}, {'name': '_NL', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 186: {'origin': {'name': '__struct_members_plus_3', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'struct_member', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 187: {'origin': {'name': '__struct_members_plus_3', '__type__': 'NonTerminal'}, 'expansion': [{'name': '_NL', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 188: {'origin': {'name': '__struct_members_plus_3', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__struct_members_plus_3', '__type__': 'NonTerminal'}, {'name': 'struct_member', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 189: {'origin': {'name': '__struct_members_plus_3', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__struct_members_plus_3', '__type__': 'NonTerminal'}, {'name': '_NL', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 190: {'origin': {'name': '__enum_members_plus_4', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'enum_member_bare', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 191: {'origin': {'name': '__enum_members_plus_4', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'enum_member_tuple', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 192: {'origin': {'name': '__enum_members_plus_4', '__type__': 'NonTerminal'}, 'expansion': [{'name': '_NL', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 193: {'origin': {'name': '__enum_members_plus_4', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__enum_members_plus_4', '__type__': 'NonTerminal'}, {'name': 'enum_member_bare', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 194: {'origin': {'name': '__enum_members_plus_4', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__enum_members_plus_4', '__type__': 'NonTerminal'}, {'name': 'enum_member_tuple', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 195: {'origin': {'name': '__enum_members_plus_4', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__enum_members_plus_4', '__type__': 'NonTerminal'}, {'name': '_NL', 'filter_out': True, '__type__': 'Terminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 196: {'origin': {'name': '__function_params_star_5', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'function_param', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 197: {'origin': {'name': '__function_params_star_5', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__function_params_star_5', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'function_param', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 198: {'origin': {'name': '__function_args_star_6', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 199: {'origin': {'name': '__function_args_star_6', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__function_args_star_6', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 200: {'origin': {'name': '__struct_init_members_star_7', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'struct_init_member', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 201: {'origin': {'name': '__struct_init_members_star_7', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__struct_init_members_star_7', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'struct_init_member', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 202: {'origin': {'name': '__array_elements_star_8', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'array_element', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 203: {'origin': {'name': '__array_elements_star_8', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__array_elements_star_8', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'array_element', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 204: {'origin': {'name': '__array_pattern_star_9', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'array_pattern_element', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 205: {'origin': {'name': '__array_pattern_star_9', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__array_pattern_star_9', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'array_pattern_element', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}}
 )
 Shift = 0
 Reduce = 1
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import abc
+import functools
+import weakref
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, TypeAlias
+from typing import TYPE_CHECKING, Any
 from typing_extensions import override
 
 
@@ -14,11 +17,101 @@ class Type:
     def name(self) -> str:
         return type(self).__name__
 
+    @override
+    def __reduce__(self) -> str | tuple[Any, ...]:
+        # The primitive types are singletons compared by identity, so they
+        # are pickled as a reference to the module level instance.
+        return type(self).__name__.upper()
+
+
+# Weak, so that the types of programs that are no longer around (like old
+# versions of a document in the language server) are not kept alive.
+_INTERNED: weakref.WeakValueDictionary[tuple[Any, ...], Interned] = (
+    weakref.WeakValueDictionary()
+)
+
+
+class _InternedMeta(type):
+    """
+    Creating an interned type returns the existing instance if a
+    structurally equal one was created before. The lookup happens before
+    the instance is built, so that repeatedly creating a common type like
+    `Array(INT)` does not allocate.
+    """
+
+    @override
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        if kwargs:
+            fields: tuple[str, ...] = getattr(cls, "__match_args__")
+            args += tuple(kwargs[name] for name in fields[len(args) :])
+
+        key: tuple[Any, ...] = getattr(cls, "key")(*args)
+        ty = _INTERNED.get(key)
+        if ty is None:
+            ty = _INTERNED[key] = super().__call__(*args)
+        return ty
+
+
+class Interned(Type, metaclass=_InternedMeta):
+    """
+    Base class of the types made up of other types. These are hash-consed:
+    structurally equal types are the same object, so they are compared and
+    hashed by identity (the subclasses are declared with `eq=False`) and
+    never have to be walked by the typechecker. Instances must not be
+    mutated after they are created.
+    """
+
+    @staticmethod
+    @abc.abstractmethod
+    def key(*args: Any, **kwargs: Any) -> tuple[Any, ...]:
+        """
+        Identifies the type built from the constructor arguments args among
+        all interned types. Component types are interned themselves and can
+        be part of the key as is.
+        """
+
+    @functools.cached_property
+    def poisoned(self) -> bool:
+        """
+        Whether the type is made up of the poison type. Types are immutable,
+        so this is only worked out once per type.
+        """
+        match self:
+            case Array(ty=inner):
+                return is_poisoned(inner)
+            case Function(arguments=args, return_type=ret):
+                return any(map(is_poisoned, args.types)) or is_poisoned(ret)
+            case Struct(members=members):
+                return any(map(is_poisoned, members.types.values()))
+            case Enum(members=members):
+                return any(
+                    is_poisoned(variant.inner)
+                    for variant in members
+                    if isinstance(variant, Enum.Tuple)
+                )
+            case _:
+                return False
+
+    @override
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Unpickled types are interned again by going through the
+        # constructor.
+        fields: tuple[str, ...] = getattr(self, "__match_args__")
+        return (type(self), tuple(getattr(self, name) for name in fields))
+
 
 class Placeholder(Type):
     pass
 
 
+class Poison(Type):
+    """
+    Type of the names defined by a statement that failed to typecheck, when
+    type errors are collected instead of raised. Errors involving it are
+    consequences of the first one and are not reported.
+    """
+
+
 class Bool(Type):
     pass
 
@@ -31,25 +124,41 @@ class String(Type):
     pass
 
 
-@dataclass
-class Struct(Type):
+@dataclass(eq=False)
+class Struct(Interned):
     struct_name: str
     members: Members
 
-    @dataclass
-    class Members(Type):
+    @staticmethod
+    @override
+    def key(struct_name: str, members: Struct.Members) -> tuple[Any, ...]:
+        return (Struct, struct_name, members)
+
+    @dataclass(eq=False)
+    class Members(Interned):
         types: dict[str, Type]
 
         def __len__(self) -> int:
             return len(self.types)
 
+        @staticmethod
+        @override
+        def key(types: dict[str, Type]) -> tuple[Any, ...]:
+            # members are matched by name, in any order
+            return (Struct.Members, frozenset(types.items()))
+
 
-@dataclass
-class Enum(Type):
+@dataclass(eq=False)
+class Enum(Interned):
     enum_name: str  # TODO: rename to name
     members: list[Variants]
     span: Span
 
+    @staticmethod
+    @override
+    def key(enum_name: str, members: list[Variants], span: Span) -> tuple[Any, ...]:
+        return (Enum, enum_name, span.pos(), *members)
+
     @property
     @override
     def name(self) -> str:
@@ -61,51 +170,72 @@ class Enum(Type):
                 return mem
         return None
 
-    @dataclass
+    @dataclass(frozen=True)
     class Simple:
         name: str
 
-    @dataclass
+    @dataclass(frozen=True)
     class Tuple:
         name: str
         inner: Type
 
-    Variants: TypeAlias = Simple | Tuple
+    Variants = Simple | Tuple
 
 
-@dataclass
-class Array(Type):
+@dataclass(eq=False)
+class Array(Interned):
     ty: Type
 
+    @staticmethod
+    @override
+    def key(ty: Type) -> tuple[Any, ...]:
+        return (Array, ty)
+
     @property
     @override
     def name(self) -> str:
         return f"Array<{self.ty.name}>"
 
 
-@dataclass
-class UntypedArray(Type):
-    pass
+@dataclass(eq=False)
+class UntypedArray(Interned):
+    @staticmethod
+    @override
+    def key() -> tuple[Any, ...]:
+        return (UntypedArray,)
 
 
-@dataclass
-class Function(Type):
+@dataclass(eq=False)
+class Function(Interned):
     function_name: str
     arguments: Params
     return_type: Type
 
-    @dataclass
-    class Params(Type):
+    @staticmethod
+    @override
+    def key(
+        function_name: str, arguments: Function.Params, return_type: Type
+    ) -> tuple[Any, ...]:
+        return (Function, function_name, arguments, return_type)
+
+    @dataclass(eq=False)
+    class Params(Interned):
         types: list[Type]
 
         def __len__(self) -> int:
             return len(self.types)
 
+        @staticmethod
+        @override
+        def key(types: list[Type]) -> tuple[Any, ...]:
+            return (Function.Params, *types)
+
 
 BOOL = Bool()
 INT = Int()
 STRING = String()
 PLACEHOLDER = Placeholder()
+POISON = Poison()
 
 
 Primitive = Int | Bool | String
@@ -119,3 +249,12 @@ def name(ty: Primitive) -> str:
             return "bool"
         case String():
             return "string"
+
+
+def is_poisoned(ty: Type) -> bool:
+    """
+    Whether ty is the poison type or is made up of it.
+    """
+    if isinstance(ty, Interned):
+        return ty.poisoned
+    return isinstance(ty, Poison)
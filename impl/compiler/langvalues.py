@@ -62,6 +62,12 @@ class Function:
     def call(self, args: list[Any], env: "RuntimeEnvironment") -> Any:
         pass
 
+    def call_steps(self, args: list[Any], env: "RuntimeEnvironment") -> Any:
+        """
+        Same as `call`, as the steps of `Ast.eval_steps`.
+        """
+        return self.call(args, env)
+
 
 class BuiltinFunction(Function):
     TYPE: ClassVar[langtypes.Function]
@@ -69,17 +75,50 @@ class BuiltinFunction(Function):
 
 @dataclass
 class RyuFunction(Function):
-    param_names: list[str]
+    param_slots: list[int]
+    frame_size: int
     body: "StatementBlock"
+    closure: RuntimeEnvironment
+    """The scope the function is defined in, which encloses its calls."""
+    reuse_frame: bool = False
+    """Whether tail calls to itself can run in the frame of the call, which
+    is not the case if the body defines functions holding on to it."""
 
     @override
     def call(self, args: list[Any], env: "RuntimeEnvironment") -> Any:
-        child_env = RuntimeEnvironment(enclosing=env)
+        child_env = RuntimeEnvironment(enclosing=self.closure, size=self.frame_size)
+        child_env.slots[0] = self
+
+        for slot, arg in zip(self.param_slots, args):
+            child_env.slots[slot] = arg
 
-        for name, arg in zip(self.param_names, args):
-            child_env.define(name, arg)
+        completion = self.body.eval(child_env)
+        if isinstance(completion, runtime.Return):
+            return completion.return_value
 
-        try:
-            self.body.eval(child_env)
-        except runtime.FunctionReturn as ret:
-            return ret.return_value
+    @override
+    def call_steps(self, args: list[Any], env: "RuntimeEnvironment") -> Any:
+        fn = self
+        child_env = RuntimeEnvironment(enclosing=fn.closure, size=fn.frame_size)
+        child_env.slots[0] = fn
+
+        while True:
+            for slot, arg in zip(fn.param_slots, args):
+                child_env.slots[slot] = arg
+            completion = yield fn.body.eval_steps(child_env)
+
+            if not isinstance(completion, runtime.TailCall):
+                if isinstance(completion, runtime.Return):
+                    return completion.return_value
+                return None
+
+            # The call in tail position runs in place of this one, in the
+            # same frame if it calls the same function: the values in the
+            # frame are dead once the arguments are evaluated.
+            args = completion.args
+            if completion.function is not fn or not fn.reuse_frame:
+                fn = completion.function
+                child_env = RuntimeEnvironment(
+                    enclosing=fn.closure, size=fn.frame_size
+                )
+                child_env.slots[0] = fn
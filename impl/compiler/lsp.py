@@ -0,0 +1,338 @@
+"""
+Language server speaking the Language Server Protocol over stdio, started
+with `ryuc lsp`. It publishes the errors of open documents as diagnostics and
+shows the type of the expression under the cursor on hover.
+
+Documents are synced incrementally: each edit is applied with
+`incremental.reparse` and the program is checked again through an
+`ItemCache`, so that only the items touched by the edit (and the ones
+depending on them) are typechecked again.
+"""
+
+import bisect
+import json
+import sys
+from typing import Any, BinaryIO, Optional
+
+from compiler import errors, langtypes
+from compiler.ast.base import Ast, field_names
+from compiler.ast.expressions import Expression
+from compiler.ast.statements import StatementList
+from compiler.compiler import get_default_environs
+from compiler.incremental import TextEdit, reparse
+from compiler.lalr import UnexpectedInput  # type: ignore
+from compiler.parser import parse_to_ast
+from compiler.typechecker import ItemCache
+
+Json = dict[str, Any]
+
+SYNC_INCREMENTAL = 2
+SEVERITY_ERROR = 1
+
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+
+MESSAGE_ERROR = 1
+
+
+class Document:
+    """
+    An open source file, with its AST and types kept up to date with edits.
+    """
+
+    source: str
+    lines: errors.LineTable
+    ast: Optional[Ast]
+    """None while the source does not parse."""
+
+    def __init__(self, source: str):
+        self.source = source
+        self.lines = errors.LineTable(source)
+        self.cache = ItemCache(get_default_environs()[0])
+        self.ast = None
+        self.parse_error: Optional[UnexpectedInput] = None
+
+        # The last AST that parsed, and the number of characters at the
+        # start and end of its source that have not been edited since. While
+        # the source does not parse, edits are merged into one that is
+        # reparsed from there, so only the broken statements are parsed.
+        self._parsed: Optional[Ast] = None
+        self._parsed_source = source
+        self._unchanged = (len(source), len(source))
+
+        try:
+            self._reparsed(parse_to_ast(source))
+        except UnexpectedInput as err:
+            self.parse_error = err
+
+    def edit(self, edit: TextEdit):
+        length = len(self.source)
+        self.source = edit.apply(self.source)
+        self.lines.edit(edit.start, edit.end, edit.text, self.source)
+
+        head, tail = self._unchanged
+        head, tail = min(head, edit.start), min(tail, length - edit.end)
+        self._unchanged = (head, tail)
+
+        try:
+            if self._parsed is None:
+                ast = parse_to_ast(self.source)
+            else:
+                edited = TextEdit(
+                    head,
+                    len(self._parsed_source) - tail,
+                    self.source[head : len(self.source) - tail],
+                )
+                ast = reparse(
+                    self._parsed, self._parsed_source, edited, exact_errors=False
+                )
+        except UnexpectedInput as err:
+            self.ast, self.parse_error = None, err
+        else:
+            self._reparsed(ast)
+
+    def _reparsed(self, ast: Ast):
+        self.ast = self._parsed = ast
+        self.parse_error = None
+        self._parsed_source = self.source
+        self._unchanged = (len(self.source), len(self.source))
+
+    def diagnostics(self) -> list[Json]:
+        """
+        Typecheck the document and return its errors as LSP diagnostics.
+        """
+        if self.ast is None:
+            err = self.parse_error
+            pos = getattr(err, "pos_in_stream", None) or 0
+            message = str(err).strip().splitlines()[0]
+            return [self._diagnostic(pos, pos, message)]
+
+        diagnostics: list[Json] = []
+        for checked in self.cache.typecheck(self.ast):
+            match checked.error:
+                case None:
+                    pass
+                case errors.CompilerError(message=message, span=span):
+                    diagnostics.append(
+                        self._diagnostic(span.start_pos, span.end_pos, message)
+                    )
+                case _:
+                    # Errors that are not reported nicely yet
+                    span = checked.item.span
+                    diagnostics.append(
+                        self._diagnostic(span.start_pos, span.end_pos, "Type error")
+                    )
+
+        return diagnostics
+
+    def hover(self, pos: int) -> Optional[Json]:
+        """
+        Type of the innermost typed expression at pos.
+        """
+        if self.ast is None:
+            return None
+
+        found: Optional[Expression] = None
+        node = self.ast
+        while node is not None:
+            if isinstance(node, Expression) and node.type is not None:
+                found = node
+            node = _child_at(node, pos)
+
+        if found is None or found.type is None:
+            return None
+
+        span = found.span
+        return {
+            "contents": {"kind": "plaintext", "value": describe(found.type)},
+            "range": self.range(span.start_pos, span.end_pos),
+        }
+
+    def offset(self, position: Json) -> int:
+        """
+        Offset of an LSP position, whose character counts UTF-16 code units.
+        """
+        if position["line"] >= self.lines.line_count():
+            return len(self.source)
+
+        pos = self.lines.line_start(position["line"] + 1)
+        units = position["character"]
+        while units > 0 and pos < len(self.source) and self.source[pos] != "\n":
+            units -= 2 if ord(self.source[pos]) > 0xFFFF else 1
+            pos += 1
+
+        return pos
+
+    def position(self, pos: int) -> Json:
+        line = self.lines.line(pos)
+        text = self.source[self.lines.line_start(line) : pos]
+        return {"line": line - 1, "character": len(text.encode("utf-16-le")) // 2}
+
+    def range(self, start: int, end: int) -> Json:
+        return {"start": self.position(start), "end": self.position(end)}
+
+    def _diagnostic(self, start: int, end: int, message: str) -> Json:
+        return {
+            "range": self.range(start, end),
+            "severity": SEVERITY_ERROR,
+            "source": "ryuc",
+            "message": message,
+        }
+
+
+def _child_at(node: Ast, pos: int) -> Optional[Ast]:
+    if isinstance(node, StatementList):
+        # top level statements are sorted, and there can be many of them
+        stmts = node.stmts
+        i = bisect.bisect_left(stmts, pos, key=lambda s: s.span.end_pos)
+        if i < len(stmts) and stmts[i].span.start_pos <= pos:
+            return stmts[i]
+        return None
+
+    for name in field_names(type(node)):
+        value = getattr(node, name)
+        children = value if isinstance(value, list) else [value]  # type: ignore
+        for child in children:
+            if isinstance(child, Ast) and (
+                child.span.start_pos <= pos <= child.span.end_pos
+            ):
+                return child
+
+    return None
+
+
+def describe(type: langtypes.Type) -> str:
+    match type:
+        case langtypes.Int() | langtypes.Bool() | langtypes.String():
+            return langtypes.name(type)
+        case langtypes.Struct(struct_name=name):
+            return name
+        case langtypes.Function(function_name=name, arguments=args, return_type=ret):
+            params = ", ".join(describe(arg) for arg in args.types)
+            return f"fn {name}({params}) -> {describe(ret)}"
+        case langtypes.Array(ty=ty):
+            return f"array<{describe(ty)}>"
+        case _:
+            return type.name
+
+
+class Server:
+    """
+    Reads JSON-RPC messages from reader and writes the responses and
+    notifications to writer, until the client sends `exit`.
+    """
+
+    def __init__(self, reader: BinaryIO, writer: BinaryIO):
+        self.reader = reader
+        self.writer = writer
+        self.documents: dict[str, Document] = {}
+        self.running = True
+
+    def serve(self):
+        while self.running and (message := self.read()) is not None:
+            self.handle(message)
+
+    def read(self) -> Optional[Json]:
+        length = None
+        while line := self.reader.readline():
+            line = line.strip()
+            if not line:
+                break
+            name, _, value = line.decode("ascii").partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+
+        if length is None:
+            return None
+        return json.loads(self.reader.read(length))
+
+    def send(self, message: Json):
+        body = json.dumps({"jsonrpc": "2.0", **message}).encode("utf-8")
+        self.writer.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii"))
+        self.writer.write(body)
+        self.writer.flush()
+
+    def handle(self, message: Json):
+        method = message.get("method")
+        params = message.get("params", {})
+        handler = getattr(self, "on_" + str(method).replace("/", "_"), None)
+
+        if "id" not in message:
+            if handler is not None:
+                try:
+                    handler(params)
+                except Exception as err:
+                    # there is no response to carry the error
+                    self.log(f"{method} failed: {err!r}")
+            return
+
+        if handler is None:
+            error = {"code": METHOD_NOT_FOUND, "message": f"Unknown method {method}"}
+            self.send({"id": message["id"], "error": error})
+            return
+
+        try:
+            result = handler(params)
+        except Exception as err:
+            error = {"code": INTERNAL_ERROR, "message": f"{method} failed: {err!r}"}
+            self.send({"id": message["id"], "error": error})
+        else:
+            self.send({"id": message["id"], "result": result})
+
+    def log(self, text: str):
+        params = {"type": MESSAGE_ERROR, "message": text}
+        self.send({"method": "window/logMessage", "params": params})
+
+    def publish(self, uri: str):
+        params = {"uri": uri, "diagnostics": self.documents[uri].diagnostics()}
+        self.send({"method": "textDocument/publishDiagnostics", "params": params})
+
+    def on_initialize(self, params: Json) -> Json:
+        return {
+            "capabilities": {
+                "textDocumentSync": {"openClose": True, "change": SYNC_INCREMENTAL},
+                "hoverProvider": True,
+            },
+            "serverInfo": {"name": "ryuc"},
+        }
+
+    def on_initialized(self, params: Json):
+        pass
+
+    def on_shutdown(self, params: Json):
+        return None
+
+    def on_exit(self, params: Json):
+        self.running = False
+
+    def on_textDocument_didOpen(self, params: Json):
+        doc = params["textDocument"]
+        self.documents[doc["uri"]] = Document(doc["text"])
+        self.publish(doc["uri"])
+
+    def on_textDocument_didChange(self, params: Json):
+        uri = params["textDocument"]["uri"]
+        document = self.documents[uri]
+
+        for change in params["contentChanges"]:
+            if "range" in change:
+                start = document.offset(change["range"]["start"])
+                end = document.offset(change["range"]["end"])
+            else:
+                start, end = 0, len(document.source)
+            document.edit(TextEdit(start, end, change["text"]))
+
+        self.publish(uri)
+
+    def on_textDocument_didClose(self, params: Json):
+        self.documents.pop(params["textDocument"]["uri"], None)
+
+    def on_textDocument_hover(self, params: Json) -> Optional[Json]:
+        document = self.documents.get(params["textDocument"]["uri"])
+        if document is None:
+            return None
+        return document.hover(document.offset(params["position"]))
+
+
+def serve():
+    Server(sys.stdin.buffer, sys.stdout.buffer).serve()
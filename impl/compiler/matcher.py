@@ -1,174 +1,306 @@
-from types import UnionType
-from typing import (
-    TYPE_CHECKING,
-    Any,
-    Container,
-    Optional,
-    Sequence,
-    Type,
-    TypeAlias,
-    TypeGuard,
-    TypeVar,
-)
-
-from compiler import errors, langtypes
+"""
+Exhaustiveness and redundancy checking of match statements, using the
+usefulness algorithm over pattern matrices from Maranget, "Warnings for
+pattern matching" (2007).
 
+Case patterns are first converted to `Pattern`s, which only keep the shape of
+the values they match. Every value is built by a constructor from the
+values of its arguments: `true` and `false` take none, an enum variant takes
+its tuple value if it has one, and an array of length n takes its n
+elements. A row of patterns is useful with respect to a matrix of rows if
+some vector of values matches the row and none of the rows of the matrix.
+A case is redundant if its pattern is not useful with respect to the cases
+before it, and a match is exhaustive if a wildcard is not useful with
+respect to all of its cases.
 
-if TYPE_CHECKING:
-    from compiler.ast.match import EnumPatternTuple
-    from compiler.ast.match import EnumPattern
-    from compiler.ast.match import ArrayPattern, WildcardPattern
-    from compiler.ast.literals import BoolLiteral
-    from compiler.errors import Span
-
-
-class MatcherCaseDuplicated(Exception):
-    def __init__(self, previous_case_span: "Span"):
-        self.previous_case_span = previous_case_span
-        super().__init__()
-
-
-class Wildcard:
-    pass
-
-
-WILDCARD = Wildcard()
-
-
-class BoolPatternMatcher:
-    def __init__(self) -> None:
-        self.cases: dict[bool | Wildcard, Span] = {}
-
-    def add_case(self, arm: "BoolLiteral | WildcardPattern"):
-        from compiler.ast.literals import BoolLiteral
-        from compiler.ast.match import WildcardPattern
-
-        match arm:
-            case BoolLiteral():
-                val = arm.value
-            case WildcardPattern():
-                val = WILDCARD
-
-        if val in self.cases:
-            raise MatcherCaseDuplicated(self.cases[val])
-
-        self.cases[val] = arm.span
-
-    def unhandled_cases(self) -> Container[bool] | None:
-        if WILDCARD in self.cases:
-            return None
-
-        cases = list(self.cases)
-        assert is_seq_of(cases, bool)
+Types with infinitely many constructors (integers, and arrays through their
+length) are never covered by their constructors alone, so only the rows
+starting with a wildcard matter for them. Checking a matrix with n rows
+takes O(n) specializations per column, independently of the number of
+variants of an enum, so the cost stays polynomial in the size of the match.
+"""
 
-        leftover = {True, False} - set(cases)
-        return leftover
+import functools
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Hashable, Optional, Sequence
 
+from typing_extensions import override
 
-class ArrayPatternMatcher:
-    def __init__(self) -> None:
-        self.cases: dict[tuple[int | Wildcard, ...] | Wildcard, Span] = {}
+from compiler import langtypes
 
-    def add_case(self, arm: "ArrayPattern | WildcardPattern"):
-        from compiler.ast.match import ArrayPattern, WildcardPattern
 
-        match arm:
-            case ArrayPattern():
-                val = tuple(arm.pattern_as_list())
-            case WildcardPattern():
-                val = WILDCARD
-
-        if val in self.cases:
-            raise MatcherCaseDuplicated(self.cases[val])
-
-        self.cases[val] = arm.span
-
-    def unhandled_cases(self) -> Container[str] | None:
-        if WILDCARD in self.cases:
-            return None
-
-        return {"_"}
+if TYPE_CHECKING:
+    from compiler.ast.literals import IntLiteral
+    from compiler.ast.match import MatchPattern
 
 
-Matcher: TypeAlias = "BoolPatternMatcher | ArrayPatternMatcher | EnumPatternMatcher"
+class Wildcard:
+    @override
+    def __repr__(self) -> str:
+        return "_"
 
 
-class EnumPatternMatcher:
-    def __init__(self, enum: langtypes.Enum) -> None:
-        self.cases: dict[str | Wildcard, tuple[Span, Optional[Matcher]]] = {}
-        self.enum = enum
+WILDCARD = Wildcard()
 
-    def add_case(self, arm: "EnumPattern | EnumPatternTuple | WildcardPattern"):
-        from compiler.ast.match import (
-            EnumPattern,
-            WildcardPattern,
-            EnumPatternTuple,
-            BoolLiteral,
-            ArrayPattern,
-        )
 
-        match arm:
-            case EnumPattern():
-                val = arm.variant
-            case WildcardPattern():
-                val = WILDCARD
+@dataclass(frozen=True, slots=True)
+class Constructed:
+    """
+    Values built by constructor from values matching args. The constructor
+    is a bool, a variant name or an integer, depending on the type: for
+    arrays it is the length.
+    """
+
+    constructor: Hashable
+    args: tuple["Pattern", ...] = ()
+
+
+Pattern = Constructed | Wildcard
+Row = tuple[Pattern, ...]
+
+
+def from_ast(pattern: "MatchPattern | IntLiteral") -> Pattern:
+    from compiler.ast.literals import BoolLiteral, IntLiteral
+    from compiler.ast.match import (
+        ArrayPattern,
+        EnumPattern,
+        EnumPatternTuple,
+        WildcardPattern,
+    )
+
+    match pattern:
+        case BoolLiteral(value=value) | IntLiteral(value=value):
+            return Constructed(value)
+        case EnumPatternTuple(variant=variant, tuple_pattern=inner):
+            return Constructed(variant, (from_ast(inner),))
+        case EnumPattern(variant=variant):
+            return Constructed(variant)
+        case WildcardPattern():
+            return WILDCARD
+        case ArrayPattern(elements=elements):
+            return Constructed(
+                len(elements), tuple(from_ast(el.literal) for el in elements)
+            )
+
+
+def find_redundant(
+    ty: langtypes.Type, patterns: Sequence[Pattern]
+) -> Optional[tuple[int, int]]:
+    """
+    Index of the first pattern that only matches values matched by the
+    patterns before it, along with the index of the last of those patterns
+    that is needed to cover it.
+    """
+    types = (ty,)
+    # Only the previous rows with the same constructor or a wildcard can
+    # cover a row, so rows are indexed by their constructor.
+    by_constructor: dict[Hashable, list[Row]] = {}
+    wildcards: list[Row] = []
+
+    for i, pattern in enumerate(patterns):
+        if isinstance(pattern, Constructed):
+            rows = by_constructor.get(pattern.constructor, []) + wildcards
+        else:
+            rows = [(p,) for p in patterns[:i]]
 
-        if val in self.cases:
-            matcher = self.cases[val][1]
-            if matcher is None:
-                raise MatcherCaseDuplicated(self.cases[val][0])
-            elif matcher and isinstance(arm, EnumPatternTuple):
-                matcher.add_case(arm.tuple_pattern)  # type: ignore
+        if _useful(rows, types, (pattern,)):
+            if isinstance(pattern, Constructed):
+                by_constructor.setdefault(pattern.constructor, []).append((pattern,))
             else:
-                raise errors.InternalCompilerError()
-        else:
-            if isinstance(arm, EnumPatternTuple):
-                match arm.tuple_pattern:
-                    case BoolLiteral():
-                        matcher = BoolPatternMatcher()
-                        matcher.add_case(arm.tuple_pattern)
-                    case ArrayPattern():
-                        matcher = ArrayPatternMatcher()
-                        matcher.add_case(arm.tuple_pattern)
-                    case EnumPattern():
-                        # matcher = EnumPatternMatcher()
-                        raise NotImplementedError()
-                    case WildcardPattern():
-                        matcher = BoolPatternMatcher()  # any matcher is fine here
-                        matcher.add_case(arm.tuple_pattern)
-                self.cases[val] = (arm.span, matcher)
+                wildcards.append((pattern,))
+            continue
+
+        # The prefixes of the previous rows cover less and less of the
+        # pattern, find the shortest one that covers it all.
+        rows = [(p,) for p in patterns[:i]]
+        lo, hi = 0, i - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if _useful(rows[: mid + 1], types, (pattern,)):
+                lo = mid + 1
             else:
-                self.cases[val] = (arm.span, None)
-
-    def unhandled_cases(self) -> Container[str] | None:
-        if WILDCARD in self.cases:
+                hi = mid
+        return (i, lo)
+
+    return None
+
+
+def missing(ty: langtypes.Type, patterns: Sequence[Pattern]) -> list[Pattern]:
+    """
+    Patterns of the values that are not matched by any of patterns. Each
+    missing constructor is listed, integers and array lengths that are not
+    matched are represented by a single example.
+    """
+    witnesses = _witnesses([(p,) for p in patterns], (ty,))
+    return [w[0] for w in witnesses]
+
+
+def describe(pattern: Pattern, ty: langtypes.Type) -> str:
+    """
+    Pattern as shown in error messages.
+    """
+    match pattern, ty:
+        case Wildcard(), _:
+            return "_"
+        case Constructed(constructor=variant, args=args), langtypes.Enum():
+            args_types = _args_types(ty, variant, len(args))
+            inner = "".join(f"({describe(a, t)})" for a, t in zip(args, args_types))
+            return f"{ty.name}::{variant}{inner}"
+        case Constructed(args=args), langtypes.Array(ty=element):
+            return "[" + ", ".join(describe(a, element) for a in args) + "]"
+        case Constructed(constructor=constructor), _:
+            return str(constructor)
+
+
+Types = tuple[langtypes.Type, ...]
+
+
+@functools.lru_cache(maxsize=256)
+def _signature(ty: langtypes.Type) -> Optional[dict[Hashable, Types]]:
+    """
+    Constructors of the values of ty along with the types of their
+    arguments, or None if there are infinitely many.
+    """
+    match ty:
+        case langtypes.Bool():
+            return {True: (), False: ()}
+        case langtypes.Enum(members=members):
+            return {
+                variant.name: (
+                    (variant.inner,)
+                    if isinstance(variant, langtypes.Enum.Tuple)
+                    else ()
+                )
+                for variant in members
+            }
+        case _:
             return None
 
-        leftover: set[str] = set()
-        leftover_simples: set[str] = set()
-        for variant in self.enum.members:
-            if isinstance(variant, langtypes.Enum.Simple):
-                leftover_simples.add(str(variant.name))
-
-        for variant, span_and_matcher in self.cases.items():
-            _, matcher = span_and_matcher
-            if matcher is None:
-                if isinstance(variant, str):
-                    leftover_simples.remove(variant)
-                continue
-            if remaining := matcher.unhandled_cases():
-                for rem in remaining:  # type: ignore
-                    leftover.add(f"{self.enum.name}::{variant}({rem})")
-
-        leftover_simples = set(
-            (f"{self.enum.name}::{variant}" for variant in leftover_simples)
-        )
-        leftover = leftover.union(leftover_simples)
-        return leftover if leftover else None
-
 
-T = TypeVar("T")
-
-
-def is_seq_of(seq: Sequence[Any], ty: Type[T] | UnionType) -> TypeGuard[Sequence[T]]:
-    return all(isinstance(item, ty) for item in seq)
+def _args_types(ty: langtypes.Type, constructor: Hashable, arity: int) -> Types:
+    if (signature := _signature(ty)) is not None and constructor in signature:
+        return signature[constructor]
+    if isinstance(ty, langtypes.Array):
+        return (ty.ty,) * arity
+    return (langtypes.PLACEHOLDER,) * arity
+
+
+def _specialize(rows: list[Row]) -> tuple[dict[Hashable, list[Row]], list[Row]]:
+    """
+    Split rows on their first column: for each constructor in that column,
+    the rows that match its values with the arguments in place of the
+    column, and the rows that start with a wildcard without the column (the
+    default matrix). Rows starting with a wildcard are in every group.
+    """
+    arities = {
+        row[0].constructor: len(row[0].args)
+        for row in rows
+        if isinstance(row[0], Constructed)
+    }
+    groups: dict[Hashable, list[Row]] = {constructor: [] for constructor in arities}
+    default: list[Row] = []
+
+    for row in rows:
+        head = row[0]
+        if isinstance(head, Constructed):
+            groups[head.constructor].append(head.args + row[1:])
+        else:
+            default.append(row[1:])
+            for constructor, group in groups.items():
+                group.append((WILDCARD,) * arities[constructor] + row[1:])
+
+    return groups, default
+
+
+def _useful(rows: list[Row], types: Types, row: Row) -> bool:
+    """
+    Whether some values match row and none of rows.
+    """
+    if not row:
+        return not rows
+
+    ty, rest = types[0], types[1:]
+    head = row[0]
+
+    if isinstance(head, Constructed):
+        arity = len(head.args)
+        specialized = [
+            (
+                (WILDCARD,) * arity + r[1:]
+                if isinstance(r[0], Wildcard)
+                else r[0].args + r[1:]
+            )
+            for r in rows
+            if isinstance(r[0], Wildcard) or r[0].constructor == head.constructor
+        ]
+        types = _args_types(ty, head.constructor, arity) + rest
+        return _useful(specialized, types, head.args + row[1:])
+
+    signature = _signature(ty)
+    heads = {r[0].constructor for r in rows if isinstance(r[0], Constructed)}
+
+    if signature is None or not signature.keys() <= heads:
+        default = [r[1:] for r in rows if isinstance(r[0], Wildcard)]
+        return _useful(default, rest, row[1:])
+
+    groups, _ = _specialize(rows)
+    return any(
+        _useful(groups[constructor], args + rest, (WILDCARD,) * len(args) + row[1:])
+        for constructor, args in signature.items()
+    )
+
+
+def _witnesses(rows: list[Row], types: Types) -> list[Row]:
+    """
+    Rows of patterns covering the values that match none of rows, that is
+    the ways in which a row of wildcards is useful.
+    """
+    if not types:
+        return [] if rows else [()]
+
+    ty, rest = types[0], types[1:]
+    groups, default = _specialize(rows)
+    signature = _signature(ty)
+    witnesses: list[Row] = []
+
+    if signature is None:
+        # Integers that are not matched are all alike, but the lengths that
+        # are matched are worth going through.
+        if isinstance(ty, langtypes.Array):
+            element = ty.ty
+            constructors = {n: (element,) * n for n in groups}  # type: ignore
+        else:
+            constructors = {}
+        missing: list[Pattern] = [_unmatched(ty, groups)]
+    else:
+        constructors = signature
+        missing = [
+            Constructed(constructor, (WILDCARD,) * len(args))
+            for constructor, args in signature.items()
+            if constructor not in groups
+        ]
+
+    for constructor, args in constructors.items():
+        if constructor not in groups:
+            continue
+        arity = len(args)
+        for w in _witnesses(groups[constructor], args + rest):
+            witnesses.append((Constructed(constructor, w[:arity]),) + w[arity:])
+
+    if missing:
+        for w in _witnesses(default, rest):
+            witnesses.extend((pattern,) + w for pattern in missing)
+
+    return witnesses
+
+
+def _unmatched(ty: langtypes.Type, groups: dict[Hashable, list[Row]]) -> Pattern:
+    """
+    Example of a value of a type with infinitely many constructors that is
+    not built by any of the constructors of groups.
+    """
+    if isinstance(ty, langtypes.Array):
+        length = next(n for n in range(len(groups) + 1) if n not in groups)
+        return Constructed(length, (WILDCARD,) * length)
+
+    return WILDCARD
@@ -1,12 +1,29 @@
-from typing import Any, Type, TypeVar
+from typing import Any, Callable, Iterable, Literal, Optional, Type, TypeVar
+from typing_extensions import override
 
-from compiler import ast
-from compiler.ast.base import Ast
+from compiler import ast, cache, pratt
+from compiler.ast.base import Ast, Steps, walk
 from compiler.lalr import Meta, Token, Tree, Lark_StandAlone, v_args, Transformer, DATA  # type: ignore
+from compiler.lalr import Discard, UnexpectedInput  # type: ignore
+from compiler.lalr import Rule, maybe_create_child_filter  # type: ignore
 
 # https://github.com/lark-parser/lark/issues/565
 DATA["options"]["maybe_placeholders"] = True  # type: ignore
-_parser = Lark_StandAlone(propagate_positions=True)
+
+
+def _load_parser(**options: Any) -> Lark_StandAlone:  # type: ignore
+    """
+    Deserializing the parse tables and compiling the lexer regexes from
+    `compiler.lalr` is a noticeable part of startup time, so the ready to
+    use parser is cached on disk and reused across runs.
+    """
+    return cache.cached_parser(
+        cache.parser_cache_key(**options),
+        lambda: Lark_StandAlone(**options),  # type: ignore
+    )
+
+
+_parser = _load_parser(propagate_positions=True)
 
 
 def parse(source: str) -> Tree[Token]:
@@ -26,6 +43,27 @@ def listify(cls: Type[T]):
 
 @v_args(meta=True, inline=True)  # type: ignore
 class LarkTreeToAstTransformer(Transformer[Token, Any]):
+    @override
+    def _transform_tree(self, tree: Tree[Token]) -> Any:
+        # Subtrees are transformed on an explicit stack, so that deeply nested
+        # programs do not hit the recursion limit.
+        return walk(self._transform_steps(tree))
+
+    def _transform_steps(self, tree: Tree[Token]) -> Steps[Any]:
+        children: list[Any] = []
+        for child in tree.children:
+            if isinstance(child, Tree):
+                result = yield self._transform_steps(child)  # type: ignore
+            elif isinstance(child, Token):
+                result = self._call_userfunc_token(child)
+            else:
+                result = child
+
+            if result is not Discard:
+                children.append(result)
+
+        return self._call_userfunc(tree, children)
+
     def TRUE(self, _) -> bool:
         return True
 
@@ -46,7 +84,7 @@ class LarkTreeToAstTransformer(Transformer[Token, Any]):
     assignment = ast.variable.Assignment
 
     array_literal = ast.array.ArrayLiteral
-    array_elements = listify(ast.array.ArrayElements)
+    array_elements = listify(ast.array.array_elements)  # type: ignore
     array_element = ast.array.ArrayElement
     index_assignment = ast.array.IndexAssignment
     indexing = ast.array.Indexing
@@ -115,3 +153,181 @@ _transformer = LarkTreeToAstTransformer()
 
 def parse_tree_to_ast(tree: Tree[Token]) -> Ast:
     return _transformer.transform(tree)
+
+
+class _Reduced:
+    """
+    A value on the parser stack that was produced by a reduction, along with
+    the region of source code it covers. The position attributes mirror
+    those of `Meta`, so an instance is passed as the meta argument to the
+    AST constructors.
+    """
+
+    __slots__ = (
+        "value",
+        "line",
+        "column",
+        "start_pos",
+        "end_line",
+        "end_column",
+        "end_pos",
+    )
+
+    value: Any
+    line: Optional[int]
+    column: int
+    start_pos: int
+    end_line: int
+    end_column: int
+    end_pos: int
+
+    def __init__(self, children: list["StackValue"]):
+        self.line = None
+        self.span_children(children)
+
+    @property
+    def children(self) -> list["StackValue"]:
+        """
+        Children of an inlined `_rule`, which are spliced into the parent
+        rule by lark's child filters.
+        """
+        return self.value
+
+    def span_children(self, children: list["StackValue"]):
+        for first in children:
+            if first.line is not None:
+                self.line = first.line
+                self.column = first.column
+                self.start_pos = first.start_pos  # type: ignore
+                break
+
+        for last in reversed(children):
+            if last.line is not None:
+                self.end_line = last.end_line  # type: ignore
+                self.end_column = last.end_column  # type: ignore
+                self.end_pos = last.end_pos  # type: ignore
+                break
+
+
+StackValue = Token | _Reduced
+ParserCallback = Callable[[list[StackValue]], StackValue]
+
+
+class AstBuilder:
+    """
+    Creates parser callbacks that build AST nodes on every LALR reduce
+    using the rule handlers of `LarkTreeToAstTransformer`, without
+    building a `Tree` first.
+
+    Lark does not pass positions to transformers run inside the parser,
+    so they are propagated here the same way `propagate_positions` does
+    for trees: a node spans from the first to the last token of its rule,
+    and a node passed through as is by a `?rule` is widened to cover the
+    tokens of that rule too (like the parentheses in `(1 + 2) * 3`).
+    """
+
+    def __init__(self, transformer: LarkTreeToAstTransformer):
+        self.transformer = transformer
+        self.terminals: dict[str, Optional[Callable[[Token], Any]]] = {}
+
+    def callbacks(self, rules: Iterable[Rule]) -> dict[Rule, ParserCallback]:  # type: ignore
+        return {rule: self._callback(rule) for rule in rules}  # type: ignore
+
+    def _unwrap(self, child: Optional[StackValue]) -> Any:
+        match child:
+            case _Reduced():
+                return child.value
+            case Token():
+                # looking up a v_args method creates a new wrapper each time
+                try:
+                    terminal = self.terminals[child.type]
+                except KeyError:
+                    terminal = getattr(self.transformer, child.type, None)
+                    self.terminals[child.type] = terminal
+                return terminal(child) if terminal else child
+            case None:
+                return None
+
+    def _callback(self, rule: Rule) -> ParserCallback:  # type: ignore
+        name: str = rule.origin.name  # type: ignore
+        expand_single: bool = rule.options.expand1 and not rule.alias  # type: ignore
+        handler = getattr(self.transformer, name, None)
+        unwrap = self._unwrap
+
+        make_filter = maybe_create_child_filter(
+            rule.expansion,  # type: ignore
+            rule.options.keep_all_tokens,  # type: ignore
+            False,
+            rule.options.empty_indices,  # type: ignore
+        )
+        child_filter: Callable[[list[StackValue]], list[Optional[StackValue]]] = (
+            make_filter(lambda children: children) if make_filter else list
+        )
+
+        def callback(children: list[StackValue]) -> StackValue:
+            filtered = child_filter(children)
+
+            if expand_single and len(filtered) == 1:
+                child = filtered[0]
+                if isinstance(child, _Reduced):
+                    child.span_children(children)
+                return child  # type: ignore
+
+            reduced = _Reduced(children)
+            if handler is not None:
+                args = [unwrap(child) for child in filtered]
+                reduced.value = handler.visit_wrapper(handler, name, args, reduced)
+            elif name.startswith("_"):
+                # Inlined into the parent rule by its child filter
+                reduced.value = filtered
+            else:
+                args = [unwrap(child) for child in filtered]
+                reduced.value = self.transformer.__default__(name, args, reduced)
+            return reduced
+
+        return callback
+
+
+def _load_ast_parser() -> Lark_StandAlone:  # type: ignore
+    parser = _load_parser(propagate_positions=False)
+    callbacks = AstBuilder(_transformer).callbacks(parser.rules)  # type: ignore
+    parser.parser.parser.parser.callbacks = callbacks  # type: ignore
+    return parser
+
+
+_ast_parser = _load_ast_parser()
+
+
+Frontend = Literal["lark", "pratt"]
+
+FRONTENDS: dict[Frontend, Callable[[str], Ast]] = {
+    "lark": lambda source: _ast_parser.parse(source).value,  # type: ignore
+    "pratt": pratt.parse_to_ast,
+}
+"""
+Parsers that turn source into an AST. All of them produce identical trees
+for the programs they accept. The pratt parser tokenizes without knowing
+the parser state, unlike lark's contextual lexer, so it rejects a few
+inputs lark accepts (keywords glued to the next token, like `casefalse`)
+and may report errors at other positions; `parse_to_ast` hides this.
+"""
+
+DEFAULT_FRONTEND: Frontend = "pratt"
+
+
+def parse_to_ast(source: str, frontend: Frontend = DEFAULT_FRONTEND) -> Ast:
+    """
+    Parse source directly into an AST. Equivalent to (but faster and more
+    memory efficient than) `parse_tree_to_ast(parse(source))`, including
+    the exceptions raised on invalid input.
+    """
+    try:
+        return FRONTENDS[frontend](source)
+    except (RecursionError, UnexpectedInput):
+        if frontend == "lark":
+            raise
+        # The pratt parser is recursive descent, while the LALR parser keeps
+        # its stack on the heap and can handle any nesting depth. On invalid
+        # input, the LALR parser either accepts what its contextual lexer
+        # splits differently or raises the error at lark's position.
+        return FRONTENDS["lark"](source)
@@ -0,0 +1,799 @@
+"""
+A hand written front end: a specialised tokenizer and a Pratt parser for
+expressions, with recursive descent for statements.
+
+It produces exactly the same AST (including spans and token types) as the
+lark based parser in `compiler.parser` for every program it accepts, and
+raises lark's `UnexpectedInput` errors otherwise. Unlike lark's contextual
+lexer, the tokenizer does not know which tokens the parser expects next, so
+it rejects keywords glued to the next token (`casefalse`) and may report
+an error at another position than lark; `compiler.parser.parse_to_ast`
+falls back to lark in that case.
+"""
+
+import re
+import sys
+from typing import Any, Callable, NoReturn, Optional, Type
+
+from compiler import ast
+from compiler.ast.base import Ast
+from compiler.ast.expressions import Expression
+from compiler.errors import LineTable, Span
+from compiler.lalr import (  # type: ignore
+    MEMO,
+    Token,
+    UnexpectedCharacters,
+    UnexpectedToken,
+)
+
+# (type, value, start_pos, line, column, end_line, end_column, end_pos),
+# the same fields as a lark Token.
+RawToken = tuple[str, str, int, int, int, int, int, int]
+
+TYPE, VALUE, START_POS, END_POS = 0, 1, 2, 7
+
+
+def _terminal_names() -> dict[str, str]:
+    """
+    Map from the literal text of every string terminal to its name in the
+    generated parser, so that tokens have the same types as lark's (some
+    of which are generated, like `__ANON_3` for `==`).
+    """
+    names: dict[str, str] = {}
+    for entry in MEMO.values():  # type: ignore
+        if entry.get("__type__") != "TerminalDef":  # type: ignore
+            continue
+        pattern = entry["pattern"]  # type: ignore
+        if pattern["__type__"] == "PatternStr":
+            names[pattern["value"]] = entry["name"]  # type: ignore
+    return names
+
+
+_TERMINALS = _terminal_names()
+
+IDENTIFIER = "IDENTIFIER"
+INT = "INT"
+STRING = "STRING"
+NEWLINE = "_NL"
+END = "$END"
+
+LET, PRINT, RETURN = _TERMINALS["let"], _TERMINALS["print"], _TERMINALS["return"]
+IF, ELIF, ELSE = _TERMINALS["if"], _TERMINALS["elif"], _TERMINALS["else"]
+MATCH, CASE = _TERMINALS["match"], _TERMINALS["case"]
+WHILE, FOR, IN = _TERMINALS["while"], _TERMINALS["for"], _TERMINALS["in"]
+STRUCT, ENUM, FN = _TERMINALS["struct"], _TERMINALS["enum"], _TERMINALS["fn"]
+TRUE, FALSE = _TERMINALS["true"], _TERMINALS["false"]
+
+EQUAL, COMMA, COLON, DOT = (_TERMINALS[t] for t in ("=", ",", ":", "."))
+LPAR, RPAR, LSQB, RSQB = (_TERMINALS[t] for t in ("(", ")", "[", "]"))
+LBRACE, RBRACE = _TERMINALS["{"], _TERMINALS["}"]
+LESSTHAN, MORETHAN = _TERMINALS["<"], _TERMINALS[">"]
+PATH, RANGE, ARROW = _TERMINALS["::"], _TERMINALS[".."], _TERMINALS["->"]
+PLUS, MINUS, BANG = _TERMINALS["+"], _TERMINALS["-"], _TERMINALS["!"]
+
+_KEYWORDS = {text: name for text, name in _TERMINALS.items() if text.isidentifier()}
+_PUNCTUATION = {
+    text: name for text, name in _TERMINALS.items() if not text.isidentifier()
+}
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<skip>[ \t]+|//[^\n]*)
+    |(?P<newline>(?:\r?\n)+)
+    |(?P<word>[A-Za-z_][A-Za-z0-9_]*)
+    |(?P<int>[0-9]+)
+    |(?P<string>".*?")
+    |(?P<punct>"""
+    + "|".join(re.escape(p) for p in sorted(_PUNCTUATION, key=len, reverse=True))
+    + ")",
+    re.VERBOSE,
+)
+
+
+def tokenize(
+    source: str,
+    pos: int = 0,
+    endpos: Optional[int] = None,
+    line: int = 1,
+    line_start: int = 0,
+) -> list[RawToken]:
+    """
+    Split source into tokens, dropping whitespace and comments. The last
+    token is always an end of input marker.
+
+    A slice of source can be tokenized by passing the offsets of the slice,
+    along with the line number of pos and the offset at which that line
+    starts, so that token positions are relative to the whole source.
+    """
+    tokens: list[RawToken] = []
+    append = tokens.append
+    match = _TOKEN_RE.match
+    keywords = _KEYWORDS
+    punctuation = _PUNCTUATION
+
+    length = len(source) if endpos is None else endpos
+
+    while pos < length:
+        m = match(source, pos, length)
+        if m is None:
+            raise UnexpectedCharacters(source, pos, line, pos - line_start + 1)
+
+        kind = m.lastgroup
+        value = m.group()
+        end = m.end()
+        column = pos - line_start + 1
+
+        if kind == "skip":
+            pass
+        elif kind == "newline":
+            end_line = line + value.count("\n")
+            line_start = pos + value.rindex("\n") + 1
+            append((NEWLINE, value, pos, line, column, end_line, end - line_start + 1, end))
+            line = end_line
+        else:
+            if kind == "word":
+                type_ = keywords.get(value, IDENTIFIER)
+            elif kind == "punct":
+                type_ = punctuation[value]
+            elif kind == "int":
+                type_ = INT
+            else:
+                type_ = STRING
+            append((type_, value, pos, line, column, line, column + end - pos, end))
+
+        pos = end
+
+    # like lark, the end marker borrows the position of the last token
+    column = pos - line_start + 1
+    last = tokens[-1] if tokens else (END, "", pos, line, column, line, column, pos)
+    append((END, "", *last[2:]))
+    return tokens
+
+
+_INFIX: dict[str, tuple[int, Type[Expression]]] = {
+    _TERMINALS[op]: (power, cls)
+    for power, cls, ops in (
+        (1, ast.operators.Equality, ("==", "!=")),
+        (2, ast.operators.Logical, ("&&", "||")),
+        (3, ast.operators.Comparison, (">", "<", "<=", ">=")),
+        (4, ast.operators.Term, ("+", "-")),
+        (5, ast.operators.Factor, ("*", "/", "%")),
+    )
+    for op in ops
+}
+"""
+Binding power and node class of every binary operator, loosest first.
+"""
+
+_PREFIX = {PLUS, MINUS, BANG}
+
+_STATEMENT_KEYWORDS = {LET, IF, MATCH, WHILE, FOR, STRUCT, ENUM, PRINT, FN, RETURN}
+
+_KEYWORD_TYPES = set(_KEYWORDS.values())
+_SOFT_KEYWORDS = _KEYWORD_TYPES - {TRUE, FALSE}
+
+
+class PrattParser:
+    def __init__(
+        self,
+        source: str,
+        tokens: Optional[list[RawToken]] = None,
+        lines: Optional[LineTable] = None,
+    ):
+        self.source = source
+        self.tokens = tokenize(source) if tokens is None else tokens
+        self.lines = LineTable(source) if lines is None else lines
+        self.pos = 0
+
+    # ============================== Helpers ==============================
+
+    def peek(self, offset: int = 0) -> str:
+        return self.tokens[self.pos + offset][TYPE]
+
+    def advance(self) -> RawToken:
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def token(self, raw: RawToken, type_: Optional[str] = None) -> Token:
+        return Token(type_ or raw[TYPE], *raw[VALUE:])
+
+    def meta(self, start: int) -> Span:
+        """
+        Span covering all tokens consumed since index start. Passed to the
+        AST constructors in place of lark's `Meta`.
+        """
+        tokens = self.tokens
+        start_pos, end_pos = tokens[start][START_POS], tokens[self.pos - 1][END_POS]
+        return Span.lazy(start_pos, end_pos, self.lines)
+
+    def error(self, *expected: str) -> NoReturn:
+        raise UnexpectedToken(self.token(self.tokens[self.pos]), set(expected))
+
+    def expect(self, type_: str) -> RawToken:
+        if self.tokens[self.pos][TYPE] != type_:
+            self.error(type_)
+        return self.advance()
+
+    def is_identifier(self, offset: int = 0) -> bool:
+        """
+        lark's contextual lexer only produces keyword tokens where the
+        keyword is valid, so keywords double as identifiers elsewhere.
+        """
+        type_ = self.tokens[self.pos + offset][TYPE]
+        return type_ == IDENTIFIER or type_ in _SOFT_KEYWORDS
+
+    def token_span(self, raw: RawToken) -> Span:
+        return Span.lazy(raw[START_POS], raw[END_POS], self.lines)
+
+    def identifier(self) -> str:
+        type_ = self.peek()
+        if type_ != IDENTIFIER and type_ not in _KEYWORD_TYPES:
+            self.error(IDENTIFIER)
+        return sys.intern(self.advance()[VALUE])
+
+    def separated(self, item: Callable[[], Any]) -> list[Any]:
+        items = [item()]
+        while self.peek() == COMMA:
+            self.advance()
+            items.append(item())
+        return items
+
+    def repeated(self, item: Callable[[], Any], end: str) -> list[Any]:
+        """
+        Parse `(item | _NL)+` up to (but excluding) the end token.
+        """
+        items: list[Any] = []
+        newlines = 0
+        while (type_ := self.peek()) != end:
+            if type_ == NEWLINE:
+                self.advance()
+                newlines += 1
+            else:
+                items.append(item())
+
+        if not items and not newlines:
+            self.error(end)
+        return items
+
+    # ============================ Statements =============================
+
+    def parse(self) -> Ast:
+        stmt = self.statement_list(END)
+        self.expect(END)
+        return stmt
+
+    def statements(self) -> list[Ast]:
+        """
+        Parse a possibly empty sequence of statements up to the end of
+        input, without collapsing them into a statement list.
+        """
+        stmts: list[Ast] = []
+        while (type_ := self.peek()) != END:
+            if type_ == NEWLINE:
+                self.advance()
+            else:
+                stmts.append(self.statement())
+        return stmts
+
+    def statement_list(self, end: str) -> Ast:
+        start = self.pos
+        stmts = self.repeated(self.statement, end)
+
+        # statement_list is an inlined rule, so it is replaced by its only
+        # statement when there is exactly one
+        if len(stmts) == 1:
+            return stmts[0]
+        return ast.statements.StatementList(self.meta(start), stmts)
+
+    def statement_block(self) -> ast.statements.StatementBlock:
+        self.expect(LBRACE)
+        start = self.pos
+        stmts = self.statement_list(RBRACE)
+        block = ast.statements.StatementBlock(self.meta(start), [stmts])
+        self.expect(RBRACE)
+        return block
+
+    def statement(self) -> Ast:
+        type_ = self.peek()
+
+        if type_ in _STATEMENT_KEYWORDS:
+            return self.STATEMENTS[type_](self)
+
+        if self.is_identifier():
+            next_type = self.peek(1)
+            if next_type == EQUAL:
+                return self.assignment()
+            if next_type == DOT:
+                return self.struct_access_or_assignment()
+            if next_type == LSQB:
+                # lark resolves the shift/reduce conflict between indexing
+                # and index_assignment in favour of the latter.
+                return self.index_assignment()
+
+        return self.expression()
+
+    def variable_declaration(self) -> Ast:
+        start = self.pos
+        self.expect(LET)
+        ident = self.identifier()
+        self.expect(EQUAL)
+        rvalue = self.expression()
+        return ast.variable.VariableDeclaration(self.meta(start), ident, rvalue)
+
+    def assignment(self) -> Ast:
+        start = self.pos
+        lvalue = self.identifier()
+        lvalue_span = self.token_span(self.tokens[start])
+        self.expect(EQUAL)
+        rvalue = self.expression()
+        return ast.variable.Assignment(
+            self.meta(start), lvalue, rvalue, lvalue_span=lvalue_span
+        )
+
+    def index_assignment(self) -> Ast:
+        start = self.pos
+        array = self.variable()
+        self.expect(LSQB)
+        index = self.expression()
+        self.expect(RSQB)
+        self.expect(EQUAL)
+        value = self.expression()
+        return ast.array.IndexAssignment(self.meta(start), array, index, value)
+
+    def struct_access(self) -> ast.struct.StructAccess:
+        start = self.pos
+        name = self.identifier()
+        self.expect(DOT)
+        member = self.identifier()
+        return ast.struct.StructAccess(self.meta(start), name, member)
+
+    def struct_access_or_assignment(self) -> Ast:
+        start = self.pos
+        access = self.struct_access()
+        if self.peek() != EQUAL:
+            return access
+
+        self.advance()
+        value = self.expression()
+        return ast.struct.StructAssignment(self.meta(start), access, value)
+
+    def print_stmt(self) -> Ast:
+        start = self.pos
+        self.expect(PRINT)
+        if self.is_identifier() and self.peek(1) == DOT:
+            expr = self.struct_access()
+        else:
+            expr = self.expression()
+        return ast.print.PrintStmt(self.meta(start), expr)
+
+    def return_stmt(self) -> Ast:
+        start = self.pos
+        self.expect(RETURN)
+        value = self.expression()
+        return ast.function.ReturnStmt(self.meta(start), value)
+
+    def if_chain(self) -> Ast:
+        start = self.pos
+        if_stmt = self.conditional(IF, ast.if_stmt.IfStmt)
+
+        else_if_ladder = None
+        if self.peek() == ELIF:
+            ladder_start = self.pos
+            blocks: list[ast.if_stmt.ElseIfStmt] = []
+            while self.peek() == ELIF:
+                blocks.append(self.conditional(ELIF, ast.if_stmt.ElseIfStmt))
+            else_if_ladder = ast.if_stmt.ElseIfLadder(self.meta(ladder_start), blocks)
+
+        else_block = None
+        if self.peek() == ELSE:
+            self.advance()
+            else_block = self.statement_block()
+
+        return ast.if_stmt.IfChain(self.meta(start), if_stmt, else_if_ladder, else_block)
+
+    def conditional(self, keyword: str, cls: Type[Any]) -> Any:
+        start = self.pos
+        self.expect(keyword)
+        cond = self.expression()
+        block = self.statement_block()
+        return cls(self.meta(start), cond, block)
+
+    def while_stmt(self) -> Ast:
+        return self.conditional(WHILE, ast.loops.WhileStmt)
+
+    def for_stmt(self) -> Ast:
+        start = self.pos
+        self.expect(FOR)
+        var = self.identifier()
+        self.expect(IN)
+        expr = self.expression()
+
+        if self.peek() == RANGE:
+            self.advance()
+            end = self.expression()
+            block = self.statement_block()
+            return ast.loops.ForStmtInt(self.meta(start), var, expr, end, block)
+
+        block = self.statement_block()
+        return ast.loops.ForStmt(self.meta(start), var, expr, block)
+
+    def match_stmt(self) -> Ast:
+        start = self.pos
+        self.expect(MATCH)
+        expr = self.expression()
+        self.expect(LBRACE)
+
+        ladder_start = self.pos
+        cases = self.repeated(self.case_stmt, RBRACE)
+        ladder = ast.match.CaseLadder(self.meta(ladder_start), cases)
+
+        self.expect(RBRACE)
+        return ast.match.MatchStmt(self.meta(start), expr, ladder)
+
+    def case_stmt(self) -> ast.match.CaseStmt:
+        start = self.pos
+        self.expect(CASE)
+        pattern = self.match_pattern()
+        block = self.statement_block()
+        return ast.match.CaseStmt(self.meta(start), pattern, block)
+
+    def match_pattern(self) -> Any:
+        start = self.pos
+        type_ = self.peek()
+
+        if type_ == TRUE or type_ == FALSE:
+            return self.bool_literal()
+
+        if type_ == LSQB:
+            return self.array_pattern()
+
+        if self.is_identifier() and self.tokens[self.pos][VALUE] == "_":
+            self.advance()
+            return ast.match.WildcardPattern(self.meta(start))
+
+        if self.is_identifier() and self.peek(1) == PATH:
+            enum_type = self.identifier()
+            self.advance()
+            variant = self.identifier()
+            if self.peek() != LPAR:
+                return ast.match.EnumPattern(self.meta(start), enum_type, variant)
+
+            self.advance()
+            inner = self.match_pattern()
+            self.expect(RPAR)
+            return ast.match.EnumPatternTuple(
+                self.meta(start), enum_type, variant, inner
+            )
+
+        self.error(TRUE, FALSE, LSQB, IDENTIFIER)
+
+    def array_pattern(self) -> ast.match.ArrayPattern:
+        start = self.pos
+        self.expect(LSQB)
+        elements: list[ast.match.ArrayPatternElement] = []
+        if self.peek() != RSQB:
+            elements = self.separated(self.array_pattern_element)
+        self.expect(RSQB)
+        return ast.match.ArrayPattern(self.meta(start), elements)
+
+    def array_pattern_element(self) -> ast.match.ArrayPatternElement:
+        start = self.pos
+        if self.peek() == INT:
+            literal = self.int_literal()
+        elif self.peek() == LSQB:
+            literal = self.array_pattern()
+        elif self.is_identifier() and self.tokens[self.pos][VALUE] == "_":
+            self.advance()
+            literal = ast.match.WildcardPattern(self.meta(start))
+        else:
+            self.error(INT, LSQB, IDENTIFIER)
+        return ast.match.ArrayPatternElement(self.meta(start), literal)
+
+    def struct_stmt(self) -> Ast:
+        start = self.pos
+        self.expect(STRUCT)
+        name = self.identifier()
+        self.expect(LBRACE)
+
+        members_start = self.pos
+        members = self.repeated(self.struct_member, RBRACE)
+        struct_members = ast.struct.StructMembers(self.meta(members_start), members)
+
+        self.expect(RBRACE)
+        return ast.struct.StructStmt(self.meta(start), name, struct_members)
+
+    def struct_member(self) -> ast.struct.StructMember:
+        start = self.pos
+        name = self.identifier()
+        self.expect(COLON)
+        annotation = self.type_annotation()
+        return ast.struct.StructMember(self.meta(start), name, annotation)
+
+    def enum_stmt(self) -> Ast:
+        start = self.pos
+        self.expect(ENUM)
+        name = self.identifier()
+        name_span = self.token_span(self.tokens[self.pos - 1])
+        self.expect(LBRACE)
+
+        members_start = self.pos
+        members = self.repeated(self.enum_member, RBRACE)
+        enum_members = ast.enum.EnumMembers(self.meta(members_start), members)
+
+        self.expect(RBRACE)
+        return ast.enum.EnumStmt(
+            self.meta(start), name, enum_members, name_span=name_span
+        )
+
+    def enum_member(self) -> Any:
+        start = self.pos
+        name = self.identifier()
+        if self.peek() != LPAR:
+            return ast.enum.EnumMemberBare(self.meta(start), name)
+
+        self.advance()
+        annotation = self.type_annotation()
+        self.expect(RPAR)
+        return ast.enum.EnumMemberTuple(self.meta(start), name, annotation)
+
+    def function_definition(self) -> Ast:
+        start = self.pos
+        self.expect(FN)
+        name = self.identifier()
+        self.expect(LPAR)
+
+        params = None
+        if self.peek() != RPAR:
+            params_start = self.pos
+            args = self.separated(self.function_param)
+            params = ast.function.FunctionParams(self.meta(params_start), args)
+
+        self.expect(RPAR)
+        self.expect(ARROW)
+        return_type = self.type_annotation()
+        body = self.statement_block()
+        return ast.function.FunctionDefinition(
+            self.meta(start), name, params, return_type, body
+        )
+
+    def function_param(self) -> ast.function.FunctionParam:
+        start = self.pos
+        name = self.identifier()
+        self.expect(COLON)
+        annotation = self.type_annotation()
+        return ast.function.FunctionParam(self.meta(start), name, annotation)
+
+    def type_annotation(self) -> ast.annotation.TypeAnnotation:
+        start = self.pos
+        ty = self.identifier()
+
+        generics = None
+        if self.peek() == LESSTHAN:
+            self.advance()
+            generics = self.type_annotation()
+            self.expect(MORETHAN)
+
+        return ast.annotation.TypeAnnotation(self.meta(start), ty, generics)
+
+    STATEMENTS: dict[str, Callable[["PrattParser"], Ast]] = {
+        LET: variable_declaration,
+        IF: if_chain,
+        MATCH: match_stmt,
+        WHILE: while_stmt,
+        FOR: for_stmt,
+        STRUCT: struct_stmt,
+        ENUM: enum_stmt,
+        PRINT: print_stmt,
+        FN: function_definition,
+        RETURN: return_stmt,
+    }
+
+    # ============================ Expressions ============================
+
+    def expression(self, min_power: int = 0) -> Any:
+        start = self.pos
+        left = self.unary_op()
+
+        while (infix := _INFIX.get(self.peek())) is not None:
+            power, cls = infix
+            if power < min_power:
+                break
+
+            raw = self.advance()
+            # Operators are left associative, so the right operand only
+            # binds tighter operators.
+            right = self.expression(power + 1)
+            left = cls(
+                self.meta(start),
+                left,
+                sys.intern(raw[VALUE]),
+                right,
+                op_span=self.token_span(raw),
+            )
+
+        return left
+
+    def unary_op(self) -> Any:
+        if self.peek() not in _PREFIX:
+            return self.indexing()
+
+        start = self.pos
+        raw = self.advance()
+        operand = self.unary_op()
+        return ast.operators.UnaryOp(
+            self.meta(start),
+            sys.intern(raw[VALUE]),
+            operand,
+            op_span=self.token_span(raw),
+        )
+
+    def indexing(self) -> Any:
+        start = self.pos
+        element = self.function_call()
+        if self.peek() != LSQB:
+            return element
+
+        self.advance()
+        index = self.expression()
+        self.expect(RSQB)
+        return ast.array.Indexing(self.meta(start), element, index)
+
+    def function_call(self) -> Any:
+        if not (self.is_identifier() and self.peek(1) == LPAR):
+            return self.atom()
+
+        start = self.pos
+        callee = self.variable()
+        self.advance()
+
+        args = None
+        if self.peek() == RPAR:
+            pass
+        elif self.is_identifier() and self.peek(1) == EQUAL:
+            args_start = self.pos
+            members = self.separated(self.struct_init_member)
+            args = ast.struct.StructInitMembers(self.meta(args_start), members)
+        else:
+            args_start = self.pos
+            exprs = self.separated(self.expression)
+            args = ast.function.FunctionArgs(self.meta(args_start), exprs)
+
+        self.expect(RPAR)
+        return ast.function.FunctionCall(self.meta(start), callee, args)
+
+    def struct_init_member(self) -> ast.struct.StructInitMember:
+        start = self.pos
+        name = self.identifier()
+        self.expect(EQUAL)
+        value = self.expression()
+        return ast.struct.StructInitMember(self.meta(start), name, value)
+
+    def atom(self) -> Any:
+        start = self.pos
+        type_ = self.peek()
+
+        if type_ == INT:
+            return self.int_literal()
+        if type_ == STRING:
+            value = self.advance()[VALUE][1:-1]  # remove quotes
+            return ast.literals.StringLiteral(self.meta(start), value)
+        if type_ == TRUE or type_ == FALSE:
+            return self.bool_literal()
+        if type_ == LSQB or type_ == LESSTHAN:
+            return self.array_literal()
+        if type_ == LPAR:
+            self.advance()
+            expr = self.expression()
+            self.expect(RPAR)
+            return expr
+
+        if self.is_identifier():
+            if self.peek(1) == PATH:
+                return self.enum_literal()
+            return self.variable()
+
+        self.error(INT, STRING, TRUE, FALSE, LSQB, LESSTHAN, LPAR, IDENTIFIER)
+
+    def variable(self) -> ast.variable.Variable:
+        start = self.pos
+        name = self.identifier()
+        return ast.variable.Variable(self.meta(start), name)
+
+    def int_literal(self) -> ast.literals.IntLiteral:
+        start = self.pos
+        value = int(self.expect(INT)[VALUE])
+        return ast.literals.IntLiteral(self.meta(start), value)
+
+    def bool_literal(self) -> ast.literals.BoolLiteral:
+        start = self.pos
+        value = self.advance()[TYPE] == TRUE
+        return ast.literals.BoolLiteral(self.meta(start), value)
+
+    def enum_literal(self) -> Any:
+        start = self.pos
+        enum_type = self.identifier()
+        self.expect(PATH)
+        variant = self.identifier()
+        if self.peek() != LPAR:
+            return ast.enum.EnumLiteralSimple(self.meta(start), enum_type, variant)
+
+        self.advance()
+        inner = self.expression()
+        self.expect(RPAR)
+        return ast.enum.EnumLiteralTuple(self.meta(start), enum_type, variant, inner)
+
+    def array_literal(self) -> ast.array.ArrayLiteral:
+        start = self.pos
+
+        declared_type = None
+        if self.peek() == LESSTHAN:
+            self.advance()
+            declared_type = self.type_annotation()
+            self.expect(MORETHAN)
+
+        self.expect(LSQB)
+        members = None
+        if self.peek() != RSQB:
+            members_start = self.pos
+            if (values := self.constant_array_values()) is not None:
+                members = ast.array.ConstantArrayElements(
+                    self.meta(members_start), values
+                )
+            else:
+                elements = self.separated(self.array_element)
+                members = ast.array.array_elements(
+                    self.meta(members_start), elements
+                )
+        self.expect(RSQB)
+
+        return ast.array.ArrayLiteral(self.meta(start), declared_type, members)
+
+    def constant_array_values(self) -> Optional[list[ast.array.ConstantValue]]:
+        """
+        Fast path for arrays of literals of a single type, like lookup tables,
+        that reads the values straight from the tokens without building a
+        node per element. Returns None (without consuming anything) for any
+        other elements, including literals in parentheses; those are left to
+        `ast.array.array_elements`.
+        """
+        tokens = self.tokens
+        pos = self.pos
+        kind = tokens[pos + (tokens[pos][TYPE] == MINUS)][TYPE]
+        values: list[ast.array.ConstantValue] = []
+
+        while True:
+            negate = tokens[pos][TYPE] == MINUS
+            pos += negate
+            type_, value = tokens[pos][TYPE], tokens[pos][VALUE]
+
+            if kind == INT and type_ == INT:
+                values.append(-int(value) if negate else int(value))
+            elif negate:
+                return None
+            elif kind == STRING and type_ == STRING:
+                values.append(value[1:-1])  # remove quotes
+            elif kind in (TRUE, FALSE) and type_ in (TRUE, FALSE):
+                values.append(type_ == TRUE)
+            else:
+                return None
+
+            pos += 1
+            type_ = tokens[pos][TYPE]
+            if type_ == RSQB:
+                break
+            if type_ != COMMA:
+                return None
+            pos += 1
+
+        self.pos = pos
+        return values
+
+    def array_element(self) -> ast.array.ArrayElement:
+        start = self.pos
+        expr = self.expression()
+        return ast.array.ArrayElement(self.meta(start), expr)
+
+
+def parse_to_ast(source: str) -> Ast:
+    return PrattParser(source).parse()
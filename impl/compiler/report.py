@@ -1,8 +1,10 @@
-from typing import TYPE_CHECKING, Optional, Sequence
+import sys
+from typing import TYPE_CHECKING, Iterable, NamedTuple, Optional, Sequence
 
 # error_report submodule is generated dynamically by pyo3 on the rust
 # side. Hence pyright cannot detect the source file.
 from error_report import (  # pyright: ignore [reportMissingModuleSource]
+    render_errors as ariadne_render,
     report_error as ariadne_error,
 )
 
@@ -91,3 +93,45 @@ def report_error(
         code=code,
         labels=labels,
     )
+
+
+class Diagnostic(NamedTuple):
+    """
+    The arguments of `report_error` besides the source, which is shared by
+    all the errors reported with `report_errors`.
+    """
+
+    start_pos: int
+    description: Text
+    code: int
+    labels: Labels
+
+    def shift(self, offset: int) -> "Diagnostic":
+        """
+        The same diagnostic for a source that has offset more characters
+        before the one it was made for.
+        """
+        labels = [(*mark[:-1], _shift(mark[-1], offset)) for mark in self.labels]
+        return self._replace(start_pos=self.start_pos + offset, labels=labels)
+
+
+def _shift(span: "ariadne.CharSpan", offset: int) -> "ariadne.CharSpan":
+    start, end = span
+    return (start + offset, end + offset)
+
+
+def report_errors(source: str, diagnostics: Iterable[Diagnostic]):
+    """
+    Report many errors in the same source. Unlike calling `report_error` for
+    each of them, the lines of the source are only indexed once, and the
+    reports are rendered to a string that is written to stderr at once.
+    Color ids have the same color in all the reports.
+    """
+    output = ariadne_render(
+        source=source,
+        diagnostics=[
+            (d.start_pos, d.description.spans, d.code, d.labels) for d in diagnostics
+        ],
+    )
+    sys.stderr.write(output)
+    sys.stderr.flush()
@@ -1,12 +1,38 @@
-from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
-class FunctionReturn(Exception):
+class Completion:
     """
-    Raised by the language runtime to signal the execution of a return
-    statement within a function.
+    Returned by the `eval` of a statement that stops the statements after it
+    from running, and passed up by the statements enclosing it until the node
+    it is meant for: the call of the function, for a return statement.
+    Statements completing normally return anything else, an expression
+    statement returns its value.
     """
 
-    return_value: Any
+    __slots__ = ()
+
+
+class Return(Completion):
+    """
+    The execution of a return statement within a function.
+    """
+
+    __slots__ = ("return_value",)
+
+    def __init__(self, return_value: Any):
+        self.return_value = return_value
+
+
+class TailCall(Completion):
+    """
+    The execution of a return statement whose value is a call to a Ryu
+    function, which the caller makes in place of the returning one instead
+    of on top of it.
+    """
+
+    __slots__ = ("function", "args")
+
+    def __init__(self, function: Any, args: list[Any]):
+        self.function = function
+        self.args = args
@@ -0,0 +1,385 @@
+"""
+Typechecking of whole programs in two phases.
+
+The first phase checks the top level statements in order, taking only the
+signatures of function definitions, so struct, enum and function types and
+global variables are defined exactly as in a single pass. The body of a top
+level function depends on nothing but the globals defined before it, so the
+bodies are set aside and checked independently in the second phase, on a
+process pool if asked to.
+
+Signatures are not hoisted: a body is checked against the functions defined
+before it only, so top level functions cannot be mutually recursive, as in
+a single pass. Functions are defined at runtime when their statement runs,
+and a body calling a later function could run before that one is defined.
+
+Editors typecheck the same program after every edit instead, through an
+`ItemCache` that only checks again the top level statements that changed or
+depend on global names that changed.
+"""
+
+import math
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Literal, Optional, Sequence
+
+from typing_extensions import override
+
+from compiler import errors, langtypes
+from compiler.ast.base import Ast, Steps, walk
+from compiler.ast.function import FunctionDefinition
+from compiler.ast.statements import StatementList
+from compiler.env import TypeEnvironment
+
+PARALLEL_MIN_FUNCTIONS = 256
+"""
+Programs with fewer top level functions have their bodies checked in the
+current process whatever the number of jobs, since starting the workers
+costs more than checking them.
+"""
+
+CHUNKS_PER_JOB = 4
+
+_Body = tuple[FunctionDefinition, langtypes.Function, TypeEnvironment]
+"""A function whose body is left to check, with its type and scope."""
+
+
+class _History:
+    """
+    Every definition of a name in the global scope, together with the index
+    of the top level statement that made it.
+    """
+
+    definitions: dict[str, tuple[list[int], list[langtypes.Type]]]
+
+    def __init__(self):
+        self.definitions = {}
+
+    def record(self, name: str, position: int, type: langtypes.Type):
+        positions, types = self.definitions.setdefault(name, ([], []))
+        positions.append(position)
+        types.append(type)
+
+    def before(self, name: str, position: int) -> Optional[langtypes.Type]:
+        if (definitions := self.definitions.get(name)) is None:
+            return None
+
+        positions, types = definitions
+        index = bisect_left(positions, position)
+        return types[index - 1] if index else None
+
+
+class _Before:
+    """
+    Read only view of the names of a history defined before a position. Takes
+    the place of the values or types dict of a `TypeEnvironment`.
+    """
+
+    def __init__(self, history: _History, position: int):
+        self.history = history
+        self.position = position
+
+    def get(self, name: str) -> Optional[langtypes.Type]:
+        return self.history.before(name, self.position)
+
+
+class _GlobalScope(TypeEnvironment):
+    """
+    Scope of the top level statements, which keeps the history of its
+    definitions so that function bodies can be checked against the scope as
+    it was at their definition, after all top level statements have run.
+    """
+
+    position: int
+    """Index of the top level statement being checked."""
+
+    def __init__(self, enclosing: TypeEnvironment):
+        super().__init__(enclosing)
+        self.position = 0
+        self.value_history = _History()
+        self.type_history = _History()
+
+    @override
+    def define_var_type(self, name: str, value: langtypes.Type):
+        super().define_var_type(name, value)
+        self.value_history.record(name, self.position, value)
+
+    @override
+    def define_type(self, type_name: str, type: langtypes.Type):
+        super().define_type(type_name, type)
+        self.type_history.record(type_name, self.position, type)
+
+    def before(self, position: int) -> TypeEnvironment:
+        """
+        The scope as it was before the top level statement at position.
+        """
+        env = TypeEnvironment(enclosing=self.parent)
+        env.diagnostics = self.diagnostics
+        env.values = _Before(self.value_history, position)  # type: ignore
+        env.types = _Before(self.type_history, position)  # type: ignore
+        return env
+
+
+def typecheck_program(
+    ast: Ast,
+    env: TypeEnvironment,
+    jobs: int = 1,
+    diagnostics: Optional[errors.Diagnostics] = None,
+):
+    """
+    Typecheck a program in the global scope env, with the same outcome as
+    `ast.typecheck(env)`: when there are type errors, the first one in the
+    source is raised. In particular, a function body cannot use a function
+    defined after it.
+
+    jobs is the number of processes checking function bodies. Bodies are
+    pickled to the workers and back with the types assigned to their nodes,
+    which takes longer than checking them unless they are large, so by
+    default they are checked in the current process.
+
+    When diagnostics are given, checking goes on after type errors, which
+    are recorded in diagnostics. These are raised at the end if there were
+    any.
+    """
+    stmts: Sequence[Ast] = ast.stmts if isinstance(ast, StatementList) else [ast]
+    scope = _GlobalScope(env)
+    scope.diagnostics = diagnostics
+    bodies: list[_Body] = []
+    error: Optional[Exception] = None
+
+    try:
+        for position, stmt in enumerate(stmts):
+            scope.position = position
+            steps = _declare_steps(stmt, scope, bodies)
+            if diagnostics is None:
+                walk(steps)
+            else:
+                walk(stmt.recovering_steps(scope, steps))
+    except Exception as exc:
+        # Bodies of the functions before the failing statement come first.
+        error = exc
+
+    if jobs > 1 and len(bodies) >= PARALLEL_MIN_FUNCTIONS:
+        results = _check_bodies_in_parallel(bodies, jobs, diagnostics)
+    else:
+        results = _check_bodies(bodies)
+
+    for (fn, _, _), result in zip(bodies, results):
+        if isinstance(result, Exception):
+            raise result
+        # workers send back a copy of the definition, whose frame layout was
+        # resolved along with its body
+        fn.body = result.body
+        fn.param_slots = result.param_slots
+        fn.frame_size = result.frame_size
+        fn.reuse_frame = result.reuse_frame
+
+    if error is not None:
+        raise error
+    if diagnostics is not None and diagnostics.errors:
+        raise diagnostics
+
+    env.values.update(scope.values)
+    env.types.update(scope.types)
+
+
+def _declare_steps(
+    stmt: Ast, scope: _GlobalScope, bodies: list[_Body]
+) -> Steps[None]:
+    """
+    First phase of a top level statement: function definitions only have
+    their signature checked and their body set aside in bodies.
+    """
+    if isinstance(stmt, FunctionDefinition):
+        type = yield stmt.signature_steps(scope)
+        bodies.append((stmt, type, scope.before(scope.position)))
+        scope.define_var_type(stmt.name, type)
+    else:
+        yield stmt.typecheck_steps(scope)
+
+
+def _check_bodies(bodies: list[_Body]) -> list[FunctionDefinition | Exception]:
+    """
+    Check the bodies of functions, returning either the typechecked function
+    or the error raised by each one.
+    """
+    results: list[FunctionDefinition | Exception] = []
+
+    for fn, type, env in bodies:
+        try:
+            walk(fn.body_steps(env, type))
+        except Exception as exc:
+            results.append(exc)
+        else:
+            results.append(fn)
+
+    return results
+
+
+def _check_bodies_in_parallel(
+    bodies: list[_Body], jobs: int, diagnostics: Optional[errors.Diagnostics]
+) -> list[FunctionDefinition | Exception]:
+    """
+    Same as `_check_bodies` on a pool of jobs processes. Bodies are sent in
+    contiguous chunks, so that each chunk pickles the global history once, and
+    come back with the types assigned to their nodes. The errors recorded by
+    the workers are added to diagnostics.
+    """
+    size = math.ceil(len(bodies) / (jobs * CHUNKS_PER_JOB))
+    chunks = [bodies[i : i + size] for i in range(0, len(bodies), size)]
+    results: list[Any] = []
+
+    with ProcessPoolExecutor(jobs) as pool:
+        for chunk_results, chunk_errors in pool.map(_check_chunk, chunks):
+            results.extend(chunk_results)
+            if diagnostics is not None:
+                diagnostics.errors.extend(chunk_errors)
+
+    return results
+
+
+def _check_chunk(
+    bodies: list[_Body],
+) -> tuple[list[FunctionDefinition | Exception], list[errors.CompilerError]]:
+    # The bodies of a chunk share the copy of the diagnostics unpickled with
+    # them, which comes with the errors recorded before they were sent.
+    diagnostics = bodies[0][2].diagnostics
+    if diagnostics is None:
+        return _check_bodies(bodies), []
+
+    recorded = len(diagnostics.errors)
+    results = _check_bodies(bodies)
+    return results, diagnostics.errors[recorded:]
+
+
+Scope = Literal["values", "types"]
+
+
+@dataclass
+class CheckedItem:
+    """
+    Outcome of typechecking a top level statement (an item) in the global
+    scope, along with everything the outcome depends on besides the text of
+    the item.
+    """
+
+    item: Ast
+
+    uses: dict[tuple[Scope, str], Optional[langtypes.Type]] = field(
+        default_factory=dict
+    )
+    """Global names looked up by the item, with the type found for each."""
+
+    definitions: list[tuple[Scope, str, langtypes.Type]] = field(
+        default_factory=list
+    )
+    """Global names defined by the item, in order."""
+
+    error: Optional[Exception] = None
+
+    def is_valid(self, scope: dict[Scope, dict[str, langtypes.Type]]) -> bool:
+        """
+        Whether checking the item again in scope would give the same result.
+        Types are interned, so they are compared by identity.
+        """
+        return all(
+            scope[kind].get(name) is type for (kind, name), type in self.uses.items()
+        )
+
+    def define(self, scope: dict[Scope, dict[str, langtypes.Type]]):
+        for kind, name, type in self.definitions:
+            scope[kind][name] = type
+
+
+class _Recording:
+    """
+    Takes the place of the values or types dict of the global scope while an
+    item is checked, recording the names it uses and defines.
+    """
+
+    def __init__(
+        self, scope: dict[str, langtypes.Type], kind: Scope, checked: CheckedItem
+    ):
+        self.scope = scope
+        self.kind: Scope = kind
+        self.checked = checked
+
+    def get(self, name: str) -> Optional[langtypes.Type]:
+        type = self.scope.get(name)
+        self.checked.uses.setdefault((self.kind, name), type)
+        return type
+
+    def __setitem__(self, name: str, type: langtypes.Type):
+        self.scope[name] = type
+        self.checked.definitions.append((self.kind, name, type))
+
+
+class ItemCache:
+    """
+    Typechecks a program again and again as it is edited. Results are cached
+    by item, so an item is only checked again if it was reparsed (unchanged
+    items keep their nodes across `incremental.reparse`) or if a global name
+    it uses now has a different type.
+
+    Unlike `typecheck_program`, an error does not stop the check: the items
+    after it are checked without the definitions that failed.
+    """
+
+    env: TypeEnvironment
+    """Enclosing scope of the program (the builtins), which is not modified."""
+
+    items: dict[int, CheckedItem]
+    """Results of the last check, by id of the item."""
+
+    rechecked: list[Ast]
+    """Items that were checked again by the last call to `typecheck`."""
+
+    def __init__(self, env: TypeEnvironment):
+        self.env = env
+        self.items = {}
+        self.rechecked = []
+
+    def typecheck(self, ast: Ast) -> list[CheckedItem]:
+        stmts: Sequence[Ast] = ast.stmts if isinstance(ast, StatementList) else [ast]
+        scope: dict[Scope, dict[str, langtypes.Type]] = {"values": {}, "types": {}}
+        items: dict[int, CheckedItem] = {}
+        self.rechecked = []
+
+        for stmt in stmts:
+            checked = self.items.get(id(stmt))
+            if (
+                checked is None
+                or checked.item is not stmt
+                or not checked.is_valid(scope)
+            ):
+                checked = self._check(stmt, scope)
+                self.rechecked.append(stmt)
+            else:
+                checked.define(scope)
+            items[id(stmt)] = checked
+
+        self.items = items
+        return list(items.values())
+
+    def _check(
+        self, stmt: Ast, scope: dict[Scope, dict[str, langtypes.Type]]
+    ) -> CheckedItem:
+        checked = CheckedItem(stmt)
+        env = TypeEnvironment(enclosing=self.env)
+        env.values = _Recording(scope["values"], "values", checked)  # type: ignore
+        env.types = _Recording(scope["types"], "types", checked)  # type: ignore
+
+        try:
+            if isinstance(stmt, FunctionDefinition):
+                # Defined before its body is checked, so that an error in
+                # the body does not cascade to the callers.
+                type = walk(stmt.signature_steps(env))
+                env.define_var_type(stmt.name, type)
+                walk(stmt.body_steps(env, type))
+            else:
+                walk(stmt.typecheck_steps(env))
+        except Exception as exc:
+            checked.error = exc
+
+        return checked
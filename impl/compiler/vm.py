@@ -0,0 +1,317 @@
+"""
+Virtual machine running the bytecode of `compiler.bytecode` in a single
+dispatch loop, with the most frequent instructions tested first.
+
+Calls from a Ryu function to another do not nest Python calls: the machine
+saves the code, offset, stack and frame of the caller on a list and carries
+on with the callee, so recursion is only bounded by memory. Other functions,
+like the builtins, are called through their `call`.
+"""
+
+from typing import Any
+
+from typing_extensions import override
+
+from compiler import errors, langvalues
+from compiler.bytecode import (
+    ADD_INT,
+    ADD_INT_CONST,
+    AND,
+    BUILD_ARRAY,
+    BUILD_ENUM,
+    BUILD_STRUCT,
+    CALL,
+    CONCAT,
+    COPY_CONST,
+    DIV_INT,
+    ENTER_FRAME,
+    EQUAL,
+    EVAL,
+    FOR_ITER,
+    GET_ATTR,
+    GET_ITER,
+    GREATER_EQUAL_INT,
+    GREATER_INT,
+    INDEX,
+    JUMP,
+    JUMP_IF_EQUAL,
+    JUMP_IF_NOT_EQUAL,
+    JUMP_IF_NOT_GREATER_EQUAL_INT,
+    JUMP_IF_NOT_GREATER_INT,
+    JUMP_IF_NOT_LESS_EQUAL_INT,
+    JUMP_IF_NOT_LESS_INT,
+    LEAVE_FRAME,
+    LESS_EQUAL_INT,
+    LESS_INT,
+    LOAD_CONST,
+    LOAD_GLOBAL,
+    LOAD_LOCAL,
+    LOAD_LOCAL_PAIR,
+    LOAD_OUTER,
+    MAKE_FUNCTION,
+    MATCH_CASE,
+    MOD_INT,
+    MUL_INT,
+    NEGATE_INT,
+    NO_MATCH,
+    NOT,
+    NOT_EQUAL,
+    OR,
+    POP_JUMP_IF_FALSE,
+    POP_TOP,
+    PRINT,
+    RANGE,
+    RETURN,
+    SET_ATTR,
+    STORE_GLOBAL,
+    STORE_INDEX,
+    STORE_LOCAL,
+    STORE_OUTER,
+    SUB_INT,
+    SUB_INT_CONST,
+    CodeObject,
+)
+from compiler.env import RuntimeEnvironment
+
+_EXHAUSTED = object()
+
+
+class BytecodeFunction(langvalues.Function):
+    """
+    A Ryu function defined by bytecode, along with the frame it is defined
+    in, which encloses the frames of its calls.
+    """
+
+    __slots__ = ("code", "closure")
+
+    def __init__(self, code: CodeObject, closure: RuntimeEnvironment):
+        self.code = code
+        self.closure = closure
+
+    @override
+    def call(self, args: list[Any], env: RuntimeEnvironment) -> Any:
+        return execute(self.code, self.frame(args))
+
+    def frame(self, args: list[Any]) -> RuntimeEnvironment:
+        """
+        Frame of a call with args.
+        """
+        code = self.code
+        frame = RuntimeEnvironment(enclosing=self.closure, size=code.frame_size)
+        slots = frame.slots
+        slots[0] = self
+        if code.params is not None:
+            slots[code.params] = args
+        else:
+            for slot, arg in zip(code.param_slots, args):
+                slots[slot] = arg
+        return frame
+
+
+def execute(code_object: CodeObject, env: RuntimeEnvironment) -> Any:
+    """
+    Run code_object in the frame env, returning the value it returns.
+    """
+    code, constants, slots = code_object.code, code_object.constants, env.slots
+    stack: list[Any] = []
+    push, pop = stack.append, stack.pop
+    callers: list[tuple[CodeObject, int, list[Any], RuntimeEnvironment]] = []
+    pc = 0
+    # the top of the stack is read through a variable rather than a literal
+    # index, so the type checker does not narrow it to the last value stored
+    top: int = -1
+
+    while True:
+        opcode = code[pc]
+        arg = code[pc + 1]
+        pc += 2
+
+        if opcode == LOAD_LOCAL:
+            push(slots[arg])
+        elif opcode == LOAD_LOCAL_PAIR:
+            push(slots[arg >> 16])
+            push(slots[arg & 0xFFFF])
+        elif opcode == LOAD_CONST:
+            push(constants[arg])
+        elif opcode == STORE_LOCAL:
+            slots[arg] = pop()
+        elif opcode == LOAD_GLOBAL:
+            push(env.values[constants[arg]])
+        elif opcode == STORE_GLOBAL:
+            env.values[constants[arg]] = pop()
+        elif opcode == JUMP:
+            pc = arg
+        elif opcode == JUMP_IF_NOT_LESS_INT:
+            right = pop()
+            if not pop() < right:
+                pc = arg
+        elif opcode == JUMP_IF_NOT_LESS_EQUAL_INT:
+            right = pop()
+            if not pop() <= right:
+                pc = arg
+        elif opcode == JUMP_IF_NOT_GREATER_INT:
+            right = pop()
+            if not pop() > right:
+                pc = arg
+        elif opcode == JUMP_IF_NOT_GREATER_EQUAL_INT:
+            right = pop()
+            if not pop() >= right:
+                pc = arg
+        elif opcode == JUMP_IF_NOT_EQUAL:
+            right = pop()
+            if pop() != right:
+                pc = arg
+        elif opcode == JUMP_IF_EQUAL:
+            right = pop()
+            if pop() == right:
+                pc = arg
+        elif opcode == POP_JUMP_IF_FALSE:
+            if pop() is not True:
+                pc = arg
+        elif opcode == FOR_ITER:
+            value = next(stack[top], _EXHAUSTED)
+            if value is _EXHAUSTED:
+                pop()
+                pc = arg
+            else:
+                push(value)
+        elif opcode == INDEX:
+            index = pop()
+            array = stack[top]
+            if len(array) <= index:
+                constants[arg].index_value(array, index)
+            stack[top] = array[index]
+        elif opcode == ADD_INT_CONST:
+            stack[top] = stack[top] + constants[arg]
+        elif opcode == SUB_INT_CONST:
+            stack[top] = stack[top] - constants[arg]
+        elif opcode == ADD_INT:
+            right = pop()
+            stack[top] = stack[top] + right
+        elif opcode == SUB_INT:
+            right = pop()
+            stack[top] = stack[top] - right
+        elif opcode == STORE_INDEX:
+            index = pop()
+            value = pop()
+            pop()[index] = value
+        elif opcode == CALL:
+            fn = stack[-arg - 1]
+            args = stack[len(stack) - arg :]
+            del stack[-arg - 1 :]
+            if type(fn) is BytecodeFunction:
+                callers.append((code_object, pc, stack, env))
+                env = fn.frame(args)
+                code_object = fn.code
+                code, constants = code_object.code, code_object.constants
+                slots = env.slots
+                stack = []
+                push, pop = stack.append, stack.pop
+                pc = 0
+            else:
+                push(fn.call(args, env))
+        elif opcode == RETURN:
+            value = pop()
+            if not callers:
+                return value
+            code_object, pc, stack, env = callers.pop()
+            code, constants = code_object.code, code_object.constants
+            slots = env.slots
+            push, pop = stack.append, stack.pop
+            push(value)
+        elif opcode == LESS_INT:
+            right = pop()
+            stack[top] = stack[top] < right
+        elif opcode == LESS_EQUAL_INT:
+            right = pop()
+            stack[top] = stack[top] <= right
+        elif opcode == GREATER_INT:
+            right = pop()
+            stack[top] = stack[top] > right
+        elif opcode == GREATER_EQUAL_INT:
+            right = pop()
+            stack[top] = stack[top] >= right
+        elif opcode == EQUAL:
+            right = pop()
+            stack[top] = stack[top] == right
+        elif opcode == NOT_EQUAL:
+            right = pop()
+            stack[top] = stack[top] != right
+        elif opcode == PRINT:
+            print(pop())
+        elif opcode == MATCH_CASE:
+            push(constants[arg].matches(stack[top]))
+        elif opcode == POP_TOP:
+            pop()
+        elif opcode == LOAD_OUTER:
+            depth, slot = constants[arg]
+            push(env.frame(depth).slots[slot])
+        elif opcode == STORE_OUTER:
+            depth, slot = constants[arg]
+            env.frame(depth).slots[slot] = pop()
+        elif opcode == MUL_INT:
+            right = pop()
+            stack[top] = stack[top] * right
+        elif opcode == DIV_INT:
+            right = pop()
+            stack[top] = stack[top] // right
+        elif opcode == MOD_INT:
+            right = pop()
+            stack[top] = stack[top] % right
+        elif opcode == CONCAT:
+            right = pop()
+            stack[top] = stack[top] + right
+        elif opcode == AND:
+            # both operands are evaluated, as by `eval`
+            right = pop()
+            stack[top] = stack[top] and right
+        elif opcode == OR:
+            right = pop()
+            stack[top] = stack[top] or right
+        elif opcode == NEGATE_INT:
+            stack[top] = -stack[top]
+        elif opcode == NOT:
+            stack[top] = not stack[top]
+        elif opcode == RANGE:
+            end = pop()
+            stack[top] = iter(range(stack[top], end))
+        elif opcode == GET_ITER:
+            stack[top] = iter(stack[top])
+        elif opcode == BUILD_ARRAY:
+            values = stack[len(stack) - arg :]
+            del stack[len(stack) - arg :]
+            push(values)
+        elif opcode == COPY_CONST:
+            push(constants[arg].copy())
+        elif opcode == GET_ATTR:
+            stack[top] = stack[top].get_attr(constants[arg])
+        elif opcode == SET_ATTR:
+            value = pop()
+            pop().set_attr(constants[arg], value)
+        elif opcode == BUILD_STRUCT:
+            name, names = constants[arg]
+            values = stack[len(stack) - len(names) :]
+            del stack[len(stack) - len(names) :]
+            attrs = dict(zip(names, values))
+            push(langvalues.StructValue(name=name, attrs=attrs))
+        elif opcode == BUILD_ENUM:
+            ty, variant = constants[arg]
+            stack[top] = langvalues.EnumTupleValue(
+                ty=ty, variant=variant, tuple_value=stack[top]
+            )
+        elif opcode == ENTER_FRAME:
+            env = RuntimeEnvironment(enclosing=env, size=arg)
+            slots = env.slots
+        elif opcode == LEAVE_FRAME:
+            env = env.parent  # type: ignore
+            slots = env.slots
+        elif opcode == MAKE_FUNCTION:
+            push(BytecodeFunction(constants[arg], closure=env))
+        elif opcode == EVAL:
+            push(constants[arg].eval(env))
+        elif opcode == NO_MATCH:
+            raise errors.InternalCompilerError(
+                "Match statement did not execute any case blocks"
+            )
+        else:
+            raise errors.InternalCompilerError(f"Unknown opcode {opcode}")
@@ -11,6 +11,8 @@ MarkColor = tuple[ColorId, CharSpan]
 MarkTextAndColor = tuple[Message, ColorId, CharSpan]
 Mark = MarkText | MarkColor | MarkTextAndColor
 
+Diagnostic = tuple[int, Message, int, Sequence[Mark]]
+
 def report_error(
     source: str,
     start_pos: int,
@@ -18,3 +20,7 @@ def report_error(
     code: int,
     labels: Sequence[Mark],
 ) -> None: ...
+def render_errors(
+    source: str,
+    diagnostics: Sequence[Diagnostic],
+) -> str: ...
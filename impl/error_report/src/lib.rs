@@ -74,38 +74,42 @@ impl ColorStore {
     }
 }
 
-#[pyfunction]
-fn report_error(
-    source: String,
-    start_pos: usize,
-    message: Message,
-    code: usize,
-    labels: Vec<Mark>,
-) {
-    let mut color_store = ColorStore::new();
+const SOURCE_ID: &str = "stdin";
 
-    let build_msg = |msg: &Message, store: &mut ColorStore| -> String {
-        msg.iter()
-            .map(|span| match span {
-                MessageSpan::Text(t) => t.clone(),
-                MessageSpan::Colored(text, color_id) => {
-                    format!("{}", text.fg(store.get(color_id)))
-                }
-            })
-            .collect()
-    };
+type SourceSpan = (&'static str, Range<usize>);
 
-    let source_id = "stdin";
+/// Arguments of `report_error` for one of the errors rendered by
+/// `render_errors`: start position, message, code and labels.
+#[derive(FromPyObject)]
+struct Diagnostic(usize, Message, usize, Vec<Mark>);
+
+fn build_msg(msg: &Message, store: &mut ColorStore) -> String {
+    msg.iter()
+        .map(|span| match span {
+            MessageSpan::Text(t) => t.clone(),
+            MessageSpan::Colored(text, color_id) => {
+                format!("{}", text.fg(store.get(color_id)))
+            }
+        })
+        .collect()
+}
 
-    let mut report = Report::build(ReportKind::Error, source_id, start_pos)
+fn build_report(
+    start_pos: usize,
+    message: &Message,
+    code: usize,
+    labels: &[Mark],
+    color_store: &mut ColorStore,
+) -> Report<'static, SourceSpan> {
+    let mut report = Report::build(ReportKind::Error, SOURCE_ID, start_pos)
         .with_code(format!("E{code:02}"))
-        .with_message(build_msg(&message, &mut color_store));
+        .with_message(build_msg(message, color_store));
 
     for mark in labels {
-        let mut label = Label::new((source_id, mark.range()));
+        let mut label = Label::new((SOURCE_ID, mark.range()));
 
         if let Some(msg) = mark.text() {
-            label = label.with_message(build_msg(msg, &mut color_store))
+            label = label.with_message(build_msg(msg, color_store))
         }
         if let Some(color_id) = mark.color_id() {
             label = label.with_color(color_store.get(color_id));
@@ -114,16 +118,49 @@ fn report_error(
         report.add_label(label);
     }
 
+    report.finish()
+}
+
+#[pyfunction]
+fn report_error(
+    source: String,
+    start_pos: usize,
+    message: Message,
+    code: usize,
+    labels: Vec<Mark>,
+) {
+    let mut color_store = ColorStore::new();
+    let report = build_report(start_pos, &message, code, &labels, &mut color_store);
+
     eprintln!();
-    report
-        .finish()
-        .eprint((source_id, Source::from(source)))
-        .unwrap();
+    report.eprint((SOURCE_ID, Source::from(source))).unwrap();
     eprintln!();
 }
 
+/// Render the reports of many errors in the same source, laid out as if
+/// `report_error` was called for each of them. The lines of the source are
+/// indexed once for all the reports, which share their colors and are
+/// written to a single buffer instead of stderr.
+#[pyfunction]
+fn render_errors(source: String, diagnostics: Vec<Diagnostic>) -> PyResult<String> {
+    let mut cache = (SOURCE_ID, Source::from(source));
+    let mut color_store = ColorStore::new();
+    let mut output: Vec<u8> = Vec::new();
+
+    for Diagnostic(start_pos, message, code, labels) in &diagnostics {
+        let report = build_report(*start_pos, message, *code, labels, &mut color_store);
+
+        output.push(b'\n');
+        report.write(&mut cache, &mut output)?;
+        output.push(b'\n');
+    }
+
+    Ok(String::from_utf8_lossy(&output).into_owned())
+}
+
 #[pymodule]
 fn error_report(_py: Python, m: &PyModule) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(report_error, m)?)?;
+    m.add_function(wrap_pyfunction!(render_errors, m)?)?;
     Ok(())
 }
@@ -0,0 +1,27 @@
+import pytest
+
+from compiler.env import TypeEnvironment
+from compiler.errors import ArrayTypeMismatch
+from compiler.langtypes import INT, Array
+from compiler.parser import parse, parse_tree_to_ast
+
+SOURCE = """\
+let a = [[1, 2], [3, 4]]
+match a {
+    case [[1, 2], 5] { 1 }
+    case _ { 0 }
+}
+"""
+
+
+def test_array_pattern_elements_type_mismatch():
+    with pytest.raises(ArrayTypeMismatch) as excinfo:
+        ast = parse_tree_to_ast(parse(SOURCE))
+        ast.typecheck(TypeEnvironment())
+
+    err = excinfo.value
+
+    assert err.span.coord() == ((3, 19), (3, 20))
+    assert err.expected_type_span.coord() == ((3, 11), (3, 17))
+    assert err.expected_type == Array(INT)
+    assert err.actual_type == INT
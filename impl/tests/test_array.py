@@ -1,8 +1,13 @@
 from typing import Any
+
+import pytest
+
+from compiler.ast.array import ArrayElements, ArrayLiteral, ConstantArrayElements
+from compiler.ast.variable import VariableDeclaration
 from compiler.compiler import get_default_environs
 from compiler.env import RuntimeEnvironment, TypeEnvironment
-from compiler.parser import parse, parse_tree_to_ast
-from compiler.langtypes import INT, Array
+from compiler.parser import FRONTENDS, parse, parse_to_ast, parse_tree_to_ast
+from compiler.langtypes import BOOL, INT, STRING, Array, Type
 from tests.utils import docstring_source_with_snapshot
 
 
@@ -59,3 +64,91 @@ def test_empty_array(source: str, snapshot: Any):
 
     ast.eval(env)
     assert env.get("x") == []
+
+
+@pytest.mark.parametrize("frontend", FRONTENDS)
+@pytest.mark.parametrize(
+    "source,values,ty",
+    [
+        ("[1, -2, 3]", [1, -2, 3], INT),
+        ('["a", "b"]', ["a", "b"], STRING),
+        ("[true, false]", [True, False], BOOL),
+    ],
+)
+def test_constant_array(frontend: Any, source: str, values: list[Any], ty: Type):
+    ast = parse_to_ast(f"let x = {source}", frontend)
+    assert isinstance(ast, VariableDeclaration)
+    assert isinstance(ast.rvalue, ArrayLiteral)
+    assert isinstance(ast.rvalue.members, ConstantArrayElements)
+    assert ast.rvalue.members.values == values
+
+    type_env, env = get_default_environs()
+    ast.typecheck(type_env)
+    assert type_env.get_var_type("x") == Array(ty)
+
+    ast.eval(env)
+    assert env.get("x") == values
+
+
+@pytest.mark.parametrize("frontend", FRONTENDS)
+@pytest.mark.parametrize("source", ["[1, true]", "[1, 2 + 3]", "[-true]", "[x, 1]"])
+def test_non_constant_array(frontend: Any, source: str):
+    ast = parse_to_ast(source, frontend)
+    assert isinstance(ast, ArrayLiteral)
+    assert isinstance(ast.members, ArrayElements)
+
+
+def test_constant_array_copied_on_eval():
+    ast = parse_to_ast(
+        """
+        fn f() -> array<int> {
+            let a = [1, 2]
+            a[0] = 3
+            return a
+        }
+        let x = f()
+        let y = f()
+        """
+    )
+    type_env, env = get_default_environs()
+    ast.typecheck(type_env)
+    ast.eval(env)
+
+    assert env.get("x") == [3, 2]
+    assert env.get("y") == [3, 2]
+    assert env.get("x") is not env.get("y")
+
+
+@pytest.mark.parametrize("frontend", FRONTENDS)
+def test_large_constant_array(frontend: Any):
+    values = list(range(-10_000, 10_000))
+    ast = parse_to_ast(f"let x = {values}", frontend)
+
+    type_env, env = get_default_environs()
+    ast.typecheck(type_env)
+    ast.eval(env)
+    assert env.get("x") == values
+
+
+def test_nested_array_typechecked_once(monkeypatch: pytest.MonkeyPatch):
+    depth = 20
+    ast = parse_to_ast("let x = " + "[" * depth + "1" + "]" * depth)
+
+    calls: list[ArrayLiteral] = []
+    typecheck_steps = ArrayLiteral.typecheck_steps
+
+    def counted(self: ArrayLiteral, env: TypeEnvironment):
+        calls.append(self)
+        return typecheck_steps(self, env)
+
+    monkeypatch.setattr(ArrayLiteral, "typecheck_steps", counted)
+    ast.typecheck(TypeEnvironment())
+
+    assert len(calls) == len(set(map(id, calls))) == depth
+
+    assert isinstance(ast, VariableDeclaration)
+    ty = ast.rvalue.type
+    for _ in range(depth):
+        assert isinstance(ty, Array)
+        ty = ty.ty
+    assert ty == INT
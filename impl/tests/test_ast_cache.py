@@ -0,0 +1,80 @@
+import os
+from pathlib import Path
+from typing import Any
+
+from compiler import cache, langtypes
+from compiler.compiler import get_default_environs, run_file
+from compiler.parser import parse_to_ast
+
+SOURCE = """\
+fn double(a: int) -> int {
+    return a * 2
+}
+let xs = [1, 2, 3]
+print double(xs[2])
+"""
+
+
+def typechecked(source: str) -> Any:
+    ast = parse_to_ast(source)
+    type_env, _ = get_default_environs()
+    ast.typecheck(type_env)
+    return ast
+
+
+def test_round_trip(tmp_path: Path):
+    ast = typechecked(SOURCE)
+    path = cache.ast_cache_path(tmp_path / "prog.ryu", SOURCE)
+    cache.store_ast(path, ast)
+
+    loaded = cache.load_ast(path)
+    assert loaded == ast
+    assert loaded.to_type_dict() == ast.to_type_dict()  # type: ignore
+
+    # primitive types are compared by identity
+    assert loaded.stmts[1].rvalue.type == langtypes.Array(langtypes.INT)  # type: ignore
+
+    op_span = loaded.stmts[0].body.stmts[0].return_value.op_span  # type: ignore
+    assert (op_span.start_pos, op_span.end_pos, op_span.end_line) == (40, 41, 2)
+
+
+def test_run_file_hit_and_miss(tmp_path: Path, capsys: Any):
+    program = tmp_path / "prog.ryu"
+    program.write_text(SOURCE)
+
+    for status in ("miss", "hit"):
+        run_file(program, *get_default_environs(), report_cache=True)
+        out, err = capsys.readouterr()
+        assert out == "6\n"
+        assert err.startswith(f"ryucache {status}:")
+
+    # a changed source replaces the stale entry
+    program.write_text(SOURCE.replace("* 2", "* 3"))
+    run_file(program, *get_default_environs(), report_cache=True)
+    out, err = capsys.readouterr()
+    assert out == "9\n"
+    assert err.startswith("ryucache miss:")
+    assert len(list((tmp_path / cache.AST_CACHE_DIR_NAME).iterdir())) == 1
+
+
+def test_corrupt_entry_is_a_miss(tmp_path: Path):
+    path = cache.ast_cache_path(tmp_path / "prog.ryu", SOURCE)
+    path.parent.mkdir()
+    path.write_bytes(b"garbage")
+    assert cache.load_ast(path) is None
+
+
+def test_eviction(tmp_path: Path):
+    ast = typechecked(SOURCE)
+    paths = [cache.ast_cache_path(tmp_path / f"p{i}.ryu", SOURCE) for i in range(4)]
+    for path in paths:
+        cache.store_ast(path, ast)
+
+    # p0 is the most recently used, followed by p3, p2 and p1
+    for mtime, path in enumerate([paths[1], paths[2], paths[3], paths[0]]):
+        os.utime(path, (mtime, mtime))
+
+    cache.evict(paths[0].parent, max_size=2 * paths[0].stat().st_size)
+
+    remaining = sorted(p.name for p in paths[0].parent.iterdir())
+    assert remaining == sorted([paths[0].name, paths[3].name])
@@ -0,0 +1,23 @@
+import inspect
+
+import pytest
+
+from compiler import ast
+from compiler.ast.base import Ast
+
+NODE_CLASSES = sorted(
+    {
+        cls
+        for module in vars(ast).values()
+        if inspect.ismodule(module)
+        for cls in vars(module).values()
+        if inspect.isclass(cls) and issubclass(cls, Ast)
+    },
+    key=lambda cls: cls.__qualname__,
+)
+
+
+@pytest.mark.parametrize("cls", NODE_CLASSES, ids=lambda cls: cls.__qualname__)
+def test_no_instance_dict(cls: type[Ast]):
+    assert cls.__dictoffset__ == 0
+
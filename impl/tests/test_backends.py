@@ -0,0 +1,137 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from compiler import errors
+from compiler.compiler import BACKENDS, Backend, get_default_environs
+from compiler.parser import parse_to_ast
+
+from benchmarks.programs import quicksort
+from tests.utils import EXAMPLES, multiline_sanitize, run_program
+
+OTHER_BACKENDS: list[Backend] = [backend for backend in BACKENDS if backend != "tree"]
+
+
+@pytest.mark.parametrize("backend", OTHER_BACKENDS)
+@pytest.mark.parametrize("path", sorted(EXAMPLES.rglob("*.ryu")), ids=lambda p: p.name)
+def test_same_output_as_tree(path: Path, backend: Backend, capsys: Any):
+    source = path.read_text()
+
+    run_program(source, "tree")
+    expected = capsys.readouterr().out
+
+    run_program(source, backend)
+    assert capsys.readouterr().out == expected
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_returns_and_captured_variables(backend: Backend, capsys: Any):
+    source = multiline_sanitize(
+        """
+        struct Counter {
+            count: int
+        }
+        enum Sign {
+            Negative
+            Zero
+            Positive(int)
+        }
+        let total = 0
+        fn sign(n: int) -> Sign {
+            match n == 0 {
+                case true { return Sign::Zero }
+                case false {
+                    if n < 0 {
+                        return Sign::Negative
+                    }
+                }
+            }
+            return Sign::Positive(n)
+        }
+        let values = [1, 2, 3]
+        let counter = Counter(count = 0)
+        fn first_over(limit: int) -> int {
+            let count = 0
+            fn bump(by: int) -> int {
+                count = count + by
+                total = total + by
+                return count
+            }
+            for j in 0..3 {
+                let value = values[j]
+                let i = 0
+                while i < 10 {
+                    if bump(value) > limit {
+                        return i
+                    }
+                    i = i + 1
+                }
+            }
+            counter.count = count
+            return 0 - 1
+        }
+        let found = first_over(9)
+        let missing = first_over(100)
+        let signs = [sign(0 - 4), sign(0), sign(7)]
+        print counter.count
+        """
+    )
+    env = run_program(source, backend)
+    assert capsys.readouterr().out == "60\n"
+    assert env.get("found") == 9
+    assert env.get("missing") == -1
+    assert env.get("total") == 70
+    assert [str(value) for value in env.get("signs")] == [
+        "Sign::Negative",
+        "Sign::Zero",
+        "Sign::Positive(7)",
+    ]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_quicksort(backend: Backend):
+    source, values = quicksort(500)
+    assert run_program(source, backend).get("sorted") == sorted(values)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_indexing_out_of_range(backend: Backend):
+    source = multiline_sanitize(
+        """
+        let values = [1, 2, 3]
+        fn at(i: int) -> int {
+            let local = values
+            return local[i]
+        }
+        let x = at(3)
+        """
+    )
+    ast = parse_to_ast(source)
+    type_env, env = get_default_environs()
+    ast.typecheck(type_env)
+
+    with pytest.raises(errors.IndexingOutOfRange) as excinfo:
+        BACKENDS[backend](ast, env)
+    assert source[slice(*excinfo.value.span.pos())] == "local[i]"
+
+
+@pytest.mark.parametrize("backend", OTHER_BACKENDS)
+def test_deep_recursion(backend: Backend, capsys: Any):
+    source = multiline_sanitize(
+        """
+        let calls = 0
+        fn depth(n: int) -> int {
+            calls = calls + 1
+            if n == 0 {
+                print calls
+                return 0
+            }
+            return 1 + depth(n - 1)
+        }
+        let d = depth(5000)
+        """
+    )
+    env = run_program(source, backend)
+    assert env.get("d") == 5000
+    assert capsys.readouterr().out == "5001\n"
@@ -0,0 +1,25 @@
+from compiler.compiler import disassemble, get_default_environs
+from tests.utils import multiline_sanitize
+
+
+def test_disassemble():
+    source = multiline_sanitize(
+        """
+        fn below(n: int, limit: int) -> int {
+            let i = 0
+            while i < limit {
+                i = i + 1
+            }
+            return i - n
+        }
+        print below(1, 3)
+        """
+    )
+    listing = disassemble(source, get_default_environs()[0])
+
+    assert listing is not None
+    assert listing.startswith("Disassembly of <program>:")
+    assert "Disassembly of below:" in listing
+    assert "LOAD_LOCAL_PAIR" in listing
+    assert "JUMP_IF_NOT_LESS_INT" in listing
+    assert "ADD_INT_CONST" in listing
@@ -0,0 +1,40 @@
+from typing import Any
+
+import pytest
+
+from compiler import closures
+from compiler.compiler import DEFAULT_BACKEND
+from tests.utils import multiline_sanitize, run_program
+
+
+def test_default_backend():
+    assert DEFAULT_BACKEND == "closures"
+
+
+def test_deep_nesting(capsys: Any):
+    depth = 3000
+    source = "if true {\n" * depth + "print 1\n" + "}\n" * depth
+
+    run_program(source, "closures")
+    assert capsys.readouterr().out == "1\n"
+
+
+def test_tail_call_from_nodes_on_stack(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(closures, "MAX_NESTING", 4)
+    source = multiline_sanitize(
+        """
+        fn outer(n: int) -> int {
+            if true {
+                if true {
+                    fn inner(m: int) -> int {
+                        return m * 2
+                    }
+                    return inner(n)
+                }
+            }
+            return 0
+        }
+        let x = outer(21)
+        """
+    )
+    assert run_program(source, "closures").get("x") == 42
@@ -0,0 +1,34 @@
+import sys
+
+import pytest
+
+from compiler.env import TypeEnvironment
+from compiler.parser import FRONTENDS, parse, parse_to_ast, parse_tree_to_ast
+
+from benchmarks.programs import nested
+
+DEPTH = 3 * sys.getrecursionlimit()
+
+
+@pytest.fixture(scope="module")
+def source() -> str:
+    return nested(DEPTH)
+
+
+def test_parse_falls_back_to_lark(source: str):
+    with pytest.raises(RecursionError):
+        FRONTENDS["pratt"](source)
+
+    assert parse_to_ast(source).span.end_pos == len(source) - 1
+
+
+def test_transform(source: str):
+    assert parse_tree_to_ast(parse(source)).span.end_pos == len(source) - 1
+
+
+def test_passes(source: str):
+    ast = parse_to_ast(source, "lark")
+    ast.typecheck(TypeEnvironment())
+
+    assert type(ast) in ast.to_dict()
+    assert type(ast) in ast.to_type_dict()
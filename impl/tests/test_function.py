@@ -6,7 +6,7 @@ from compiler.langtypes import (
     Array,
     Function,
 )
-from tests.utils import docstring_source_with_snapshot
+from tests.utils import docstring_source, docstring_source_with_snapshot
 
 
 @docstring_source_with_snapshot
@@ -247,3 +247,42 @@ def test_function_recursive(source: str, snapshot: Any):
     assert env.get("x4") == 24
     assert env.get("x5") == 120
     assert env.get("x6") == 720
+
+
+@docstring_source
+def test_return_from_nested_statements(source: str):
+    """
+    fn one() -> int {
+        return 1
+    }
+    fn find(arr: array<int>, target: int) -> int {
+        for i in 0..3 {
+            let tries = 0
+            while tries < 3 {
+                match arr[i] == target {
+                    case true {
+                        if i == 0 {
+                            return 100
+                        } elif tries == 1 {
+                            return i
+                        }
+                    }
+                    case false { let skipped = one() }
+                }
+                tries = tries + 1
+            }
+        }
+        return -1
+    }
+    let first = find([4, 5, 6], 4)
+    let found = find([4, 5, 6], 6)
+    let missing = find([4, 5, 6], 7)
+    """
+    ast = parse_tree_to_ast(parse(source))
+    type_env, env = get_default_environs()
+    ast.typecheck(type_env)
+    ast.eval(env)
+
+    assert env.get("first") == 100
+    assert env.get("found") == 2
+    assert env.get("missing") == -1
@@ -0,0 +1,119 @@
+import pytest
+
+from compiler.incremental import TextEdit, reparse
+from compiler.lalr import UnexpectedInput  # type: ignore
+from compiler.parser import parse_to_ast
+
+SOURCE = """\
+// header
+let a = 1
+let b = [1, 2, 3]
+
+fn f(x: int) -> int {
+    return x + a
+}
+let c = f(2) let d = 4
+print c
+"""
+
+
+def assert_reparse(source: str, edit: TextEdit):
+    previous = parse_to_ast(source)
+    expected = parse_to_ast(edit.apply(source))
+
+    # dataclass equality includes the spans of every node
+    assert reparse(previous, source, edit) == expected
+
+
+def offset(text: str) -> int:
+    return SOURCE.index(text)
+
+
+@pytest.mark.parametrize(
+    "edit",
+    [
+        TextEdit(offset("1\n"), offset("1\n") + 1, "100"),
+        TextEdit(offset("let b"), offset("let b"), "let z = 0\n\n"),
+        TextEdit(offset("let b"), offset("fn f"), ""),
+        TextEdit(offset("x + a"), offset("x + a") + 1, "x * 2\n    let y = x\n    y"),
+        TextEdit(offset("4"), offset("4") + 1, "5"),
+        TextEdit(offset("print c"), len(SOURCE), "print d\n\n\n"),
+        TextEdit(offset("print c"), len(SOURCE), ""),
+        TextEdit(0, 0, "\n\n"),
+        TextEdit(0, offset("let a"), ""),
+        TextEdit(offset("\nlet b"), offset("\nlet b") + 1, " "),
+    ],
+)
+def test_matches_full_parse(edit: TextEdit):
+    assert_reparse(SOURCE, edit)
+
+
+def test_reuses_statements():
+    previous = parse_to_ast(SOURCE)
+    before, after = previous.stmts[0], previous.stmts[-1]  # type: ignore
+
+    start = offset("4")
+    ast = reparse(previous, SOURCE, TextEdit(start, start + 1, "42\nlet e = 5"))
+
+    assert ast.stmts[0] is before  # type: ignore
+    assert ast.stmts[-1] is after  # type: ignore
+    assert after.span.start_line == 10
+
+
+def test_single_statement():
+    assert_reparse("let a = 1", TextEdit(8, 9, "2\nlet b = 3"))
+    assert_reparse("let a = 1\nlet b = 2", TextEdit(9, 19, ""))
+
+
+def test_syntax_error():
+    start = offset("let b")
+    with pytest.raises(UnexpectedInput):
+        reparse(parse_to_ast(SOURCE), SOURCE, TextEdit(start, start, "let = "))
+
+
+@pytest.mark.parametrize("exact_errors", [True, False])
+def test_previous_is_kept_on_errors(exact_errors: bool):
+    previous = parse_to_ast(SOURCE)
+    start = offset("print c")
+
+    with pytest.raises(UnexpectedInput) as excinfo:
+        reparse(previous, SOURCE, TextEdit(start, start, "\n\nlet = "), exact_errors)
+    assert excinfo.value.pos_in_stream == start + len("\n\nlet ")
+
+    edit = TextEdit(start, start, "let e = 5\n")
+    ast, expected = reparse(previous, SOURCE, edit), parse_to_ast(edit.apply(SOURCE))
+    assert ast == expected
+    assert ast.stmts[-1].span.coord() == expected.stmts[-1].span.coord()  # type: ignore
+
+
+def test_merge_statements():
+    source = "fn f() -> int {\n    return 1\n}\nfn g() -> int {\n    return 2\n}\nprint 1"
+    start = source.index("}\nfn g")
+    end = source.index("    return 2")
+    assert_reparse(source, TextEdit(start, end, ""))
+
+
+def test_later_statements_are_not_moved():
+    previous = parse_to_ast(SOURCE)
+    last = previous.stmts[-1]  # type: ignore
+    source = SOURCE
+
+    def apply(edit: TextEdit):
+        nonlocal previous, source
+        previous = reparse(previous, source, edit)
+        source = edit.apply(source)
+        assert previous == parse_to_ast(source)
+
+    # Typing in the middle of the file leaves the spans after it anchored
+    # to the end, and editing before or after the earlier edits keeps them
+    # right.
+    for text in ["let x = 1", "0", "0", "\n"]:
+        start = source.index("\nlet c")
+        apply(TextEdit(start, start, text))
+        assert last.span.anchored_to_end
+
+    apply(TextEdit(0, 0, "\n\n"))
+    apply(TextEdit(len(source), len(source), "1\n"))
+
+    assert last.span.pos() == (source.index("print c"), source.index("print c") + 7)
+    assert last.span.coord() == ((12, 1), (12, 8))
@@ -1,6 +1,9 @@
 from typing import Any
+
+import pytest
+
 from compiler.env import RuntimeEnvironment, TypeEnvironment
-from compiler.parser import parse, parse_tree_to_ast
+from compiler.parser import FRONTENDS, parse, parse_to_ast, parse_tree_to_ast
 
 EMPTY_ENV = RuntimeEnvironment()
 EMPTY_TYPE_ENV = TypeEnvironment()
@@ -386,3 +389,29 @@ def test_noteq_diffnum(snapshot: Any):
     ast.typecheck(EMPTY_TYPE_ENV)
     assert ast.to_type_dict() == snapshot
     assert ast.eval(EMPTY_ENV) is True
+
+
+# Associativity
+
+
+@pytest.mark.parametrize("frontend", FRONTENDS)
+@pytest.mark.parametrize(
+    "source,expected",
+    [
+        ("10-4-3", 3),
+        ("8/4/2", 1),
+        ("2*3%4", 2),
+        ("1-2+3", 2),
+    ],
+)
+def test_left_associative(frontend: Any, source: str, expected: int):
+    ast = parse_to_ast(source, frontend)
+    ast.typecheck(EMPTY_TYPE_ENV)
+    assert ast.eval(EMPTY_ENV) == expected
+
+
+@pytest.mark.parametrize("frontend", FRONTENDS)
+def test_long_chain(frontend: Any):
+    ast = parse_to_ast(" + ".join(["1"] * 10_000) + " - 1 * 2", frontend)
+    ast.typecheck(EMPTY_TYPE_ENV)
+    assert ast.eval(EMPTY_ENV) == 9_998
@@ -0,0 +1,65 @@
+import gc
+import pickle
+import weakref
+
+from compiler import langtypes
+from compiler.errors import Span
+from compiler.langtypes import (
+    BOOL,
+    INT,
+    POISON,
+    STRING,
+    Array,
+    Enum,
+    Function,
+    Struct,
+)
+
+
+def test_structurally_equal_types_are_identical():
+    assert Array(INT) is Array(ty=INT)
+    assert Array(Array(STRING)) is Array(Array(STRING))
+    assert Array(INT) is not Array(BOOL)
+
+    params = Function.Params([INT, Array(INT)])
+    assert params is Function.Params([INT, Array(INT)])
+    assert Function("f", params, BOOL) is Function(
+        function_name="f", arguments=params, return_type=BOOL
+    )
+    assert Function("f", params, BOOL) is not Function("g", params, BOOL)
+
+
+def test_struct_members_in_any_order():
+    members = Struct.Members({"x": INT, "y": STRING})
+    assert members is Struct.Members({"y": STRING, "x": INT})
+    assert members is not Struct.Members({"x": STRING, "y": INT})
+    assert Struct("Point", members) is Struct("Point", members)
+
+
+def test_enums_are_distinguished_by_span():
+    members: list[langtypes.Enum.Variants] = [
+        Enum.Simple("A"),
+        Enum.Tuple("B", Array(INT)),
+    ]
+    span = Span(1, 1, 1, 5, 0, 4)
+    assert Enum("E", members, span) is Enum("E", list(members), Span(1, 1, 1, 5, 0, 4))
+    assert Enum("E", members, span) is not Enum("E", members, Span(2, 2, 1, 5, 9, 13))
+
+
+def test_unpickled_types_are_interned():
+    ty = Function("f", Function.Params([Array(INT)]), Array(Array(BOOL)))
+    assert pickle.loads(pickle.dumps(ty)) is ty
+
+
+def test_unused_types_are_dropped():
+    ty = weakref.ref(Struct("Unused", Struct.Members({"x": INT})))
+    gc.collect()
+    assert ty() is None
+
+
+def test_poisoned_types():
+    assert langtypes.is_poisoned(POISON)
+    assert langtypes.is_poisoned(Array(Array(POISON)))
+    assert langtypes.is_poisoned(Function("f", Function.Params([POISON]), INT))
+    assert not langtypes.is_poisoned(Function("f", Function.Params([INT]), INT))
+    assert not langtypes.is_poisoned(Struct("P", Struct.Members({"x": INT})))
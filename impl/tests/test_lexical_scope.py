@@ -1,8 +1,16 @@
 from typing import Any
+from compiler.ast.function import FunctionDefinition
+from compiler.compiler import get_default_environs
 from compiler.env import RuntimeEnvironment, TypeEnvironment
 from compiler.parser import parse, parse_tree_to_ast
 from compiler.langtypes import STRING
-from tests.utils import docstring_source_with_snapshot
+from tests.utils import (
+    docstring_source,
+    docstring_source_with_snapshot,
+    frames as frames,
+    multiline_sanitize,
+    run_program,
+)
 
 
 @docstring_source_with_snapshot
@@ -47,3 +55,102 @@ def test_lexical_scope_variable_type(source: str, snapshot: Any):
     env = RuntimeEnvironment()
     ast.eval(env)
     assert env.get("x") == "outside"
+
+
+@docstring_source
+def test_function_sees_scope_of_definition(source: str):
+    """
+    let x = "global"
+    fn f() -> string {
+        return x
+    }
+    let r = ""
+    if true {
+        let x = "block"
+        r = f()
+    }
+    """
+    assert run_program(source, "tree").get("r") == "global"
+
+
+@docstring_source
+def test_function_defined_in_block(source: str):
+    """
+    let total = 0
+    if true {
+        let base = 10
+        fn add(n: int) -> int {
+            if n == 0 {
+                return base
+            }
+            return 1 + add(n - 1)
+        }
+        for i in 0..3 {
+            total = total + add(i)
+        }
+    }
+    """
+    assert run_program(source, "tree").get("total") == 33
+
+
+@docstring_source
+def test_variables_resolved_to_slots(source: str):
+    """
+    let g = 1
+    fn f(a: int, b: int) -> int {
+        let c = a
+        for i in 0..b {
+            c = c + i + g
+        }
+        return c
+    }
+    """
+    ast = parse_tree_to_ast(parse(source))
+    ast.typecheck(get_default_environs()[0])
+
+    fn = ast.stmts[1]
+    assert isinstance(fn, FunctionDefinition)
+    assert fn.slot is None
+    assert fn.param_slots == [1, 2]
+
+    # the blocks and the loop have their variables in the frame of the call
+    assert fn.frame_size == 5
+    [assignment] = fn.body.stmts[0].stmts[1].stmts.stmts  # type: ignore
+    assert (assignment.depth, assignment.slot) == (0, 3)
+    c, i, g = (
+        assignment.rvalue.left.left,
+        assignment.rvalue.left.right,
+        assignment.rvalue.right,
+    )
+    assert (c.depth, c.slot) == (0, 3)
+    assert (i.depth, i.slot) == (0, 4)
+    assert g.slot is None
+
+
+def test_frames_allocated_per_call(frames: list[RuntimeEnvironment]):
+    source = multiline_sanitize(
+        """
+        fn sum(n: int) -> int {
+            let total = 0
+            for i in 0..n {
+                let j = i
+                while j > 0 {
+                    let k = j
+                    total = total + k
+                    j = j - 1
+                }
+            }
+            return total
+        }
+        let results = [0, 0, 0, 0, 0]
+        for n in 0..5 {
+            let r = sum(n)
+            results[n] = r
+        }
+        """
+    )
+    env = run_program(source, "tree")
+
+    assert env.get("results") == [0, 0, 1, 4, 10]
+    # one for the top level loop, then one per call
+    assert len(frames) == 1 + 5
@@ -0,0 +1,50 @@
+import pytest
+
+from compiler.errors import LineTable, Span
+
+SOURCE = "let a = 1\n\nprint a\r\nlet b = 2"
+
+
+@pytest.mark.parametrize(
+    "pos, coord",
+    [(0, (1, 1)), (9, (1, 10)), (10, (2, 1)), (11, (3, 1)), (19, (3, 9)), (20, (4, 1))],
+)
+def test_coord(pos: int, coord: tuple[int, int]):
+    assert LineTable(SOURCE).coord(pos) == coord
+
+
+@pytest.mark.parametrize(
+    "start, end, text",
+    [(0, 0, "\n\n"), (4, 5, "abc"), (9, 11, ""), (8, 12, "1\nlet c = 3\n"), (20, 29, "\n")],
+)
+def test_edit(start: int, end: int, text: str):
+    lines = LineTable(SOURCE)
+    lines.starts()
+    lines.edit(start, end, text)
+
+    expected = LineTable(SOURCE[:start] + text + SOURCE[end:])
+    assert lines.source == expected.source
+    assert lines.starts() == expected.starts()
+
+
+def test_lazy_span():
+    lines = LineTable(SOURCE)
+    span = Span.lazy(11, 18, lines)
+    assert span.coord() == ((3, 1), (3, 8))
+    assert span == Span(3, 3, 1, 8, 11, 18)
+
+
+def test_edits_move_the_gap():
+    lines = LineTable(SOURCE)
+    source = SOURCE
+    lines.starts()
+
+    for start, end, text in [(20, 20, "\n"), (0, 0, "x\n"), (10, 12, ""), (21, 22, "")]:
+        lines.edit(start, end, text)
+        source = source[:start] + text + source[end:]
+
+        expected = LineTable(source)
+        assert lines.starts() == expected.starts()
+        assert [lines.coord(pos) for pos in range(len(source) + 1)] == [
+            expected.coord(pos) for pos in range(len(source) + 1)
+        ]
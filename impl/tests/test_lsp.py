@@ -0,0 +1,146 @@
+import io
+import json
+from typing import Any
+
+import pytest
+
+from compiler.incremental import TextEdit
+from compiler import incremental, lsp
+from compiler.lsp import INTERNAL_ERROR, Document, Server
+from tests.utils import multiline_sanitize
+
+SOURCE = multiline_sanitize(
+    """
+    struct Point {
+        x: int
+    }
+    fn origin() -> Point {
+        return Point(x = 0)
+    }
+    fn one() -> int {
+        return 1
+    }
+    let p = origin()
+    let n = one() + 1
+    """
+)
+
+
+def frame(message: dict[str, Any]) -> bytes:
+    body = json.dumps({"jsonrpc": "2.0", **message}).encode()
+    return b"Content-Length: %d\r\n\r\n" % len(body) + body
+
+
+def serve(*messages: dict[str, Any]) -> list[dict[str, Any]]:
+    output = io.BytesIO()
+    Server(io.BytesIO(b"".join(map(frame, messages))), output).serve()
+
+    replies: list[dict[str, Any]] = []
+    data = output.getvalue()
+    while data:
+        header, _, data = data.partition(b"\r\n\r\n")
+        length = int(header.split(b":")[1])
+        replies.append(json.loads(data[:length]))
+        data = data[length:]
+    return replies
+
+
+def edit(document: Document, old: str, new: str):
+    start = document.source.index(old)
+    document.edit(TextEdit(start, start + len(old), new))
+
+
+def test_diagnostics_and_hover():
+    doc = {"uri": "file:///a.ryu", "text": SOURCE.replace("return 1", "return true")}
+    replies = serve(
+        {"id": 1, "method": "initialize", "params": {}},
+        {"method": "textDocument/didOpen", "params": {"textDocument": doc}},
+        {
+            "id": 2,
+            "method": "textDocument/hover",
+            "params": {
+                "textDocument": {"uri": doc["uri"]},
+                "position": {"line": 9, "character": 9},
+            },
+        },
+        {"id": 3, "method": "shutdown"},
+        {"method": "exit"},
+    )
+
+    initialize, diagnostics, hover, shutdown = replies
+    assert initialize["result"]["capabilities"]["hoverProvider"]
+
+    # the body of one fails, not the statement calling it
+    [error] = diagnostics["params"]["diagnostics"]
+    assert error["range"]["start"] == {"line": 6, "character": 0}
+
+    assert hover["result"]["contents"]["value"] == "fn origin() -> Point"
+    assert hover["result"]["range"]["start"] == {"line": 9, "character": 8}
+    assert shutdown == {"jsonrpc": "2.0", "id": 3, "result": None}
+
+
+def test_only_changed_items_are_checked_again():
+    document = Document(SOURCE)
+    assert document.diagnostics() == []
+    assert len(document.cache.rechecked) == 5
+
+    edit(document, "return 1", "return 12")
+    assert document.diagnostics() == []
+    assert [stmt.name for stmt in document.cache.rechecked] == ["one"]  # type: ignore
+
+    # Every item using the struct depends on its type
+    edit(document, "x: int", "x: string")
+    assert len(document.diagnostics()) == 1
+    assert len(document.cache.rechecked) == 3
+
+    edit(document, "x = 0", 'x = "0"')
+    assert document.diagnostics() == []
+    assert len(document.cache.rechecked) == 1
+
+
+def test_parse_errors():
+    document = Document(SOURCE)
+    edit(document, "let p =", "let p = =")
+
+    [error] = document.diagnostics()
+    assert error["range"]["start"] == {"line": 9, "character": 8}
+    assert document.hover(0) is None
+
+    edit(document, "let p = =", "let p =")
+    assert document.diagnostics() == []
+
+
+def test_broken_documents_are_not_parsed_again(monkeypatch: pytest.MonkeyPatch):
+    document = Document(SOURCE)
+
+    def parse_to_ast(source: str):
+        raise AssertionError("the whole document was parsed")
+
+    monkeypatch.setattr(lsp, "parse_to_ast", parse_to_ast)
+    monkeypatch.setattr(incremental, "parse_to_ast", parse_to_ast)
+
+    edit(document, "return 1", "return (1")
+    edit(document, "let p =", "let p = =")
+    assert len(document.diagnostics()) == 1
+
+    edit(document, "let p = =", "let p =")
+    edit(document, "(1", "(1)")
+    monkeypatch.undo()
+    assert document.ast == Document(document.source).ast
+    assert document.diagnostics() == []
+
+
+def test_handler_errors():
+    doc = {"textDocument": {"uri": "file:///missing.ryu"}, "contentChanges": []}
+    replies = serve(
+        {"method": "textDocument/didChange", "params": doc},
+        {"id": 1, "method": "textDocument/hover", "params": {}},
+        {"id": 2, "method": "shutdown"},
+        {"method": "exit"},
+    )
+
+    log, hover, shutdown = replies
+    assert log["method"] == "window/logMessage"
+    assert "KeyError" in log["params"]["message"]
+    assert hover["error"]["code"] == INTERNAL_ERROR
+    assert shutdown["result"] is None
@@ -154,3 +154,34 @@ def test_match_array_wildcard_element(source: str, snapshot: Any):
     assert env.get("two") is True
     assert env.get("three") is True
     assert env.get("no2") is False
+
+
+@docstring_source_with_snapshot
+def test_match_nested_array(source: str, snapshot: Any):
+    """
+    fn shape(rows: array<array<int>>) -> int {
+        match rows {
+            case [[1, _], _, []] { return 1 }
+            case [[_, _], [3], _] { return 2 }
+            case [_, [_]] { return 3 }
+            case _ { return 0 }
+        }
+    }
+
+    let first = shape([[1, 2], [3], <int>[]])
+    let second = shape([[5, 6], [3], [4]])
+    let third = shape([[1], [2]])
+    let other = shape([[1]])
+    """
+    ast = parse_tree_to_ast(parse(source))
+    assert ast.to_dict() == snapshot(name="ast")
+
+    type_env, env = get_default_environs()
+    ast.typecheck(type_env)
+    assert ast.to_type_dict() == snapshot(name="typed-ast")
+
+    ast.eval(env)
+    assert env.get("first") == 1
+    assert env.get("second") == 2
+    assert env.get("third") == 3
+    assert env.get("other") == 0
@@ -0,0 +1,135 @@
+import pytest
+
+from compiler.compiler import get_default_environs
+from compiler.errors import DuplicatedCase, InexhaustiveMatch
+from compiler.parser import parse_to_ast
+
+from benchmarks.programs import match_ladder
+from tests.utils import multiline_sanitize
+
+ENUMS = multiline_sanitize(
+    """
+    enum Inner {
+        A
+        B(bool)
+    }
+    enum Outer {
+        Some(bool)
+        Nested(Inner)
+        None
+    }
+    """
+)
+
+
+def typecheck(source: str):
+    parse_to_ast(source).typecheck(get_default_environs()[0])
+
+
+def match_outer(*cases: str) -> str:
+    arms = "\n".join(f"    case {case} {{ print 1 }}" for case in cases)
+    return ENUMS + "\nmatch Outer::None {\n" + arms + "\n}\n"
+
+
+def test_nested_enum_patterns():
+    typecheck(
+        match_outer(
+            "Outer::Nested(Inner::B(true))",
+            "Outer::Nested(Inner::B(false))",
+            "Outer::Nested(Inner::A)",
+            "Outer::Some(_)",
+            "Outer::None",
+        )
+    )
+
+    with pytest.raises(InexhaustiveMatch) as excinfo:
+        typecheck(match_outer("Outer::Some(true)", "Outer::Nested(Inner::B(false))"))
+
+    assert excinfo.value.remaining_values == {
+        "Outer::Some(False)",
+        "Outer::Nested(Inner::A)",
+        "Outer::Nested(Inner::B(True))",
+        "Outer::None",
+    }
+
+
+def test_redundant_case_points_at_covering_case():
+    source = match_outer(
+        "Outer::Nested(Inner::B(_))",
+        "Outer::Some(_)",
+        "Outer::Nested(Inner::A)",
+        "Outer::Nested(_)",
+        "_",
+    )
+    with pytest.raises(DuplicatedCase) as excinfo:
+        typecheck(source)
+
+    err = excinfo.value
+    assert source[slice(*err.span.pos())] == "Outer::Nested(_)"
+    assert source[slice(*err.previous_case_span.pos())] == "Outer::Nested(Inner::A)"
+
+
+def test_wildcard_after_exhaustive_cases():
+    source = multiline_sanitize(
+        """
+        match true {
+            case true { print 1 }
+            case false { print 2 }
+            case _ { print 3 }
+        }
+        """
+    )
+    with pytest.raises(DuplicatedCase) as excinfo:
+        typecheck(source)
+
+    assert source[slice(*excinfo.value.previous_case_span.pos())] == "false"
+
+
+def test_array_patterns():
+    source = multiline_sanitize(
+        """
+        match [1, 2] {
+            case [] { print 0 }
+            case [_] { print 1 }
+            case [1, _] { print 2 }
+            case [_, 2] { print 3 }
+        }
+        """
+    )
+    with pytest.raises(InexhaustiveMatch) as excinfo:
+        typecheck(source)
+    assert excinfo.value.remaining_values == {"[_, _]", "[_, _, _]"}
+
+    with pytest.raises(DuplicatedCase):
+        typecheck(source.replace("case [_, 2]", "case [1, 2]"))
+
+
+def test_nested_array_patterns():
+    source = multiline_sanitize(
+        """
+        match [[1, 2], [3]] {
+            case [[], _] { print 0 }
+            case [[1, _], [_]] { print 1 }
+            case [[_, _], []] { print 2 }
+            case [_, [_, _]] { print 3 }
+        }
+        """
+    )
+    with pytest.raises(InexhaustiveMatch) as excinfo:
+        typecheck(source)
+    assert "[]" in excinfo.value.remaining_values
+
+    with pytest.raises(DuplicatedCase):
+        typecheck(source.replace("case [_, [_, _]]", "case [[1, 2], [3]]"))
+
+    typecheck(source.replace("case [_, [_, _]]", "case _"))
+
+
+def test_large_enum():
+    typecheck(match_ladder(3_000, 300))
+    typecheck(match_ladder(3_000, 5_000))
+
+    source = match_ladder(3_000, 5_000)
+    with pytest.raises(InexhaustiveMatch) as excinfo:
+        typecheck(source.replace("case E::V2999(Inner::A) { return 4999 }", ""))
+    assert excinfo.value.remaining_values == {"E::V2999(Inner::A)"}
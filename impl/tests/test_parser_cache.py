@@ -0,0 +1,72 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from compiler import cache
+from compiler.lalr import Lark_StandAlone  # type: ignore
+from compiler.parser import parse
+
+SOURCE = "let a = 1 + 2\nprint a"
+
+
+def build():
+    return Lark_StandAlone(propagate_positions=True)  # type: ignore
+
+
+def test_parser_is_cached(tmp_path: Path):
+    key = cache.parser_cache_key(propagate_positions=True)
+    parser = cache.cached_parser(key, build, directory=tmp_path)
+    assert (tmp_path / f"{key}.pickle").exists()
+
+    def fail():
+        assert False, "parser should have been loaded from the cache"
+
+    cached = cache.cached_parser(key, fail, directory=tmp_path)
+    assert cached.parse(SOURCE) == parser.parse(SOURCE) == parse(SOURCE)  # type: ignore
+
+
+def test_corrupt_cache_is_rebuilt(tmp_path: Path):
+    key = cache.parser_cache_key(propagate_positions=True)
+    (tmp_path / f"{key}.pickle").write_bytes(b"garbage")
+
+    parser = cache.cached_parser(key, build, directory=tmp_path)
+    assert parser.parse(SOURCE) == parse(SOURCE)  # type: ignore
+
+
+def test_cache_key_depends_on_options():
+    assert cache.parser_cache_key(propagate_positions=True) != cache.parser_cache_key(
+        propagate_positions=False
+    )
+
+
+def test_cache_key_depends_on_grammar(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    key = cache.parser_cache_key(propagate_positions=True)
+
+    # a regenerated module of the same size and modification time
+    lalr_path = Path(cache.lalr.__file__)
+    regenerated = tmp_path / "lalr.py"
+    regenerated.write_bytes(lalr_path.read_bytes().replace(b"LALR", b"RLAL", 1))
+    stat = lalr_path.stat()
+    os.utime(regenerated, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    monkeypatch.setattr(cache.lalr, "__file__", str(regenerated))
+    cache._lalr_digest.cache_clear()  # type: ignore
+    try:
+        assert cache.parser_cache_key(propagate_positions=True) != key
+    finally:
+        cache._lalr_digest.cache_clear()  # type: ignore
+
+
+def test_stale_parsers_are_removed(tmp_path: Path):
+    key = cache.parser_cache_key(propagate_positions=True)
+    other_options = cache.parser_cache_key(propagate_positions=False)
+    stale = tmp_path / "lalr-1.0.0-py30-0000000000000000-0123456789abcdef.pickle"
+    stale.write_bytes(b"old grammar")
+    (tmp_path / f"{other_options}.pickle").write_bytes(b"same grammar")
+
+    cache.cached_parser(key, build, directory=tmp_path)
+
+    assert not stale.exists()
+    assert (tmp_path / f"{other_options}.pickle").exists()
+    assert (tmp_path / f"{key}.pickle").exists()
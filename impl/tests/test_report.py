@@ -0,0 +1,88 @@
+import re
+from typing import Any
+
+import pytest
+from _pytest.capture import CaptureFixture
+
+from compiler import errors, report
+from compiler.compiler import get_default_environs, run
+from compiler.parser import parse_to_ast
+from compiler.typechecker import typecheck_program
+from tests.utils import multiline_sanitize
+
+SOURCE = multiline_sanitize(
+    """
+    print a
+    let x = 1 + true
+    fn f() -> int {
+        print b
+        return 1
+    }
+    let y = x + 1
+    """
+)
+
+
+@pytest.fixture
+def rendered(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, list[Any]]]:
+    calls: list[tuple[str, list[Any]]] = []
+
+    def render(source: str, diagnostics: list[Any]) -> str:
+        calls.append((source, diagnostics))
+        return "".join(f"E{code:02}\n" for _, _, code, _ in diagnostics)
+
+    monkeypatch.setattr(report, "ariadne_render", render)
+    return calls
+
+
+def test_all_errors_rendered_at_once(
+    rendered: list[tuple[str, list[Any]]], capfd: CaptureFixture[str]
+):
+    run(SOURCE, *get_default_environs(), all_errors=True)
+
+    [(source, diagnostics)] = rendered
+    assert source == SOURCE
+    assert [(start_pos, code) for start_pos, _, code, _ in diagnostics] == [
+        (SOURCE.index("a"), 2),
+        (SOURCE.index("1 + true"), 1),
+        (SOURCE.index("b"), 2),
+    ]
+
+    _, err = capfd.readouterr()
+    assert err == "E02\nE01\nE02\n"
+
+
+def test_first_error_without_all_errors(rendered: list[tuple[str, list[Any]]]):
+    run(SOURCE, *get_default_environs())
+    assert rendered == []
+
+
+@pytest.fixture
+def diagnostics() -> list[report.Diagnostic]:
+    found = errors.Diagnostics()
+    with pytest.raises(errors.Diagnostics):
+        typecheck_program(
+            parse_to_ast(SOURCE), get_default_environs()[0], diagnostics=found
+        )
+    return [err.diagnostic() for err in found.sorted()]
+
+
+def test_rendered_like_single_reports(
+    diagnostics: list[report.Diagnostic], capfd: CaptureFixture[str]
+):
+    for diagnostic in diagnostics:
+        report.report_errors(SOURCE, [diagnostic])
+        _, rendered = capfd.readouterr()
+
+        report.report_error(SOURCE, *diagnostic)
+        _, reported = capfd.readouterr()
+        assert rendered == reported
+
+
+def test_rendered_in_order(
+    diagnostics: list[report.Diagnostic], capfd: CaptureFixture[str]
+):
+    report.report_errors(SOURCE, diagnostics)
+
+    _, err = capfd.readouterr()
+    assert re.findall(r"E\d\d", err) == ["E02", "E01", "E02"]
@@ -0,0 +1,79 @@
+import pytest
+
+from compiler.ast.function import FunctionDefinition
+from compiler.compiler import get_default_environs
+from compiler.env import RuntimeEnvironment
+from compiler.parser import parse_to_ast
+
+from benchmarks.programs import quicksort
+from tests.utils import frames as frames, multiline_sanitize, run_program
+
+RECURSION = multiline_sanitize(
+    """
+    fn depth(n: int) -> int {
+        if n == 0 {
+            return 0
+        }
+        return 1 + depth(n - 1)
+    }
+    fn count(n: int, total: int) -> int {
+        if n == 0 {
+            return total
+        }
+        return count(n - 1, total + 1)
+    }
+    fn start(n: int) -> int {
+        return count(n, 0)
+    }
+    """
+)
+
+
+def test_recursion_deeper_than_python():
+    source = RECURSION + "let d = depth(5000)\n"
+
+    with pytest.raises(RecursionError):
+        run_program(source, "tree")
+
+    assert run_program(source, "stack").get("d") == 5000
+
+
+def test_tail_calls_reuse_frame(frames: list[RuntimeEnvironment]):
+    source = RECURSION + "let c = start(3000)\n"
+
+    env = run_program(source, "stack")
+
+    assert env.get("c") == 3000
+    # one frame for start, then one for count, reused by its calls to itself
+    assert len(frames) == 2
+
+
+def test_quicksort_sorted_input():
+    source, values = quicksort(600)
+    source = source.replace(str(values), str(sorted(values)))
+
+    env = run_program(source, "stack")
+    assert env.get("sorted") == sorted(values)
+
+
+def test_frames_with_closures_not_reused():
+    source = multiline_sanitize(
+        """
+        fn total(n: int, sum: int) -> int {
+            fn add(x: int) -> int {
+                return x + n
+            }
+            if n == 0 {
+                return sum
+            }
+            return total(n - 1, add(sum))
+        }
+        """
+    )
+    ast = parse_to_ast(source)
+    ast.typecheck(get_default_environs()[0])
+    assert isinstance(ast, FunctionDefinition)
+    assert not ast.reuse_frame
+
+    env = run_program(source + "let t = total(100, 0)\n", "stack")
+    assert env.get("t") == 5050
@@ -0,0 +1,83 @@
+import io
+from pathlib import Path
+from typing import Any
+
+import pytest
+from _pytest.capture import CaptureFixture
+
+from compiler.compiler import get_default_environs, run, run_stream, statement_chunks
+from compiler.lalr import UnexpectedInput  # type: ignore
+from compiler.parser import parse
+
+EXAMPLES = sorted(Path(__file__).parent.parent.joinpath("examples").rglob("*.ryu"))
+
+
+@pytest.mark.parametrize("path", EXAMPLES, ids=lambda p: p.name)
+def test_same_output_as_run(path: Path, capsys: Any):
+    source = path.read_text()
+
+    run(source, *get_default_environs())
+    expected = capsys.readouterr().out
+
+    run_stream(io.StringIO(source), *get_default_environs())
+    assert capsys.readouterr().out == expected
+
+
+def test_statement_chunks():
+    source = """\
+// comment
+
+let a = 1 let b = "{"
+fn f() -> int {
+    // }
+    return 1
+}
+
+print f()
+"""
+    chunks = list(statement_chunks(io.StringIO(source)))
+    assert chunks == [
+        ('let a = 1 let b = "{"\n', 12, 3),
+        ("fn f() -> int {\n    // }\n    return 1\n}\n", 34, 4),
+        ("print f()\n", 75, 9),
+    ]
+    for chunk in chunks:
+        assert source[chunk.offset :].startswith(chunk.source)
+        program = chunk.in_program()
+        assert program[chunk.offset :] == chunk.source
+        assert program.count("\n", 0, chunk.offset) == chunk.line - 1
+
+
+def test_shared_environment(capsys: Any):
+    type_env, runtime_env = get_default_environs()
+
+    lines = ["let a = 1\n", "fn f() -> int {\n", "return a + 1\n", "}\n"]
+    run_stream(lines, type_env, runtime_env)
+    run_stream(["print f()\n"], type_env, runtime_env)
+
+    assert capsys.readouterr().out == "2\n"
+
+
+def test_type_error_positions(capfd: CaptureFixture[str]):
+    source = Path(__file__).parent.parent.joinpath(
+        "examples", "errors", "type_mismatch.ryu"
+    ).read_text()
+
+    run(source, *get_default_environs())
+    expected = capfd.readouterr().err
+
+    run_stream(io.StringIO(source), *get_default_environs())
+    assert capfd.readouterr().err == expected
+
+
+def test_syntax_error_positions():
+    source = "print 1\n\n// comment\nlet a = 1\nlet b = (2\nprint 3\n"
+
+    with pytest.raises(UnexpectedInput) as expected:
+        parse(source)
+
+    with pytest.raises(UnexpectedInput) as actual:
+        run_stream(io.StringIO(source), *get_default_environs())
+
+    assert (actual.value.line, actual.value.column) == (5, 11)
+    assert actual.value.pos_in_stream == expected.value.pos_in_stream
@@ -0,0 +1,234 @@
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from compiler import errors, typechecker
+from compiler.ast.base import Ast
+from compiler.compiler import get_default_environs, run
+from compiler.langtypes import INT, STRING
+from compiler.parser import parse_to_ast
+from compiler.typechecker import typecheck_program
+
+from benchmarks.programs import functions
+from tests.utils import multiline_sanitize
+
+EXAMPLES = sorted(Path(__file__).parent.parent.joinpath("examples").rglob("*.ryu"))
+
+
+@pytest.fixture
+def parallel(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(typechecker, "PARALLEL_MIN_FUNCTIONS", 1)
+
+
+def outcome(typecheck: Callable[[Ast], Any], source: str) -> Any:
+    ast = parse_to_ast(source)
+    try:
+        typecheck(ast)
+    except errors.CompilerError as err:
+        return (type(err), err.span.pos())
+    return ast.to_type_dict()
+
+
+@pytest.mark.parametrize("path", EXAMPLES, ids=lambda p: p.name)
+def test_same_outcome_as_single_pass(path: Path):
+    source = path.read_text()
+
+    expected = outcome(lambda ast: ast.typecheck(get_default_environs()[0]), source)
+    actual = outcome(
+        lambda ast: typecheck_program(ast, get_default_environs()[0]), source
+    )
+    assert actual == expected
+
+
+def test_bodies_checked_in_workers(parallel: Any):
+    source = functions(8)
+
+    expected = parse_to_ast(source)
+    expected.typecheck(get_default_environs()[0])
+
+    ast = parse_to_ast(source)
+    type_env, _ = get_default_environs()
+    typecheck_program(ast, type_env, jobs=2)
+    assert ast.to_type_dict() == expected.to_type_dict()
+    assert type_env.get_var_type("r7") is INT
+
+
+def test_program_checked_in_workers_runs():
+    source = functions(typechecker.PARALLEL_MIN_FUNCTIONS)
+
+    expected = get_default_environs()[1]
+    run(source, get_default_environs()[0], expected)
+
+    env = get_default_environs()[1]
+    run(source, get_default_environs()[0], env, jobs=2)
+    for i in range(typechecker.PARALLEL_MIN_FUNCTIONS):
+        assert env.get(f"r{i}") == expected.get(f"r{i}")
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_bodies_see_globals_defined_before(jobs: int, parallel: Any):
+    source = multiline_sanitize(
+        """
+        let x = 1
+        fn f() -> int {
+            return x
+        }
+        let x = "shadowed"
+        fn g() -> string {
+            return x
+        }
+        """
+    )
+    type_env, _ = get_default_environs()
+    typecheck_program(parse_to_ast(source), type_env, jobs)
+    assert type_env.get_var_type("x") is STRING
+
+    later = multiline_sanitize(
+        """
+        fn f() -> int {
+            return y
+        }
+        let y = 1
+        """
+    )
+    with pytest.raises(errors.UnknownVariable):
+        typecheck_program(parse_to_ast(later), get_default_environs()[0], jobs)
+
+    mutual = multiline_sanitize(
+        """
+        fn even(n: int) -> bool {
+            if n == 0 {
+                return true
+            }
+            return odd(n - 1)
+        }
+        fn odd(n: int) -> bool {
+            if n == 0 {
+                return false
+            }
+            return even(n - 1)
+        }
+        """
+    )
+    with pytest.raises(errors.UnknownVariable):
+        typecheck_program(parse_to_ast(mutual), get_default_environs()[0], jobs)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_first_error_in_source_order(jobs: int, parallel: Any):
+    source = multiline_sanitize(
+        """
+        fn f() -> int {
+            return a
+        }
+        fn g() -> int {
+            return b
+        }
+        c
+        """
+    )
+    with pytest.raises(errors.UnknownVariable) as err:
+        typecheck_program(parse_to_ast(source), get_default_environs()[0], jobs)
+    assert err.value.variable == "a"
+
+
+def collect(source: str, jobs: int = 1) -> list[errors.CompilerError]:
+    diagnostics = errors.Diagnostics()
+    with pytest.raises(errors.Diagnostics) as raised:
+        typecheck_program(
+            parse_to_ast(source), get_default_environs()[0], jobs, diagnostics
+        )
+    assert raised.value is diagnostics
+    return diagnostics.sorted()
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_all_errors_in_one_run(jobs: int, parallel: Any):
+    source = multiline_sanitize(
+        """
+        fn f() -> int {
+            print a
+            return 1
+        }
+        let x = "one" + 1
+        fn g() -> int {
+            print b
+            if 1 {
+                print c
+            }
+            return f()
+        }
+        print d
+        """
+    )
+    found = collect(source, jobs)
+    assert [type(err) for err in found] == [
+        errors.UnknownVariable,
+        errors.InvalidOperationError,
+        errors.UnknownVariable,
+        errors.UnexpectedType,
+        errors.UnknownVariable,
+    ]
+    assert [getattr(err, "variable", None) for err in found] == [
+        "a",
+        None,
+        "b",
+        None,
+        "d",
+    ]
+
+
+def test_poisoned_names_do_not_cascade():
+    source = multiline_sanitize(
+        """
+        let x = 1 + true
+        let y = x * 2
+        if y {
+            print y
+        }
+        enum E {
+            A
+            A
+        }
+        fn f(e: E) -> int {
+            return e
+        }
+        let n = f(E::A) + "n"
+        print z
+        """
+    )
+    [invalid, duplicated, unknown] = collect(source)
+    assert isinstance(invalid, errors.InvalidOperationError)
+    assert isinstance(duplicated, errors.DuplicatedAttribute)
+    assert isinstance(unknown, errors.UnknownVariable)
+
+
+def test_errors_in_expression_statements():
+    source = multiline_sanitize(
+        """
+        let x = 1
+        x + true
+        if true {
+            x - "a"
+        }
+        print z
+        """
+    )
+    found = collect(source)
+    assert [type(err) for err in found] == [
+        errors.InvalidOperationError,
+        errors.InvalidOperationError,
+        errors.UnknownVariable,
+    ]
+
+def test_no_errors_same_types():
+    source = functions(8)
+
+    expected = parse_to_ast(source)
+    expected.typecheck(get_default_environs()[0])
+
+    ast = parse_to_ast(source)
+    type_env = get_default_environs()[0]
+    typecheck_program(ast, type_env, diagnostics=errors.Diagnostics())
+    assert ast.to_type_dict() == expected.to_type_dict()
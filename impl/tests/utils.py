@@ -1,11 +1,50 @@
-from typing import Any, Callable
+from pathlib import Path
+from typing import Any, Callable, Optional
 from textwrap import dedent
 
+import pytest
+
+from compiler.compiler import Backend, get_default_environs, run
+from compiler.env import RuntimeEnvironment
+
+EXAMPLES = Path(__file__).parent.parent / "examples"
+
 
 def multiline_sanitize(source: str) -> str:
     return dedent(source).strip()
 
 
+def run_program(source: str, backend: Backend) -> RuntimeEnvironment:
+    """
+    Run source in fresh environments on backend, returning the runtime one.
+    """
+    type_env, env = get_default_environs()
+    run(source, type_env, env, backend=backend)
+    return env
+
+
+@pytest.fixture
+def frames(monkeypatch: pytest.MonkeyPatch) -> list[RuntimeEnvironment]:
+    """
+    Frames created during the test, that is the runtime environments of calls
+    and blocks (but not the global ones, which have no enclosing one).
+    """
+    created: list[RuntimeEnvironment] = []
+    init = RuntimeEnvironment.__init__
+
+    def counting_init(
+        env: RuntimeEnvironment,
+        enclosing: Optional[RuntimeEnvironment] = None,
+        size: int = 0,
+    ):
+        if enclosing is not None:
+            created.append(env)
+        init(env, enclosing, size)
+
+    monkeypatch.setattr(RuntimeEnvironment, "__init__", counting_init)
+    return created
+
+
 def docstring_source(func: Callable[[str], None]) -> Callable[[], None]:
     source = multiline_sanitize(func.__doc__ or "")
 